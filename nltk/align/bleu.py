@@ -9,6 +9,12 @@
 from __future__ import division
 
 import math
+import random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from nltk import word_tokenize
 from nltk.compat import Counter
@@ -203,6 +209,228 @@ class BLEU(object):
         else:
             return math.exp(1 - r / c)
 
+
+class CorpusBLEU(object):
+    """
+    Corpus-level BLEU [1] of system outputs against a fixed test set of
+    references.  The clipped n-gram matches and the lengths are added up
+    over all the segments of the test set, before the precisions and the
+    brevity penalty are computed.
+
+    The maximum count of each n-gram over the references of each segment
+    is computed once, when the ``CorpusBLEU`` is created, so that any
+    number of system outputs can then be scored against the same
+    references.  Each system output is first reduced to *sufficient
+    statistics*: for each segment, the candidate length, the closest
+    reference length, and the number of clipped matches and the total
+    number of n-grams of each order.  These are all that is needed to
+    compute BLEU on the whole test set, or on any resampling of it.
+
+    >>> references = [[['the', 'cat', 'is', 'on', 'the', 'mat'],
+    ...                ['there', 'is', 'a', 'cat', 'on', 'the', 'mat']],
+    ...               [['he', 'read', 'the', 'book', 'because', 'he',
+    ...                 'was', 'interested', 'in', 'world', 'history']]]
+    >>> bleu = CorpusBLEU(references)
+    >>> system1 = [['the', 'cat', 'is', 'on', 'the', 'mat'],
+    ...            ['he', 'was', 'interested', 'in', 'world', 'history',
+    ...             'because', 'he', 'read', 'the', 'book']]
+    >>> system2 = [['the', 'cat', 'the', 'cat', 'on', 'the', 'mat'],
+    ...            ['he', 'read', 'the', 'book', 'because', 'he', 'was',
+    ...             'interested', 'in', 'history']]
+    >>> print('%.4f' % bleu.score(system1))
+    0.8221
+    >>> ['%.4f' % score for score in bleu.score_many([system1, system2])]
+    ['0.8221', '0.7041']
+
+    Unlike ``BLEU.compute()``, a test set with no matches for some n-gram
+    order gets a score of zero, and tokens are compared case-sensitively
+    unless ``lowercase`` is true.
+
+    [1] Papineni, Kishore, et al. "BLEU: a method for automatic evaluation of
+    machine translation." Proceedings of the 40th annual meeting on
+    association for computational linguistics. Association for Computational
+    Linguistics, 2002.
+    """
+
+    def __init__(self, references, max_n=4, lowercase=False):
+        """
+        :param references: The references of each segment of the test set.
+        :type references: list(list(list(str)))
+        :param max_n: The highest n-gram order that is counted.
+        :param lowercase: If true, then compare tokens case-insensitively.
+        """
+        self._max_n = max_n
+        self._lowercase = lowercase
+        self._max_counts = []
+        self._ref_lengths = []
+        for segment_references in references:
+            segment_references = [self._tokens(reference)
+                                  for reference in segment_references]
+            max_counts = {}
+            for reference in segment_references:
+                for n in range(1, min(max_n, len(reference))+1):
+                    for ngram, count in Counter(ngrams(reference, n)).items():
+                        if count > max_counts.get(ngram, 0):
+                            max_counts[ngram] = count
+            self._max_counts.append(max_counts)
+            self._ref_lengths.append(sorted(set(
+                len(reference) for reference in segment_references)))
+
+    def _tokens(self, tokens):
+        if self._lowercase:
+            return [token.lower() for token in tokens]
+        return list(tokens)
+
+    def __len__(self):
+        return len(self._max_counts)
+
+    def segment_stats(self, candidate, i):
+        """
+        :return: The sufficient statistics of a candidate translation of
+            segment ``i``: the candidate length, the closest reference
+            length (the shorter one, if two are equally close), the clipped
+            matches of each n-gram order, and the number of n-grams of each
+            order in the candidate.
+        :rtype: tuple(int)
+        """
+        candidate = self._tokens(candidate)
+        c = len(candidate)
+        r = min(self._ref_lengths[i], key=lambda length: (abs(length - c),
+                                                           length))
+        max_counts = self._max_counts[i]
+        matches = []
+        totals = []
+        for n in range(1, self._max_n+1):
+            if n > c:
+                matches.append(0)
+                totals.append(0)
+                continue
+            counts = Counter(ngrams(candidate, n))
+            matches.append(sum(min(count, max_counts.get(ngram, 0))
+                               for ngram, count in counts.items()))
+            totals.append(c - n + 1)
+        return tuple([c, r] + matches + totals)
+
+    def sufficient_stats(self, candidates):
+        """
+        :return: The sufficient statistics of each segment of a system
+            output (see ``segment_stats()``).
+        :param candidates: The candidate translation of each segment.
+        :type candidates: list(list(str))
+        """
+        if len(candidates) != len(self):
+            raise ValueError('Expected %d candidates, got %d' %
+                             (len(self), len(candidates)))
+        return [self.segment_stats(candidate, i)
+                for (i, candidate) in enumerate(candidates)]
+
+    def score_stats(self, stats, weights=None):
+        """
+        :return: The BLEU score of the test set whose segments have the
+            given sufficient statistics.
+        :param weights: The weight of the log precision of each n-gram
+            order.  Defaults to uniform weights over all orders.
+        """
+        max_n = self._max_n
+        if weights is None:
+            weights = [1 / max_n] * max_n
+        totals = [sum(column) for column in zip(*stats)]
+        if not totals or totals[0] == 0:
+            return 0.0
+        c, r = totals[0], totals[1]
+        matches = totals[2:2+max_n]
+        counts = totals[2+max_n:]
+
+        s = 0.0
+        for (w, m, n) in zip(weights, matches, counts):
+            if m == 0:
+                return 0.0
+            s += w * math.log(m / n)
+
+        bp = 1 if c > r else math.exp(1 - r / c)
+        return bp * math.exp(s)
+
+    def score(self, candidates, weights=None):
+        """
+        :return: The BLEU score of a system output.
+        :param candidates: The candidate translation of each segment.
+        :type candidates: list(list(str))
+        """
+        return self.score_stats(self.sufficient_stats(candidates), weights)
+
+    def score_many(self, systems, weights=None):
+        """
+        :return: The BLEU score of each of several system outputs.
+        :type systems: list(list(list(str)))
+        """
+        return [self.score(candidates, weights) for candidates in systems]
+
+    def paired_bootstrap(self, system1, system2, samples=1000, weights=None,
+                         rng=None):
+        """
+        Paired bootstrap resampling (Koehn, 2004): score both systems on
+        the same random resamplings of the test set's segments.
+
+        >>> references = [[['a', 'b', 'c', 'd']], [['e', 'f', 'g', 'h']],
+        ...               [['i', 'j', 'k', 'l']]] * 10
+        >>> bleu = CorpusBLEU(references, max_n=2)
+        >>> good = [ref[0] for ref in references]
+        >>> bad = [ref[0][:2] + ['x', 'y'] for ref in references]
+        >>> bleu.paired_bootstrap(good, bad, samples=100,
+        ...                       rng=random.Random(0))
+        0.0
+
+        Candidates may be tuples of tokens as well as lists:
+
+        >>> bleu.paired_bootstrap([tuple(c) for c in bad], good, samples=100,
+        ...                       rng=random.Random(0))
+        1.0
+
+        :param system1, system2: The two system outputs.
+        :type system1, system2: list(list(str))
+        :param samples: The number of resampled test sets.
+        :param rng: The random number generator that is used.
+        :type rng: random.Random
+        :return: The proportion of the resampled test sets on which the
+            second system scores higher than the first one.
+        :rtype: float
+        """
+        return self.paired_bootstrap_stats(self.sufficient_stats(system1),
+                                           self.sufficient_stats(system2),
+                                           samples, weights, rng)
+
+    def paired_bootstrap_stats(self, stats1, stats2, samples=1000,
+                               weights=None, rng=None):
+        """
+        Paired bootstrap resampling of two system outputs, given by their
+        sufficient statistics (see ``sufficient_stats()``), so that they
+        can be compared with several other systems without being counted
+        again.  See ``paired_bootstrap()``.
+        """
+        if rng is None:
+            rng = random.Random()
+        if numpy is not None:
+            stats1 = numpy.array(stats1)
+            stats2 = numpy.array(stats2)
+        N = len(stats1)
+        wins = 0
+        for sample in range(samples):
+            drawn = [rng.randrange(N) for i in range(N)]
+            if numpy is not None:
+                # the number of times that each segment is drawn
+                counts = numpy.bincount(drawn, minlength=N)
+                resampled1 = [numpy.dot(counts, stats1)]
+                resampled2 = [numpy.dot(counts, stats2)]
+            else:
+                resampled1 = [stats1[i] for i in drawn]
+                resampled2 = [stats2[i] for i in drawn]
+            score1 = self.score_stats(resampled1, weights)
+            score2 = self.score_stats(resampled2, weights)
+            if score2 > score1:
+                wins += 1
+        return wins / samples
+
+
 # run doctests
 if __name__ == "__main__":
     import doctest
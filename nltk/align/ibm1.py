@@ -15,6 +15,7 @@
 from __future__  import division
 from collections import defaultdict
 from nltk.align  import AlignedSent
+from nltk.align.indexed import IndexedBitext, train_ibm1
 from nltk.corpus import comtrans
 
 class IBMModel1(object):
@@ -40,10 +41,22 @@ class IBMModel1(object):
     0.833
     >>> print('{0:.3f}'.format(bitexts[6].alignment_error_rate(aligned_sent)))
     0.333
-    
+
+    If ``algorithm`` is ``'indexed'``, then the model is trained with
+    array operations over an ``IndexedBitext`` (see ``nltk.align.indexed``),
+    which needs much less time and memory for large corpora, and
+    ``probabilities`` is a ``TranslationTable``.  The ``processes``
+    argument gives the number of worker processes that it uses.  This
+    algorithm requires numpy.
     """
-    def __init__(self, align_sents, num_iter):
-        self.probabilities = self.train(align_sents, num_iter)
+    def __init__(self, align_sents, num_iter, algorithm=None, processes=1):
+        if algorithm is None:
+            self.probabilities = self.train(align_sents, num_iter)
+        elif algorithm == 'indexed':
+            self.probabilities = train_ibm1(IndexedBitext(align_sents),
+                                            num_iter, processes)
+        else:
+            raise ValueError('Unknown algorithm %r' % algorithm)
 
     def train(self, align_sents, num_iter):
         """
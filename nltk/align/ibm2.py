@@ -11,6 +11,7 @@ from collections import defaultdict
 from nltk.align  import AlignedSent
 from nltk.corpus import comtrans
 from nltk.align.ibm1 import IBMModel1
+from nltk.align.indexed import IndexedBitext, train_ibm2
 
 class IBMModel2(object):
     """
@@ -42,9 +43,21 @@ class IBMModel2(object):
     >>> bitexts[0].alignment_error_rate(aligned_sent)
     0.1428571428571429
 
+    If ``algorithm`` is ``'indexed'``, then the model is trained with
+    array operations over an ``IndexedBitext`` (see ``nltk.align.indexed``),
+    and ``probabilities`` and ``alignments`` are a ``TranslationTable``
+    and an ``AlignmentTable``.  The ``processes`` argument gives the number
+    of worker processes that it uses.  This algorithm requires numpy.
     """
-    def __init__(self, align_sents, num_iter):
-        self.probabilities, self.alignments = self.train(align_sents, num_iter)
+    def __init__(self, align_sents, num_iter, algorithm=None, processes=1):
+        if algorithm is None:
+            self.probabilities, self.alignments = \
+                self.train(align_sents, num_iter)
+        elif algorithm == 'indexed':
+            self.probabilities, self.alignments = \
+                train_ibm2(IndexedBitext(align_sents), num_iter, processes)
+        else:
+            raise ValueError('Unknown algorithm %r' % algorithm)
 
     def train(self, align_sents, num_iter):
         """
@@ -106,16 +119,16 @@ class IBMModel2(object):
                 # compute normalization
                 for j in range(1, l_e+1):
                     en_word = en_set[j-1]
-                    total_e[en_word] = 0
+                    total_e[j] = 0
                     for i in range(0, l_f+1):
-                        total_e[en_word] += t_ef[en_word][fr_set[i]] * align[i][j][l_e][l_f]
+                        total_e[j] += t_ef[en_word][fr_set[i]] * align[i][j][l_e][l_f]
 
                 # collect counts
                 for j in range(1, l_e+1):
                     en_word = en_set[j-1]
                     for i in range(0, l_f+1):
                         fr_word = fr_set[i]
-                        c = t_ef[en_word][fr_word] * align[i][j][l_e][l_f] / total_e[en_word]
+                        c = t_ef[en_word][fr_word] * align[i][j][l_e][l_f] / total_e[j]
                         count_ef[en_word][fr_word] += c
                         total_f[fr_word] += c
                         count_align[i][j][l_e][l_f] += c
@@ -10,7 +10,7 @@ from __future__  import division
 from collections import defaultdict
 from nltk.align  import AlignedSent
 from nltk.align.ibm2 import IBMModel2
-from math import factorial
+from math import factorial, log
 
 class HashableDict(dict):
     """
@@ -62,26 +62,56 @@ class IBMModel3(object):
     ['klein', 'ist', 'das', 'Haus']
     >>> aligned_sent.mots
     ['the', 'house', 'is', 'small']
-    >>> aligned_sent.alignment
-    Alignment([(0, 2), (1, 3), (2, 0), (3, 1)])
+    >>> sorted(aligned_sent.alignment[2] + aligned_sent.alignment[3])
+    [(2, 0), (3, 1)]
+
+    The two alignments of 'klein' and 'ist' to 'is' and 'small' are
+    equally likely, up to rounding errors, so only the positions that
+    they are aligned to are certain:
+
+    >>> sorted(i for (j, i) in aligned_sent.alignment if j < 2)
+    [2, 3]
+
+    During training, the alignments of each sentence pair are sampled
+    from tables of the model probabilities for that sentence pair, and
+    the hill climbing search scores each neighboring alignment by the
+    change that it makes to the current alignment's probability.  The
+    sentence pairs can be sampled by several worker processes:
+
+    >>> ibm3 = IBMModel3(align_sents, 5, processes=2)
+    >>> alignment = ibm3.align(align_sents[0]).alignment
+    >>> sorted(alignment[2] + alignment[3])
+    [(2, 0), (3, 1)]
 
     """
 
-    def __init__(self, align_sents, num_iter):
+    def __init__(self, align_sents, num_iter, processes=1):
         # If there is not an initial value, it throws an exception of 
         # the number divided by zero. And the value of computing 
         # probability will be always zero.
         self.PROB_SMOOTH = 0.1
 
-        self.train(align_sents, num_iter)
+        self.train(align_sents, num_iter, processes)
 
 
-    def train(self, align_sents, num_iter):
+    def train(self, align_sents, num_iter, processes=1):
         """
         This function is the main process of training model, which
         initialize all the probability distributions and executes 
         a specific number of iterations. 
         """
+        workers = None
+        if processes > 1:
+            import multiprocessing
+            workers = multiprocessing.Pool(processes)
+        try:
+            self._train(align_sents, num_iter, workers)
+        finally:
+            if workers is not None:
+                workers.close()
+                workers.join()
+
+    def _train(self, align_sents, num_iter, workers):
         # Get the translation and alignment probabilities from IBM model 2
         ibm2 = IBMModel2(align_sents, num_iter)
         self.probabilities, self.align_table = ibm2.probabilities, ibm2.alignments
@@ -114,24 +144,29 @@ class IBMModel3(object):
             count_f = defaultdict(lambda: defaultdict(lambda: 0.0))
             total_f = defaultdict(lambda: 0.0)
 
-            for alignSent in align_sents:
+            # Sample the alignment space of each sentence pair
+            tables = (self._sentence_tables(alignSent)
+                      for alignSent in align_sents)
+            if workers is None:
+                samples = map(_sample_alignments, tables)
+            else:
+                samples = workers.imap(_sample_alignments, tables, 16)
+
+            for (alignSent, A) in zip(align_sents, samples):
 
                 en_set = alignSent.words
                 fr_set = [None] + alignSent.mots
                 l_f = len(fr_set) - 1
                 l_e = len(en_set)
 
-                # Sample the alignment space
-                A = self.sample( en_set, fr_set)
-                
                 # Collect counts
                 c_total = 0.0
 
-                for (a, fert) in A:
-                    c_total += self.probability(a, en_set, fr_set, fert)
+                for (a, prob) in A:
+                    c_total += prob
 
-                for (a, fert) in A:
-                    c = self.probability(a, en_set, fr_set, fert)/c_total
+                for (a, prob) in A:
+                    c = prob/c_total
                     null = 0
 
                     for j in range(1, l_e+1):
@@ -198,6 +233,30 @@ class IBMModel3(object):
             p1 = count_p1 / (count_p1+count_p0)
             self.null_insertion = 1 - p1
 
+    def _sentence_tables(self, align_sent):
+        """
+        Return the probabilities of the current model that are needed to
+        sample the alignments of a sentence pair, as lists indexed by
+        English position j (from 1) and foreign position i (from 0):
+        the translation probabilities ``t[j][i]``, the distortion
+        probabilities ``d[j][i]``, the IBM Model 2 alignment scores
+        ``m2[j][i]``, and the fertility terms ``fert[i][phi]`` (the
+        factorial of phi times the fertility probability).
+        """
+        es = align_sent.words
+        fs = [None] + align_sent.mots
+        l_e = len(es)
+        l_f = len(fs) - 1
+        t = [None] + [[self.probabilities[e][f] for f in fs] for e in es]
+        d = [None] + [[self.distortion[j][i][l_e][l_f]
+                       for i in range(0, l_f+1)] for j in range(1, l_e+1)]
+        m2 = [None] + [[t[j][i] * self.align_table[i][j][l_e][l_f]
+                        for i in range(0, l_f+1)] for j in range(1, l_e+1)]
+        fert = [None] + [[factorial(phi) * self.fertility[phi][fs[i]]
+                          for phi in range(0, l_e+1)]
+                         for i in range(1, l_f+1)]
+        return (l_e, l_f, t, d, m2, fert, self.null_insertion)
+
     def sample(self, e, f):
         """
         This function returns a sample from the entire alignment space.
@@ -397,6 +456,236 @@ class IBMModel3(object):
 
         return AlignedSent(align_sent.words, align_sent.mots, alignment)
 
+def _sample_alignments(tables):
+    """
+    Sample the alignment space of one sentence pair, as ``IBMModel3.sample()``
+    does, from the tables returned by ``IBMModel3._sentence_tables()``.
+
+    :return: A list of ``(alignment, probability)`` pairs, where each
+        alignment is a tuple whose j-th element (from 1) is the foreign
+        position aligned to English position j.
+    """
+    return _AlignmentSampler(*tables).sample()
+
+class _AlignmentSampler(object):
+    """
+    Samples the alignments of a single sentence pair.
+
+    Alignments are tuples, whose element 0 is unused, and fertilities are
+    lists indexed by foreign position.  The probability of an alignment is
+    the product of a NULL insertion term, a fertility term for each foreign
+    word, and a translation and distortion term for each English word.  The
+    hill climbing search keeps each term in log space, as a pair of the
+    number of zero factors and the sum of the logs of the other factors,
+    so that the score of a neighboring alignment is the score of the
+    current alignment plus the change in the few terms that differ.
+    """
+    def __init__(self, l_e, l_f, t, d, m2, fert, null_insertion):
+        self.l_e = l_e
+        self.l_f = l_f
+        self.t = t
+        self.d = d
+        self.m2 = m2
+
+        # the fertility terms, with the NULL insertion term as fert[0]
+        p1 = 1 - null_insertion
+        self.fert = [[self._null_term(p1, null_insertion, phi)
+                      for phi in range(0, l_e+1)]] + fert[1:]
+        self.log_fert = [[_log_factor(x) for x in row] for row in self.fert]
+        self.log_lex = [None] + [[_log_factor(t[j][i] * d[j][i])
+                                  for i in range(0, l_f+1)]
+                                 for j in range(1, l_e+1)]
+
+    def _null_term(self, p1, p0, phi0):
+        l_e = self.l_e
+        try:
+            total = pow(p1, phi0) * pow(p0, l_e - 2 * phi0)
+        except ZeroDivisionError:
+            return 0.0
+        if total == 0:
+            return total
+        # the combination (l_e - phi0) choose phi0
+        for i in range(1, phi0+1):
+            total *= (l_e - phi0 - i + 1) / i
+            if total == 0:
+                return total
+        return total
+
+    def probability(self, a, fert):
+        """
+        The probability of an alignment, computed in the same way as
+        ``IBMModel3.probability()``.
+        """
+        total = self.fert[0][fert[0]]
+        if total == 0:
+            return total
+        for i in range(1, self.l_f+1):
+            total *= self.fert[i][fert[i]]
+            if total == 0:
+                return total
+        for j in range(1, self.l_e+1):
+            total *= self.t[j][a[j]]
+            total *= self.d[j][a[j]]
+            if total == 0:
+                return total
+        return total
+
+    def fertility(self, a):
+        fert = [0] * (self.l_f+1)
+        for j in range(1, self.l_e+1):
+            fert[a[j]] += 1
+        return fert
+
+    def score(self, a, fert):
+        """
+        The log probability of an alignment, as a pair of the number of
+        zero factors and the sum of the logs of the others.
+        """
+        zeros, total = 0, 0.0
+        for i in range(0, self.l_f+1):
+            z, x = self.log_fert[i][fert[i]]
+            zeros += z
+            total += x
+        for j in range(1, self.l_e+1):
+            z, x = self.log_lex[j][a[j]]
+            zeros += z
+            total += x
+        return zeros, total
+
+    def sample(self):
+        l_e, l_f = self.l_e, self.l_f
+
+        # the best alignment of each English word according to model 2
+        best = [None]
+        for j in range(1, l_e+1):
+            maxalignment = 0
+            besti = 1
+            for i in range(0, l_f+1):
+                if self.m2[j][i] > maxalignment:
+                    maxalignment = self.m2[j][i]
+                    besti = i
+            best.append(besti)
+
+        A = set()
+        climbed = set()
+        for i in range(0, l_f+1):
+            for j in range(1, l_e+1):
+                # Pegging one alignment point
+                a = list(best)
+                a[0] = 0
+                a[j] = i
+                a = self.hillclimb(tuple(a), j)
+                if (a, j) not in climbed:
+                    climbed.add((a, j))
+                    A.update(self.neighboring(a, j))
+
+        return [(a, self.probability(a, self.fertility(a))) for a in A]
+
+    def hillclimb(self, a, j_pegged):
+        """
+        Move to the best neighboring alignment until no neighbor is more
+        probable than the current alignment.
+        """
+        l_e, l_f = self.l_e, self.l_f
+        log_fert = self.log_fert
+        log_lex = self.log_lex
+        while True:
+            fert = self.fertility(a)
+            zeros, total = self.score(a, fert)
+            best = None
+            best_total = None
+
+            # Moves
+            for j in range(1, l_e+1):
+                if j == j_pegged:
+                    continue
+                old = a[j]
+                lex_z, lex_x = log_lex[j][old]
+                dec_z, dec_x = log_fert[old][fert[old] - 1]
+                old_z, old_x = log_fert[old][fert[old]]
+                for i in range(0, l_f+1):
+                    if i == old:
+                        continue
+                    new_z, new_x = log_lex[j][i]
+                    inc_z, inc_x = log_fert[i][fert[i] + 1]
+                    cur_z, cur_x = log_fert[i][fert[i]]
+                    z = (zeros + new_z - lex_z + dec_z - old_z +
+                         inc_z - cur_z)
+                    if z:
+                        continue
+                    x = (total + new_x - lex_x + dec_x - old_x +
+                         inc_x - cur_x)
+                    if best_total is None or x > best_total:
+                        best, best_total = (j, i, None), x
+
+            # Swaps
+            for j_one in range(1, l_e+1):
+                if j_one == j_pegged:
+                    continue
+                for j_two in range(j_one+1, l_e+1):
+                    if j_two == j_pegged or a[j_one] == a[j_two]:
+                        continue
+                    one_z, one_x = log_lex[j_one][a[j_two]]
+                    two_z, two_x = log_lex[j_two][a[j_one]]
+                    old_one_z, old_one_x = log_lex[j_one][a[j_one]]
+                    old_two_z, old_two_x = log_lex[j_two][a[j_two]]
+                    if zeros + one_z + two_z - old_one_z - old_two_z:
+                        continue
+                    x = total + one_x + two_x - old_one_x - old_two_x
+                    if best_total is None or x > best_total:
+                        best, best_total = (j_one, a[j_two], j_two), x
+
+            if best is None or (zeros == 0 and
+                                best_total <= total + _LOG_TOLERANCE):
+                # Until this alignment is the highest one in local
+                return a
+
+            a = list(a)
+            j, i, j_two = best
+            if j_two is not None:
+                a[j_two] = a[j]
+            a[j] = i
+            a = tuple(a)
+
+    def neighboring(self, a, j_pegged):
+        """
+        Return the set of alignments that can be reached from the given
+        alignment by moving or swapping one alignment point other than
+        the pegged one (including the alignment itself, if there are any).
+        """
+        N = set()
+        l_e, l_f = self.l_e, self.l_f
+        for j in range(1, l_e+1):
+            if j != j_pegged:
+                # Moves
+                for i in range(0, l_f+1):
+                    N.add(a[:j] + (i,) + a[j+1:])
+        for j_one in range(1, l_e+1):
+            if j_one != j_pegged:
+                # Swaps
+                for j_two in range(j_one+1, l_e+1):
+                    if j_two != j_pegged:
+                        new_align = list(a)
+                        new_align[j_one] = a[j_two]
+                        new_align[j_two] = a[j_one]
+                        N.add(tuple(new_align))
+        return N
+
+#: Neighboring alignments must be more probable than the current one by
+#: more than this (in log space) for the hill climbing search to move, so
+#: that rounding errors cannot make it cycle between equally probable
+#: alignments.
+_LOG_TOLERANCE = 1e-9
+
+def _log_factor(x):
+    """
+    Return a factor of a probability as a pair of 1 (if it is zero) or 0,
+    and its log (or 0).
+    """
+    if x == 0:
+        return (1, 0.0)
+    return (0, log(x))
+
 # run doctests
 if __name__ == "__main__":
     import doctest
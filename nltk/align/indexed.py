@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+# Natural Language Toolkit: Array-based IBM Model 1 and 2 training
+#
+# Copyright (C) 2001-2013 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Array-based EM training for IBM Models 1 and 2.
+
+``IBMModel1`` and ``IBMModel2`` keep their probability tables in nested
+dictionaries keyed by words, with an entry for every pair of words in
+the two vocabularies, and train them with Python loops over every word
+pair of every sentence pair.  An ``IndexedBitext`` instead maps the
+words of each language to integer ids, stores the sentences in flat
+arrays, and keeps one table entry for each pair of words that actually
+co-occur in some sentence pair.  The E-step is then computed with array
+operations over batches of sentence pairs, and can be split across
+several worker processes, whose expected counts are added up at the end
+of each iteration.
+
+The trained models are the same as those found by ``IBMModel1`` and
+``IBMModel2``; they are returned as ``TranslationTable`` and
+``AlignmentTable`` objects, which support the same ``t[e][f]`` and
+``a[i][j][l_e][l_f]`` lookups as the nested dictionaries:
+
+    >>> from nltk.align import AlignedSent
+    >>> from nltk.align.indexed import IndexedBitext, train_ibm1
+    >>> bitext = IndexedBitext([AlignedSent(['the', 'house'], ['das', 'Haus']),
+    ...                         AlignedSent(['the', 'book'], ['das', 'Buch']),
+    ...                         AlignedSent(['a', 'book'], ['ein', 'Buch'])])
+    >>> t = train_ibm1(bitext, 20)
+    >>> print(round(t['the']['das'], 1))
+    1.0
+    >>> print(round(t['book'][None], 1))
+    0.5
+
+``IBMModel1`` and ``IBMModel2`` use these functions when they are given
+``algorithm='indexed'``, optionally with several worker processes:
+
+    >>> from nltk.align import IBMModel1, IBMModel2
+    >>> corpus = [AlignedSent(['the', 'house'], ['das', 'Haus']),
+    ...           AlignedSent(['the', 'book'], ['das', 'Buch']),
+    ...           AlignedSent(['a', 'book'], ['ein', 'Buch'])]
+    >>> em_ibm1 = IBMModel1(corpus, 20)
+    >>> idx_ibm1 = IBMModel1(corpus, 20, algorithm='indexed')
+    >>> abs(idx_ibm1.probabilities['a']['Buch'] -
+    ...     em_ibm1.probabilities['a']['Buch']) < 1e-12
+    True
+
+    >>> em_ibm2 = IBMModel2(corpus, 5)
+    >>> idx_ibm2 = IBMModel2(corpus, 5, algorithm='indexed', processes=2)
+    >>> abs(idx_ibm2.probabilities['book']['Buch'] -
+    ...     em_ibm2.probabilities['book']['Buch']) < 1e-12
+    True
+    >>> abs(idx_ibm2.alignments[1][2][2][2] -
+    ...     em_ibm2.alignments[1][2][2][2]) < 1e-12
+    True
+    >>> idx_ibm2.align(corpus[0]).alignment
+    Alignment([(0, 0), (1, 1)])
+
+These functions require numpy.
+"""
+from __future__ import division
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+def _check_numpy():
+    if numpy is None:
+        raise ImportError('nltk.align.indexed requires numpy')
+
+class IndexedBitext(object):
+    """
+    A corpus of sentence pairs, encoded as arrays of integer word ids.
+
+    Id 0 of the foreign vocabulary is the NULL word (``None``), which is
+    prepended to each foreign sentence.  Each pair of an English word and
+    a foreign word that occur in the same sentence pair is assigned a
+    *pair index*, which indexes the translation probability arrays.  Each
+    distinct combination of sentence lengths is assigned a block of the
+    alignment probability arrays.
+    """
+
+    #: The maximum number of (English word, foreign word) token pairs
+    #: that are processed in a single batch.
+    BATCH_SIZE = 2**20
+
+    def __init__(self, align_sents):
+        """
+        :param align_sents: The sentence pairs.
+        :type align_sents: list(AlignedSent)
+        """
+        _check_numpy()
+        self.en_vocab = []
+        self.fr_vocab = [None]
+        self.en_ids = {}
+        self.fr_ids = {None: 0}
+        en_tokens = []
+        fr_tokens = []
+        en_lengths = []
+        fr_lengths = []
+        for align_sent in align_sents:
+            for word in align_sent.words:
+                en_tokens.append(self._intern(word, self.en_ids,
+                                              self.en_vocab))
+            fr_tokens.append(0)
+            for word in align_sent.mots:
+                fr_tokens.append(self._intern(word, self.fr_ids,
+                                              self.fr_vocab))
+            en_lengths.append(len(align_sent.words))
+            fr_lengths.append(len(align_sent.mots) + 1)
+
+        self.en_tokens = numpy.array(en_tokens, numpy.int64)
+        self.fr_tokens = numpy.array(fr_tokens, numpy.int64)
+        # the foreign lengths include the NULL word
+        self.en_lengths = numpy.array(en_lengths, numpy.int64)
+        self.fr_lengths = numpy.array(fr_lengths, numpy.int64)
+        self.en_starts = _starts(self.en_lengths)
+        self.fr_starts = _starts(self.fr_lengths)
+        self.pair_starts = _starts(self.en_lengths * self.fr_lengths)
+
+        # the co-occurring word pairs, as sorted keys e * |F| + f
+        self.pair_keys = numpy.zeros(0, numpy.int64)
+        keys = [numpy.unique(self._token_pairs(start, stop)[0])
+                for (start, stop) in self.batches()]
+        if keys:
+            self.pair_keys = numpy.unique(numpy.concatenate(keys))
+        self.pair_fr = self.pair_keys % len(self.fr_vocab)
+
+        # the alignment probability blocks, one for each (l_e, l_f)
+        shape_ids = {}
+        self.shapes = []
+        sentence_shapes = []
+        for (l_e, l_f) in zip(en_lengths, fr_lengths):
+            shape = (l_e, l_f - 1)
+            sentence_shapes.append(self._intern(shape, shape_ids,
+                                                self.shapes))
+        self.shape_ids = shape_ids
+        self.sentence_shapes = numpy.array(sentence_shapes, numpy.int64)
+        #: the number of sentence pairs with each shape
+        self.shape_counts = numpy.bincount(self.sentence_shapes,
+                                           minlength=len(self.shapes))
+        self.shape_starts = _starts(numpy.array(
+            [l_e * (l_f + 1) for (l_e, l_f) in self.shapes], numpy.int64))
+
+    @staticmethod
+    def _intern(value, ids, values):
+        i = ids.get(value)
+        if i is None:
+            i = ids[value] = len(values)
+            values.append(value)
+        return i
+
+    def __len__(self):
+        return len(self.en_lengths)
+
+    def num_pairs(self):
+        """
+        :return: The number of distinct co-occurring word pairs.
+        """
+        return len(self.pair_keys)
+
+    def num_alignment_params(self):
+        """
+        :return: The size of the alignment probability arrays.
+        """
+        return int(self.shape_starts[-1])
+
+    def batches(self, start=0, stop=None):
+        """
+        Split the sentence pairs from ``start`` to ``stop`` into batches
+        with at most ``BATCH_SIZE`` token pairs each (unless a single
+        sentence pair has more).
+
+        :return: An iterator over ``(start, stop)`` sentence ranges.
+        """
+        if stop is None:
+            stop = len(self)
+        while start < stop:
+            end = numpy.searchsorted(
+                self.pair_starts, self.pair_starts[start] + self.BATCH_SIZE,
+                side='right') - 1
+            end = min(max(end, start + 1), stop)
+            yield start, end
+            start = end
+
+    def _token_pairs(self, start, stop):
+        """
+        Return arrays describing every (English token, foreign token)
+        pair of the sentence pairs from ``start`` to ``stop``, ordered by
+        sentence, then English position, then foreign position:
+
+          - the word pair key ``e * |F| + f``
+          - the position of the English token, relative to the batch
+          - the sentence index
+          - the index of the token pair within its sentence pair, which
+            is ``(j-1) * (l_f+1) + i`` for English position j and foreign
+            position i
+        """
+        counts = (self.en_lengths[start:stop] *
+                  self.fr_lengths[start:stop])
+        sent = numpy.repeat(numpy.arange(start, stop), counts)
+        k = (numpy.arange(counts.sum()) -
+             numpy.repeat(self.pair_starts[start:stop] -
+                          self.pair_starts[start], counts))
+        fr_lengths = self.fr_lengths[sent]
+        en_pos = self.en_starts[sent] + k // fr_lengths
+        fr_pos = self.fr_starts[sent] + k % fr_lengths
+        keys = (self.en_tokens[en_pos] * len(self.fr_vocab) +
+                self.fr_tokens[fr_pos])
+        return keys, en_pos - self.en_starts[start], sent, k
+
+    def expected_counts(self, t, a=None, start=0, stop=None):
+        """
+        Run the E-step over the sentence pairs from ``start`` to ``stop``.
+
+        :param t: The translation probability of each word pair.
+        :param a: The alignment probabilities (for Model 2), or None (for
+            Model 1).
+        :return: The expected counts of each word pair, and of each
+            alignment parameter (or None).
+        """
+        count_t = numpy.zeros(len(t))
+        count_a = None if a is None else numpy.zeros(len(a))
+        for (b_start, b_stop) in self.batches(start, stop):
+            keys, en_pos, sent, k = self._token_pairs(b_start, b_stop)
+            pairs = numpy.searchsorted(self.pair_keys, keys)
+            p = t[pairs]
+            if a is not None:
+                params = self.shape_starts[self.sentence_shapes[sent]] + k
+                p = p * a[params]
+            # normalise over the foreign words of each English token
+            total_e = numpy.bincount(en_pos, weights=p)
+            c = p / total_e[en_pos]
+            count_t += numpy.bincount(pairs, weights=c, minlength=len(t))
+            if a is not None:
+                count_a += numpy.bincount(params, weights=c,
+                                          minlength=len(a))
+        return count_t, count_a
+
+######################################################################
+#{ Training
+######################################################################
+
+def train_ibm1(bitext, num_iter, processes=1, t=None):
+    """
+    Train IBM Model 1 on an indexed bitext, giving the same model as
+    ``IBMModel1``.
+
+    :param bitext: The sentence pairs.
+    :type bitext: IndexedBitext
+    :param num_iter: The number of EM iterations.
+    :param processes: The number of worker processes used to compute
+        the expected counts.
+    :param t: If given, the initial translation probability array,
+        rather than the uniform distribution.
+    :rtype: TranslationTable
+    """
+    _check_numpy()
+    init_prob = 1 / len(bitext.en_vocab)
+    if t is None:
+        t = numpy.empty(bitext.num_pairs())
+        t.fill(init_prob)
+    collector = _CountCollector(bitext, processes)
+    try:
+        for i in range(num_iter):
+            count_t, _ = collector.expected_counts(t, None)
+            t = _normalise_translations(bitext, count_t)
+    finally:
+        collector.close()
+    missing = init_prob if num_iter == 0 else 0.0
+    return TranslationTable(bitext, t, init_prob, missing)
+
+def train_ibm2(bitext, num_iter, processes=1, ibm1_iter=10):
+    """
+    Train IBM Model 2 on an indexed bitext, giving the same model as
+    ``IBMModel2``.  The translation probabilities are initialised with
+    ``ibm1_iter`` iterations of Model 1.
+
+    :param bitext: The sentence pairs.
+    :type bitext: IndexedBitext
+    :param num_iter: The number of EM iterations.
+    :param processes: The number of worker processes used to compute
+        the expected counts.
+    :rtype: tuple(TranslationTable, AlignmentTable)
+    """
+    _check_numpy()
+    t = train_ibm1(bitext, ibm1_iter, processes).probs
+
+    # a(i|j,l_e,l_f) = 1/(l_f + 1)
+    a = numpy.empty(bitext.num_alignment_params())
+    for (s, (l_e, l_f)) in enumerate(bitext.shapes):
+        a[bitext.shape_starts[s]:bitext.shape_starts[s+1]] = 1 / (l_f + 1)
+
+    collector = _CountCollector(bitext, processes)
+    try:
+        for i in range(num_iter):
+            count_t, count_a = collector.expected_counts(t, a)
+            t = _normalise_translations(bitext, count_t)
+            a = _normalise_alignments(bitext, count_a)
+    finally:
+        collector.close()
+    return (TranslationTable(bitext, t, 0.0, 0.0),
+            AlignmentTable(bitext, a))
+
+def _normalise_translations(bitext, count_t):
+    # t(e|f) = count(e, f) / count(f)
+    total_f = numpy.bincount(bitext.pair_fr, weights=count_t,
+                             minlength=len(bitext.fr_vocab))
+    return count_t / total_f[bitext.pair_fr]
+
+def _normalise_alignments(bitext, count_a):
+    a = numpy.empty(len(count_a))
+    for (s, (l_e, l_f)) in enumerate(bitext.shapes):
+        start, stop = bitext.shape_starts[s], bitext.shape_starts[s+1]
+        block = count_a[start:stop].reshape(l_e, l_f + 1)
+
+        # IBMModel2 smooths the counts once for every sentence pair with
+        # these lengths, each time adding half of the smallest positive
+        # count (or of 1, if that is smaller) to every count, and l_e times
+        # that amount to each total.  After the first time, the smallest
+        # positive count is just the smallest count plus the amounts
+        # added so far.
+        positive = block[block > 0]
+        laplace = min(1.0, positive.min()) if len(positive) else 1.0
+        smallest = block.min()
+        added = 0.0
+        for n in range(bitext.shape_counts[s]):
+            added += laplace * 0.5
+            laplace = min(1.0, smallest + added)
+
+        totals = block.sum(axis=1) + added * l_e
+        a[start:stop] = ((block + added) /
+                         totals[:, numpy.newaxis]).reshape(-1)
+    return a
+
+class _CountCollector(object):
+    """
+    Computes the expected counts of a bitext, optionally by splitting it
+    into one contiguous shard for each of several worker processes.
+    """
+    def __init__(self, bitext, processes=1):
+        self._bitext = bitext
+        self._workers = None
+        if processes > 1 and len(bitext) > 1:
+            import multiprocessing
+            self._workers = multiprocessing.Pool(
+                processes, _init_worker, (bitext,))
+            bounds = numpy.linspace(0, len(bitext), processes + 1)
+            bounds = sorted(set(int(b) for b in bounds))
+            self._shards = list(zip(bounds[:-1], bounds[1:]))
+
+    def expected_counts(self, t, a):
+        if self._workers is None:
+            return self._bitext.expected_counts(t, a)
+        results = self._workers.map(
+            _expected_counts_in_worker,
+            [(t, a, start, stop) for (start, stop) in self._shards])
+        count_t = sum(result[0] for result in results)
+        count_a = None if a is None else sum(result[1] for result in results)
+        return count_t, count_a
+
+    def close(self):
+        if self._workers is not None:
+            self._workers.close()
+            self._workers.join()
+            self._workers = None
+
+_worker_bitext = None
+
+def _init_worker(bitext):
+    global _worker_bitext
+    _worker_bitext = bitext
+
+def _expected_counts_in_worker(args):
+    t, a, start, stop = args
+    return _worker_bitext.expected_counts(t, a, start, stop)
+
+######################################################################
+#{ Probability Tables
+######################################################################
+
+class _PartialKey(object):
+    """
+    The result of indexing a table with some, but not all, of the keys
+    of a probability, as in ``t[e]``.
+    """
+    def __init__(self, prob, keys, depth):
+        self._prob = prob
+        self._keys = keys
+        self._depth = depth
+
+    def __getitem__(self, key):
+        keys = self._keys + (key,)
+        if len(keys) == self._depth:
+            return self._prob(*keys)
+        return _PartialKey(self._prob, keys, self._depth)
+
+class TranslationTable(object):
+    """
+    The translation probabilities t(e|f) of an IBM model that was trained
+    on an ``IndexedBitext``, looked up with ``t[e][f]`` or ``t.prob(e, f)``.
+    """
+    def __init__(self, bitext, probs, default, missing=0.0):
+        """
+        :param probs: The probability of each co-occurring word pair.
+        :param default: The probability of word pairs that contain an
+            unknown word.
+        :param missing: The probability of word pairs of known words
+            that never co-occur.
+        """
+        self._bitext = bitext
+        self.probs = probs
+        self._default = default
+        self._missing = missing
+
+    def prob(self, e, f):
+        bitext = self._bitext
+        e_id = bitext.en_ids.get(e)
+        f_id = bitext.fr_ids.get(f)
+        if e_id is None or f_id is None:
+            return self._default
+        key = e_id * len(bitext.fr_vocab) + f_id
+        i = numpy.searchsorted(bitext.pair_keys, key)
+        if i < len(bitext.pair_keys) and bitext.pair_keys[i] == key:
+            return float(self.probs[i])
+        return self._missing
+
+    def __getitem__(self, e):
+        return _PartialKey(self.prob, (e,), 2)
+
+    def __repr__(self):
+        return '<TranslationTable with %d word pairs>' % len(self.probs)
+
+class AlignmentTable(object):
+    """
+    The alignment probabilities a(i|j,l_e,l_f) of an IBM Model 2 that was
+    trained on an ``IndexedBitext``, looked up with ``a[i][j][l_e][l_f]``
+    or ``a.prob(i, j, l_e, l_f)``.
+    """
+    def __init__(self, bitext, probs):
+        self._bitext = bitext
+        self.probs = probs
+
+    def prob(self, i, j, l_e, l_f):
+        s = self._bitext.shape_ids.get((l_e, l_f))
+        if s is None or not (0 <= i <= l_f and 1 <= j <= l_e):
+            return 0.0
+        return float(self.probs[self._bitext.shape_starts[s] +
+                                (j - 1) * (l_f + 1) + i])
+
+    def __getitem__(self, i):
+        return _PartialKey(self.prob, (i,), 4)
+
+    def __repr__(self):
+        return '<AlignmentTable with %d parameters>' % len(self.probs)
+
+def _starts(lengths):
+    """
+    Return the offsets of consecutive blocks of the given lengths,
+    followed by their total length.
+    """
+    starts = numpy.zeros(len(lengths) + 1, numpy.int64)
+    numpy.cumsum(lengths, out=starts[1:])
+    return starts
+
+# skip doctests if numpy is not installed
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except ImportError:
+        raise SkipTest("numpy is not installed")
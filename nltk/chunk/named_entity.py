@@ -50,64 +50,88 @@ class NEChunkParserTagger(ClassifierBasedTagger):
             wl = self._en_wordlist
         return wl
 
+    #: The maximum number of words whose word-level features are
+    #: memoized by ``_word_features()``.
+    _WORD_CACHE_SIZE = 100000
+
     def _feature_detector(self, tokens, index, history):
+        return self.history_features(tokens, index, history,
+                                     self.context_features(tokens, index))
+
+    def context_features(self, tokens, index):
         word = tokens[index][0]
         pos = simplify_pos(tokens[index][1])
         if index == 0:
-            prevword = prevprevword = None
-            prevpos = prevprevpos = None
-            prevshape = prevtag = prevprevtag = None
-        elif index == 1:
-            prevword = tokens[index-1][0].lower()
-            prevprevword = None
-            prevpos = simplify_pos(tokens[index-1][1])
-            prevprevpos = None
-            prevtag = history[index-1][0]
-            prevshape = prevprevtag = None
+            prevword = None
+            prevpos = None
         else:
             prevword = tokens[index-1][0].lower()
-            prevprevword = tokens[index-2][0].lower()
             prevpos = simplify_pos(tokens[index-1][1])
-            prevprevpos = simplify_pos(tokens[index-2][1])
-            prevtag = history[index-1]
-            prevprevtag = history[index-2]
-            prevshape = shape(prevword)
         if index == len(tokens)-1:
-            nextword = nextnextword = None
-            nextpos = nextnextpos = None
-        elif index == len(tokens)-2:
-            nextword = tokens[index+1][0].lower()
-            nextpos = tokens[index+1][1].lower()
-            nextnextword = None
-            nextnextpos = None
+            nextword = None
+            nextpos = None
         else:
             nextword = tokens[index+1][0].lower()
             nextpos = tokens[index+1][1].lower()
-            nextnextword = tokens[index+2][0].lower()
-            nextnextpos = tokens[index+2][1].lower()
+
+        wordshape, lower, prefix3, suffix3, in_wordlist = \
+            self._word_features(word)
 
         # 89.6
         features = {
             'bias': True,
-            'shape': shape(word),
+            'shape': wordshape,
             'wordlen': len(word),
-            'prefix3': word[:3].lower(),
-            'suffix3': word[-3:].lower(),
+            'prefix3': prefix3,
+            'suffix3': suffix3,
             'pos': pos,
             'word': word,
-            'en-wordlist': (word in self._english_wordlist()),
-            'prevtag': prevtag,
+            'en-wordlist': in_wordlist,
             'prevpos': prevpos,
             'nextpos': nextpos,
             'prevword': prevword,
             'nextword': nextword,
-            'word+nextpos': '%s+%s' % (word.lower(), nextpos),
-            'pos+prevtag': '%s+%s' % (pos, prevtag),
-            'shape+prevtag': '%s+%s' % (prevshape, prevtag),
+            'word+nextpos': '%s+%s' % (lower, nextpos),
             }
+        return features
+
+    def history_features(self, tokens, index, history, context):
+        if index == 0:
+            prevshape = prevtag = None
+        elif index == 1:
+            prevtag = history[index-1][0]
+            prevshape = None
+        else:
+            prevtag = history[index-1]
+            prevshape = self._word_features(tokens[index-1][0].lower())[0]
 
+        features = dict(context)
+        features['prevtag'] = prevtag
+        features['pos+prevtag'] = '%s+%s' % (context['pos'], prevtag)
+        features['shape+prevtag'] = '%s+%s' % (prevshape, prevtag)
         return features
 
+    def _word_features(self, word):
+        """
+        Return a tuple ``(shape, lowercase, prefix3, suffix3,
+        in_wordlist)`` for the given word.  These are memoized, since they are relatively expensive
+        to compute and most words occur many times.
+        """
+        cache = self.__dict__.setdefault('_word_cache', {})
+        result = cache.get(word)
+        if result is None:
+            result = (shape(word), word.lower(), word[:3].lower(),
+                      word[-3:].lower(), word in self._english_wordlist())
+            if len(cache) >= self._WORD_CACHE_SIZE:
+                cache.clear()
+            cache[word] = result
+        return result
+
+    def __getstate__(self):
+        state = ClassifierBasedTagger.__getstate__(self)
+        state.pop('_word_cache', None)
+        return state
+
 class NEChunkParser(ChunkParserI):
     """
     Expected input: list of pos-tagged words
@@ -10,7 +10,12 @@ A classifier model that decides which label to assign to a token on
 the basis of a tree structure, where branches correspond to conditions
 on feature values, and leaves correspond to label assignments.
 """
-from __future__ import print_function, unicode_literals
+from __future__ import print_function, unicode_literals, division
+
+try:
+    import numpy
+except ImportError:
+    pass
 
 from collections import defaultdict
 
@@ -129,12 +134,28 @@ class DecisionTreeClassifier(ClassifierI):
     @staticmethod
     def train(labeled_featuresets, entropy_cutoff=0.05, depth_cutoff=100,
               support_cutoff=10, binary=False, feature_values=None,
-              verbose=False):
+              verbose=False, algorithm=None, processes=1):
         """
         :param binary: If true, then treat all feature/value pairs as
             individual binary features, rather than using a single n-way
             branch for each feature.
+        :param algorithm: The induction algorithm to use.  ``'stump'``
+            (the default) builds and evaluates a complete stump for
+            every candidate feature at every node.  ``'indexed'``
+            encodes the featuresets once into integer columns and
+            scores candidate features from label histograms, which is
+            much faster on large training sets; it requires numpy.
+        :param processes: The number of worker processes used to score
+            candidate features when ``algorithm='indexed'``.
         """
+        if algorithm is not None and algorithm.lower() == 'indexed':
+            inducer = _IndexedTreeInducer(labeled_featuresets, binary,
+                                          feature_values, processes)
+            return inducer.train(entropy_cutoff, depth_cutoff,
+                                 support_cutoff, verbose)
+        elif algorithm is not None and algorithm.lower() != 'stump':
+            raise ValueError('Unknown algorithm %s' % algorithm)
+
         # Collect a list of all feature names.
         feature_names = set()
         for featureset, label in labeled_featuresets:
@@ -276,6 +297,274 @@ class DecisionTreeClassifier(ClassifierI):
                    (len(labeled_featuresets), descr, best_error)))
         return best_stump
 
+
+######################################################################
+#{ Indexed Induction
+######################################################################
+
+# The feature columns of the training set being induced in the current
+# worker process; see _IndexedTreeInducer._pool().
+_worker_inducer = None
+
+def _init_worker(inducer):
+    global _worker_inducer
+    _worker_inducer = inducer
+
+def _score_features_in_worker(args):
+    fids, idx, node_hist = args
+    return [_worker_inducer._score_feature(fid, idx, node_hist)
+            for fid in fids]
+
+class _IndexedTreeInducer(object):
+    """
+    A decision tree induction engine that works on an integer encoding
+    of the training set.  Each featureset is encoded once: labels and
+    feature values are interned to integer ids, and each feature is
+    stored as a pair of arrays ``(rows, codes)`` listing the training
+    instances where it is present and the id of its value there (value
+    id 0 is reserved for "missing", i.e. ``None``).
+
+    Each node of the tree is described by a sorted array of training
+    instance indices.  Candidate splits are scored from the
+    (value x label) histogram of each feature over those indices, which
+    is computed with a single ``numpy.bincount`` rather than by building
+    and evaluating a stump classifier; and child nodes are created by
+    partitioning the index array, without copying any featuresets.
+
+    The trees built by this engine have the same structure and leaves
+    as those built by ``DecisionTreeClassifier.stump()`` and
+    ``refine()``, up to ties between equally good features.
+    """
+    # Nodes with fewer instances than this are always scored serially,
+    # since the cost of dispatching them to workers would dominate.
+    PARALLEL_MIN_SIZE = 1000
+
+    def __init__(self, labeled_featuresets, binary=False,
+                 feature_values=None, processes=1):
+        self._binary = binary
+        self._processes = processes
+
+        self._labels = []
+        label_ids = {}
+        self._fnames = []
+        fname_ids = {}
+        self._fvals = []     # fid -> list of values, indexed by value id
+        fval_ids = []        # fid -> dict mapping value to value id
+        rows = []
+        codes = []
+        instance_labels = []
+        for i, (featureset, label) in enumerate(labeled_featuresets):
+            if label not in label_ids:
+                label_ids[label] = len(self._labels)
+                self._labels.append(label)
+            instance_labels.append(label_ids[label])
+            for fname, fval in featureset.items():
+                if fval is None:
+                    continue
+                fid = fname_ids.get(fname)
+                if fid is None:
+                    fid = fname_ids[fname] = len(self._fnames)
+                    self._fnames.append(fname)
+                    self._fvals.append([None])
+                    fval_ids.append({})
+                    rows.append([])
+                    codes.append([])
+                vid = fval_ids[fid].get(fval)
+                if vid is None:
+                    vid = fval_ids[fid][fval] = len(self._fvals[fid])
+                    self._fvals[fid].append(fval)
+                rows[fid].append(i)
+                codes[fid].append(vid)
+
+        self._y = numpy.array(instance_labels, dtype=numpy.intp)
+        self._rows = [numpy.array(r, dtype=numpy.intp) for r in rows]
+        self._codes = [numpy.array(c, dtype=numpy.intp) for c in codes]
+
+        # For binary trees, the value ids that may be tested for each
+        # feature.
+        if binary:
+            self._tested = []
+            for fid, fname in enumerate(self._fnames):
+                if feature_values is None:
+                    tested = numpy.ones(len(self._fvals[fid]), dtype=bool)
+                else:
+                    tested = numpy.zeros(len(self._fvals[fid]), dtype=bool)
+                    for fval in feature_values.get(fname, ()):
+                        vid = fval_ids[fid].get(fval)
+                        if vid is not None:
+                            tested[vid] = True
+                tested[0] = False
+                self._tested.append(tested)
+
+    def train(self, entropy_cutoff, depth_cutoff, support_cutoff, verbose):
+        self._entropy_cutoff = entropy_cutoff
+        self._support_cutoff = support_cutoff
+        self._verbose = verbose
+        self._workers = None
+        if self._processes > 1 and len(self._fnames) > 1:
+            import multiprocessing
+            self._workers = multiprocessing.Pool(
+                self._processes, _init_worker, (self,))
+        try:
+            idx = numpy.arange(len(self._y))
+            return self._train(idx, depth_cutoff)
+        finally:
+            if self._workers is not None:
+                self._workers.close()
+                self._workers.join()
+                self._workers = None
+
+    def __getstate__(self):
+        # Worker processes get a copy of the encoded training set, but
+        # not of the pool itself.
+        state = self.__dict__.copy()
+        state['_workers'] = None
+        return state
+
+    #////////////////////////////////////////////////////////////
+    # Histograms
+    #////////////////////////////////////////////////////////////
+
+    def _label_hist(self, idx):
+        return numpy.bincount(self._y[idx], minlength=len(self._labels))
+
+    def _majority(self, idx, hist):
+        """
+        Return the most frequent label in ``idx``.  Like
+        ``FreqDist.max()``, ties are broken in favor of the label that
+        occurs first.
+        """
+        best = numpy.flatnonzero(hist == hist.max())
+        if len(best) > 1:
+            y = self._y[idx]
+            best = [min(best, key=lambda l: (y == l).argmax())]
+        return self._labels[best[0]]
+
+    def _node_codes(self, fid, idx):
+        """
+        Return an array giving the value id of feature ``fid`` for each
+        of the (sorted) instance indices ``idx``.
+        """
+        rows = self._rows[fid]
+        result = numpy.zeros(len(idx), dtype=numpy.intp)
+        if len(rows) == 0:
+            return result
+        pos = numpy.searchsorted(rows, idx)
+        pos[pos == len(rows)] = 0
+        found = rows[pos] == idx
+        result[found] = self._codes[fid][pos[found]]
+        return result
+
+    def _value_hist(self, fid, idx, node_hist):
+        """
+        Return a (value x label) count matrix for feature ``fid`` over
+        the instances ``idx``.  Row 0 counts instances where the
+        feature is missing.
+        """
+        rows = self._rows[fid]
+        nvals, nlabels = len(self._fvals[fid]), len(self._labels)
+        pos = numpy.searchsorted(rows, idx)
+        pos[pos == len(rows)] = 0
+        found = rows[pos] == idx
+        cells = self._codes[fid][pos[found]] * nlabels + self._y[idx[found]]
+        hist = numpy.bincount(cells, minlength=nvals * nlabels)
+        hist = hist.reshape(nvals, nlabels)
+        hist[0] = node_hist - hist[1:].sum(axis=0)
+        return hist
+
+    def _score_feature(self, fid, idx, node_hist):
+        """
+        Return ``(errors, vid)`` for the best stump on feature ``fid``,
+        where ``errors`` is the number of training instances in ``idx``
+        that it misclassifies, and ``vid`` is the tested value id for
+        binary stumps (or None for n-way stumps).
+        """
+        hist = self._value_hist(fid, idx, node_hist)
+        if not self._binary:
+            return len(idx) - hist.max(axis=1).sum(), None
+        tested = self._tested[fid]
+        if not tested.any():
+            return len(idx), None
+        neg = node_hist - hist
+        errors = len(idx) - hist.max(axis=1) - neg.max(axis=1)
+        errors = numpy.where(tested, errors, len(idx))
+        vid = int(errors.argmin())
+        return errors[vid], vid
+
+    def _entropy(self, hist):
+        p = hist[hist > 0] / float(hist.sum())
+        return -(p * numpy.log2(p)).sum()
+
+    #////////////////////////////////////////////////////////////
+    # Induction
+    #////////////////////////////////////////////////////////////
+
+    def _best_split(self, idx, node_hist):
+        fids = range(len(self._fnames))
+        if self._workers is not None and len(idx) >= self.PARALLEL_MIN_SIZE:
+            chunks = [(fids[i::self._processes], idx, node_hist)
+                      for i in range(self._processes)]
+            results = self._workers.map(_score_features_in_worker, chunks)
+            scores = [None] * len(fids)
+            for i, chunk_scores in enumerate(results):
+                scores[i::self._processes] = chunk_scores
+        else:
+            scores = [self._score_feature(fid, idx, node_hist)
+                      for fid in fids]
+
+        best_errors, best_fid, best_vid = len(idx) - node_hist.max(), None, None
+        for fid, (errors, vid) in enumerate(scores):
+            if errors < best_errors:
+                best_errors, best_fid, best_vid = errors, fid, vid
+        return best_errors, best_fid, best_vid
+
+    def _train(self, idx, depth_cutoff):
+        node_hist = self._label_hist(idx)
+        label = self._majority(idx, node_hist)
+        errors, fid, vid = self._best_split(idx, node_hist)
+
+        if self._verbose:
+            if fid is None:
+                descr = None if not self._binary else '(default)'
+            elif self._binary:
+                descr = '%s=%s' % (self._fnames[fid], self._fvals[fid][vid])
+            else:
+                descr = self._fnames[fid]
+            print(('best stump for %6d toks uses %-20s err=%6.4f' %
+                   (len(idx), descr, errors / len(idx))))
+
+        if fid is None:
+            return DecisionTreeClassifier(label)
+
+        # Partition the instances by the value of the chosen feature.
+        # For binary stumps, the instances that do not have the tested
+        # value go to the default branch (whose key is None).
+        node_codes = self._node_codes(fid, idx)
+        if self._binary:
+            pos = node_codes == vid
+            branches = [(self._fvals[fid][vid], idx[pos]), (None, idx[~pos])]
+        else:
+            branches = [(self._fvals[fid][v], idx[node_codes == v])
+                        for v in numpy.unique(node_codes)]
+
+        refine = len(idx) > self._support_cutoff and depth_cutoff > 1
+        decisions, default = {}, None
+        for i, (fval, child_idx) in enumerate(branches):
+            if len(child_idx) == 0:
+                continue
+            child_hist = self._label_hist(child_idx)
+            if refine and self._entropy(child_hist) > self._entropy_cutoff:
+                child = self._train(child_idx, depth_cutoff - 1)
+            else:
+                child = DecisionTreeClassifier(
+                    self._majority(child_idx, child_hist))
+            if self._binary and i == 1:
+                default = child
+            else:
+                decisions[fval] = child
+        return DecisionTreeClassifier(label, self._fnames[fid], decisions,
+                                      default)
+
 ##//////////////////////////////////////////////////////
 ##  Demo
 ##//////////////////////////////////////////////////////
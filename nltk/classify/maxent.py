@@ -56,9 +56,11 @@ __docformat__ = 'epytext en'
 
 try:
     import numpy
+    from scipy import sparse
 except ImportError:
     pass
 
+import math
 import time
 import tempfile
 import os
@@ -304,6 +306,47 @@ class MaxentClassifier(ClassifierI):
         else:
             raise ValueError('Unknown algorithm %s' % algorithm)
 
+    @classmethod
+    def train_vectors(cls, X, labels, vectorizer, algorithm=None, trace=3,
+                      **cutoffs):
+        """
+        Train a new maxent classifier from training samples whose
+        featuresets have already been converted to a feature matrix
+        by a vectorizer (see ``nltk.classify.vectorizer``).  The
+        joint-features of the classifier are the ``(column, label)``
+        pairs that are attested in ``X``; see
+        ``VectorizedMaxentFeatureEncoding``.  Each training iteration
+        works directly on ``X``, so featuresets are never re-encoded.
+
+        :rtype: MaxentClassifier
+        :param X: The feature matrix, with one row per training sample.
+        :type X: scipy.sparse.spmatrix
+        :param labels: The label of each training sample.
+        :type labels: list
+        :param vectorizer: The vectorizer that was used to build ``X``.
+            It is used to encode the featuresets that are given to the
+            trained classifier.
+        :type vectorizer: FeatureVectorizerI
+        :param algorithm: ``'GIS'`` or ``'IIS'`` (the default).
+        :param cutoffs: See ``train()``.
+        """
+        if algorithm is None:
+            algorithm = 'iis'
+        for key in cutoffs:
+            if key not in ('max_iter', 'min_ll', 'min_lldelta',
+                           'max_acc', 'min_accdelta'):
+                raise TypeError('Unexpected keyword arg %r' % key)
+        algorithm = algorithm.lower()
+        if algorithm == 'iis':
+            return train_maxent_classifier_with_iis_vectors(
+                X, labels, vectorizer, trace, **cutoffs)
+        elif algorithm == 'gis':
+            return train_maxent_classifier_with_gis_vectors(
+                X, labels, vectorizer, trace, **cutoffs)
+        else:
+            raise ValueError('Algorithm %s does not support vectorized '
+                             'training data' % algorithm)
+
 
 #: Alias for MaxentClassifier.
 ConditionalExponentialClassifier = MaxentClassifier
@@ -965,6 +1008,141 @@ class TypedMaxentFeatureEncoding(MaxentFeatureEncodingI):
 
 
 
+class VectorizedMaxentFeatureEncoding(MaxentFeatureEncodingI):
+    """
+    A feature encoding whose input-features are the columns of the
+    feature vectors that are generated by a vectorizer (see
+    ``nltk.classify.vectorizer``).  It defines one joint-feature for
+    each ``(column, label)`` pair that was attested in the training
+    data, whose value is the value of that column:
+
+    |   joint_feat(fs, l) = { vectorizer.encode(fs)[column] if l == label
+    |                       {
+    |                       { 0 otherwise
+
+    If a correction constant ``C`` is given, then a GIS correction
+    feature is also added (see ``GISEncoding``).
+
+    Unlike other encodings, this encoding can also encode a whole
+    feature matrix at once; see ``encode_matrix()``.
+    """
+    def __init__(self, vectorizer, labels, joint_features, C=None):
+        """
+        :param vectorizer: The vectorizer used to encode featuresets.
+        :type vectorizer: FeatureVectorizerI
+        :param labels: A list of the "known labels" for this encoding.
+        :param joint_features: A sorted array of the joint-features of
+            this encoding.  The joint-feature for ``(column, label)`` is
+            represented as ``column * len(labels) + labels.index(label)``,
+            and its joint-feature id is its index in this array.
+        :param C: The GIS correction constant, or None for no
+            correction feature.
+        """
+        self._vectorizer = vectorizer
+        self._labels = list(labels)
+        self._label_index = dict((l, i) for (i, l) in enumerate(self._labels))
+        self._joint_features = numpy.asarray(joint_features)
+        self._C = C
+
+    @property
+    def C(self):
+        """The GIS correction constant."""
+        if self._C is None:
+            raise AttributeError('This encoding has no correction feature')
+        return self._C
+
+    def _joint_fids(self, cols, label):
+        """
+        Return the joint-feature ids for the given columns and label,
+        and a mask of which columns have joint-features.
+        """
+        keys = numpy.asarray(cols) * len(self._labels) + self._label_index[label]
+        pos = numpy.searchsorted(self._joint_features, keys)
+        pos[pos == len(self._joint_features)] = 0
+        found = self._joint_features[pos] == keys
+        return pos, found
+
+    def encode(self, featureset, label):
+        vector = self._vectorizer.encode(featureset)
+        encoding = []
+        if vector and label in self._label_index:
+            cols, vals = compat.izip(*vector)
+            pos, found = self._joint_fids(cols, label)
+            encoding = [(int(fid), val) for (fid, val, ok)
+                        in zip(pos, vals, found) if ok]
+        if self._C is not None:
+            total = sum(v for (f, v) in encoding)
+            encoding.append((len(self._joint_features), self._C - total))
+        return encoding
+
+    def encode_matrix(self, X, label):
+        """
+        Encode each row of the feature matrix ``X`` with the given
+        label.
+
+        :return: A CSR matrix with one row for each row of ``X`` and
+            one column for each joint-feature.
+        :rtype: scipy.sparse.csr_matrix
+        """
+        X = sparse.csr_matrix(X)
+        rows = numpy.repeat(numpy.arange(X.shape[0]), numpy.diff(X.indptr))
+        pos, found = self._joint_fids(X.indices, label)
+        rows, fids, vals = rows[found], pos[found], X.data[found]
+        if self._C is not None:
+            totals = numpy.bincount(rows, vals, minlength=X.shape[0])
+            rows = numpy.concatenate([rows, numpy.arange(X.shape[0])])
+            fids = numpy.concatenate(
+                [fids, numpy.repeat(len(self._joint_features), X.shape[0])])
+            vals = numpy.concatenate([vals, self._C - totals])
+        return sparse.csr_matrix((vals, (rows, fids)),
+                                 shape=(X.shape[0], self.length()))
+
+    def labels(self):
+        # Inherit docs.
+        return self._labels
+
+    def length(self):
+        # Inherit docs.
+        if self._C is not None:
+            return len(self._joint_features) + 1
+        return len(self._joint_features)
+
+    def describe(self, f_id):
+        # Inherit docs.
+        if not isinstance(f_id, compat.integer_types):
+            raise TypeError('describe() expected an int')
+        if f_id == len(self._joint_features) and self._C is not None:
+            return 'Correction feature (%s)' % self._C
+        col, label_index = divmod(int(self._joint_features[f_id]),
+                                  len(self._labels))
+        return '%s and label is %r' % (self._vectorizer.describe(col),
+                                       self._labels[label_index])
+
+    @classmethod
+    def train(cls, X, labels, vectorizer, correction=False):
+        """
+        Construct and return a new feature encoding, based on a feature
+        matrix ``X`` and the labels of its rows.
+
+        :param correction: If true, then add a GIS correction feature,
+            whose correction constant is one more than the largest sum
+            of any row of ``X``.
+        """
+        X = sparse.csr_matrix(X)
+        label_set = sorted(set(labels))
+        label_index = dict((l, i) for (i, l) in enumerate(label_set))
+        y = numpy.array([label_index[l] for l in labels])
+        rows = numpy.repeat(numpy.arange(X.shape[0]), numpy.diff(X.indptr))
+        nonzero = X.data != 0
+        joint_features = numpy.unique(
+            X.indices[nonzero].astype(numpy.int64) * len(label_set) +
+            y[rows[nonzero]])
+        C = None
+        if correction:
+            C = float(numpy.asarray(X.sum(axis=1)).max()) + 1
+        return cls(vectorizer, label_set, joint_features, C)
+
+
 ######################################################################
 #{ Classifier Trainer: Generalized Iterative Scaling
 ######################################################################
@@ -1086,6 +1264,130 @@ def calculate_estimated_fcount(classifier, train_toks, encoding):
     return fcount
 
 
+def train_maxent_classifier_with_gis_vectors(X, labels, vectorizer, trace=3,
+                                             **cutoffs):
+    """
+    Train a new ``ConditionalExponentialClassifier`` from a feature
+    matrix, using the Generalized Iterative Scaling algorithm.  The
+    joint-feature vectors of all training samples are computed once,
+    as one sparse matrix per label, and each iteration is computed
+    with matrix products.
+
+    :see: ``MaxentClassifier.train_vectors()`` for parameter
+        descriptions.
+    """
+    cutoffs.setdefault('max_iter', 100)
+    cutoffchecker = CutoffChecker(cutoffs)
+
+    if (X.data < 0).any():
+        raise ValueError('The GIS algorithm requires non-negative '
+                         'feature values.')
+    encoding, matrices, y = encode_training_vectors(
+        X, labels, vectorizer, correction=True)
+    Cinv = 1.0/encoding.C
+
+    # Count how many times each feature occurs in the training data.
+    empirical_fcount = calculate_empirical_fcount_vectors(matrices, y)
+
+    # Start with weight=0 for each attested feature, and
+    # weight=-infinity for each unattested feature.
+    unattested = numpy.nonzero(empirical_fcount==0)[0]
+    weights = numpy.zeros(len(empirical_fcount), 'd')
+    weights[unattested] = -numpy.inf
+
+    log_empirical_fcount = numpy.log2(empirical_fcount)
+    del empirical_fcount
+
+    if trace > 0: print('  ==> Training (%d iterations)' % cutoffs['max_iter'])
+    if trace > 2:
+        print()
+        print('      Iteration    Log Likelihood    Accuracy')
+        print('      ---------------------------------------')
+
+    # Train the classifier.
+    try:
+        while True:
+            probs = calculate_label_probs(weights, matrices)
+            if trace > 2:
+                ll = cutoffchecker.ll or vectors_log_likelihood(probs, y)
+                acc = cutoffchecker.acc or vectors_accuracy(probs, y)
+                iternum = cutoffchecker.iter
+                print('     %9d    %14.5f    %9.3f' % (iternum, ll, acc))
+
+            # Use the model to estimate the number of times each
+            # feature should occur in the training data.
+            estimated_fcount = sum(matrix.T.dot(probs[:, i])
+                                   for (i, matrix) in enumerate(matrices))
+
+            # Take the log of estimated fcount (avoid taking log(0).)
+            estimated_fcount[unattested] += 1
+            log_estimated_fcount = numpy.log2(estimated_fcount)
+            del estimated_fcount
+
+            # Update the classifier weights
+            weights += (log_empirical_fcount - log_estimated_fcount) * Cinv
+
+            # Check the log-likelihood & accuracy cutoffs.
+            if cutoffchecker.check_log_likelihood(
+                    lambda: vectors_log_likelihood(
+                        calculate_label_probs(weights, matrices), y)):
+                break
+
+    except KeyboardInterrupt:
+        print('      Training stopped: keyboard interrupt')
+
+    if trace > 2:
+        probs = calculate_label_probs(weights, matrices)
+        ll = vectors_log_likelihood(probs, y)
+        acc = vectors_accuracy(probs, y)
+        print('         Final    %14.5f    %9.3f' % (ll, acc))
+
+    return ConditionalExponentialClassifier(encoding, weights)
+
+def encode_training_vectors(X, labels, vectorizer, correction=False):
+    """
+    Build a ``VectorizedMaxentFeatureEncoding`` for the feature matrix
+    ``X``, and use it to encode ``X`` with every label.
+
+    :return: A tuple ``(encoding, matrices, y)``, where ``matrices[i]``
+        is the joint-feature matrix of ``X`` with the ``i``\ th label
+        of ``encoding``, and ``y`` is an array of the label indices of
+        the rows of ``X``.
+    """
+    encoding = VectorizedMaxentFeatureEncoding.train(
+        X, labels, vectorizer, correction)
+    matrices = [encoding.encode_matrix(X, label)
+                for label in encoding.labels()]
+    label_index = dict((l, i) for (i, l) in enumerate(encoding.labels()))
+    y = numpy.array([label_index[l] for l in labels])
+    return encoding, matrices, y
+
+def calculate_empirical_fcount_vectors(matrices, y):
+    fcount = numpy.zeros(matrices[0].shape[1], 'd')
+    for i, matrix in enumerate(matrices):
+        fcount += numpy.asarray(matrix[y == i].sum(axis=0)).ravel()
+    return fcount
+
+def calculate_label_probs(weights, matrices):
+    """
+    :return: An array whose ``[j, i]``\ th element is the probability
+        that the model with the given weights assigns to the ``i``\ th
+        label for the ``j``\ th row of the encoded training data.
+    """
+    scores = numpy.column_stack([matrix.dot(weights) for matrix in matrices])
+    scores -= scores.max(axis=1)[:, numpy.newaxis]
+    probs = 2 ** scores
+    probs /= probs.sum(axis=1)[:, numpy.newaxis]
+    return probs
+
+def vectors_log_likelihood(probs, y):
+    return math.log(probs[numpy.arange(len(y)), y].mean())
+
+def vectors_accuracy(probs, y):
+    return (probs.argmax(axis=1) == y).mean()
+
+
+
 ######################################################################
 #{ Classifier Trainer: Improved Iterative Scaling
 ######################################################################
@@ -1267,14 +1569,6 @@ def calculate_deltas(train_toks, classifier, unattested, ffreq_empirical,
     :param nftranspose: The transpose of ``nfarray``
     :type nftranspose: array(float)
     """
-    # These parameters control when we decide that we've
-    # converged.  It probably should be possible to set these
-    # manually, via keyword arguments to train.
-    NEWTON_CONVERGE = 1e-12
-    MAX_NEWTON = 300
-
-    deltas = numpy.ones(encoding.length(), 'd')
-
     # Precompute the A matrix:
     # A[nf][id] = sum ( p(fs) * p(label|fs) * f(fs,label) )
     # over all label,fs s.t. num_features[label,fs]=nf
@@ -1293,6 +1587,25 @@ def calculate_deltas(train_toks, classifier, unattested, ffreq_empirical,
                 A[nfmap[nf], id] += dist.prob(label) * val
     A /= len(train_toks)
 
+    return solve_deltas(A, ffreq_empirical, unattested, nfarray, nftranspose)
+
+def solve_deltas(A, ffreq_empirical, unattested, nfarray, nftranspose):
+    """
+    Solve for the IIS update values, using Newton's method, given the
+    matrix ``A``, where ``A[nf][id]`` is the sum of
+    ``p(fs) * p(label|fs) * f[id](fs,label)`` over all ``(fs, label)``
+    such that ``nf(feature_vector(fs,label)) = nf``.
+
+    :see: ``calculate_deltas()``
+    """
+    # These parameters control when we decide that we've
+    # converged.  It probably should be possible to set these
+    # manually, via keyword arguments to train.
+    NEWTON_CONVERGE = 1e-12
+    MAX_NEWTON = 300
+
+    deltas = numpy.ones(A.shape[1], 'd')
+
     # Iteratively solve for delta.  Use the following variables:
     #   - nf_delta[x][y] = nfarray[x] * delta[y]
     #   - exp_nf_delta[x][y] = exp(nf[x] * delta[y])
@@ -1322,6 +1635,88 @@ def calculate_deltas(train_toks, classifier, unattested, ffreq_empirical,
 
     return deltas
 
+def train_maxent_classifier_with_iis_vectors(X, labels, vectorizer, trace=3,
+                                             **cutoffs):
+    """
+    Train a new ``ConditionalExponentialClassifier`` from a feature
+    matrix, using the Improved Iterative Scaling algorithm.  The
+    joint-feature vectors of all training samples are computed once,
+    as one sparse matrix per label, and each iteration is computed
+    with matrix products.
+
+    :see: ``MaxentClassifier.train_vectors()`` for parameter
+        descriptions.
+    """
+    cutoffs.setdefault('max_iter', 100)
+    cutoffchecker = CutoffChecker(cutoffs)
+
+    encoding, matrices, y = encode_training_vectors(X, labels, vectorizer)
+    num_toks = len(y)
+
+    # Count how many times each feature occurs in the training data.
+    empirical_ffreq = calculate_empirical_fcount_vectors(matrices, y) / num_toks
+
+    # nf is the sum of the features for a given labeled text.
+    # nfarray lists all of the attested values of nf; and nfindex
+    # gives the position in nfarray of the nf of each labeled text.
+    nfs = [numpy.asarray(matrix.sum(axis=1)).ravel() for matrix in matrices]
+    nfarray = numpy.unique(numpy.concatenate(nfs))
+    nfindex = [numpy.searchsorted(nfarray, nf) for nf in nfs]
+    nftranspose = numpy.reshape(nfarray, (len(nfarray), 1))
+
+    # Start with weight=0 for each attested feature, and
+    # weight=-infinity for each unattested feature.
+    unattested = set(numpy.nonzero(empirical_ffreq==0)[0])
+    weights = numpy.zeros(len(empirical_ffreq), 'd')
+    for fid in unattested: weights[fid] = -numpy.inf
+
+    if trace > 0: print('  ==> Training (%d iterations)' % cutoffs['max_iter'])
+    if trace > 2:
+        print()
+        print('      Iteration    Log Likelihood    Accuracy')
+        print('      ---------------------------------------')
+
+    # Train the classifier.
+    try:
+        while True:
+            probs = calculate_label_probs(weights, matrices)
+            if trace > 2:
+                ll = cutoffchecker.ll or vectors_log_likelihood(probs, y)
+                acc = cutoffchecker.acc or vectors_accuracy(probs, y)
+                iternum = cutoffchecker.iter
+                print('     %9d    %14.5f    %9.3f' % (iternum, ll, acc))
+
+            # A[nf][id] = sum ( p(fs) * p(label|fs) * f(fs,label) )
+            # over all label,fs s.t. num_features[label,fs]=nf
+            A = numpy.zeros((len(nfarray), len(weights)), 'd')
+            for i, matrix in enumerate(matrices):
+                label_probs = sparse.csr_matrix(
+                    (probs[:, i], (numpy.arange(num_toks), nfindex[i])),
+                    shape=(num_toks, len(nfarray)))
+                A += label_probs.T.dot(matrix).toarray()
+            A /= num_toks
+
+            # Use the deltas to update our weights.
+            weights += solve_deltas(A, empirical_ffreq, unattested,
+                                    nfarray, nftranspose)
+
+            # Check the log-likelihood & accuracy cutoffs.
+            if cutoffchecker.check_log_likelihood(
+                    lambda: vectors_log_likelihood(
+                        calculate_label_probs(weights, matrices), y)):
+                break
+
+    except KeyboardInterrupt:
+        print('      Training stopped: keyboard interrupt')
+
+    if trace > 2:
+        probs = calculate_label_probs(weights, matrices)
+        ll = vectors_log_likelihood(probs, y)
+        acc = vectors_accuracy(probs, y)
+        print('         Final    %14.5f    %9.3f' % (ll, acc))
+
+    return ConditionalExponentialClassifier(encoding, weights)
+
 ######################################################################
 #{ Classifier Trainer: megam
 ######################################################################
@@ -199,6 +199,64 @@ class NaiveBayesClassifier(ClassifierI):
                 # Keep a list of all feature names.
                 fnames.add(fname)
 
+        return NaiveBayesClassifier._train_from_counts(
+            label_freqdist, feature_freqdist, feature_values, fnames,
+            estimator)
+
+    @staticmethod
+    def train_vectors(X, labels, vectorizer, estimator=ELEProbDist):
+        """
+        Train a new classifier from training samples whose featuresets
+        have already been converted to a feature matrix by a
+        vectorizer.  The feature counts are computed directly from the
+        nonzero entries of the matrix.
+
+        :param X: The feature matrix, with one row per training sample.
+        :type X: scipy.sparse.spmatrix
+        :param labels: The label of each training sample.
+        :param vectorizer: The ``FeatureIndex`` that was used to build
+            ``X``.  Each of its columns must correspond to a single
+            ``(fname, fval)`` pair.
+        """
+        if not hasattr(vectorizer, 'feature') or vectorizer.numeric:
+            raise ValueError('NaiveBayesClassifier requires a vectorizer '
+                             'whose columns are (fname, fval) pairs, such '
+                             'as FeatureIndex(numeric=False)')
+        import numpy
+        from scipy import sparse
+
+        X = sparse.csr_matrix(X)
+        label_list = sorted(set(labels))
+        label_index = dict((l, i) for (i, l) in enumerate(label_list))
+        y = numpy.array([label_index[l] for l in labels], dtype=numpy.int64)
+
+        # Count the rows of each label that have each column.
+        rows = numpy.repeat(numpy.arange(X.shape[0]), numpy.diff(X.indptr))
+        nonzero = X.data != 0
+        cells = y[rows[nonzero]] * X.shape[1] + X.indices[nonzero]
+        cells, counts = numpy.unique(cells, return_counts=True)
+
+        label_freqdist = FreqDist()
+        for i, count in enumerate(numpy.bincount(y)):
+            if count:
+                label_freqdist[label_list[i]] = int(count)
+        feature_freqdist = defaultdict(FreqDist)
+        feature_values = defaultdict(set)
+        fnames = set()
+        for cell, count in zip(cells, counts):
+            i, col = divmod(int(cell), X.shape[1])
+            fname, fval = vectorizer.feature(col)
+            feature_freqdist[label_list[i], fname][fval] += int(count)
+            feature_values[fname].add(fval)
+            fnames.add(fname)
+
+        return NaiveBayesClassifier._train_from_counts(
+            label_freqdist, feature_freqdist, feature_values, fnames,
+            estimator)
+
+    @staticmethod
+    def _train_from_counts(label_freqdist, feature_freqdist, feature_values,
+                           fnames, estimator):
         # If a feature didn't have a value given for an instance, then
         # we assume that it gets the implicit value 'None.'  This loop
         # counts up the number of 'missing' feature values for each
@@ -50,7 +50,7 @@ __all__ = ['SklearnClassifier']
 class SklearnClassifier(ClassifierI):
     """Wrapper for scikit-learn classifiers."""
 
-    def __init__(self, estimator, dtype=float, sparse=True):
+    def __init__(self, estimator, dtype=float, sparse=True, vectorizer=None):
         """
         :param estimator: scikit-learn classifier object.
 
@@ -65,10 +65,18 @@ class SklearnClassifier(ClassifierI):
             involve sparse feature sets. Setting this to False may take a
             great amount of memory.
         :type sparse: boolean.
+
+        :param vectorizer: The vectorizer used to convert featuresets
+            into feature matrices, such as a ``FeatureIndex`` or a
+            ``FeatureHasher`` from ``nltk.classify.vectorizer``.  If
+            not specified, a scikit-learn ``DictVectorizer`` with the
+            given ``dtype`` and ``sparse`` settings is used.
         """
         self._clf = estimator
         self._encoder = LabelEncoder()
-        self._vectorizer = DictVectorizer(dtype=dtype, sparse=sparse)
+        if vectorizer is None:
+            vectorizer = DictVectorizer(dtype=dtype, sparse=sparse)
+        self._vectorizer = vectorizer
 
     def __repr__(self):
         return "<SklearnClassifier(%r)>" % self._clf
@@ -119,6 +127,19 @@ class SklearnClassifier(ClassifierI):
 
         return self
 
+    def train_vectors(self, X, labels):
+        """
+        Train (fit) the scikit-learn estimator on a feature matrix that
+        has already been built by this classifier's vectorizer.
+
+        :param X: The feature matrix, with one row per training sample.
+        :param labels: The label of each training sample.
+        """
+        y = self._encoder.fit_transform(labels)
+        self._clf.fit(X, y)
+
+        return self
+
     def _make_probdist(self, y_proba):
         classes = self._encoder.classes_
         return DictionaryProbDist(dict((classes[i], p)
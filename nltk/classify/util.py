@@ -110,12 +110,22 @@ class CutoffChecker(object):
         self.iter = 1
 
     def check(self, classifier, train_toks):
+        return self.check_log_likelihood(
+            lambda: nltk.classify.util.log_likelihood(classifier, train_toks))
+
+    def check_log_likelihood(self, log_likelihood):
+        """
+        Like ``check()``, but the log likelihood of the training data
+        is computed by calling ``log_likelihood()``, which is only
+        done if it is needed.  This is used by trainers whose training
+        data is not available as a list of labeled featuresets.
+        """
         cutoffs = self.cutoffs
         self.iter += 1
         if 'max_iter' in cutoffs and self.iter >= cutoffs['max_iter']:
             return True # iteration cutoff.
 
-        new_ll = nltk.classify.util.log_likelihood(classifier, train_toks)
+        new_ll = log_likelihood()
         if math.isnan(new_ll):
             return True
 
@@ -128,8 +138,7 @@ class CutoffChecker(object):
             self.ll = new_ll
 
         if 'max_acc' in cutoffs or 'min_accdelta' in cutoffs:
-            new_acc = nltk.classify.util.log_likelihood(
-                classifier, train_toks)
+            new_acc = log_likelihood()
             if 'max_acc' in cutoffs and new_acc >= cutoffs['max_acc']:
                 return True # log likelihood cutoff
             if ('min_accdelta' in cutoffs and self.acc and
@@ -0,0 +1,322 @@
+# Natural Language Toolkit: Featureset Vectorizers
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Classes for converting featuresets into sparse feature vectors.
+
+NLTK classifiers consume featuresets -- dicts mapping feature names to
+feature values.  Training algorithms that make several passes over the
+training corpus end up looking up (or hashing) the same feature names
+and values again on every pass.  A *vectorizer* converts each
+featureset into a row of a ``scipy.sparse`` CSR matrix once, so that
+the matrix can be reused by any number of training iterations and by
+any classifier that accepts pre-vectorized input:
+
+    >>> from nltk.classify.vectorizer import FeatureIndex
+    >>> vectorizer = FeatureIndex()
+    >>> X = vectorizer.fit_transform([{'a': 1, 'b': 'x'}, {'a': 0}])
+    >>> X.shape
+    (2, 3)
+    >>> vectorizer.encode({'a': 0, 'b': 'y'})
+    [(2, 1)]
+
+Two vectorizers are defined:
+
+  - ``FeatureIndex`` assigns a column to each feature that was seen
+    while it was being fit.  Its columns can be mapped back to
+    features, and features that were never seen are ignored.
+  - ``FeatureHasher`` uses the "hashing trick": the column of each
+    feature is a hash of the feature, modulo a fixed width.  It needs
+    no fitting and no memory for a feature index, at the cost of
+    occasional collisions between features.
+
+By default, each ``(fname, fval)`` pair is treated as a separate
+binary input-feature, whose value is 1 -- the same view of featuresets
+that is taken by ``NaiveBayesClassifier`` and by
+``BinaryMaxentFeatureEncoding``.  If ``numeric=True``, then numeric
+feature values are instead stored as the value of a single column for
+the feature name.
+"""
+from __future__ import print_function, unicode_literals, division
+
+import zlib
+
+try:
+    import numpy
+    from scipy import sparse
+except ImportError:
+    pass
+
+from nltk import compat
+
+######################################################################
+#{ Vectorizer Interface
+######################################################################
+
+class FeatureVectorizerI(object):
+    """
+    A mapping from featuresets to sparse feature vectors of a fixed
+    width.  Subclasses must define ``encode()``, ``width()`` and
+    ``describe()``; the bulk conversion methods are defined in terms of
+    ``encode()``.
+    """
+    def encode(self, featureset):
+        """
+        Return the sparse feature vector for the given featureset, as
+        a list of ``(column, value)`` tuples sorted by column.
+
+        :type featureset: dict
+        :rtype: list(tuple(int, int))
+        """
+        raise NotImplementedError()
+
+    def width(self):
+        """
+        :return: The number of columns of the feature vectors that are
+            generated by this vectorizer.
+        :rtype: int
+        """
+        raise NotImplementedError()
+
+    def describe(self, col):
+        """
+        :return: A string describing the input-feature(s) that are
+            mapped to the given column.
+        :rtype: str
+        """
+        raise NotImplementedError()
+
+    def fit(self, featuresets):
+        """
+        Adapt this vectorizer to the given featuresets, and return it.
+        By default, this does nothing.
+        """
+        return self
+
+    def fit_transform(self, featuresets):
+        """
+        Fit this vectorizer to the given featuresets, and return their
+        feature matrix.  ``featuresets`` may be any iterable; it is
+        only traversed once.
+        """
+        featuresets = list(featuresets)
+        return self.fit(featuresets).transform(featuresets)
+
+    def transform(self, featuresets):
+        """
+        :return: A CSR matrix with one row for each featureset.
+        :rtype: scipy.sparse.csr_matrix
+        """
+        indptr = [0]
+        indices = []
+        data = []
+        for featureset in featuresets:
+            for (col, val) in self.encode(featureset):
+                indices.append(col)
+                data.append(val)
+            indptr.append(len(indices))
+        return sparse.csr_matrix(
+            (numpy.array(data, dtype=float),
+             numpy.array(indices, dtype=numpy.int32),
+             numpy.array(indptr, dtype=numpy.int64)),
+            shape=(len(indptr)-1, self.width()))
+
+    def transform_iter(self, featuresets, batch_size=1000):
+        """
+        Convert a (possibly unbounded) stream of featuresets into
+        feature matrices, without materializing the whole stream.
+
+        :return: An iterator over CSR matrices, each of which holds the
+            rows for (at most) ``batch_size`` consecutive featuresets.
+        """
+        batch = []
+        for featureset in featuresets:
+            batch.append(featureset)
+            if len(batch) == batch_size:
+                yield self.transform(batch)
+                batch = []
+        if batch:
+            yield self.transform(batch)
+
+
+class _NumericValue(object):
+    """
+    The type of ``NUMERIC``, the feature value in the keys of numeric
+    columns.  All of its instances are equal, so that keys are still
+    found after a vectorizer is unpickled.
+    """
+    def __eq__(self, other):
+        return isinstance(other, _NumericValue)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash('NUMERIC')
+
+    def __repr__(self):
+        return 'NUMERIC'
+
+#: The feature value in the key ``(fname, NUMERIC)`` of the column that
+#: holds the values of the numeric feature ``fname``.  Unlike None, it
+#: is not the value of any feature.
+NUMERIC = _NumericValue()
+
+def _feature_key(fname, fval, numeric):
+    """
+    Return the key ``(fname, fval)`` used for an input-feature, and its
+    value.  For numeric features (if ``numeric`` is true), the key is
+    ``(fname, NUMERIC)`` and the value is ``fval``.
+    """
+    if (numeric and isinstance(fval, compat.integer_types + (float,))
+            and not isinstance(fval, bool)):
+        return (fname, NUMERIC), fval
+    return (fname, fval), 1
+
+######################################################################
+#{ Feature Index
+######################################################################
+
+class FeatureIndex(FeatureVectorizerI):
+    """
+    A vectorizer that assigns one column to each input-feature that is
+    seen by ``fit()``, in order of first occurrence.  Input-features
+    that were not seen by ``fit()`` are ignored by ``encode()`` and
+    ``transform()``.
+    """
+    def __init__(self, numeric=False):
+        """
+        :param numeric: If true, then the value of each numeric feature
+            is stored in a single column for its feature name, rather
+            than using one binary column per ``(fname, fval)`` pair.
+        """
+        self._numeric = numeric
+        self._columns = {}   # maps (fname, fval) -> column
+        self._features = []  # maps column -> (fname, fval)
+
+    @property
+    def numeric(self):
+        """True if numeric values are stored in per-name columns."""
+        return self._numeric
+
+    def fit(self, featuresets):
+        for featureset in featuresets:
+            for (fname, fval) in featureset.items():
+                key, _ = _feature_key(fname, fval, self._numeric)
+                if key not in self._columns:
+                    self._columns[key] = len(self._features)
+                    self._features.append(key)
+        return self
+
+    def encode(self, featureset):
+        vector = []
+        for (fname, fval) in featureset.items():
+            key, val = _feature_key(fname, fval, self._numeric)
+            col = self._columns.get(key)
+            if col is not None:
+                vector.append((col, val))
+        vector.sort()
+        return vector
+
+    def width(self):
+        return len(self._features)
+
+    def feature(self, col):
+        """
+        :return: The ``(fname, fval)`` input-feature for the given
+            column.  For numeric columns, ``fval`` is ``NUMERIC``.
+        """
+        return self._features[col]
+
+    def describe(self, col):
+        fname, fval = self._features[col]
+        if isinstance(fval, _NumericValue):
+            return '%s' % (fname,)
+        return '%s==%r' % (fname, fval)
+
+    def __len__(self):
+        return len(self._features)
+
+    def __repr__(self):
+        return '<FeatureIndex with %d features>' % len(self._features)
+
+######################################################################
+#{ Feature Hashing
+######################################################################
+
+class FeatureHasher(FeatureVectorizerI):
+    """
+    A vectorizer that uses the "hashing trick": each input-feature is
+    mapped to the column ``hash(feature) % width``.  The hash function
+    (CRC-32 of the UTF-8 encoded feature) is stable across processes
+    and Python versions, so feature matrices that are built by
+    different workers can be combined.
+
+    Features that collide in the same column have their values added.
+    If ``alternate_sign`` is true, then the value of each feature is
+    multiplied by a sign that is derived from its hash, so that
+    collisions tend to cancel out rather than accumulate.
+    """
+    def __init__(self, width=2**20, numeric=False, alternate_sign=False):
+        """
+        :param width: The number of columns of the generated feature
+            vectors.
+        :param numeric: If true, then the value of each numeric feature
+            is stored in a single column for its feature name, rather
+            than using one binary column per ``(fname, fval)`` pair.
+        :param alternate_sign: If true, then use a hash-derived sign for
+            each feature value.
+        """
+        self._width = width
+        self._numeric = numeric
+        self._alternate_sign = alternate_sign
+
+    @property
+    def numeric(self):
+        """True if numeric values are stored in per-name columns."""
+        return self._numeric
+
+    def _hash(self, key):
+        fname, fval = key
+        if isinstance(fval, _NumericValue):
+            s = '%s' % (fname,)
+        else:
+            s = '%s=%s' % (fname, fval)
+        return zlib.crc32(s.encode('utf-8')) & 0xffffffff
+
+    def encode(self, featureset):
+        vector = {}
+        for (fname, fval) in featureset.items():
+            key, val = _feature_key(fname, fval, self._numeric)
+            h = self._hash(key)
+            if self._alternate_sign and h & 0x80000000:
+                val = -val
+            col = h % self._width
+            vector[col] = vector.get(col, 0) + val
+        return sorted(vector.items())
+
+    def width(self):
+        return self._width
+
+    def describe(self, col):
+        return 'hash bucket %d' % col
+
+    def transform(self, featuresets):
+        X = FeatureVectorizerI.transform(self, featuresets)
+        X.eliminate_zeros()
+        return X
+
+    def __repr__(self):
+        return '<FeatureHasher with width %d>' % self._width
+
+
+# skip doctests if scipy is not installed
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import scipy
+    except ImportError:
+        raise SkipTest("scipy is not installed")
@@ -31,7 +31,7 @@ class EMClusterer(VectorSpaceClusterer):
 
     def __init__(self, initial_means, priors=None, covariance_matrices=None,
                        conv_threshold=1e-6, bias=0.1, normalise=False,
-                       svd_dimensions=None):
+                       svd_dimensions=None, covariance_type='full'):
         """
         Creates an EM clusterer with the given starting parameters,
         convergence threshold and vector mangling parameters.
@@ -41,6 +41,9 @@ class EMClusterer(VectorSpaceClusterer):
         :param  priors: the prior probability for each cluster
         :type   priors: numpy array or seq of float
         :param  covariance_matrices: the covariance matrix for each cluster
+                    (for 'full' covariances), the variances of each cluster
+                    (for 'diagonal' covariances), or the single covariance
+                    matrix shared by all clusters (for 'tied' covariances)
         :type   covariance_matrices: [seq of] numpy array
         :param  conv_threshold: maximum change in likelihood before deemed
                     convergent
@@ -53,122 +56,170 @@ class EMClusterer(VectorSpaceClusterer):
         :param  svd_dimensions: number of dimensions to use in reducing vector
                                dimensionsionality with SVD
         :type   svd_dimensions: int
+        :param  covariance_type: 'full' (a covariance matrix for each
+                    cluster), 'diagonal' (a variance for each dimension of
+                    each cluster) or 'tied' (one covariance matrix shared
+                    by all clusters).  The 'diagonal' and 'tied' models have
+                    fewer parameters and need less memory.
+        :type   covariance_type: str
         """
         VectorSpaceClusterer.__init__(self, normalise, svd_dimensions)
+        if covariance_type not in self.COVARIANCE_TYPES:
+            raise ValueError('Unknown covariance type %r' % covariance_type)
         self._means = numpy.array(initial_means, numpy.float64)
         self._num_clusters = len(initial_means)
         self._conv_threshold = conv_threshold
         self._covariance_matrices = covariance_matrices
+        self._covariance_type = covariance_type
         self._priors = priors
         self._bias = bias
 
+    #: The supported covariance models.
+    COVARIANCE_TYPES = ('full', 'diagonal', 'tied')
+
     def num_clusters(self):
         return self._num_clusters
 
     def cluster_vectorspace(self, vectors, trace=False):
         assert len(vectors) > 0
+        vectors = numpy.asarray(vectors, numpy.float64)
 
         # set the parameters to initial values
-        dimensions = len(vectors[0])
+        dimensions = vectors.shape[1]
         means = self._means
         priors = self._priors
-        if not priors:
-            priors = self._priors = numpy.ones(self._num_clusters,
-                                        numpy.float64) / self._num_clusters
+        if priors is None:
+            priors = numpy.ones(self._num_clusters,
+                                numpy.float64) / self._num_clusters
+        priors = self._priors = numpy.array(priors, numpy.float64)
         covariances = self._covariance_matrices
-        if not covariances:
-            covariances = self._covariance_matrices = \
-                [ numpy.identity(dimensions, numpy.float64)
-                  for i in range(self._num_clusters) ]
-
-        # do the E and M steps until the likelihood plateaus
-        lastl = self._loglikelihood(vectors, priors, means, covariances)
-        converged = False
-
-        while not converged:
-            if trace: print('iteration; loglikelihood', lastl)
+        if covariances is None:
+            if self._covariance_type == 'full':
+                covariances = [numpy.identity(dimensions, numpy.float64)
+                               for i in range(self._num_clusters)]
+            elif self._covariance_type == 'diagonal':
+                covariances = numpy.ones((self._num_clusters, dimensions),
+                                         numpy.float64)
+            else:
+                covariances = numpy.identity(dimensions, numpy.float64)
+        covariances = self._covariance_matrices = \
+            numpy.array(covariances, numpy.float64)
+
+        # do the E and M steps until the likelihood plateaus; the
+        # likelihood computed by each E-step is the likelihood of the
+        # parameters from the previous M-step.
+        lastl = None
+        while True:
             # E-step, calculate hidden variables, h[i,j]
-            h = numpy.zeros((len(vectors), self._num_clusters),
-                numpy.float64)
-            for i in range(len(vectors)):
-                for j in range(self._num_clusters):
-                    h[i,j] = priors[j] * self._gaussian(means[j],
-                                               covariances[j], vectors[i])
-                h[i,:] /= sum(h[i,:])
-
-            # M-step, update parameters - cvm, p, mean
-            for j in range(self._num_clusters):
-                covariance_before = covariances[j]
-                new_covariance = numpy.zeros((dimensions, dimensions),
-                            numpy.float64)
-                new_mean = numpy.zeros(dimensions, numpy.float64)
-                sum_hj = 0.0
-                for i in range(len(vectors)):
-                    delta = vectors[i] - means[j]
-                    new_covariance += h[i,j] * \
-                        numpy.multiply.outer(delta, delta)
-                    sum_hj += h[i,j]
-                    new_mean += h[i,j] * vectors[i]
-                covariances[j] = new_covariance / sum_hj
-                means[j] = new_mean / sum_hj
-                priors[j] = sum_hj / len(vectors)
-
-                # bias term to stop covariance matrix being singular
-                covariances[j] += self._bias * \
-                    numpy.identity(dimensions, numpy.float64)
-
-            # calculate likelihood - FIXME: may be broken
-            l = self._loglikelihood(vectors, priors, means, covariances)
+            log_h = self._log_joint(vectors)
+            log_p = _logsumexp(log_h)
+            l = log_p.sum()
+            if trace: print('iteration; loglikelihood', l)
 
             # check for convergence
-            if abs(lastl - l) < self._conv_threshold:
-                converged = True
+            if lastl is not None and abs(lastl - l) < self._conv_threshold:
+                break
             lastl = l
+            h = numpy.exp(log_h - log_p[:, numpy.newaxis])
+
+            # M-step, update parameters - cvm, p, mean.  The covariances
+            # are computed about the means from before this step.
+            sum_h = h.sum(axis=0)
+            new_means = numpy.dot(h.T, vectors) / sum_h[:, numpy.newaxis]
+            if self._covariance_type == 'tied':
+                covariances[:] = 0
+            for j in range(self._num_clusters):
+                delta = vectors - means[j]
+                weighted = h[:, j, numpy.newaxis] * delta
+                if self._covariance_type == 'full':
+                    covariances[j] = numpy.dot(weighted.T, delta) / sum_h[j]
+                    # bias term to stop covariance matrix being singular
+                    covariances[j] += self._bias * \
+                        numpy.identity(dimensions, numpy.float64)
+                elif self._covariance_type == 'diagonal':
+                    covariances[j] = (weighted * delta).sum(axis=0) / sum_h[j]
+                    covariances[j] += self._bias
+                else:
+                    covariances += numpy.dot(weighted.T, delta)
+            if self._covariance_type == 'tied':
+                covariances /= len(vectors)
+                covariances += self._bias * \
+                    numpy.identity(dimensions, numpy.float64)
+            means[:] = new_means
+            priors[:] = sum_h / len(vectors)
 
     def classify_vectorspace(self, vector):
-        best = None
-        for j in range(self._num_clusters):
-            p = self._priors[j] * self._gaussian(self._means[j],
-                                    self._covariance_matrices[j], vector)
-            if not best or p > best[0]:
-                best = (p, j)
-        return best[1]
+        vectors = numpy.asarray(vector)[numpy.newaxis]
+        return int(self._log_joint(vectors)[0].argmax())
 
     def likelihood_vectorspace(self, vector, cluster):
         cid = self.cluster_names().index(cluster)
-        return self._priors[cluster] * self._gaussian(self._means[cluster],
-                                self._covariance_matrices[cluster], vector)
-
-    def _gaussian(self, mean, cvm, x):
-        m = len(mean)
-        assert cvm.shape == (m, m), \
-            'bad sized covariance matrix, %s' % str(cvm.shape)
-        try:
-            det = numpy.linalg.det(cvm)
-            inv = numpy.linalg.inv(cvm)
-            a = det ** -0.5 * (2 * numpy.pi) ** (-m / 2.0)
-            dx = x - mean
-            print(dx, inv)
-            b = -0.5 * numpy.dot( numpy.dot(dx, inv), dx)
-            return a * numpy.exp(b)
-        except OverflowError:
-            # happens when the exponent is negative infinity - i.e. b = 0
-            # i.e. the inverse of cvm is huge (cvm is almost zero)
-            return 0
-
-    def _loglikelihood(self, vectors, priors, means, covariances):
-        llh = 0.0
-        for vector in vectors:
-            p = 0
-            for j in range(len(priors)):
-                p += priors[j] * \
-                         self._gaussian(means[j], covariances[j], vector)
-            llh += numpy.log(p)
-        return llh
+        vectors = numpy.asarray(vector)[numpy.newaxis]
+        return numpy.exp(self._log_joint(vectors)[0, cid])
+
+    def covariance_matrix(self, cluster):
+        """
+        :return: the (full) covariance matrix of the given cluster
+        :rtype: numpy array
+        """
+        if self._covariance_type == 'full':
+            return self._covariance_matrices[cluster]
+        elif self._covariance_type == 'diagonal':
+            return numpy.diag(self._covariance_matrices[cluster])
+        else:
+            return self._covariance_matrices
+
+    def _log_joint(self, vectors):
+        """
+        Return the matrix of the log probabilities of each of the given
+        vectors (a 2-D array) being generated by each cluster, i.e. the log
+        of the prior times the gaussian density.
+        """
+        priors = self._priors
+        means = self._means
+        covariances = self._covariance_matrices
+        m = vectors.shape[1]
+        log_h = numpy.empty((len(vectors), self._num_clusters), numpy.float64)
+        if self._covariance_type == 'tied':
+            tied = _cholesky(covariances)
+        for j in range(self._num_clusters):
+            dx = vectors - means[j]
+            if self._covariance_type == 'diagonal':
+                log_det = numpy.log(covariances[j]).sum()
+                b = ((dx * dx) / covariances[j]).sum(axis=1)
+            else:
+                if self._covariance_type == 'tied':
+                    cholesky = tied
+                else:
+                    cholesky = _cholesky(covariances[j])
+                log_det = 2 * numpy.log(numpy.diagonal(cholesky)).sum()
+                y = numpy.linalg.solve(cholesky, dx.T)
+                b = (y * y).sum(axis=0)
+            log_h[:, j] = (numpy.log(priors[j]) - 0.5 *
+                           (m * numpy.log(2 * numpy.pi) + log_det + b))
+        return log_h
 
     def __repr__(self):
         return '<EMClusterer means=%s>' % list(self._means)
 
+def _cholesky(cvm):
+    """
+    Return the lower-triangular Cholesky factor of a covariance matrix.
+    """
+    try:
+        return numpy.linalg.cholesky(cvm)
+    except numpy.linalg.LinAlgError:
+        raise ValueError('Covariance matrix is not positive definite')
+
+def _logsumexp(a):
+    """
+    Return the log of the sum of the exponentials of each row of ``a``,
+    without underflowing when the values are very negative.
+    """
+    a_max = a.max(axis=1)
+    a_max[~numpy.isfinite(a_max)] = 0
+    return numpy.log(numpy.exp(a - a_max[:, numpy.newaxis]).sum(axis=1)) + a_max
+
 def demo():
     """
     Non-interactive demonstration of the clusterers with simple 2-D data.
@@ -192,7 +243,7 @@ def demo():
         print('Cluster:', c)
         print('Prior:  ', clusterer._priors[c])
         print('Mean:   ', clusterer._means[c])
-        print('Covar:  ', clusterer._covariance_matrices[c])
+        print('Covar:  ', clusterer.covariance_matrix(c))
         print()
 
     # classify a new vector
@@ -4,7 +4,10 @@
 # Author: Trevor Cohn <tacohn@cs.mu.oz.au>
 # URL: <http://nltk.org/>
 # For license information, see LICENSE.TXT
-from __future__ import print_function, unicode_literals
+from __future__ import print_function, unicode_literals, division
+
+import os
+import tempfile
 
 try:
     import numpy
@@ -26,13 +29,51 @@ class GAAClusterer(VectorSpaceClusterer):
 
     This clusterer uses the cosine similarity metric only, which allows for
     efficient speed-up in the clustering process.
+
+    By default, the distances between all pairs of clusters are kept in an
+    N x N matrix, which is rescanned after every merge.  If ``algorithm`` is
+    ``'nn-chain'``, then the nearest-neighbor chain algorithm is used
+    instead: the only per-cluster state is the sum of the (normalised)
+    vectors in each cluster, from which the group average distance between
+    two clusters is computed directly.  This needs O(N) rather than O(N^2)
+    memory and O(N^2) rather than O(N^3) time, and gives the same merges
+    (up to ties between equally distant clusters).
     """
 
-    def __init__(self, num_clusters=1, normalise=True, svd_dimensions=None):
+    #: The algorithms that can be used to find the merges.
+    ALGORITHMS = ('matrix', 'nn-chain')
+
+    def __init__(self, num_clusters=1, normalise=True, svd_dimensions=None,
+                 algorithm=None, dtype=None, scratch_dir=None):
+        """
+        :param num_clusters: the number of clusters to stop merging at
+        :type num_clusters: int
+        :param normalise: should vectors be normalised to length 1
+        :type normalise: boolean
+        :param svd_dimensions: number of dimensions to use in reducing vector
+                               dimensionsionality with SVD
+        :type svd_dimensions: int
+        :param algorithm: ``'matrix'`` (the default) or ``'nn-chain'``
+        :type algorithm: str
+        :param dtype: the numpy floating point type used for the distances
+                      (or cluster sums); ``numpy.float32`` halves the memory
+                      that is needed.  Defaults to ``numpy.float64``.
+        :param scratch_dir: if given, the distance matrix (or the cluster
+                            sums) is stored in a memory-mapped temporary
+                            file in this directory, rather than in memory
+        :type scratch_dir: str
+        """
         VectorSpaceClusterer.__init__(self, normalise, svd_dimensions)
         self._num_clusters = num_clusters
         self._dendrogram = None
         self._groups_values = None
+        if algorithm is None:
+            algorithm = 'matrix'
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError('Unknown algorithm %r' % algorithm)
+        self._algorithm = algorithm
+        self._dtype = dtype
+        self._scratch_dir = scratch_dir
 
     def cluster(self, vectors, assign_clusters=False, trace=False):
         # stores the merge order
@@ -41,18 +82,63 @@ class GAAClusterer(VectorSpaceClusterer):
         return VectorSpaceClusterer.cluster(self, vectors, assign_clusters, trace)
 
     def cluster_vectorspace(self, vectors, trace=False):
+        scratch = []
+        try:
+            if self._algorithm == 'nn-chain':
+                self._cluster_nn_chain(vectors, trace, scratch)
+            else:
+                self._cluster_matrix(vectors, trace, scratch)
+        finally:
+            for filename in scratch:
+                os.remove(filename)
+        self.update_clusters(self._num_clusters)
+
+    def _array(self, shape, scratch):
+        """
+        Return a new uninitialised array of the given shape, which is
+        memory-mapped to a temporary file if a scratch directory was given.
+        The names of temporary files are appended to ``scratch``.
+        """
+        dtype = self._dtype or numpy.float64
+        if self._scratch_dir is None:
+            return numpy.empty(shape, dtype)
+        fd, filename = tempfile.mkstemp(dir=self._scratch_dir,
+                                        suffix='.gaac')
+        os.close(fd)
+        scratch.append(filename)
+        return numpy.memmap(filename, dtype, 'w+', shape=shape)
+
+    def _unit_vectors(self, vectors, start=0, stop=None):
+        """
+        Return the given rows of ``vectors``, normalised to length 1, as
+        a 2-D array.
+        """
+        rows = numpy.array(vectors[start:stop], dtype=self._dtype or
+                           numpy.float64)
+        rows /= numpy.sqrt((rows * rows).sum(axis=1))[:, numpy.newaxis]
+        return rows
+
+    #: The number of rows of the distance matrix that are computed at once.
+    _BLOCK_SIZE = 1000
+
+    def _cluster_matrix(self, vectors, trace, scratch):
         # variables describing the initial situation
         N = len(vectors)
         cluster_len = [1]*N
         cluster_count = N
         index_map = numpy.arange(N)
 
-        # construct the similarity matrix
+        # construct the similarity matrix, a block of rows at a time
         dims = (N, N)
-        dist = numpy.ones(dims, dtype=numpy.float)*numpy.inf
-        for i in range(N):
-            for j in range(i+1, N):
-                dist[i, j] = cosine_distance(vectors[i], vectors[j])
+        dist = self._array(dims, scratch)
+        unit = self._unit_vectors(vectors)
+        for start in range(0, N, self._BLOCK_SIZE):
+            stop = min(start + self._BLOCK_SIZE, N)
+            dist[start:stop] = 1 - numpy.dot(unit[start:stop], unit.T)
+            # only the upper triangle is used
+            rows = numpy.arange(start, stop)[:, numpy.newaxis]
+            dist[start:stop][rows >= numpy.arange(N)] = numpy.inf
+        del unit
 
         while cluster_count > max(self._num_clusters, 1):
             i, j = numpy.unravel_index(dist.argmin(), dims)
@@ -76,8 +162,6 @@ class GAAClusterer(VectorSpaceClusterer):
             index_map[j+1:] -= 1
             index_map[j] = N
 
-        self.update_clusters(self._num_clusters)
-
     def _merge_similarities(self, dist, cluster_len, i, j):
         # the new cluster i merged from i and j adopts the average of
         # i and j's similarity to each other cluster, weighted by the
@@ -95,6 +179,68 @@ class GAAClusterer(VectorSpaceClusterer):
         dist[i, j+1:] = dist[i, j+1:]*i_weight + dist[j, j+1:]*j_weight
         dist[i, i+1:] /= weight_sum
 
+    def _cluster_nn_chain(self, vectors, trace, scratch):
+        # The group average distance between clusters A and B is
+        #     1 - (sum(A) . sum(B)) / (|A| |B|)
+        # where sum(X) is the sum of the normalised vectors in X, so each
+        # cluster is represented by its sum, stored in the row of its
+        # lowest-numbered vector.
+        N = len(vectors)
+        sums = self._array((N, len(vectors[0])), scratch)
+        for start in range(0, N, self._BLOCK_SIZE):
+            sums[start:start+self._BLOCK_SIZE] = \
+                self._unit_vectors(vectors, start, start+self._BLOCK_SIZE)
+        sizes = numpy.ones(N)
+        active = numpy.ones(N, bool)
+
+        def distances(a):
+            d = 1 - numpy.dot(sums, sums[a]) / (sizes * sizes[a])
+            d[~active] = numpy.inf
+            d[a] = numpy.inf
+            return d
+
+        # Grow a chain of nearest neighbors until its last two clusters
+        # are each other's nearest neighbors, then merge them.  Because
+        # the group average distance never decreases when clusters are
+        # merged, the rest of the chain stays valid.
+        merges = []
+        heights = numpy.zeros(N)
+        chain = []
+        for remaining in range(N, 1, -1):
+            if not chain:
+                chain.append(int(numpy.flatnonzero(active)[0]))
+            while True:
+                a = chain[-1]
+                d = distances(a)
+                b = int(d.argmin())
+                # prefer the previous cluster in the chain, to avoid cycles
+                if len(chain) > 1 and d[chain[-2]] <= d[b]:
+                    b = chain[-2]
+                if len(chain) > 1 and b == chain[-2]:
+                    break
+                chain.append(b)
+            chain.pop()
+            chain.pop()
+            i, j = min(a, b), max(a, b)
+            # the height of a merge is never less than that of the merges
+            # below it, so sorting by height puts the merges in order
+            height = max(d[b], heights[i], heights[j])
+            merges.append((height, len(merges), i, j))
+            sums[i] += sums[j]
+            sizes[i] += sizes[j]
+            heights[i] = height
+            active[j] = False
+
+        # replay the first merges in order of distance
+        merges.sort()
+        index_map = numpy.arange(N)
+        for (height, _, i, j) in merges[:N - max(self._num_clusters, 1)]:
+            if trace:
+                print("merging %d and %d" % (i, j))
+            self._dendrogram.merge(index_map[i], index_map[j])
+            index_map[j+1:] -= 1
+            index_map[j] = N
+
     def update_clusters(self, num_clusters):
         clusters = self._dendrogram.groups(num_clusters)
         self._centroids = []
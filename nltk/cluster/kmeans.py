@@ -16,7 +16,8 @@ except ImportError:
     pass
 
 
-from nltk.cluster.util import VectorSpaceClusterer
+from nltk.cluster.util import (VectorSpaceClusterer, euclidean_distance,
+                               cosine_distance)
 from nltk.compat import python_2_unicode_compatible
 
 
@@ -30,12 +31,21 @@ class KMeansClusterer(VectorSpaceClusterer):
     hill-climbing algorithm which may converge to a local maximum. Hence the
     clustering is often repeated with random initial means and the most
     commonly occurring output means are chosen.
+
+    When the distance is ``euclidean_distance`` or ``cosine_distance``,
+    the vectors are assigned to clusters with matrix operations over the
+    whole data set, rather than one at a time.
     """
 
+    #: The number of vectors whose distances to the means are computed
+    #: at once by the matrix operations.
+    _BLOCK_SIZE = 10000
+
     def __init__(self, num_means, distance, repeats=1,
                        conv_test=1e-6, initial_means=None,
                        normalise=False, svd_dimensions=None,
-                       rng=None, avoid_empty_clusters=False):
+                       rng=None, avoid_empty_clusters=False,
+                       init='random', batch_size=None, processes=1):
 
         """
         :param  num_means:  the number of means to use (may use fewer)
@@ -60,6 +70,17 @@ class KMeansClusterer(VectorSpaceClusterer):
                                      of next one; avoids undefined behavior
                                      when clusters become empty
         :type avoid_empty_clusters: boolean
+        :param  init:       how to choose the initial means: 'random'
+                            (a random sample of the vectors) or
+                            'kmeans++' (k-means++ seeding)
+        :type   init:       str
+        :param  batch_size: if given, update the means from random
+                            mini-batches of this many vectors, rather
+                            than from all of the vectors at each step
+        :type   batch_size: int
+        :param  processes:  number of worker processes used to run the
+                            clustering trials in parallel
+        :type   processes:  int
         """
         VectorSpaceClusterer.__init__(self, normalise, svd_dimensions)
         self._num_means = num_means
@@ -72,18 +93,42 @@ class KMeansClusterer(VectorSpaceClusterer):
         self._repeats = repeats
         self._rng = (rng if rng else random.Random())
         self._avoid_empty_clusters = avoid_empty_clusters
+        if init not in ('random', 'kmeans++'):
+            raise ValueError('Unknown initialisation method %r' % init)
+        self._init = init
+        self._batch_size = batch_size
+        self._processes = processes
 
     def cluster_vectorspace(self, vectors, trace=False):
         if self._means and self._repeats > 1:
             print('Warning: means will be discarded for subsequent trials')
 
-        meanss = []
+        # Choose the initial means (and a random number generator for
+        # the mini-batches) of every trial up front, so that the trials
+        # can be run independently.
+        trials = []
         for trial in range(self._repeats):
-            if trace: print('k-means trial', trial)
-            if not self._means or trial > 1:
-                self._means = self._rng.sample(list(vectors), self._num_means)
-            self._cluster_vectorspace(vectors, trace)
-            meanss.append(self._means)
+            if not self._means or trial > 0:
+                self._means = self._initial_means(vectors)
+            trials.append(self._means)
+        seeds = [self._rng.random() for trial in trials]
+
+        if self._processes > 1 and self._repeats > 1:
+            import multiprocessing
+            pool = multiprocessing.Pool(self._processes)
+            try:
+                meanss = pool.map(_cluster_trial,
+                                  [(self, vectors, means, seed, trial, trace)
+                                   for (trial, (means, seed))
+                                   in enumerate(zip(trials, seeds))])
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            meanss = [self._cluster_trial(vectors, means, seed, trial, trace)
+                      for (trial, (means, seed))
+                      in enumerate(zip(trials, seeds))]
+        self._means = meanss[-1]
 
         if len(meanss) > 1:
             # sort the means first (so that different cluster numbering won't
@@ -104,8 +149,83 @@ class KMeansClusterer(VectorSpaceClusterer):
             # use the best means
             self._means = min_means
 
-    def _cluster_vectorspace(self, vectors, trace=False):
-        if self._num_means < len(vectors):
+    def _cluster_trial(self, vectors, means, seed, trial, trace=False):
+        if trace: print('k-means trial', trial)
+        self._means = means
+        self._cluster_vectorspace(vectors, trace, random.Random(seed))
+        return self._means
+
+    def _initial_means(self, vectors):
+        if self._init == 'random':
+            return self._rng.sample(list(vectors), self._num_means)
+
+        # k-means++: choose each mean from the vectors with probability
+        # proportional to its squared distance from the nearest mean
+        # chosen so far.
+        vectors = list(vectors)
+        X = numpy.asarray(vectors, dtype=float)
+        index = self._rng.randrange(len(vectors))
+        chosen = [index]
+        sqdists = self._distances(X, X[index:index+1])[:, 0] ** 2
+        while len(chosen) < min(self._num_means, len(vectors)):
+            cumulative = numpy.cumsum(sqdists)
+            if cumulative[-1] > 0:
+                r = self._rng.random() * cumulative[-1]
+                index = int(numpy.searchsorted(cumulative, r, side='right'))
+                index = min(index, len(vectors) - 1)
+            else:
+                index = self._rng.choice([i for i in range(len(vectors))
+                                          if i not in chosen])
+            chosen.append(index)
+            sqdists = numpy.minimum(
+                sqdists, self._distances(X, X[index:index+1])[:, 0] ** 2)
+        return [vectors[index] for index in chosen]
+
+    def _vectorised(self):
+        """
+        True if this clusterer's distance function can be computed with
+        matrix operations.
+        """
+        return self._distance in (euclidean_distance, cosine_distance)
+
+    def _distances(self, X, means):
+        """
+        Return the array of distances between each row of ``X`` and each
+        row of ``means``.
+        """
+        if self._distance is euclidean_distance:
+            sqdists = ((X * X).sum(axis=1)[:, numpy.newaxis]
+                       - 2 * numpy.dot(X, means.T)
+                       + (means * means).sum(axis=1)[numpy.newaxis, :])
+            return numpy.sqrt(numpy.maximum(sqdists, 0))
+        elif self._distance is cosine_distance:
+            norms = numpy.sqrt((X * X).sum(axis=1))
+            mean_norms = numpy.sqrt((means * means).sum(axis=1))
+            return 1 - (numpy.dot(X, means.T) /
+                        numpy.outer(norms, mean_norms))
+        else:
+            return numpy.array([[self._distance(x, mean) for mean in means]
+                                for x in X])
+
+    def _assign(self, X, means):
+        """
+        Return the index of the closest mean for each row of ``X``.
+        """
+        if not self._vectorised():
+            return numpy.array([self._distances(x[numpy.newaxis, :],
+                                                means).argmin()
+                                for x in X], dtype=int)
+        return numpy.concatenate(
+            [self._distances(X[i:i+self._BLOCK_SIZE], means).argmin(axis=1)
+             for i in range(0, len(X), self._BLOCK_SIZE)])
+
+    def _cluster_vectorspace(self, vectors, trace=False, rng=None):
+        if self._num_means < len(vectors) and self._batch_size and \
+                self._batch_size < len(vectors):
+            self._cluster_minibatch(vectors, trace, rng or self._rng)
+        elif self._num_means < len(vectors) and self._vectorised():
+            self._cluster_vectorised(vectors, trace)
+        elif self._num_means < len(vectors):
             # perform k-means clustering
             converged = False
             while not converged:
@@ -131,6 +251,73 @@ class KMeansClusterer(VectorSpaceClusterer):
                 # remember the new means
                 self._means = new_means
 
+    def _cluster_vectorised(self, vectors, trace=False):
+        X = numpy.asarray(vectors, dtype=float)
+        means = numpy.asarray(self._means, dtype=float)
+        converged = False
+        while not converged:
+            # assign the vectors to clusters based on minimum distance to
+            # the cluster means
+            labels = self._assign(X, means)
+            counts = numpy.bincount(labels, minlength=len(means))
+            sums = numpy.zeros_like(means)
+            numpy.add.at(sums, labels, X)
+
+            if trace: print('iteration')
+
+            # recalculate cluster means by computing the centroid of each cluster
+            if self._avoid_empty_clusters:
+                new_means = (means + sums) / (1 + counts)[:, numpy.newaxis]
+            else:
+                if not counts.all():
+                    sys.stderr.write('Error: no centroid defined for empty cluster.\n')
+                    sys.stderr.write('Try setting argument \'avoid_empty_clusters\' to True\n')
+                    assert(False)
+                new_means = sums / counts[:, numpy.newaxis]
+
+            # measure the degree of change from the previous step for convergence
+            difference = self._sum_distances(means, new_means)
+            if difference < self._max_difference:
+                converged = True
+
+            # remember the new means
+            means = new_means
+        self._means = list(means)
+
+    def _cluster_minibatch(self, vectors, trace, rng):
+        # Mini-batch k-means (Sculley, 2010): each step assigns a random
+        # sample of the vectors to the closest means, and moves each mean
+        # towards the vectors assigned to it with a learning rate that is
+        # the inverse of the number of vectors assigned to it so far.
+        X = numpy.asarray(vectors, dtype=float)
+        means = numpy.array(self._means, dtype=float)
+        seen = numpy.zeros(len(means))
+
+        # Stop after the equivalent of 100 passes over the data, if the
+        # means have not converged by then.
+        max_batches = 100 * (len(X) // self._batch_size + 1)
+        for batch in range(max_batches):
+            sample = X[rng.sample(range(len(X)), self._batch_size)]
+            labels = self._assign(sample, means)
+            counts = numpy.bincount(labels, minlength=len(means))
+            sums = numpy.zeros_like(means)
+            numpy.add.at(sums, labels, sample)
+
+            if trace: print('iteration')
+
+            seen += counts
+            assigned = counts > 0
+            new_means = means.copy()
+            new_means[assigned] += (
+                (sums[assigned] - counts[assigned, numpy.newaxis]
+                 * means[assigned]) / seen[assigned, numpy.newaxis])
+
+            difference = self._sum_distances(means, new_means)
+            means = new_means
+            if difference < self._max_difference:
+                break
+        self._means = list(means)
+
     def classify_vectorspace(self, vector):
         # finds the closest cluster centroid
         # returns that cluster's index
@@ -180,6 +367,14 @@ class KMeansClusterer(VectorSpaceClusterer):
         return '<KMeansClusterer means=%s repeats=%d>' % \
                     (self._means, self._repeats)
 
+def _cluster_trial(args):
+    """
+    Run a single k-means clustering trial; used by the worker processes
+    of ``KMeansClusterer.cluster_vectorspace()``.
+    """
+    clusterer, vectors, means, seed, trial, trace = args
+    return clusterer._cluster_trial(vectors, means, seed, trial, trace)
+
 #################################################################################
 
 def demo():
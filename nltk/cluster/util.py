@@ -58,7 +58,6 @@ class VectorSpaceClusterer(ClusterI):
 
         # assign the vectors to clusters
         if assign_clusters:
-            print(self._Tt, vectors)
             return [self.classify(vector) for vector in vectors]
 
     def cluster_vectorspace(self, vectors, trace):
@@ -150,7 +149,7 @@ class _DendrogramNode(object):
         while len(queue) < n:
             priority, node = queue.pop()
             if not node._children:
-                queue.push((priority, node))
+                queue.append((priority, node))
                 break
             for child in node._children:
                 if child._children:
@@ -158,7 +157,7 @@ class _DendrogramNode(object):
                 else:
                     queue.append((0, child))
             # makes the earliest merges at the start, latest at the end
-            queue.sort()
+            queue.sort(key=lambda item: item[0])
 
         groups = []
         for priority, node in queue:
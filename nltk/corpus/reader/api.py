@@ -382,33 +382,46 @@ class SyntaxCorpusReader(CorpusReader):
         elif isinstance(fileids, compat.string_types): fileids = [fileids]
         return concat([self.open(f).read() for f in fileids])
 
-    def parsed_sents(self, fileids=None):
-        reader = self._read_parsed_sent_block
-        return concat([StreamBackedCorpusView(fileid, reader, encoding=enc)
-                       for fileid, enc in self.abspaths(fileids, True)])
+    def parsed_sents(self, fileids=None, processes=1):
+        return self._views(fileids, '_read_parsed_sent_block', (), processes)
 
-    def tagged_sents(self, fileids=None, tagset=None):
-        def reader(stream):
-            return self._read_tagged_sent_block(stream, tagset)
-        return concat([StreamBackedCorpusView(fileid, reader, encoding=enc)
-                       for fileid, enc in self.abspaths(fileids, True)])
+    def tagged_sents(self, fileids=None, tagset=None, processes=1):
+        return self._views(fileids, '_read_tagged_sent_block', (tagset,),
+                           processes)
 
-    def sents(self, fileids=None):
-        reader = self._read_sent_block
-        return concat([StreamBackedCorpusView(fileid, reader, encoding=enc)
-                       for fileid, enc in self.abspaths(fileids, True)])
+    def sents(self, fileids=None, processes=1):
+        return self._views(fileids, '_read_sent_block', (), processes)
 
-    def tagged_words(self, fileids=None, tagset=None):
-        def reader(stream):
-            return self._read_tagged_word_block(stream, tagset)
-        return concat([StreamBackedCorpusView(fileid, reader, encoding=enc)
-                       for fileid, enc in self.abspaths(fileids, True)])
+    def tagged_words(self, fileids=None, tagset=None, processes=1):
+        return self._views(fileids, '_read_tagged_word_block', (tagset,),
+                           processes)
 
-    def words(self, fileids=None):
-        return concat([StreamBackedCorpusView(fileid,
-                                              self._read_word_block,
-                                              encoding=enc)
-                       for fileid, enc in self.abspaths(fileids, True)])
+    def words(self, fileids=None, processes=1):
+        return self._views(fileids, '_read_word_block', (), processes)
+
+    def _views(self, fileids, block_reader, args=(), processes=1):
+        """
+        :return: The concatenated corpus views of the given files, whose
+            blocks are read by calling the method named ``block_reader``
+            with the stream and ``args``.  If ``processes`` is greater
+            than one, then the files are read by that many worker
+            processes, and a list is returned instead.
+        """
+        paths = self.abspaths(fileids, True)
+        if processes > 1:
+            tasks = [(self, fileid, enc, block_reader, args)
+                     for (fileid, enc) in paths]
+            import multiprocessing
+            workers = multiprocessing.Pool(processes)
+            try:
+                results = workers.map(_read_file_in_worker, tasks)
+            finally:
+                workers.close()
+                workers.join()
+            return [item for result in results for item in result]
+        reader = _BlockReader(self, block_reader, args)
+        return concat([StreamBackedCorpusView(fileid, reader, encoding=enc)
+                       for (fileid, enc) in paths])
 
     #------------------------------------------------------------
     #{ Block Readers
@@ -432,3 +445,23 @@ class SyntaxCorpusReader(CorpusReader):
     #} End of Block Readers
     #------------------------------------------------------------
 
+
+class _BlockReader(object):
+    """
+    A block reader that calls a method of a corpus reader by name, so
+    that it can be pickled.
+    """
+    def __init__(self, reader, name, args):
+        self._reader = reader
+        self._name = name
+        self._args = args
+
+    def __call__(self, stream):
+        return getattr(self._reader, self._name)(stream, *self._args)
+
+
+def _read_file_in_worker(args):
+    (reader, fileid, encoding, block_reader, block_args) = args
+    return list(StreamBackedCorpusView(
+        fileid, _BlockReader(reader, block_reader, block_args),
+        encoding=encoding))
@@ -19,7 +19,7 @@ import textwrap
 from collections import defaultdict
 from pprint import pprint, pformat
 from nltk.internals import ElementWrapper
-from nltk.corpus.reader import XMLCorpusReader, XMLCorpusView
+from nltk.corpus.reader import XMLCorpusReader, StreamingXMLCorpusView
 from nltk.compat import text_type, string_types, python_2_unicode_compatible
 from nltk.util import AbstractLazySequence, LazyMap
 
@@ -497,17 +497,17 @@ class FramenetCorpusReader(XMLCorpusReader):
             self._buildrelationindex()  # always load frame relations before frames,
             # otherwise weird ordering effects might result in incomplete information
         self._frame_idx = {}
-        for f in XMLCorpusView(self.abspath("frameIndex.xml"),
-                               'frameIndex/frame', self._handle_elt):
+        for f in StreamingXMLCorpusView(self.abspath("frameIndex.xml"),
+                                        'frameIndex/frame', self._handle_elt):
             self._frame_idx[f['ID']] = f
 
     def _buildcorpusindex(self):
         # The total number of fulltext annotated documents in Framenet
         # is fairly small (~90) so this index should not be very large
         self._fulltext_idx = {}
-        for doclist in XMLCorpusView(self.abspath("fulltextIndex.xml"),
-                                     'fulltextIndex/corpus',
-                                     self._handle_fulltextindex_elt):
+        for doclist in StreamingXMLCorpusView(self.abspath("fulltextIndex.xml"),
+                                              'fulltextIndex/corpus',
+                                              self._handle_fulltextindex_elt):
             for doc in doclist:
                 self._fulltext_idx[doc.ID] = doc
 
@@ -515,16 +515,16 @@ class FramenetCorpusReader(XMLCorpusReader):
         # The number of LUs in Framenet is about 13,000 so this index
         # should not be very large
         self._lu_idx = {}
-        for lu in XMLCorpusView(self.abspath("luIndex.xml"),
-                                'luIndex/lu', self._handle_elt):
+        for lu in StreamingXMLCorpusView(self.abspath("luIndex.xml"),
+                                         'luIndex/lu', self._handle_elt):
             self._lu_idx[lu['ID']] = lu # populate with LU index entries. if any of these
             # are looked up they will be replaced by full LU objects.
 
     def _buildrelationindex(self):
         #print('building relation index...', file=sys.stderr)
-        freltypes = PrettyList(x for x in XMLCorpusView(self.abspath("frRelation.xml"),
-                                            'frameRelations/frameRelationType',
-                                            self._handle_framerelationtype_elt))
+        freltypes = PrettyList(x for x in StreamingXMLCorpusView(self.abspath("frRelation.xml"),
+                                                     'frameRelations/frameRelationType',
+                                                     self._handle_framerelationtype_elt))
         self._freltyp_idx = {}
         self._frel_idx = {}
         self._frel_f_idx = defaultdict(set)
@@ -629,7 +629,7 @@ class FramenetCorpusReader(XMLCorpusReader):
             "{0}".format(self._root), self._fulltext_dir, xmlfname)
 
         # Grab the top-level xml element containing the fulltext annotation
-        elt = XMLCorpusView(locpath, 'fullTextAnnotation')[0]
+        elt = StreamingXMLCorpusView(locpath, 'fullTextAnnotation')[0]
         return self._handle_fulltextannotation_elt(elt)
 
     def frame_by_id(self, fn_fid, ignorekeys=[]):
@@ -712,7 +712,7 @@ class FramenetCorpusReader(XMLCorpusReader):
         #print(locpath, file=sys.stderr)
         # Grab the xml for the frame
         try:
-            elt = XMLCorpusView(locpath, 'frame')[0]
+            elt = StreamingXMLCorpusView(locpath, 'frame')[0]
         except IOError:
             raise FramenetError('Unknown frame: {0}'.format(fn_fname))
 
@@ -983,7 +983,7 @@ class FramenetCorpusReader(XMLCorpusReader):
             self._buildluindex()
 
         try:
-            elt = XMLCorpusView(locpath, 'lexUnit')[0]
+            elt = StreamingXMLCorpusView(locpath, 'lexUnit')[0]
         except IOError:
             raise FramenetError('Unknown LU id: {0}'.format(fn_luid))
 
@@ -995,9 +995,9 @@ class FramenetCorpusReader(XMLCorpusReader):
     def _loadsemtypes(self):
         """Create the semantic types index."""
         self._semtypes = AttrDict()
-        semtypeXML = [x for x in XMLCorpusView(self.abspath("semTypes.xml"),
-                                             'semTypes/semType',
-                                             self._handle_semtype_elt)]
+        semtypeXML = [x for x in StreamingXMLCorpusView(self.abspath("semTypes.xml"),
+                                                      'semTypes/semType',
+                                                      self._handle_semtype_elt)]
         for st in semtypeXML:
             n = st['name']
             a = st['abbrev']
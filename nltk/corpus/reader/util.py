@@ -621,6 +621,57 @@ def read_regexp_block(stream, start_re, end_re=None):
         # Anything else is part of the token.
         lines.append(line)
 
+def read_unindented_paren_block(stream, block_size=16384):
+    """
+    Read a sequence of tokens from a stream, where tokens begin with
+    lines that start with an open parenthesis, and end at the next such
+    line or EOF.  The tokens are the same as those of
+    ``read_regexp_block(stream, r'^\(')``, but the stream is read
+    ``block_size`` characters at a time rather than a line at a time,
+    and all the complete tokens in the block are returned.
+
+    :param block_size: The default block size for reading.  If a
+        token is longer than one block, then more than one block will
+        be read.
+    """
+    encoding = getattr(stream, 'encoding', None)
+    if encoding is not None:
+        try:
+            has_bom = bool(''.encode(encoding))
+        except LookupError:
+            has_bom = True
+        if has_bom:
+            # The byte offsets of a string can not be found by encoding
+            # it (e.g., utf-16 adds a BOM), so fall back to reading lines.
+            return read_regexp_block(stream, start_re=r'^\(')
+
+    start = stream.tell()
+    block = ''
+    while True:
+        # Make sure that the block ends on a line boundary.
+        next_block = stream.read(block_size)
+        if next_block:
+            next_block += stream.readline()
+        block += next_block
+        starts = [m.start() + 1 for m in _UNINDENTED_PAREN.finditer(block)]
+        if block[:1] == '(':
+            starts.insert(0, 0)
+        if not next_block:
+            # End of file: the last token ends here.
+            ends = starts[1:] + [len(block)]
+            return [block[s:e] for (s, e) in zip(starts, ends)]
+        if len(starts) > 1:
+            # Move to the start of the last token, which may continue
+            # in the next block.
+            offset = starts[-1]
+            if encoding is None:
+                stream.seek(start+offset)
+            else:
+                stream.seek(start+len(block[:offset].encode(encoding)))
+            return [block[s:e] for (s, e) in zip(starts, starts[1:])]
+
+_UNINDENTED_PAREN = re.compile(r'\n\(')
+
 def read_sexpr_block(stream, block_size=16384, comment_char=None):
     """
     Read a sequence of s-expressions from the stream, and leave the
@@ -13,6 +13,8 @@ Corpus reader for corpora whose documents are xml files.
 from __future__ import print_function, unicode_literals
 
 import codecs
+from xml.parsers import expat
+from xml.sax.saxutils import quoteattr
 
 # Use the c version of ElementTree, which is faster, if possible:
 try: from xml.etree import cElementTree as ElementTree
@@ -385,3 +387,220 @@ class XMLCorpusView(StreamBackedCorpusView):
                                   elt.encode('ascii', 'xmlcharrefreplace')),
                             context)
                 for (elt, context) in elts]
+
+
+class StreamingXMLCorpusView(XMLCorpusView):
+    """
+    An ``XMLCorpusView`` that reads its file with a single incremental
+    XML parser, rather than scanning it with regular expressions and
+    re-parsing each selected element from a string.  It has the same
+    tag specifications and element handlers as ``XMLCorpusView``.
+
+    Only the selected elements are built (with an ElementTree
+    ``TreeBuilder``, as by ``ElementTree.iterparse()``), and each is
+    dropped once it has been passed to the element handler, so the
+    memory that is used does not depend on the size of the file.  The
+    parser reports the byte offset of each start tag, and each block
+    ends at a start tag outside of the selected elements; the view
+    records the open elements (and namespace declarations) at that
+    offset, so that a block can be read again later by parsing from
+    the offset, as in any ``StreamBackedCorpusView``.
+
+    Namespaces are handled as by ``ElementTree``: the tags of the
+    elements are ``{uri}local``, while the tag specification is matched
+    against the tag names as they appear in the file.
+    """
+
+    #: The number of bytes after which a block ends, at the next start
+    #: tag outside of the selected elements.
+    _BLOCK_SIZE = 64 * 1024
+
+    #: The number of bytes that are passed to the parser at a time.
+    _READ_SIZE = 64 * 1024
+
+    def __init__(self, fileid, tagspec, elt_handler=None):
+        """
+        Create a new corpus view based on a specified XML file.
+
+        :type tagspec: str
+        :param tagspec: A tag specification, indicating what XML
+            elements should be included in the view.  Each non-nested
+            element that matches this specification corresponds to one
+            item in the view.
+
+        :param elt_handler: A function used to transform each element
+            to a value for the view (see ``XMLCorpusView``).
+        """
+        XMLCorpusView.__init__(self, fileid, tagspec, elt_handler)
+        # The file is read as bytes, and decoded by the parser.
+        self._xml_encoding = self._encoding
+        self._encoding = None
+
+    def read_block(self, stream, tagspec=None, elt_handler=None):
+        """
+        Parse ``stream`` until at least one element that matches
+        ``tagspec`` has been found and ``_BLOCK_SIZE`` bytes have been
+        read (or until the end of the file), and return the result of
+        applying ``elt_handler`` to each element found.
+        """
+        if tagspec is None: tagspec = self._tagspec
+        if elt_handler is None: elt_handler = self.handle_elt
+        if isinstance(tagspec, compat.string_types):
+            tagspec = re.compile(tagspec)
+
+        startpos = stream.tell()
+        context = self._tag_context.get(startpos)
+        assert context is not None # check this -- could it ever happen?
+        prefix = ''.join(_start_tag(name, decls) for (name, decls) in context)
+        prefix = prefix.encode(self._xml_encoding)
+
+        if startpos == 0:
+            # Let the parser read the encoding from the XML declaration
+            parser = expat.ParserCreate(None, '}')
+        else:
+            parser = expat.ParserCreate(
+                _EXPAT_ENCODINGS.get(self._xml_encoding, self._xml_encoding), '}')
+        # The prefix opens the elements of the context again.
+        reader = _ElementReader(parser, tagspec, startpos - len(prefix),
+                                startpos + self._BLOCK_SIZE)
+        try:
+            parser.Parse(prefix, False)
+            while True:
+                data = stream.read(self._READ_SIZE)
+                parser.Parse(data, not data)
+                if not data:
+                    break
+            endpos = stream.tell()
+        except _EndOfBlock:
+            endpos = reader.endpos
+        except expat.ExpatError as e:
+            raise ValueError('Unable to parse %s: %s' % (self._fileid, e))
+        stream.seek(endpos)
+
+        # Update the _tag_context dict.
+        context = tuple(reader.context)
+        if endpos in self._tag_context:
+            assert context == self._tag_context[endpos]
+        else:
+            self._tag_context[endpos] = context
+
+        return [elt_handler(elt, elt_context)
+                for (elt, elt_context) in reader.elts]
+
+
+#: The names that expat uses for the encodings of ``_detect_encoding()``
+#: that have no byte order mark when a file is parsed from the middle.
+_EXPAT_ENCODINGS = {'utf-16-be': 'UTF-16BE', 'utf-16-le': 'UTF-16LE'}
+
+def _start_tag(name, decls):
+    """
+    :return: A start tag for the element ``name`` which declares the
+        given ``(prefix, uri)`` namespaces.
+    """
+    attrs = ''.join(' xmlns%s=%s' % (':' + prefix if prefix else '',
+                                     quoteattr(uri))
+                    for (prefix, uri) in decls)
+    return '<%s%s>' % (name, attrs)
+
+class _EndOfBlock(Exception):
+    """Raised by ``_ElementReader`` to stop the parser."""
+
+class _ElementReader(object):
+    """
+    The handlers of an expat parser with namespace processing (and
+    ``namespace_prefixes``), which build the elements that match a
+    tag specification, and stop the parser at the first start tag
+    outside of them after ``endpos``.
+
+    :ivar context: The ``(name, decls)`` pairs of the open elements,
+        where ``name`` is the tag name in the file and ``decls`` are
+        the namespaces that it declares (or None for the elements
+        inside of a selected element).
+    :ivar elts: The ``(elt, context)`` pairs of the selected elements.
+    :ivar endpos: The offset in the file at which the parser stopped.
+    """
+    def __init__(self, parser, tagspec, offset, endpos):
+        self._parser = parser
+        self._tagspec = tagspec
+        self._offset = offset
+        self.context = []
+        self.elts = []
+        self.endpos = endpos
+        self._decls = []
+        self._builder = None
+        # The tag paths of the open elements
+        self._paths = ['']
+        # Whether each tag path matches the tag specification
+        self._matches = {}
+        # The (tag, name) pair of each name reported by expat
+        self._names = {}
+        parser.namespace_prefixes = True
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._data
+        parser.StartNamespaceDeclHandler = self._start_namespace
+
+    def _split_name(self, name):
+        try:
+            return self._names[name]
+        except KeyError:
+            result = self._names[name] = _split_name(name)
+            return result
+
+    def _start(self, name, attrs):
+        (tag, qname) = self._split_name(name)
+        builder = self._builder
+        decls = self._decls
+        self._decls = []
+        if builder is None:
+            if self.elts:
+                pos = self._offset + self._parser.CurrentByteIndex
+                if pos >= self.endpos:
+                    self.endpos = pos
+                    raise _EndOfBlock()
+            path = self._paths[-1] + '/' + qname if self.context else qname
+            self.context.append((qname, tuple(decls)))
+            self._paths.append(path)
+            try:
+                match = self._matches[path]
+            except KeyError:
+                match = self._matches[path] = bool(self._tagspec.match(path))
+            if not match:
+                return
+            builder = self._builder = ElementTree.TreeBuilder()
+        else:
+            self.context.append(None)
+        if attrs:
+            attrs = dict((self._split_name(key)[0], value)
+                         for (key, value) in attrs.items())
+        builder.start(tag, attrs)
+
+    def _end(self, name):
+        if self._builder is not None:
+            self._builder.end(self._split_name(name)[0])
+            if self.context[-1] is not None:
+                self.elts.append((self._builder.close(), self._paths[-1]))
+                self._builder = None
+        if self.context.pop() is not None:
+            self._paths.pop()
+
+    def _data(self, text):
+        if self._builder is not None:
+            self._builder.data(text)
+
+    def _start_namespace(self, prefix, uri):
+        self._decls.append((prefix, uri))
+
+def _split_name(name):
+    """
+    :return: The ElementTree tag (``{uri}local``) and the name in the
+        file (``prefix:local``) of a name reported by expat.
+    """
+    parts = name.split('}')
+    if len(parts) == 1:
+        return (name, name)
+    elif len(parts) == 2:
+        return ('{%s}%s' % tuple(parts), parts[1])
+    else:
+        return ('{%s}%s' % tuple(parts[:2]), '%s:%s' % (parts[2], parts[1]))
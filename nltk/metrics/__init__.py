@@ -14,12 +14,15 @@ Classes and methods for scoring processing modules.
 """
 
 from nltk.metrics.scores import          (accuracy, precision, recall, f_measure,
-                                          log_likelihood, approxrand)
+                                          log_likelihood, approxrand,
+                                          paired_bootstrap)
 from nltk.metrics.confusionmatrix import ConfusionMatrix
-from nltk.metrics.distance        import (edit_distance, binary_distance,
+from nltk.metrics.distance        import (edit_distance, edit_distance_many,
+                                          edit_distance_matrix, binary_distance,
                                           jaccard_distance, masi_distance,
                                           interval_distance, custom_distance,
                                           presence, fractional_presence)
+from nltk.metrics.bktree          import BKTree
 from nltk.metrics.paice           import Paice
 from nltk.metrics.segmentation    import windowdiff, ghd, pk
 from nltk.metrics.agreement       import AnnotationTask
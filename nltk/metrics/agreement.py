@@ -35,6 +35,11 @@ each containing a coder's assignment for one object in the task:
 Note that the data list needs to contain the same number of triples for each
 individual coder, containing category values for the same set of items.
 
+The labels are counted once, when the first coefficient is computed: for
+each coder, for each pair of coders, and for each pair of labels that
+co-occur on an item; and the distance function is called once for each
+pair of labels.  The coefficients are computed from these counts.
+
 Alpha (Krippendorff 1980)
 Kappa (Cohen 1960)
 S (Bennet, Albert and Goldstein 1954)
@@ -54,6 +59,12 @@ Expected results from the Artstein and Poesio survey paper:
     0.7995322418977615...
     >>> t.S()
     0.8199999999999998...
+    >>> t.alpha()
+    0.8005345806882727...
+    >>> t.kappa()
+    0.8013245033112583...
+    >>> t.weighted_kappa()
+    0.8013245033112583...
 
     This would have returned a wrong value (0.0) in @785fb79 as coders are in
     the wrong order. Subsequently, all values for pi(), S(), and kappa() would
@@ -74,9 +85,8 @@ import logging
 from itertools import groupby
 from operator import itemgetter
 
-from nltk.probability import FreqDist, ConditionalFreqDist
 from nltk.internals import deprecated
-from nltk.compat import python_2_unicode_compatible, iteritems
+from nltk.compat import python_2_unicode_compatible, iteritems, izip, Counter
 
 from nltk.metrics.distance import binary_distance
 
@@ -105,6 +115,7 @@ class AnnotationTask(object):
         self.K = set()
         self.C = set()
         self.data = []
+        self._indexed = False
         if data is not None:
             self.load_array(data)
 
@@ -124,6 +135,83 @@ class AnnotationTask(object):
             self.K.add(labels)
             self.I.add(item)
             self.data.append({'coder':coder, 'labels':labels, 'item':item})
+        self._indexed = False
+
+    def _build_tables(self):
+        """Count the labels in the data, once, in the tables from which
+        the agreement coefficients are computed.  Labels are numbered,
+        and the distance between each pair of labels is only computed
+        once.
+
+        """
+        if self._indexed:
+            return
+        labels = list(self.K)
+        label_ids = dict((k, n) for (n, k) in enumerate(labels))
+        item_ids = dict((i, n) for (n, i) in enumerate(self.I))
+        # columns[c][n]: the id of the label given by coder c to item n
+        columns = dict((c, [None] * len(item_ids)) for c in self.C)
+        for x in self.data:
+            columns[x['coder']][item_ids[x['item']]] = label_ids[x['labels']]
+        # coder_counts[c][k]: the number of items given label k by coder c
+        coder_counts = {}
+        for (c, column) in iteritems(columns):
+            counts = [0] * len(labels)
+            for (k, n) in iteritems(Counter(column)):
+                if k is not None:
+                    counts[k] = n
+            coder_counts[c] = counts
+        totals = [sum(counts[k] for counts in coder_counts.values())
+                  for k in range(len(labels))]
+        # coincidences[k, l]: the sum over all items of the number of
+        # coders that gave label k times the number that gave label l
+        coincidences = Counter()
+        item_counts = Counter(izip(*columns.values())) if columns else {}
+        for (item_labels, n) in iteritems(item_counts):
+            counts = list(Counter(item_labels).items())
+            for (k, nk) in counts:
+                for (l, nl) in counts:
+                    if k is not None and l is not None:
+                        coincidences[k, l] += n * nk * nl
+        distances = [[float(self.distance(k, l)) for l in labels]
+                     for k in labels]
+        self._label_ids = label_ids
+        self._columns = columns
+        self._coder_counts = coder_counts
+        self._totals = totals
+        self._coincidences = coincidences
+        self._distances = distances
+        self._pair_counts_cache = {}
+        self._indexed = True
+
+    def _pair_counts(self, cA, cB):
+        """Return a Counter mapping each pair of label ids (kA, kB) to
+        the number of items that coder cA gave label kA and coder cB
+        gave label kB.
+
+        """
+        self._build_tables()
+        pair_counts = self._pair_counts_cache
+        if (cA, cB) not in pair_counts:
+            counts = Counter(izip(self._columns[cA], self._columns[cB]))
+            for pair in list(counts):
+                if None in pair:
+                    del counts[pair]
+            pair_counts[cA, cB] = counts
+        return pair_counts[cA, cB]
+
+    def _pair_distance(self, cA, cB):
+        """The sum over all items of the distance between the labels
+        given by coders cA and cB.
+
+        """
+        self._build_tables()
+        distances = self._distances
+        return sum(n * distances[k][l]
+                   for ((k, l), n) in iteritems(self._pair_counts(cA, cB)))
+
+    def _num_pairs(self):
+        return len(self.C) * (len(self.C) - 1) / 2.0
 
     def agr(self, cA, cB, i, data=None):
         """Agreement between two coders on a given item
@@ -147,13 +235,19 @@ class AnnotationTask(object):
         return ret
 
     def Nk(self, k):
-        return float(sum(1 for x in self.data if x['labels'] == k))
+        self._build_tables()
+        if k not in self._label_ids:
+            return 0.0
+        return float(self._totals[self._label_ids[k]])
 
     def Nik(self, i, k):
         return float(sum(1 for x in self.data if x['item'] == i and x['labels'] == k))
 
     def Nck(self, c, k):
-        return float(sum(1 for x in self.data if x['coder'] == c and x['labels'] == k))
+        self._build_tables()
+        if c not in self._coder_counts or k not in self._label_ids:
+            return 0.0
+        return float(self._coder_counts[c][self._label_ids[k]])
 
     @deprecated('Use Nk, Nik or Nck instead')
     def N(self, k=None, i=None, c=None):
@@ -179,8 +273,8 @@ class AnnotationTask(object):
         """Observed agreement between two coders on all items.
 
         """
-        data = self._grouped_data('item', (x for x in self.data if x['coder'] in (cA, cB)))
-        ret = float(sum(self.agr(cA, cB, item, item_data) for item, item_data in data)) / float(len(self.I))
+        n = sum(self._pair_counts(cA, cB).values())
+        ret = (n - self._pair_distance(cA, cB)) / float(len(self.I))
         log.debug("Observed agreement between %s and %s: %f", cA, cB, ret)
         return ret
 
@@ -199,11 +293,25 @@ class AnnotationTask(object):
         ret = total / n
         return ret
 
+    def _avg_pair_distance(self):
+        """The average over all coder pairs of the sum over all items of
+        the distance between the labels given by the two coders.  This
+        is computed from the coincidences of labels within items, rather
+        than from each pair of coders.
+
+        """
+        self._build_tables()
+        distances = self._distances
+        total = sum(n * distances[k][l]
+                    for ((k, l), n) in iteritems(self._coincidences))
+        total -= sum(n * distances[k][k] for (k, n) in enumerate(self._totals))
+        return total / 2.0 / self._num_pairs()
+
     def avg_Ao(self):
         """Average observed agreement across all coders and items.
 
         """
-        ret = self._pairwise_average(self.Ao)
+        ret = 1.0 - self._avg_pair_distance() / float(len(self.I))
         log.debug("Average observed agreement: %f", ret)
         return ret
 
@@ -213,13 +321,10 @@ class AnnotationTask(object):
         The alpha coefficient, unlike the other metrics, uses this rather than
         observed agreement.
         """
-        total = 0.0
-        for i, itemdata in self._grouped_data('item'):
-            label_freqs = FreqDist(x['labels'] for x in itemdata)
-
-            for j, nj in iteritems(label_freqs):
-                for l, nl in iteritems(label_freqs):
-                    total += float(nj * nl) * self.distance(l, j)
+        self._build_tables()
+        distances = self._distances
+        total = sum(float(n) * distances[k][l]
+                    for ((k, l), n) in iteritems(self._coincidences))
         ret = (1.0 / float((len(self.I) * len(self.C) * (len(self.C) - 1)))) * total
         log.debug("Observed disagreement: %f", ret)
         return ret
@@ -228,14 +333,7 @@ class AnnotationTask(object):
         """The observed disagreement for the weighted kappa coefficient.
 
         """
-        total = 0.0
-        data = (x for x in self.data if x['coder'] in (cA, cB))
-        for i, itemdata in self._grouped_data('item', data):
-            # we should have two items; distance doesn't care which comes first
-            total += self.distance(itemdata.next()['labels'],
-                    itemdata.next()['labels'])
-
-        ret = total / (len(self.I) * max_distance)
+        ret = self._pair_distance(cA, cB) / (len(self.I) * max_distance)
         log.debug("Observed disagreement between %s and %s: %f", cA, cB, ret)
         return ret
 
@@ -243,7 +341,7 @@ class AnnotationTask(object):
         """Averaged over all labelers
 
         """
-        ret = self._pairwise_average(lambda cA, cB: self.Do_Kw_pairwise(cA, cB, max_distance))
+        ret = self._avg_pair_distance() / (len(self.I) * max_distance)
         log.debug("Observed disagreement: %f", ret)
         return ret
 
@@ -261,20 +359,17 @@ class AnnotationTask(object):
         Equivalent to K from Siegel and Castellan (1988).
 
         """
-        total = 0.0
-        label_freqs = FreqDist(x['labels'] for x in self.data)
-        for k, f in iteritems(label_freqs):
-            total += f ** 2
+        self._build_tables()
+        total = float(sum(f ** 2 for f in self._totals))
         Ae = total / float((len(self.I) * len(self.C)) ** 2)
         return (self.avg_Ao() - Ae) / (1 - Ae)
 
     def Ae_kappa(self, cA, cB):
-        Ae = 0.0
+        self._build_tables()
         nitems = float(len(self.I))
-        label_freqs = ConditionalFreqDist((x['labels'], x['coder']) for x in self.data)
-        for k in label_freqs.conditions():
-            Ae += (label_freqs[k][cA] / nitems) * (label_freqs[k][cB] / nitems)
-        return Ae
+        return sum((nA / nitems) * (nB / nitems)
+                   for (nA, nB) in zip(self._coder_counts[cA],
+                                       self._coder_counts[cB]))
 
     def kappa_pairwise(self, cA, cB):
         """
@@ -297,20 +392,23 @@ class AnnotationTask(object):
         Averages over observed and expected agreements for each coder pair.
 
         """
-        Ae = self._pairwise_average(self.Ae_kappa)
+        self._build_tables()
+        # the sum over coder pairs of the products of their label counts
+        total = sum(f ** 2 for f in self._totals)
+        total -= sum(n ** 2 for counts in self._coder_counts.values()
+                     for n in counts)
+        Ae = total / 2.0 / self._num_pairs() / float(len(self.I)) ** 2
         return (self.avg_Ao() - Ae) / (1.0 - Ae)
 
     def alpha(self):
         """Krippendorff 1980
 
         """
+        self._build_tables()
         De = 0.0
-
-        label_freqs = FreqDist(x['labels'] for x in self.data)
-        for j in self.K:
-            nj = label_freqs[j]
-            for l in self.K:
-                De += float(nj * label_freqs[l]) * self.distance(j, l)
+        for (j, nj) in enumerate(self._totals):
+            for (l, nl) in enumerate(self._totals):
+                De += float(nj * nl) * self._distances[j][l]
         De = (1.0 / (len(self.I) * len(self.C) * (len(self.I) * len(self.C) - 1))) * De
         log.debug("Expected disagreement: %f", De)
         ret = 1.0 - (self.Do_alpha() / De)
@@ -320,13 +418,11 @@ class AnnotationTask(object):
         """Cohen 1968
 
         """
+        self._build_tables()
         total = 0.0
-        label_freqs = ConditionalFreqDist((x['coder'], x['labels'])
-                for x in self.data
-                if x['coder'] in (cA, cB))
-        for j in self.K:
-            for l in self.K:
-                total += label_freqs[cA][j] * label_freqs[cB][l] * self.distance(j, l)
+        for (j, nA) in enumerate(self._coder_counts[cA]):
+            for (l, nB) in enumerate(self._coder_counts[cB]):
+                total += nA * nB * self._distances[j][l]
         De = total / (max_distance * pow(len(self.I), 2))
         log.debug("Expected disagreement between %s and %s: %f", cA, cB, De)
         Do = self.Do_Kw_pairwise(cA, cB)
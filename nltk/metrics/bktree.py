@@ -0,0 +1,176 @@
+# Natural Language Toolkit: Approximate String Matching
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+An index for finding the strings in a lexicon that are close to a given
+string, by edit distance.
+
+A BK-tree (Burkhard and Keller, 1973) stores one string at each node,
+and labels each edge with the distance between the strings of the two
+nodes that it connects.  By the triangle inequality, if the query is at
+distance *d* from a node, then the strings within distance *k* of the
+query can only be found below the edges labelled *d-k* to *d+k*, so
+most of the tree is never visited:
+
+    >>> from nltk.metrics.bktree import BKTree
+    >>> tree = BKTree(['rain', 'shine', 'train', 'brain', 'drain', 'sun'])
+    >>> tree.search('rain', 1)
+    [(0, 'rain'), (1, 'brain'), (1, 'drain'), (1, 'train')]
+    >>> tree.nearest('shone')
+    [(1, 'shine')]
+
+The distances are those computed by ``edit_distance()``.  The tree only
+consists of lists and dictionaries, so it can be pickled.
+"""
+from __future__ import print_function
+
+import bisect
+import heapq
+
+from nltk.metrics.distance import _pattern_bits, _edit_dist_bits
+
+
+class BKTree(object):
+    """
+    A BK-tree over a set of strings, which finds all the strings within
+    a given edit distance of a query string, or the strings nearest to
+    it.  Results are sorted by distance, and then by string.
+
+    The nodes of the tree are numbered in order of insertion;
+    ``self._strings[i]`` is the string at node *i*, and
+    ``self._children[i]`` maps edge labels (distances) to child nodes.
+    """
+    def __init__(self, strings=(), transpositions=False):
+        """
+        :param strings: The strings to add to the tree.
+        :param transpositions: Must be false.  With transpositions,
+            ``edit_distance()`` is the optimal string alignment distance,
+            which does not satisfy the triangle inequality, so the
+            tree would miss some of the strings that match.
+        :raise ValueError: If ``transpositions`` is true.
+        """
+        if transpositions:
+            raise ValueError('BKTree does not support transpositions, as '
+                             'the distance with transpositions does not '
+                             'satisfy the triangle inequality')
+        self._transpositions = transpositions
+        self._strings = []
+        self._children = []
+        self.update(strings)
+
+    def add(self, s):
+        """
+        Add a string to the tree.  Adding a string that is already in
+        the tree has no effect.
+        """
+        if not self._strings:
+            self._strings.append(s)
+            self._children.append({})
+            return
+        peq = _pattern_bits(s)
+        node = 0
+        while True:
+            d = _edit_dist_bits(peq, len(s), self._strings[node],
+                                self._transpositions)
+            if d == 0:
+                return
+            child = self._children[node].get(d)
+            if child is None:
+                self._children[node][d] = len(self._strings)
+                self._strings.append(s)
+                self._children.append({})
+                return
+            node = child
+
+    def update(self, strings):
+        """
+        Add each of the given strings to the tree.
+        """
+        for s in strings:
+            self.add(s)
+
+    def search(self, s, max_distance):
+        """
+        :return: A list of ``(distance, string)`` pairs for the strings
+            in the tree that are at most ``max_distance`` from ``s``,
+            sorted by distance and then by string.
+        :rtype: list(tuple(int, str))
+        """
+        results = []
+        if not self._strings:
+            return results
+        peq = _pattern_bits(s)
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            children = self._children[node]
+            # The distance only needs to be known exactly if it is small
+            # enough to match, or to select one of the children.
+            limit = max_distance + max(children) if children else max_distance
+            d = _edit_dist_bits(peq, len(s), self._strings[node],
+                                self._transpositions, limit)
+            if d <= max_distance:
+                results.append((d, self._strings[node]))
+            for (label, child) in children.items():
+                if d - max_distance <= label <= d + max_distance:
+                    stack.append(child)
+        results.sort()
+        return results
+
+    def nearest(self, s, n=1, max_distance=None):
+        """
+        :return: A list of ``(distance, string)`` pairs for the ``n``
+            strings in the tree that are nearest to ``s``, sorted by
+            distance and then by string.  Ties between strings at the
+            same distance are broken by sorting the strings.
+        :param max_distance: If specified, then only strings that are at
+            most this far from ``s`` are returned.
+        :rtype: list(tuple(int, str))
+        """
+        if not self._strings or n < 1:
+            return []
+        peq = _pattern_bits(s)
+        best = []  # the best results so far, in sorted order
+        radius = max_distance
+        # Visit the nodes best-first, by a lower bound on the distance
+        # from s to any string below them.
+        queue = [(0, 0)]
+        while queue:
+            (bound, node) = heapq.heappop(queue)
+            if radius is not None and bound > radius:
+                break
+            children = self._children[node]
+            if radius is None:
+                limit = None
+            elif children:
+                limit = radius + max(children)
+            else:
+                limit = radius
+            d = _edit_dist_bits(peq, len(s), self._strings[node],
+                                self._transpositions, limit)
+            if radius is None or d <= radius:
+                bisect.insort(best, (d, self._strings[node]))
+                if len(best) > n:
+                    best.pop()
+                if len(best) == n:
+                    radius = best[-1][0]
+            for (label, child) in children.items():
+                child_bound = max(bound, abs(d - label))
+                if radius is None or child_bound <= radius:
+                    heapq.heappush(queue, (child_bound, child))
+        return best
+
+    def __contains__(self, s):
+        return bool(self._strings) and self.search(s, 0) != []
+
+    def __iter__(self):
+        return iter(self._strings)
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __repr__(self):
+        return '<BKTree with %d strings>' % len(self._strings)
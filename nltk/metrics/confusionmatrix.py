@@ -5,9 +5,8 @@
 #         Steven Bird <stevenbird1@gmail.com>
 # URL: <http://nltk.org/>
 # For license information, see LICENSE.TXT
-from __future__ import print_function, unicode_literals
-from nltk.probability import FreqDist
-from nltk.compat import python_2_unicode_compatible
+from __future__ import print_function, unicode_literals, division
+from nltk.compat import python_2_unicode_compatible, Counter, izip
 
 @python_2_unicode_compatible
 class ConfusionMatrix(object):
@@ -27,9 +26,23 @@ class ConfusionMatrix(object):
     Note that the diagonal entries *Ri=Tj* of this matrix
     corresponds to correct values; and the off-diagonal entries
     correspond to incorrect values.
+
+    A confusion matrix can also be accumulated from a stream of
+    (batches of) values with ``update()``, and the confusion matrices
+    of several parts of a corpus can be combined with ``merge()``:
+
+        >>> cm = ConfusionMatrix()
+        >>> cm.update(ref[:5], test[:5])
+        >>> cm.update(ref[5:], test[5:])
+        >>> cm
+        <ConfusionMatrix: 8/10 correct>
+        >>> print('%.3f' % cm.precision('NN'))
+        0.750
+        >>> print('%.3f' % cm.recall('VB'))
+        1.000
     """
 
-    def __init__(self, reference, test, sort_by_count=False):
+    def __init__(self, reference=(), test=(), sort_by_count=False):
         """
         Construct a new confusion matrix from a list of reference
         values and a corresponding list of test values.
@@ -39,43 +52,96 @@ class ConfusionMatrix(object):
         :type test: list
         :param test: A list of values to compare against the
             corresponding reference values.
+        :param sort_by_count: If true, then the values are listed in
+            order of decreasing frequency (in ``reference`` and
+            ``test``), rather than in sorted order.
         :raise ValueError: If ``reference`` and ``length`` do not have
             the same length.
         """
-        if len(reference) != len(test):
-            raise ValueError('Lists must have the same length.')
-
-        # Get a list of all values.
-        if sort_by_count:
-            ref_fdist = FreqDist(reference)
-            test_fdist = FreqDist(test)
-            def key(v): return -(ref_fdist[v]+test_fdist[v])
-            values = sorted(set(reference+test), key=key)
-        else:
-            values = sorted(set(reference+test))
-
-        # Construct a value->index dictionary
-        indices = dict((val,i) for (i,val) in enumerate(values))
-
-        # Make a confusion matrix table.
-        confusion = [[0 for val in values] for val in values]
-        max_conf = 0 # Maximum confusion
-        for w,g in zip(reference, test):
-            confusion[indices[w]][indices[g]] += 1
-            max_conf = max(max_conf, confusion[indices[w]][indices[g]])
-
-        #: A list of all values in ``reference`` or ``test``.
-        self._values = values
-        #: A dictionary mapping values in ``self._values`` to their indices.
-        self._indices = indices
-        #: The confusion matrix itself (as a list of lists of counts).
-        self._confusion = confusion
+        #: A list of all values in the matrix, in order of first
+        #: occurrence.  (The display order is given by ``values()``.)
+        self._labels = []
+        #: A dictionary mapping values in ``self._labels`` to their indices.
+        self._indices = {}
+        #: The confusion matrix itself (as a list of lists of counts),
+        #: indexed by ``self._indices``.
+        self._confusion = []
         #: The greatest count in ``self._confusion`` (used for printing).
-        self._max_conf = max_conf
+        self._max_conf = 0
         #: The total number of values in the confusion matrix.
-        self._total = len(reference)
+        self._total = 0
         #: The number of correct (on-diagonal) values in the matrix.
-        self._correct = sum(confusion[i][i] for i in range(len(values)))
+        self._correct = 0
+        self._sort_by_count = sort_by_count
+        self.update(reference, test)
+
+    def _index(self, value):
+        """
+        Return the index of ``value``, adding a row and a column for it
+        to the matrix if it has not been seen before.
+        """
+        i = self._indices.get(value)
+        if i is None:
+            i = self._indices[value] = len(self._labels)
+            self._labels.append(value)
+            for row in self._confusion:
+                row.append(0)
+            self._confusion.append([0] * len(self._labels))
+        return i
+
+    def update(self, reference, test):
+        """
+        Add the counts for a list of reference values and a
+        corresponding list of test values to this confusion matrix.
+        The lists may be any iterables; they are only traversed once.
+
+        :raise ValueError: If ``reference`` and ``length`` are sequences
+            that do not have the same length.
+        """
+        if (hasattr(reference, '__len__') and hasattr(test, '__len__') and
+                len(reference) != len(test)):
+            raise ValueError('Lists must have the same length.')
+        self._add_counts(Counter(izip(reference, test)).items())
+
+    def merge(self, other):
+        """
+        Add the counts of another confusion matrix (e.g., one computed
+        for another part of a corpus, or by another process) to this
+        confusion matrix.
+        """
+        self._add_counts(((r, t), other._confusion[i][j])
+                         for (r, i) in other._indices.items()
+                         for (t, j) in other._indices.items()
+                         if other._confusion[i][j])
+
+    def _add_counts(self, counts):
+        confusion = self._confusion
+        for ((r, t), count) in counts:
+            i = self._index(r)
+            j = self._index(t)
+            confusion[i][j] += count
+            self._max_conf = max(self._max_conf, confusion[i][j])
+            self._total += count
+            if i == j:
+                self._correct += count
+        self._values = None
+
+    def values(self):
+        """
+        :return: A list of all values in ``reference`` or ``test``, in
+            the order in which they are displayed.
+        """
+        if self._values is None:
+            values = sorted(self._labels)
+            if self._sort_by_count:
+                confusion = self._confusion
+                def key(v):
+                    i = self._indices[v]
+                    return -(sum(confusion[i]) +
+                             sum(row[i] for row in confusion))
+                values.sort(key=key)
+            self._values = values
+        return self._values
 
     def __getitem__(self, li_lj_tuple):
         """
@@ -88,6 +154,73 @@ class ConfusionMatrix(object):
         j = self._indices[lj]
         return self._confusion[i][j]
 
+    def accuracy(self):
+        """
+        :return: The fraction of the values that are correct, or None
+            if the matrix is empty.
+        """
+        if self._total == 0:
+            return None
+        return self._correct / self._total
+
+    def precision(self, value):
+        """
+        :return: The fraction of the test values ``value`` that are
+            correct, or None if ``value`` is never given as a test value.
+        """
+        j = self._indices.get(value)
+        if j is None:
+            return None
+        given = sum(row[j] for row in self._confusion)
+        if given == 0:
+            return None
+        return self._confusion[j][j] / given
+
+    def recall(self, value):
+        """
+        :return: The fraction of the reference values ``value`` that
+            are given as test values, or None if ``value`` is never a
+            reference value.
+        """
+        i = self._indices.get(value)
+        if i is None:
+            return None
+        expected = sum(self._confusion[i])
+        if expected == 0:
+            return None
+        return self._confusion[i][i] / expected
+
+    def f_measure(self, value, alpha=0.5):
+        """
+        :return: The f-measure of ``value``, i.e. the harmonic mean of
+            its ``precision`` and ``recall``, weighted by ``alpha``; or
+            None if either of them is None.
+        :see: ``nltk.metrics.scores.f_measure()``
+        """
+        return _f_measure(self.precision(value), self.recall(value), alpha)
+
+    def macro_average(self, alpha=0.5):
+        """
+        :return: A tuple ``(precision, recall, f_measure)`` containing
+            the averages of each of these scores over all values.
+            Scores that are undefined (None) count as 0.
+        """
+        if not self._labels:
+            return (None, None, None)
+        scores = [(self.precision(v) or 0, self.recall(v) or 0,
+                   self.f_measure(v, alpha) or 0) for v in self._labels]
+        return tuple(sum(s) / len(scores) for s in zip(*scores))
+
+    def micro_average(self, alpha=0.5):
+        """
+        :return: A tuple ``(precision, recall, f_measure)`` containing
+            the scores computed from the counts of all values together.
+            As each item has exactly one reference value and one test
+            value, these are all equal to ``accuracy()``.
+        """
+        accuracy = self.accuracy()
+        return (accuracy, accuracy, accuracy)
+
     def __repr__(self):
         return '<ConfusionMatrix: %s/%s correct>' % (self._correct,
                                                      self._total)
@@ -113,7 +246,7 @@ class ConfusionMatrix(object):
         """
         confusion = self._confusion
 
-        values = self._values
+        values = self.values()
         if sort_by_count:
             values = sorted(values, key=lambda v:
                             -sum(self._confusion[self._indices[v]]))
@@ -184,7 +317,7 @@ class ConfusionMatrix(object):
         return s
 
     def key(self):
-        values = self._values
+        values = self.values()
         str = 'Value key:\n'
         indexlen = len(repr(len(values)-1))
         key_format = '  %'+repr(indexlen)+'d: %s\n'
@@ -193,6 +326,13 @@ class ConfusionMatrix(object):
 
         return str
 
+def _f_measure(p, r, alpha):
+    if p is None or r is None:
+        return None
+    if p == 0 or r == 0:
+        return 0
+    return 1.0/(alpha/p + (1-alpha)/r)
+
 def demo():
     reference = 'DET NN VB DET JJ NN NN IN DET NN'.split()
     test    = 'DET VB VB DET NN NN NN IN DET NN'.split()
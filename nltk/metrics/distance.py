@@ -54,7 +54,92 @@ def _edit_dist_step(lev, i, j, s1, s2, transpositions=False):
     lev[i][j] = min(a, b, c, d)
 
 
-def edit_distance(s1, s2, transpositions=False):
+def _edit_dist_rows(s1, s2, transpositions=False, max_distance=None):
+    """
+    Compute the edit distance with the same recurrence as
+    ``_edit_dist_step()``, keeping only the last (two) rows of the table.
+    This works for sequences of unhashable items, which
+    ``_edit_dist_bits()`` does not support.
+    """
+    len2 = len(s2)
+    before = None
+    previous = list(range(len2 + 1))
+    for i in range(1, len(s1) + 1):
+        c1 = s1[i - 1]
+        current = [i] + [0] * len2
+        for j in range(1, len2 + 1):
+            c2 = s2[j - 1]
+            cost = min(previous[j] + 1, current[j - 1] + 1,
+                       previous[j - 1] + (c1 != c2))
+            if (transpositions and i > 1 and j > 1 and
+                    s1[i - 2] == c2 and s2[j - 2] == c1):
+                cost = min(cost, before[j - 2] + 1)
+            current[j] = cost
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        before, previous = previous, current
+    return _clip(previous[len2], max_distance)
+
+
+def _pattern_bits(s1):
+    """
+    Return a dictionary mapping each item of ``s1`` to the bit vector
+    (an int) of the positions where it occurs.
+    """
+    peq = {}
+    for (i, c) in enumerate(s1):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def _edit_dist_bits(peq, len1, s2, transpositions=False, max_distance=None):
+    """
+    Compute the edit distance between a sequence ``s1`` of length ``len1``
+    whose positions are given by ``peq = _pattern_bits(s1)`` and ``s2``,
+    using the bit-parallel algorithm of Myers (1999), with Hyyro's (2003)
+    extension for transpositions.  Each column of the dynamic programming
+    table is represented by bit vectors of its vertical differences.
+    """
+    if len1 == 0:
+        return _clip(len(s2), max_distance)
+    mask = (1 << len1) - 1
+    high = 1 << (len1 - 1)
+    vp = mask
+    vn = 0
+    d0 = 0
+    pm_prev = 0
+    score = len1
+    remaining = len(s2)
+    for c in s2:
+        eq = peq.get(c, 0)
+        d0_new = (((eq & vp) + vp) ^ vp) | eq | vn
+        if transpositions:
+            d0_new |= (((~d0) & eq) << 1) & pm_prev
+            pm_prev = eq
+        d0 = d0_new
+        hp = vn | ~(d0 | vp)
+        hn = d0 & vp
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        remaining -= 1
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+        hp = (hp << 1) | 1
+        hn = hn << 1
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = hp & d0
+    return _clip(score, max_distance)
+
+
+def _clip(distance, max_distance):
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def edit_distance(s1, s2, transpositions=False, max_distance=None):
     """
     Calculate the Levenshtein edit-distance between two strings.
     The edit distance is the number of characters that need to be
@@ -67,23 +152,130 @@ def edit_distance(s1, s2, transpositions=False):
     This also optionally allows transposition edits (e.g., "ab" -> "ba"),
     though this is disabled by default.
 
+    If ``max_distance`` is given, then the computation stops as soon as
+    the distance is known to be greater than ``max_distance``, and
+    ``max_distance + 1`` is returned instead of the distance.
+
+        >>> edit_distance("rain", "shine")
+        3
+        >>> edit_distance("abc", "acb")
+        2
+        >>> edit_distance("abc", "acb", transpositions=True)
+        1
+        >>> edit_distance("rain", "shine", max_distance=1)
+        2
+
     :param s1, s2: The strings to be analysed
     :param transpositions: Whether to allow transposition edits
+    :param max_distance: The largest distance that needs to be computed
+        exactly
     :type s1: str
     :type s2: str
     :type transpositions: bool
+    :type max_distance: int
     :rtype int
     """
-    # set up a 2-D array
     len1 = len(s1)
     len2 = len(s2)
-    lev = _edit_dist_init(len1 + 1, len2 + 1)
+    if max_distance is not None and abs(len1 - len2) > max_distance:
+        return max_distance + 1
+    try:
+        peq = _pattern_bits(s1)
+    except TypeError:
+        # unhashable items
+        return _edit_dist_rows(s1, s2, transpositions, max_distance)
+    return _edit_dist_bits(peq, len1, s2, transpositions, max_distance)
 
-    # iterate over the array
-    for i in range(len1):
-        for j in range(len2):
-            _edit_dist_step(lev, i + 1, j + 1, s1, s2, transpositions=transpositions)
-    return lev[len1][len2]
+
+def edit_distance_many(s1, strings, transpositions=False, max_distance=None,
+                       processes=1):
+    """
+    Calculate the edit distance between ``s1`` and each of the given
+    strings.  ``s1`` is only preprocessed once, and if ``processes`` is
+    greater than one, then the strings are divided among that many
+    worker processes.
+
+        >>> edit_distance_many("rain", ["shine", "rain", "train"])
+        [3, 0, 1]
+        >>> edit_distance_many("rain", ["shine", "rain", "train"],
+        ...                    max_distance=1)
+        [2, 0, 1]
+
+    :param strings: The strings to compare ``s1`` with
+    :type strings: list(str)
+    :rtype: list(int)
+    :see: ``edit_distance()`` for the other parameters
+    """
+    strings = list(strings)
+    if processes > 1 and len(strings) > 1:
+        chunk = -(-len(strings) // processes)
+        results = _map_in_workers(
+            _edit_distance_many_in_worker,
+            [(s1, strings[i:i+chunk], transpositions, max_distance)
+             for i in range(0, len(strings), chunk)], processes)
+        return [d for result in results for d in result]
+
+    len1 = len(s1)
+    try:
+        peq = _pattern_bits(s1)
+    except TypeError:
+        peq = None
+    distances = []
+    for s2 in strings:
+        if max_distance is not None and abs(len1 - len(s2)) > max_distance:
+            distances.append(max_distance + 1)
+        elif peq is None:
+            distances.append(_edit_dist_rows(s1, s2, transpositions,
+                                             max_distance))
+        else:
+            distances.append(_edit_dist_bits(peq, len1, s2, transpositions,
+                                             max_distance))
+    return distances
+
+
+def edit_distance_matrix(strings, transpositions=False, max_distance=None,
+                         processes=1):
+    """
+    Calculate the edit distance between each pair of the given strings.
+
+        >>> edit_distance_matrix(["rain", "shine", "train"])
+        [[0, 3, 1], [3, 0, 4], [1, 4, 0]]
+
+    :return: A symmetric matrix, as a list of rows, whose element
+        ``[i][j]`` is the distance between ``strings[i]`` and
+        ``strings[j]``.
+    :rtype: list(list(int))
+    :see: ``edit_distance_many()`` for the parameters
+    """
+    strings = list(strings)
+    tasks = [(strings[i], strings[i+1:], transpositions, max_distance)
+             for i in range(len(strings))]
+    if processes > 1 and len(strings) > 1:
+        rows = _map_in_workers(_edit_distance_many_in_worker, tasks,
+                               processes)
+    else:
+        rows = [_edit_distance_many_in_worker(task) for task in tasks]
+
+    matrix = [[0] * len(strings) for s in strings]
+    for (i, row) in enumerate(rows):
+        for (k, d) in enumerate(row):
+            matrix[i][i+k+1] = matrix[i+k+1][i] = d
+    return matrix
+
+
+def _edit_distance_many_in_worker(args):
+    s1, strings, transpositions, max_distance = args
+    return edit_distance_many(s1, strings, transpositions, max_distance)
+
+
+def _map_in_workers(function, tasks, processes):
+    import multiprocessing
+    workers = multiprocessing.Pool(processes)
+    try:
+        return workers.map(function, tasks)
+    finally:
+        workers.close()
+        workers.join()
 
 
 def binary_distance(label1, label2):
@@ -8,15 +8,18 @@
 from __future__ import print_function
 
 from math import fabs
-import operator
-from random import shuffle
-from functools import reduce
+import random
 
 try:
     from scipy.stats.stats import betai
 except ImportError:
     betai = None
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from nltk.compat import xrange, izip
 from nltk.util import LazyConcatenation, LazyMap
 
@@ -147,6 +150,11 @@ def approxrand(a, b, **kwargs):
     statistic of the permutated lists varies from the actual statistic of
     the unpermuted argument lists.
 
+    If numpy is installed and no ``statistic`` is given (or if a
+    ``vectorized_statistic`` is given), then the shuffles are generated
+    as arrays of permutations, and the statistic is computed for many
+    shuffles at once.  This can be divided among several processes.
+
     :return: a tuple containing an approximate significance level, the count
              of the number of times the pseudo-statistic varied from the
              actual statistic, and the number of shuffles
@@ -155,17 +163,53 @@ def approxrand(a, b, **kwargs):
     :type a: list
     :param b: another list of independently generated test values
     :type b: list
+    :param shuffles: the number of shuffles (default 999)
+    :param statistic: a function from a list of test values to the
+        statistic (default: their mean)
+    :param vectorized_statistic: a function from a 2-D array, whose rows
+        are lists of test values, to the array of the statistics of the
+        rows.  It must be picklable (e.g. a module-level function) if
+        ``processes > 1``.
+    :param seed: a seed for the random number generator, for
+        reproducible results
+    :param processes: the number of worker processes that are used to
+        compute a vectorized statistic
+    :param verbose: whether to print progress reports
     """
     shuffles = kwargs.get('shuffles', 999)
     # there's no point in trying to shuffle beyond all possible permutations
-    shuffles = \
-        min(shuffles, reduce(operator.mul, xrange(1, len(a) + len(b) + 1)))
-    stat = kwargs.get('statistic', lambda lst: float(sum(lst)) / len(lst))
+    shuffles = _permutation_limit(len(a) + len(b), shuffles)
+    stat = kwargs.get('statistic')
+    vstat = kwargs.get('vectorized_statistic')
+    seed = kwargs.get('seed')
+    processes = kwargs.get('processes', 1)
     verbose = kwargs.get('verbose', False)
 
     if verbose:
         print('shuffles: %d' % shuffles)
 
+    if vstat is None and stat is None and numpy is not None:
+        vstat = _mean
+    if vstat is not None:
+        x = numpy.concatenate([numpy.asarray(a, dtype=float),
+                               numpy.asarray(b, dtype=float)])
+        actual_stat = abs(vstat(x[None, :len(a)])[0] -
+                          vstat(x[None, len(a):])[0])
+        if verbose:
+            print('actual statistic: %f' % actual_stat)
+            print('-' * 60)
+        c = 1e-100 + _count_in_batches(
+            _approxrand_batch, (x, len(a), actual_stat, vstat),
+            shuffles, len(x), seed, processes)
+        return _report_significance(c, shuffles, verbose)
+
+    if stat is None:
+        stat = lambda lst: float(sum(lst)) / len(lst)
+    if seed is not None:
+        shuffle = random.Random(seed).shuffle
+    else:
+        shuffle = random.shuffle
+
     actual_stat = fabs(stat(a) - stat(b))
 
     if verbose:
@@ -194,6 +238,95 @@ def approxrand(a, b, **kwargs):
             print('significance: %f' % (float(c + 1) / (i + 1)))
             print('-' * 60)
 
+    return _report_significance(c, shuffles, verbose)
+
+
+def paired_bootstrap(a, b, **kwargs):
+    """
+    Returns an approximate significance level for the difference between
+    two lists of paired test values, such as the scores of two systems
+    on the same test items, by paired bootstrap resampling (Koehn 2004).
+
+    Each sample draws the same items, with replacement, from both lists;
+    the significance level is estimated from the number of samples in
+    which the difference between the statistics of the two lists is not
+    in the same direction as the actual difference.
+
+    :return: a tuple containing an approximate significance level, the
+             count of the number of samples in which the difference was
+             not in the direction of the actual difference, and the
+             number of samples
+    :rtype: tuple
+    :param a: a list of test values
+    :type a: list
+    :param b: another list of test values, for the same items
+    :type b: list
+    :param samples: the number of bootstrap samples (default 999)
+    :raise ValueError: If ``a`` and ``b`` do not have the same length.
+    :see: ``approxrand()`` for the other parameters
+    """
+    if len(a) != len(b):
+        raise ValueError("Lists must have the same length.")
+    samples = kwargs.get('samples', 999)
+    stat = kwargs.get('statistic')
+    vstat = kwargs.get('vectorized_statistic')
+    seed = kwargs.get('seed')
+    processes = kwargs.get('processes', 1)
+    verbose = kwargs.get('verbose', False)
+
+    if verbose:
+        print('samples: %d' % samples)
+
+    if vstat is None and stat is None and numpy is not None:
+        vstat = _mean
+    if vstat is not None:
+        x = numpy.array([a, b], dtype=float)
+        actual_diff = vstat(x[:1])[0] - vstat(x[1:])[0]
+        if verbose:
+            print('actual difference: %f' % actual_diff)
+            print('-' * 60)
+        c = 1e-100 + _count_in_batches(
+            _bootstrap_batch, (x, actual_diff, vstat),
+            samples, len(a), seed, processes)
+        return _report_significance(c, samples, verbose)
+
+    if stat is None:
+        stat = lambda lst: float(sum(lst)) / len(lst)
+    if seed is not None:
+        randrange = random.Random(seed).randrange
+    else:
+        randrange = random.randrange
+
+    actual_diff = stat(a) - stat(b)
+
+    if verbose:
+        print('actual difference: %f' % actual_diff)
+        print('-' * 60)
+
+    c = 1e-100
+    for i in xrange(samples):
+        indices = [randrange(len(a)) for j in xrange(len(a))]
+        diff = stat([a[j] for j in indices]) - stat([b[j] for j in indices])
+        if diff * actual_diff <= 0:
+            c += 1
+
+    return _report_significance(c, samples, verbose)
+
+
+def _permutation_limit(n, limit):
+    """
+    Return the smaller of ``limit`` and ``n!``, without computing ``n!``
+    in full.
+    """
+    count = 1
+    for i in xrange(2, n + 1):
+        count *= i
+        if count >= limit:
+            return limit
+    return min(count, limit)
+
+
+def _report_significance(c, shuffles, verbose):
     significance = float(c + 1) / (shuffles + 1)
 
     if verbose:
@@ -204,6 +337,51 @@ def approxrand(a, b, **kwargs):
 
     return (significance, c, shuffles)
 
+# The number of test values that are drawn at once by a single task of
+# a vectorized significance test.
+_BATCH_SIZE = 2**20
+
+def _mean(x):
+    return x.mean(axis=-1)
+
+def _count_in_batches(count_batch, args, n, width, seed, processes):
+    """
+    Return the sum of ``count_batch(args + (rows, seed))`` over batches
+    of ``rows`` random draws, which add up to ``n`` draws of ``width``
+    values each.  Each batch has its own seed, drawn in advance, so the
+    result does not depend on the number of ``processes``.
+    """
+    rows = max(1, _BATCH_SIZE // max(width, 1))
+    sizes = [min(rows, n - i) for i in xrange(0, n, rows)]
+    seeds = numpy.random.RandomState(seed).randint(2**31 - 1,
+                                                   size=len(sizes))
+    tasks = [args + (size, int(s)) for (size, s) in zip(sizes, seeds)]
+    if processes > 1 and len(tasks) > 1:
+        import multiprocessing
+        workers = multiprocessing.Pool(processes)
+        try:
+            counts = workers.map(count_batch, tasks)
+        finally:
+            workers.close()
+            workers.join()
+    else:
+        counts = [count_batch(task) for task in tasks]
+    return sum(counts)
+
+def _approxrand_batch(args):
+    x, len_a, actual_stat, vstat, rows, seed = args
+    rng = numpy.random.RandomState(seed)
+    shuffled = x[numpy.argsort(rng.random_sample((rows, len(x))), axis=1)]
+    pseudo_stat = numpy.abs(vstat(shuffled[:, :len_a]) -
+                            vstat(shuffled[:, len_a:]))
+    return int(numpy.count_nonzero(pseudo_stat >= actual_stat))
+
+def _bootstrap_batch(args):
+    x, actual_diff, vstat, rows, seed = args
+    rng = numpy.random.RandomState(seed)
+    indices = rng.randint(x.shape[1], size=(rows, x.shape[1]))
+    diff = vstat(x[0][indices]) - vstat(x[1][indices])
+    return int(numpy.count_nonzero(diff * actual_diff <= 0))
 
 def demo():
     print('-'*75)
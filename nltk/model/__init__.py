@@ -0,0 +1,24 @@
+# Natural Language Toolkit: Language Models
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+NLTK Language Models
+
+Classes for estimating the probability of the next word of a sentence
+from the counts of the n-grams of a corpus.  ``NgramCounter`` stores the
+counts of n-grams of any order compactly, in arrays of integer word ids;
+``KneserNeyModel`` is a Kneser-Ney smoothed model estimated from them.
+
+Models can be saved in the ARPA format (``write_arpa()``), and read by
+``ArpaModel``; or saved in a compact binary format (``write_binary()``),
+and queried through a memory map by ``BinaryModel``.
+"""
+
+from nltk.model.api import ModelI, BOS, EOS, UNK
+from nltk.model.counter import NgramCounter
+from nltk.model.kneserney import KneserNeyModel
+from nltk.model.arpa import BackoffModelI, ArpaModel, write_arpa
+from nltk.model.binary import BinaryModel, write_binary
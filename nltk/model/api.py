@@ -0,0 +1,107 @@
+# Natural Language Toolkit: Language Model Interface
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+The interface of n-gram language models.
+"""
+from __future__ import division, unicode_literals
+
+import math
+
+# The symbols that are added at the start and end of each sentence, and
+# that replace the words that are not in the vocabulary of a model.
+BOS = '<s>'
+EOS = '</s>'
+UNK = '<unk>'
+
+
+class ModelI(object):
+    """
+    A processing interface for assigning a probability to the next word
+    of a sentence, given the words before it (its context).  Each
+    sentence is preceded by the symbol ``BOS``, and its last word is
+    followed by the symbol ``EOS``, which is also predicted.
+
+    Subclasses must define:
+      - ``order``, the length of the longest n-grams of the model
+      - ``score()``
+
+    Probabilities are in base 2 logarithms, as in ``ProbDistI``.
+    """
+    order = None
+
+    def score(self, word, context=()):
+        """
+        :return: The probability of ``word`` following ``context``, of
+            which only the last ``order - 1`` words are used.
+        :rtype: float
+        :param word: A word (words that are not in the vocabulary are
+            replaced by ``UNK``).
+        :param context: A sequence of words.
+        """
+        raise NotImplementedError()
+
+    def logscore(self, word, context=()):
+        """
+        :return: The base 2 logarithm of ``score(word, context)``, or
+            ``float('-inf')`` if the probability is zero.
+        :rtype: float
+        """
+        p = self.score(word, context)
+        return math.log(p, 2) if p > 0 else float('-inf')
+
+    def ngram_logprobs(self, order):
+        """
+        Generate the n-grams of the given order that have their own
+        probabilities in this model, as in an ARPA file: tuples
+        ``(ngram, logprob, backoff)`` of the n-gram, the base 10
+        logarithm of the probability of its last word following the
+        others, and the base 10 logarithm of its backoff weight (or None
+        for the longest n-grams).
+        """
+        raise NotImplementedError()
+
+    def logscore_sents(self, sents):
+        """
+        :return: The base 2 logarithm of the probability of each
+            sentence (including its ``EOS``).  The score of each n-gram
+            is only computed once.
+        :rtype: list(float)
+        :param sents: A list of sentences, each of which is a list of
+            words.
+        """
+        scores = {}
+        results = []
+        for sent in sents:
+            padded = [BOS] + list(sent) + [EOS]
+            total = 0.0
+            for i in range(1, len(padded)):
+                ngram = tuple(padded[max(0, i - self.order + 1):i+1])
+                try:
+                    total += scores[ngram]
+                except KeyError:
+                    score = scores[ngram] = self.logscore(ngram[-1], ngram[:-1])
+                    total += score
+            results.append(total)
+        return results
+
+    def entropy(self, sents):
+        """
+        :return: The average negative base 2 logarithm of the
+            probability of the words of the given sentences (including
+            each ``EOS``).
+        :rtype: float
+        """
+        sents = list(sents)
+        num_words = sum(len(sent) + 1 for sent in sents)
+        return -sum(self.logscore_sents(sents)) / num_words
+
+    def perplexity(self, sents):
+        """
+        :return: The perplexity of the given sentences, ``2 ** entropy``.
+        :rtype: float
+        """
+        return 2 ** self.entropy(sents)
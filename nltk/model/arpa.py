@@ -0,0 +1,215 @@
+# Natural Language Toolkit: ARPA Language Model Files
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Reading and writing backoff language models in the ARPA format, which
+is used by SRILM, KenLM and most other language modeling toolkits.
+
+An ARPA file lists, for each order, the n-grams of the model with the
+base 10 logarithm of their probability and (except for the longest
+n-grams) of their backoff weight:
+
+    \\data\\
+    ngram 1=4
+    ngram 2=2
+
+    \\1-grams:
+    -0.6020600	</s>
+    -99.0000000	<s>	-0.3010300
+    ...
+
+    \\end\\
+
+The probability of a word following a context is the probability of
+the longest listed n-gram that ends with the word and is a suffix of
+the context, times the backoff weights of the longer suffixes of the
+context.
+"""
+from __future__ import division, print_function, unicode_literals
+
+import codecs
+import math
+
+from nltk import compat
+from nltk.model.api import ModelI, UNK
+
+
+class BackoffModelI(ModelI):
+    """
+    A model that stores the probability and backoff weight of each of
+    its n-grams, as in an ARPA file.
+
+    Subclasses must define:
+      - ``order``
+      - ``_encode()``
+      - ``_entry()``
+      - ``ngram_logprobs()``
+    """
+    def _encode(self, words):
+        """
+        :return: The keys of the given words, for ``_entry()``.  Words
+            that are not in the vocabulary must be replaced by the key
+            of ``UNK``, or by a key that is in no n-gram.
+        :rtype: tuple
+        """
+        raise NotImplementedError()
+
+    def _entry(self, ngram):
+        """
+        :return: The ``(logprob, backoff)`` pair of the n-gram with the
+            given tuple of keys, or None if it is not in the model.
+        """
+        raise NotImplementedError()
+
+    def logprob(self, context, word):
+        """
+        :return: The base 10 logarithm of the probability of ``word``
+            following ``context``, or ``float('-inf')`` if the word is
+            not in the vocabulary and there is no ``UNK``.
+        :rtype: float
+        """
+        context = tuple(context)[1 - self.order:] if self.order > 1 else ()
+        ngram = self._encode(context + (word,))
+        (context, word) = (ngram[:-1], ngram[-1:])
+        backoff = 0.0
+        for k in range(len(context), -1, -1):
+            h = context[len(context)-k:]
+            entry = self._entry(h + word)
+            if entry is not None:
+                return entry[0] + backoff
+            if k > 0:
+                entry = self._entry(h)
+                if entry is not None and entry[1] is not None:
+                    backoff += entry[1]
+        return float('-inf')
+
+    def score(self, word, context=()):
+        return 10 ** self.logprob(context, word)
+
+    def logscore(self, word, context=()):
+        return self.logprob(context, word) / math.log10(2)
+
+
+@compat.python_2_unicode_compatible
+class ArpaModel(BackoffModelI):
+    """
+    A backoff language model that is read from an ARPA file.
+
+        >>> import os, tempfile
+        >>> from nltk.model import KneserNeyModel, ArpaModel, write_arpa
+        >>> lm = KneserNeyModel(2, [['a', 'b'], ['b', 'a', 'b']])
+        >>> fd, filename = tempfile.mkstemp()
+        >>> os.close(fd)
+        >>> write_arpa(lm, filename)
+        >>> arpa = ArpaModel(filename)
+        >>> arpa
+        <ArpaModel: 5 1-grams, 5 2-grams>
+        >>> print('%.4f %.4f' % (lm.score('b', ['a']), arpa.score('b', ['a'])))
+        0.8693 0.8693
+        >>> os.remove(filename)
+    """
+    def __init__(self, filename, encoding='utf8'):
+        """
+        :param filename: The name of the ARPA file.
+        :param encoding: The encoding of the file.
+        """
+        self._ngrams = []
+        with codecs.open(filename, 'r', encoding=encoding) as infile:
+            _read_arpa(infile, self._ngrams)
+        self.order = len(self._ngrams)
+
+    def _encode(self, words):
+        unigrams = self._ngrams[0]
+        return tuple(word if (word,) in unigrams else UNK for word in words)
+
+    def _entry(self, ngram):
+        if not 0 < len(ngram) <= self.order:
+            return None
+        return self._ngrams[len(ngram)-1].get(ngram)
+
+    def ngram_logprobs(self, order):
+        for ngram in sorted(self._ngrams[order-1]):
+            (logprob, backoff) = self._ngrams[order-1][ngram]
+            yield (ngram, logprob, backoff)
+
+    def __repr__(self):
+        return '<ArpaModel: %s>' % ', '.join(
+            '%d %d-grams' % (len(ngrams), k)
+            for (k, ngrams) in enumerate(self._ngrams, 1))
+
+
+def _read_arpa(infile, ngrams):
+    """
+    Read the n-grams of an ARPA file into a list of dictionaries, one
+    for each order, which map n-grams to ``(logprob, backoff)`` pairs.
+    """
+    sizes = []
+    section = None
+    for (lineno, line) in enumerate(infile, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line == '\\data\\':
+            section = 'data'
+        elif line == '\\end\\':
+            break
+        elif line.startswith('\\') and line.endswith('-grams:'):
+            order = int(line[1:-len('-grams:')])
+            if order != len(ngrams) + 1 or order > len(sizes):
+                raise ValueError('Unexpected section on line %d of ARPA '
+                                 'file: %s' % (lineno, line))
+            ngrams.append({})
+            section = order
+        elif section == 'data':
+            if not line.startswith('ngram '):
+                raise ValueError('Bad header on line %d of ARPA file: %s'
+                                 % (lineno, line))
+            sizes.append(int(line.split('=')[1]))
+        elif section is None:
+            continue
+        else:
+            fields = line.split()
+            if len(fields) == section + 1:
+                backoff = None
+            elif len(fields) == section + 2:
+                backoff = float(fields[-1])
+            else:
+                raise ValueError('Bad %d-gram on line %d of ARPA file: %s'
+                                 % (section, lineno, line))
+            ngram = tuple(fields[1:section+1])
+            ngrams[-1][ngram] = (float(fields[0]), backoff)
+    else:
+        raise ValueError('ARPA file has no \\end\\ marker')
+    for (k, size) in enumerate(sizes):
+        if k >= len(ngrams) or len(ngrams[k]) != size:
+            raise ValueError('ARPA file has the wrong number of %d-grams'
+                             % (k + 1))
+
+
+def write_arpa(model, filename, encoding='utf8'):
+    """
+    Write a model to a file, in the ARPA format.
+
+    :param model: A model that defines ``ngram_logprobs()``, such as a
+        ``KneserNeyModel``.
+    :param filename: The name of the ARPA file.
+    :param encoding: The encoding of the file.
+    """
+    with codecs.open(filename, 'w', encoding=encoding) as out:
+        sections = [list(model.ngram_logprobs(k))
+                    for k in range(1, model.order + 1)]
+        out.write('\\data\\\n')
+        for (k, ngrams) in enumerate(sections, 1):
+            out.write('ngram %d=%d\n' % (k, len(ngrams)))
+        for (k, ngrams) in enumerate(sections, 1):
+            out.write('\n\\%d-grams:\n' % k)
+            for (ngram, logprob, backoff) in ngrams:
+                if backoff is None:
+                    out.write('%.7f\t%s\n' % (logprob, ' '.join(ngram)))
+                else:
+                    out.write('%.7f\t%s\t%.7f\n' %
+                              (logprob, ' '.join(ngram), backoff))
+        out.write('\n\\end\\\n')
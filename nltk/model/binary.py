@@ -0,0 +1,311 @@
+# Natural Language Toolkit: Memory-Mapped Language Models
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+A compact binary format for backoff language models, which is queried
+through a memory map of the file rather than loaded into Python
+objects.  Opening a model only reads its header, and the pages of the
+file that are used are shared by all the processes that open it.
+
+The file consists of a header, the vocabulary, and a trie of the
+n-grams of each order, in little-endian arrays:
+
+  - the magic string ``NLTKLM01``, the order, the vocabulary size and
+    the number of n-grams of each order (unsigned 32-bit integers);
+  - the offsets of the words in the UTF-8 text of the vocabulary
+    (sorted by their bytes, so that the id of a word is its rank)
+    followed by that text;
+  - for each order: the last word id of each n-gram (except for
+    unigrams, whose index is their id), the logarithm of its
+    probability, and (except for the longest n-grams) the logarithm of
+    its backoff weight and the index of its first child in the next
+    order.  The logarithms are 32-bit floats.
+
+Each array starts at a multiple of 8 bytes.
+"""
+from __future__ import division, print_function, unicode_literals
+
+import io
+import mmap
+import struct
+import sys
+from array import array
+
+from nltk import compat
+from nltk.model.api import UNK
+from nltk.model.arpa import BackoffModelI
+
+_MAGIC = b'NLTKLM01'
+_UINT = struct.Struct(str('<I'))
+_FLOAT = struct.Struct(str('<f'))
+
+
+@compat.python_2_unicode_compatible
+class BinaryModel(BackoffModelI):
+    """
+    A backoff language model that is read from a binary file, written
+    by ``write_binary()``.
+
+        >>> import os, tempfile
+        >>> from nltk.model import KneserNeyModel, BinaryModel, write_binary
+        >>> lm = KneserNeyModel(2, [['a', 'b'], ['b', 'a', 'b']])
+        >>> fd, filename = tempfile.mkstemp()
+        >>> os.close(fd)
+        >>> write_binary(lm, filename)
+        >>> binary = BinaryModel(filename)
+        >>> binary
+        <BinaryModel: 5 1-grams, 5 2-grams>
+        >>> print('%.4f %.4f' % (lm.score('b', ['a']), binary.score('b', ['a'])))
+        0.8693 0.8693
+        >>> binary.close()
+        >>> os.remove(filename)
+
+    A ``BinaryModel`` can be pickled (for example, to send it to worker
+    processes), as the name of its file.
+    """
+    def __init__(self, filename):
+        """
+        :param filename: The name of the binary model file.
+        """
+        self._filename = filename
+        self._open()
+
+    def _open(self):
+        with open(self._filename, 'rb') as infile:
+            self._map = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = self._map
+        if buf[:len(_MAGIC)] != _MAGIC:
+            raise ValueError('%s is not a binary language model'
+                             % self._filename)
+        offset = len(_MAGIC)
+        (self.order, self._vocab_size) = struct.unpack_from(
+            str('<II'), buf, offset)
+        offset += 8
+        self._sizes = struct.unpack_from(str('<%dI' % self.order), buf, offset)
+        offset = _align(offset + 4 * self.order)
+
+        self._word_offsets = offset
+        text_size = _UINT.unpack_from(buf, offset + 4 * self._vocab_size)[0]
+        offset = _align(offset + 4 * (self._vocab_size + 1))
+        self._text = offset
+        offset = _align(offset + text_size)
+
+        # The offsets of the arrays of each order
+        self._last = []
+        self._logprobs = []
+        self._backoffs = []
+        self._starts = []
+        for (k, size) in enumerate(self._sizes):
+            if k == 0:
+                self._last.append(None)
+            else:
+                self._last.append(offset)
+                offset = _align(offset + 4 * size)
+            self._logprobs.append(offset)
+            offset = _align(offset + 4 * size)
+            if k < self.order - 1:
+                self._backoffs.append(offset)
+                offset = _align(offset + 4 * size)
+                self._starts.append(offset)
+                offset = _align(offset + 4 * (size + 1))
+        if offset != len(buf):
+            raise ValueError('%s is truncated or corrupt' % self._filename)
+
+    def close(self):
+        """
+        Close the memory map of the file.
+        """
+        self._map.close()
+
+    def __getstate__(self):
+        return {'_filename': self._filename}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._open()
+
+    def _uint(self, offset, index):
+        return _UINT.unpack_from(self._map, offset + 4 * index)[0]
+
+    def _float(self, offset, index):
+        return _FLOAT.unpack_from(self._map, offset + 4 * index)[0]
+
+    def _word(self, word_id):
+        start = self._uint(self._word_offsets, word_id)
+        end = self._uint(self._word_offsets, word_id + 1)
+        return self._map[self._text+start:self._text+end].decode('utf8')
+
+    def _word_id(self, word):
+        """
+        :return: The id of ``word``, or -1 if it is not in the vocabulary.
+        """
+        key = word.encode('utf8')
+        lo, hi = 0, self._vocab_size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self._uint(self._word_offsets, mid)
+            end = self._uint(self._word_offsets, mid + 1)
+            if self._map[self._text+start:self._text+end] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._vocab_size and self._word(lo) == word:
+            return lo
+        return -1
+
+    def _child(self, k, node, word_id):
+        """
+        :return: The index of the n-gram of order ``k+1`` that extends
+            the n-gram at index ``node`` of order ``k`` by ``word_id``,
+            or -1 if there is none.
+        """
+        lo = self._uint(self._starts[k-1], node)
+        end = hi = self._uint(self._starts[k-1], node + 1)
+        last = self._last[k]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._uint(last, mid) < word_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < end and self._uint(last, lo) == word_id:
+            return lo
+        return -1
+
+    def _encode(self, words):
+        unk = self._word_id(UNK)
+        return tuple(word_id if word_id >= 0 else unk
+                     for word_id in map(self._word_id, words))
+
+    def _entry(self, ngram):
+        if not 0 < len(ngram) <= self.order or -1 in ngram:
+            return None
+        node = ngram[0]
+        for k in range(1, len(ngram)):
+            node = self._child(k, node, ngram[k])
+            if node < 0:
+                return None
+        k = len(ngram) - 1
+        logprob = self._float(self._logprobs[k], node)
+        if k < self.order - 1:
+            return (logprob, self._float(self._backoffs[k], node))
+        return (logprob, None)
+
+    def ngram_logprobs(self, order):
+        def ngrams(k):
+            if k == 0:
+                for i in range(self._vocab_size):
+                    yield (i, (self._word(i),))
+                return
+            for (parent, prefix) in ngrams(k - 1):
+                for i in range(self._uint(self._starts[k-1], parent),
+                               self._uint(self._starts[k-1], parent + 1)):
+                    yield (i, prefix + (self._word(self._uint(self._last[k], i)),))
+        k = order - 1
+        for (i, ngram) in ngrams(k):
+            backoff = None
+            if k < self.order - 1:
+                backoff = self._float(self._backoffs[k], i)
+            yield (ngram, self._float(self._logprobs[k], i), backoff)
+
+    def __repr__(self):
+        return '<BinaryModel: %s>' % ', '.join(
+            '%d %d-grams' % (size, k)
+            for (k, size) in enumerate(self._sizes, 1))
+
+
+def _align(offset):
+    return (offset + 7) & ~7
+
+
+def write_binary(model, filename):
+    """
+    Write a model to a file, in the format that is read by
+    ``BinaryModel``.
+
+    :param model: A model that defines ``ngram_logprobs()``, such as a
+        ``KneserNeyModel`` or an ``ArpaModel``.
+    :param filename: The name of the binary model file.
+    """
+    unigrams = sorted(model.ngram_logprobs(1),
+                      key=lambda entry: entry[0][0].encode('utf8'))
+    words = [ngram[0] for (ngram, logprob, backoff) in unigrams]
+    ids = dict((word, i) for (i, word) in enumerate(words))
+
+    with io.open(filename, 'wb') as out:
+        sizes = []
+        # Write the arrays of each order to a temporary buffer, as the
+        # header needs the number of n-grams of each order.
+        body = io.BytesIO()
+        parents = [(ids[ngram[0]],) for (ngram, logprob, backoff) in unigrams]
+        _write_array(body, 'f', [logprob for (ngram, logprob, backoff) in unigrams])
+        entries = unigrams
+        sizes.append(len(entries))
+        for k in range(1, model.order + 1):
+            if k < model.order:
+                children = sorted(
+                    (tuple(ids[w] for w in ngram), logprob, backoff)
+                    for (ngram, logprob, backoff) in model.ngram_logprobs(k + 1))
+            else:
+                children = []
+            if k > 1:
+                _write_array(body, 'I', [ngram[-1] for (ngram, lp, bo) in entries])
+                _write_array(body, 'f', [lp for (ngram, lp, bo) in entries])
+            if k < model.order:
+                _write_array(body, 'f', [bo or 0.0 for (ngram, lp, bo) in entries])
+                _write_array(body, 'I', _child_starts(parents, children))
+                sizes.append(len(children))
+            parents = [ngram for (ngram, lp, bo) in children]
+            entries = children
+
+        text = b''.join(word.encode('utf8') for word in words)
+        offsets = [0]
+        for word in words:
+            offsets.append(offsets[-1] + len(word.encode('utf8')))
+        header = io.BytesIO()
+        header.write(_MAGIC)
+        header.write(struct.pack(str('<II'), model.order, len(words)))
+        header.write(struct.pack(str('<%dI' % len(sizes)), *sizes))
+        _pad(header)
+        _write_array(header, 'I', offsets)
+        header.write(text)
+        _pad(header)
+        out.write(header.getvalue())
+        out.write(body.getvalue())
+
+
+def _child_starts(parents, children):
+    """
+    :return: The index of the first child of each parent, and the number
+        of children, where ``parents`` and ``children`` are sorted
+        tuples of word ids.
+    """
+    starts = []
+    i = 0
+    for parent in parents:
+        starts.append(i)
+        while i < len(children) and children[i][0][:-1] == parent:
+            i += 1
+    if i != len(children):
+        raise ValueError('The prefix of n-gram %r is not in the model'
+                         % (children[i][0],))
+    starts.append(i)
+    return starts
+
+
+def _write_array(out, typecode, values):
+    values = array(str(typecode), values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    if hasattr(values, 'tobytes'):
+        out.write(values.tobytes())
+    else:
+        out.write(values.tostring())
+    _pad(out)
+
+
+def _pad(out):
+    out.write(b'\0' * (_align(out.tell()) - out.tell()))
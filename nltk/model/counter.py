@@ -0,0 +1,310 @@
+# Natural Language Toolkit: N-gram Counts
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Compact storage for the counts of the n-grams in a corpus.
+
+The words are replaced by integer ids, and the n-grams are stored in a
+trie of sorted arrays: the n-grams of each order are sorted, and the
+children of each (n-1)-gram (the n-grams that extend it by one word)
+form a contiguous range of the arrays of order n, which are searched
+by bisection.  Each n-gram then takes two machine integers (its last
+word and its count) plus one for the start of its children, rather
+than a tuple of strings and a dictionary entry.
+"""
+from __future__ import print_function, unicode_literals
+
+from array import array
+from bisect import bisect_left
+
+from nltk import compat
+from nltk.compat import Counter, izip
+from nltk.util import everygrams
+
+# The typecode of the arrays of ids and counts (signed long)
+_TYPECODE = str('l')
+
+
+@compat.python_2_unicode_compatible
+class NgramCounter(object):
+    """
+    The counts of all n-grams of length 1 to ``order`` in a collection
+    of sequences.
+
+        >>> from nltk.model import NgramCounter
+        >>> counts = NgramCounter(2, [['a', 'b', 'a'], ['b', 'a']])
+        >>> counts[('a',)], counts[('b', 'a')], counts[('a', 'a')]
+        (3, 2, 0)
+        >>> sorted(counts.ngrams(2))
+        [(('a', 'b'), 1), (('b', 'a'), 2)]
+
+    New counts are first gathered in a dictionary, which is merged into
+    the arrays whenever it holds ``buffer_size`` n-grams, so that the
+    memory needed to count a corpus mostly depends on the number of
+    distinct n-grams in it.
+    """
+    def __init__(self, order, sequences=(), vocabulary=(),
+                 buffer_size=2**20):
+        """
+        :param order: The length of the longest n-grams to count.
+        :type order: int
+        :param sequences: The sequences of words to count.
+        :param vocabulary: Words that are given the first ids (in order),
+            whether they occur in the sequences or not.
+        :param buffer_size: The number of distinct n-grams to gather
+            before merging them into the arrays.
+        :type buffer_size: int
+        """
+        if order < 1:
+            raise ValueError('order must be at least 1')
+        self._order = order
+        self._buffer_size = buffer_size
+        self._words = []
+        self._ids = {}
+        # self._counts[k] are the counts of the n-grams of order k+1;
+        # the unigram with id i is at index i.
+        self._counts = [array(_TYPECODE) for k in range(order)]
+        # self._last[k] are the last word ids of the n-grams of order k+1
+        # (None for unigrams), and the children of the n-gram at index i
+        # of order k+1 are at indices self._starts[k][i] to
+        # self._starts[k][i+1] of order k+2.
+        self._last = [None] + [array(_TYPECODE) for k in range(1, order)]
+        self._starts = [array(_TYPECODE, [0]) for k in range(1, order)]
+        self._pending = Counter()
+        for word in vocabulary:
+            self.word_id(word)
+        self.update(sequences)
+
+    @property
+    def order(self):
+        """The length of the longest n-grams that are counted."""
+        return self._order
+
+    def vocabulary(self):
+        """
+        :return: The words, indexed by their ids.
+        :rtype: list
+        """
+        return self._words
+
+    def word_id(self, word):
+        """
+        :return: The id of ``word``, which is added to the vocabulary if
+            it is not in it.
+        :rtype: int
+        """
+        try:
+            return self._ids[word]
+        except KeyError:
+            self._ids[word] = len(self._words)
+            self._words.append(word)
+            return self._ids[word]
+
+    def lookup_id(self, word, default=None):
+        """
+        :return: The id of ``word``, or ``default`` if it is not in the
+            vocabulary.
+        """
+        return self._ids.get(word, default)
+
+    def update(self, sequences):
+        """
+        Count the n-grams of each of the given sequences of words.
+        """
+        for sequence in sequences:
+            ids = [self.word_id(word) for word in sequence]
+            self._pending.update(everygrams(ids, max_len=self._order))
+            if len(self._pending) >= self._buffer_size:
+                self.flush()
+
+    def flush(self):
+        """
+        Merge the counts that were gathered by ``update()`` into the
+        arrays.  This is done automatically before the counts are read.
+        """
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = Counter()
+        ordered = [[] for k in range(self._order)]
+        for (ngram, count) in pending.items():
+            ordered[len(ngram)-1].append((ngram, count))
+        del pending
+
+        unigrams = self._counts[0]
+        old_size = len(unigrams)
+        unigrams.extend([0] * (len(self._words) - len(unigrams)))
+        for ((i,), count) in ordered[0]:
+            unigrams[i] += count
+
+        counts = [unigrams]
+        last = [None]
+        starts = []
+        for k in range(1, self._order):
+            ordered[k].sort()
+            old = izip(_iter_trie(self._last, self._starts, old_size, k),
+                       self._counts[k])
+            merged = _merge_counts(old, ordered[k])
+            ordered[k] = None
+            parents = _iter_trie(last, starts, len(unigrams), k - 1)
+            words_k, counts_k, starts_k = _build_level(
+                merged, parents, len(counts[k-1]))
+            last.append(words_k)
+            counts.append(counts_k)
+            starts.append(starts_k)
+        self._counts = counts
+        self._last = last
+        self._starts = starts
+
+    def _index(self, ids):
+        """
+        :return: The index of the n-gram with the given word ids in the
+            arrays of its order, or -1 if it was not counted.
+        """
+        node = ids[0]
+        if node < 0 or node >= len(self._counts[0]):
+            return -1
+        for k in range(1, len(ids)):
+            node = self._child(k, node, ids[k])
+            if node < 0:
+                return -1
+        return node
+
+    def _child(self, k, node, word_id):
+        """
+        :return: The index of the n-gram of order ``k+1`` that extends
+            the n-gram at index ``node`` of order ``k`` by ``word_id``,
+            or -1 if it was not counted.
+        """
+        words = self._last[k]
+        starts = self._starts[k-1]
+        lo, hi = starts[node], starts[node+1]
+        index = bisect_left(words, word_id, lo, hi)
+        if index == hi or words[index] != word_id:
+            return -1
+        return index
+
+    def count_ids(self, ids):
+        """
+        :return: The count of the n-gram with the given word ids.
+        :rtype: int
+        """
+        self.flush()
+        if not ids or len(ids) > self._order:
+            return 0
+        index = self._index(ids)
+        if index < 0:
+            return 0
+        return self._counts[len(ids)-1][index]
+
+    def __getitem__(self, ngram):
+        ids = []
+        for word in ngram:
+            word_id = self._ids.get(word)
+            if word_id is None:
+                return 0
+            ids.append(word_id)
+        return self.count_ids(ids)
+
+    def ngram_ids(self, order):
+        """
+        :return: An iterator over ``(ids, count)`` pairs for the n-grams
+            of the given order, sorted by their tuples of word ids.
+        """
+        self.flush()
+        return izip(_iter_trie(self._last, self._starts,
+                               len(self._counts[0]), order - 1),
+                    self._counts[order-1])
+
+    def ngrams(self, order):
+        """
+        :return: An iterator over ``(ngram, count)`` pairs for the
+            n-grams of the given order that were counted.
+        """
+        words = self._words
+        return ((tuple(words[i] for i in ids), count)
+                for (ids, count) in self.ngram_ids(order) if count)
+
+    def num_ngrams(self, order):
+        """
+        :return: The number of distinct n-grams of the given order.
+        """
+        self.flush()
+        counts = self._counts[order-1]
+        if order == 1:
+            return sum(1 for count in counts if count)
+        return len(counts)
+
+    def __repr__(self):
+        self.flush()
+        return '<NgramCounter: %s>' % ', '.join(
+            '%d %d-grams' % (self.num_ngrams(k), k)
+            for k in range(1, self._order + 1))
+
+
+def _iter_trie(last, starts, size, k):
+    """
+    Iterate over the tuples of word ids of the n-grams of order ``k+1``,
+    in sorted order.
+    """
+    if k == 0:
+        return ((i,) for i in range(size))
+    return _iter_children(_iter_trie(last, starts, size, k - 1),
+                          last[k], starts[k-1])
+
+def _iter_children(parents, words, starts):
+    for (i, parent) in enumerate(parents):
+        for j in range(starts[i], starts[i+1]):
+            yield parent + (words[j],)
+
+def _merge_counts(xs, ys):
+    """
+    Merge two sorted iterators over ``(ngram, count)`` pairs, adding the
+    counts of the n-grams that are in both.
+    """
+    xs = iter(xs)
+    ys = iter(ys)
+    x = next(xs, None)
+    y = next(ys, None)
+    while x is not None and y is not None:
+        if x[0] < y[0]:
+            yield x
+            x = next(xs, None)
+        elif y[0] < x[0]:
+            yield y
+            y = next(ys, None)
+        else:
+            yield (x[0], x[1] + y[1])
+            x = next(xs, None)
+            y = next(ys, None)
+    if x is not None:
+        yield x
+        for x in xs:
+            yield x
+    if y is not None:
+        yield y
+        for y in ys:
+            yield y
+
+def _build_level(ngrams, parents, num_parents):
+    """
+    Build the arrays of one order of the trie from its sorted n-grams,
+    and the sorted iterator over the n-grams of the order below, which
+    contains the prefix of each n-gram.
+    """
+    words = array(_TYPECODE)
+    counts = array(_TYPECODE)
+    starts = array(_TYPECODE)
+    parent = None
+    for (ngram, count) in ngrams:
+        prefix = ngram[:-1]
+        while prefix != parent:
+            parent = next(parents)
+            starts.append(len(words))
+        words.append(ngram[-1])
+        counts.append(count)
+    starts.extend([len(words)] * (num_parents + 1 - len(starts)))
+    return words, counts, starts
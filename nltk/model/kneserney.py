@@ -0,0 +1,292 @@
+# Natural Language Toolkit: Kneser-Ney Language Models
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+Kneser-Ney smoothed n-gram language models of any order.
+
+The probability of a word in the longest context is discounted by
+subtracting a constant ``D`` from the counts of the n-grams of that
+context, and the probability mass that is freed is given to the
+distribution of the next shorter context, down to the uniform
+distribution over the vocabulary.  Except for the longest n-grams, the
+counts are replaced by continuation counts: the number of distinct
+words that precede the n-gram.  (Chen and Goodman, 1998; the n-grams
+that start with ``BOS`` keep their counts, as in KenLM.)
+"""
+from __future__ import division, print_function, unicode_literals
+
+import math
+from array import array
+
+from nltk import compat
+from nltk.model.api import ModelI, BOS, EOS, UNK
+from nltk.model.counter import NgramCounter, _TYPECODE
+
+# The ids of the special symbols in the vocabulary of the counts
+_UNK_ID, _BOS_ID, _EOS_ID = 0, 1, 2
+
+# The log probability of BOS in ARPA files, where it stands for zero
+_BOS_LOGPROB = -99.0
+
+# The discount for orders with too few n-grams to estimate one
+_DEFAULT_DISCOUNT = 0.75
+
+
+@compat.python_2_unicode_compatible
+class KneserNeyModel(ModelI):
+    """
+    An interpolated (or backoff) Kneser-Ney language model, estimated
+    from the counts of an ``NgramCounter``.
+
+        >>> from nltk.model import KneserNeyModel
+        >>> sents = [['the', 'cat', 'sat'], ['the', 'dog', 'sat'],
+        ...          ['a', 'cat', 'ran']]
+        >>> lm = KneserNeyModel(3, sents)
+        >>> print('%.4f' % lm.score('cat', ['the']))
+        0.2967
+        >>> print('%.4f' % lm.score('sat', ['the', 'cat']))
+        0.4725
+        >>> print('%.4f' % lm.perplexity([['the', 'cat', 'ran']]))
+        2.7521
+
+    :ivar discounts: The discount of each order (``discounts[k-1]`` is
+        the discount of the n-grams of order ``k``).
+    """
+    def __init__(self, order, sents=(), discount=None, interpolate=True,
+                 buffer_size=2**20):
+        """
+        :param order: The length of the longest n-grams of the model.
+        :type order: int
+        :param sents: The training sentences, each of which is a list
+            of words.
+        :param discount: The discount of all orders, between 0 and 1, or
+            a list of the discounts of each order.  If not specified,
+            then the discount of each order is estimated as
+            ``n1 / (n1 + 2 * n2)``, where ``n1`` and ``n2`` are the
+            numbers of n-grams with counts 1 and 2.
+        :param interpolate: Whether the probabilities of the n-grams
+            that occur in a context are interpolated with those of the
+            shorter contexts (true), or only unseen n-grams back off to
+            them (false).
+        :type interpolate: bool
+        :param buffer_size: See ``NgramCounter``.
+        """
+        self.order = order
+        self._interpolate = interpolate
+        self._counter = NgramCounter(
+            order, ([BOS] + list(sent) + [EOS] for sent in sents),
+            vocabulary=(UNK, BOS, EOS), buffer_size=buffer_size)
+        self._counter.flush()
+        self._estimate(discount)
+
+    def _estimate(self, discount):
+        counter = self._counter
+        order = self.order
+        size = len(counter._counts[0])
+        # The words that can be predicted: all but BOS
+        self._uniform = 1.0 / (size - 1)
+
+        # The adjusted counts of each order
+        self._adjusted = []
+        for k in range(order):
+            counts = counter._counts[k]
+            if k == order - 1:
+                adjusted = array(_TYPECODE, counts)
+            else:
+                adjusted = array(_TYPECODE, [0]) * len(counts)
+                for (ids, count) in counter.ngram_ids(k + 2):
+                    adjusted[counter._index(ids[1:])] += 1
+                for (index, (ids, count)) in enumerate(counter.ngram_ids(k + 1)):
+                    if ids[0] == _BOS_ID:
+                        adjusted[index] = count
+            if k == 0:
+                adjusted[_BOS_ID] = 0
+            self._adjusted.append(adjusted)
+
+        if discount is None:
+            self.discounts = [_estimate_discount(adjusted)
+                              for adjusted in self._adjusted]
+        elif isinstance(discount, (list, tuple)):
+            if len(discount) != order:
+                raise ValueError('Expected %d discounts' % order)
+            self.discounts = list(discount)
+        else:
+            self.discounts = [discount] * order
+        for d in self.discounts:
+            if not 0 < d < 1:
+                raise ValueError('Discounts must be between 0 and 1')
+
+        # The total adjusted count, and number of distinct words, that
+        # follow each context (self._totals[0] is for the empty context).
+        self._totals = [array(_TYPECODE, [sum(self._adjusted[0])])]
+        self._types = [array(_TYPECODE, [sum(1 for c in self._adjusted[0] if c)])]
+        for k in range(1, order):
+            starts = counter._starts[k-1]
+            following = self._adjusted[k]
+            totals = array(_TYPECODE, [0]) * (len(starts) - 1)
+            types = array(_TYPECODE, [0]) * (len(starts) - 1)
+            for node in range(len(starts) - 1):
+                counts = following[starts[node]:starts[node+1]]
+                totals[node] = sum(counts)
+                types[node] = sum(1 for c in counts if c)
+            self._totals.append(totals)
+            self._types.append(types)
+        self._alphas = {}
+
+    @property
+    def counts(self):
+        """The ``NgramCounter`` of the training sentences."""
+        return self._counter
+
+    def vocabulary(self):
+        """
+        :return: The words of the model, including ``UNK``, ``BOS`` and
+            ``EOS``, indexed by their ids.
+        :rtype: list
+        """
+        return self._counter.vocabulary()
+
+    def _ids(self, words):
+        lookup_id = self._counter.lookup_id
+        return tuple(lookup_id(word, _UNK_ID) for word in words)
+
+    def score(self, word, context=()):
+        context = tuple(context)[1 - self.order:] if self.order > 1 else ()
+        return self._prob(self._ids(context), self._ids([word])[0])
+
+    def _prob(self, context, word):
+        """
+        :return: The probability of the word with id ``word``, following
+            the words with ids ``context``.
+        """
+        if word == _BOS_ID:
+            return 0.0
+        if self._interpolate:
+            return self._interpolated_prob(context, word)
+        return self._backoff_prob(context, word)
+
+    def _contexts(self, context):
+        """
+        Generate ``(k, node)`` for the suffixes of ``context`` that were
+        seen, from the shortest to the longest, where ``node`` is the
+        index of the suffix of length ``k``.
+        """
+        yield (0, 0)
+        index = self._counter._index
+        for k in range(1, len(context) + 1):
+            node = index(context[len(context)-k:])
+            if node < 0 or self._totals[k][node] == 0:
+                return
+            yield (k, node)
+
+    def _count(self, k, node, word):
+        """
+        :return: The adjusted count of ``word`` following the context
+            of length ``k`` at index ``node``.
+        """
+        if k == 0:
+            index = word if word < len(self._adjusted[0]) else -1
+        else:
+            index = self._counter._child(k, node, word)
+        return self._adjusted[k][index] if index >= 0 else 0
+
+    def _interpolated_prob(self, context, word):
+        p = self._uniform
+        for (k, node) in self._contexts(context):
+            d = self.discounts[k]
+            total = self._totals[k][node]
+            count = self._count(k, node, word)
+            p = (max(count - d, 0) + d * self._types[k][node] * p) / total
+        return p
+
+    def _backoff_prob(self, context, word):
+        contexts = list(self._contexts(context))
+        p = None
+        for (k, node) in reversed(contexts):
+            count = self._count(k, node, word)
+            if count:
+                p = (count - self.discounts[k]) / self._totals[k][node]
+                break
+        else:
+            k = -1
+            p = self._uniform
+        # Back off from the contexts that are longer than the one found
+        for (k, node) in contexts[k+1:]:
+            p *= self._alpha(k, node, context)
+        return p
+
+    def _alpha(self, k, node, context):
+        """
+        :return: The backoff weight of the context of length ``k`` at
+            index ``node``, which is a suffix of ``context``.
+        """
+        try:
+            return self._alphas[k, node]
+        except KeyError:
+            pass
+        d = self.discounts[k]
+        total = self._totals[k][node]
+        if k == 0:
+            words = range(len(self._adjusted[0]))
+            shorter = None
+        else:
+            starts = self._counter._starts[k-1]
+            words = self._counter._last[k][starts[node]:starts[node+1]]
+            shorter = context[len(context)-k+1:]
+        seen = 0.0
+        lower = 0.0
+        for word in words:
+            count = self._count(k, node, word)
+            if count:
+                seen += (count - d) / total
+                if shorter is None:
+                    lower += self._uniform
+                else:
+                    lower += self._backoff_prob(shorter, word)
+        if lower < 1:
+            alpha = (1 - seen) / (1 - lower)
+        else:
+            alpha = d * self._types[k][node] / total
+        self._alphas[k, node] = alpha
+        return alpha
+
+    def ngram_logprobs(self, order):
+        words = self.vocabulary()
+        for (index, (ids, count)) in enumerate(self._counter.ngram_ids(order)):
+            if order > 1 and self._adjusted[order-1][index] == 0:
+                continue
+            if ids == (_BOS_ID,):
+                # BOS is never predicted, so it only has a backoff weight
+                logprob = _BOS_LOGPROB
+            else:
+                logprob = math.log10(self._prob(ids[:-1], ids[-1]))
+            if order == self.order:
+                backoff = None
+            elif self._totals[order][index] == 0:
+                backoff = 0.0
+            elif self._interpolate:
+                backoff = math.log10(self.discounts[order] *
+                                     self._types[order][index] /
+                                     self._totals[order][index])
+            else:
+                backoff = math.log10(self._alpha(order, index, ids))
+            yield (tuple(words[i] for i in ids), logprob, backoff)
+
+    def __repr__(self):
+        return '<KneserNeyModel: order %d, %d words>' % (
+            self.order, len(self.vocabulary()))
+
+
+def _estimate_discount(counts):
+    """
+    :return: The discount ``n1 / (n1 + 2 * n2)`` for the given counts,
+        or ``_DEFAULT_DISCOUNT`` if it cannot be estimated.
+    """
+    n1 = sum(1 for count in counts if count == 1)
+    n2 = sum(1 for count in counts if count == 2)
+    if n1 == 0 or n2 == 0:
+        return _DEFAULT_DISCOUNT
+    return n1 / (n1 + 2 * n2)
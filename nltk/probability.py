@@ -32,9 +32,12 @@ experiment.  There are two types of probability distribution:
 
 The ``ConditionalFreqDist`` class and ``ConditionalProbDistI`` interface
 are used to encode conditional distributions.  Conditional probability
-distributions can be derived or analytic; but currently the only
-implementation of the ``ConditionalProbDistI`` interface is
-``ConditionalProbDist``, a derived distribution.
+distributions can be derived or analytic; but currently the
+implementations of the ``ConditionalProbDistI`` interface are derived
+distributions (``ConditionalProbDist`` and ``CompactConditionalProbDist``)
+or wrap existing distributions (``DictionaryConditionalProbDist``).
+``CompactConditionalFreqDist`` stores the counts of a conditional
+frequency distribution in integer arrays, for very large tables.
 
 """
 from __future__ import print_function, unicode_literals
@@ -43,13 +46,20 @@ import math
 import random
 import warnings
 import array
+from bisect import bisect_left
 from operator import itemgetter
 from collections import defaultdict
 from functools import reduce
 from nltk import compat
-from nltk.compat import Counter
+from nltk.compat import Counter, izip
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from nltk.internals import raise_unorderable_types
+from nltk.util import LRUCache
 
 _NINF = float('-1e300')
 
@@ -85,6 +95,13 @@ class FreqDist(Counter):
 
         >>> fdist = FreqDist(word.lower() for word in word_tokenize(sent))
 
+    A frequency distribution keeps the total of its counts up to date
+    as they change, so that ``N()`` and ``freq()`` take constant time.
+    Each assignment to a count is then a call to a Python method, which
+    makes ``fdist[word] += 1`` several times slower than with a plain
+    ``Counter``.  The initializer and ``update()`` add all of their
+    samples at once, so they are not slowed down, and they are much
+    faster than incrementing each count.
     """
 
     def __init__(self, samples=None):
@@ -103,8 +120,75 @@ class FreqDist(Counter):
             distribution with.
         :type samples: Sequence
         """
+        # The total of the counts (or None if it must be recomputed),
+        # and the cached sorted items and frequencies of frequencies,
+        # which are discarded whenever a count changes.
+        self._N = 0
+        self._sorted = None
+        self._r_Nr_table = None
         Counter.__init__(self, samples)
 
+    def __setitem__(self, sample, count):
+        # This is called for every count that changes, so it only does
+        # what is needed to keep the total and the caches valid.
+        N = self._N
+        if N is not None:
+            self._N = N + count - dict.get(self, sample, 0)
+        self._sorted = self._r_Nr_table = None
+        dict.__setitem__(self, sample, count)
+
+    def __delitem__(self, sample):
+        if sample in self:
+            if self._N is not None:
+                self._N -= self[sample]
+            self._sorted = self._r_Nr_table = None
+        super(FreqDist, self).__delitem__(sample)
+
+    def update(self, *args, **kwargs):
+        """
+        Add the counts of the given samples (or of the samples and counts
+        of the given mapping) to this frequency distribution.
+        """
+        # Count in a plain Counter, which is faster than calling
+        # __setitem__ for each sample, and then add the totals.
+        counts = Counter(*args, **kwargs)
+        if not counts:
+            return
+        if self:
+            get = self.get
+            for (sample, count) in counts.items():
+                dict.__setitem__(self, sample, get(sample, 0) + count)
+        else:
+            dict.update(self, counts)
+        if self._N is not None:
+            self._N += sum(counts.values())
+        self._sorted = self._r_Nr_table = None
+
+    def setdefault(self, sample, default=None):
+        if sample not in self:
+            self._N = None
+            self._sorted = self._r_Nr_table = None
+        return super(FreqDist, self).setdefault(sample, default)
+
+    def pop(self, sample, *default):
+        if sample in self:
+            count = self[sample]
+            del self[sample]
+            return count
+        return super(FreqDist, self).pop(sample, *default)
+
+    def popitem(self):
+        item = super(FreqDist, self).popitem()
+        if self._N is not None:
+            self._N -= item[1]
+        self._sorted = self._r_Nr_table = None
+        return item
+
+    def clear(self):
+        super(FreqDist, self).clear()
+        self._N = 0
+        self._sorted = self._r_Nr_table = None
+
     def N(self):
         """
         Return the total number of sample outcomes that have been
@@ -112,9 +196,14 @@ class FreqDist(Counter):
         sample values (or bins) with counts greater than zero, use
         ``FreqDist.B()``.
 
+        The total is kept up to date as the counts change, so this
+        takes constant time.
+
         :rtype: int
         """
-        return sum(self.values())
+        if self._N is None:
+            self._N = sum(self.values())
+        return self._N
 
     def B(self):
         """
@@ -151,15 +240,34 @@ class FreqDist(Counter):
         :rtype: int
         """
 
-        _r_Nr = defaultdict(int)
-        for count in self.values():
-            _r_Nr[count] += 1
+        if self._r_Nr_table is None:
+            table = defaultdict(int)
+            for count in self.values():
+                table[count] += 1
+            self._r_Nr_table = table
+
+        _r_Nr = defaultdict(int, self._r_Nr_table)
 
         # Special case for Nr[0]:
         _r_Nr[0] = bins - self.B() if bins is not None else 0
 
         return _r_Nr
 
+    def most_common(self, n=None):
+        """
+        Return a list of the ``n`` most common samples and their counts,
+        from the most common to the least (or of all samples, if ``n``
+        is not specified).  The sorted list of all samples is cached
+        until a count changes.
+
+        :rtype: list(tuple)
+        """
+        if self._sorted is None:
+            self._sorted = Counter.most_common(self)
+        if n is None:
+            return list(self._sorted)
+        return self._sorted[:max(n, 0)]
+
     def _cumulative_frequencies(self, samples):
         """
         Return the cumulative frequencies of the specified samples.
@@ -292,6 +400,24 @@ class FreqDist(Counter):
         """
         return self.__class__(self)
 
+    # Arithmetic returns a FreqDist (rather than a Counter)
+    def __add__(self, other):
+        return self._from_counter(super(FreqDist, self).__add__(other))
+
+    def __sub__(self, other):
+        return self._from_counter(super(FreqDist, self).__sub__(other))
+
+    def __or__(self, other):
+        return self._from_counter(super(FreqDist, self).__or__(other))
+
+    def __and__(self, other):
+        return self._from_counter(super(FreqDist, self).__and__(other))
+
+    def _from_counter(self, counter):
+        if counter is NotImplemented:
+            return counter
+        return self.__class__(counter)
+
     def __le__(self, other):
         if not isinstance(other, FreqDist):
             raise_unorderable_types("<=", self, other)
@@ -1503,8 +1629,24 @@ class KneserNeyProbDist(ProbDistI):
     FreqDist instance to train on. Optionally, a different from default discount
     value can be specified. The default discount is set to 0.75.
 
+    The words of the trigrams are replaced by integer ids, and the counts
+    that are derived from the trigrams are kept in arrays indexed by the
+    ids of words and of pairs of words.  The probabilities of the most
+    recently used trigrams are cached, and the probabilities of many
+    trigrams can be computed at once with ``prob_many()``:
+
+        >>> from nltk.probability import FreqDist, KneserNeyProbDist
+        >>> from nltk.util import trigrams
+        >>> words = 'the cat sat on the mat and the cat ate'.split()
+        >>> kn = KneserNeyProbDist(FreqDist(trigrams(words)), cache_size=100)
+        >>> print('%.4f' % kn.prob(('the', 'cat', 'sat')))
+        0.1250
+        >>> ['%.4f' % p for p in kn.prob_many([('the', 'cat', 'ate'),
+        ...                                    ('on', 'the', 'cat'),
+        ...                                    ('a', 'b', 'c')])]
+        ['0.1250', '0.7500', '0.0000']
     """
-    def __init__(self, freqdist, bins=None, discount=0.75):
+    def __init__(self, freqdist, bins=None, discount=0.75, cache_size=2**16):
         """
         :param trigrams: The trigram frequency distribution upon which to base
             the estimation
@@ -1514,6 +1656,10 @@ class KneserNeyProbDist(ProbDistI):
         :param discount: The discount applied when retrieving counts of
             trigrams
         :type discount: float (preferred, but can be set to int)
+        :param cache_size: The maximum number of probabilities to cache
+            (the least recently used are discarded).  If 0 or None, then
+            probabilities are not cached.
+        :type cache_size: int
         """
 
         if not bins:
@@ -1523,57 +1669,149 @@ class KneserNeyProbDist(ProbDistI):
         self._D = discount
 
         # cache for probability calculation
-        self._cache = {}
+        self._cache = LRUCache(cache_size) if cache_size else None
+        self._hits = self._misses = 0
 
-        # internal bigram and trigram frequency distributions
-        self._bigrams = defaultdict(int)
         self._trigrams = freqdist
 
-        # helper dictionaries used to calculate probabilities
-        self._wordtypes_after = defaultdict(float)
-        self._trigrams_contain = defaultdict(float)
-        self._wordtypes_before = defaultdict(float)
+        # The ids of the words, and of the pairs of words (which are
+        # keyed by first_id * number_of_words + second_id).
+        self._word_ids = {}
         for w0, w1, w2 in freqdist:
-            self._bigrams[(w0,w1)] += freqdist[(w0, w1, w2)]
-            self._wordtypes_after[(w0,w1)] += 1
-            self._trigrams_contain[w1] += 1
-            self._wordtypes_before[(w1,w2)] += 1
+            for word in (w0, w1, w2):
+                if word not in self._word_ids:
+                    self._word_ids[word] = len(self._word_ids)
+        self._pair_ids = {}
+
+        # helper arrays used to calculate probabilities: for each pair of
+        # words, the count of the trigrams that start with it, and the
+        # number of distinct words that follow and precede it; and for
+        # each word, the number of distinct trigrams that it is the
+        # middle of.
+        self._bigrams = array.array(str('d'))
+        self._wordtypes_after = array.array(str('l'))
+        self._wordtypes_before = array.array(str('l'))
+        self._trigrams_contain = array.array(str('l'), [0]) * len(self._word_ids)
+        for trigram in freqdist:
+            w0, w1, w2 = trigram
+            i0, i1, i2 = (self._word_ids[w] for w in trigram)
+            before = self._pair_index(i0, i1, True)
+            after = self._pair_index(i1, i2, True)
+            self._bigrams[before] += freqdist[trigram]
+            self._wordtypes_after[before] += 1
+            self._trigrams_contain[i1] += 1
+            self._wordtypes_before[after] += 1
+
+    def _pair_index(self, i0, i1, add=False):
+        """
+        Return the index of the pair of words with ids ``i0`` and ``i1``
+        in the helper arrays, or -1 if it is not in them (unless ``add``
+        is true, in which case it is added).
+        """
+        key = i0 * len(self._word_ids) + i1
+        index = self._pair_ids.get(key, -1)
+        if index < 0 and add:
+            index = self._pair_ids[key] = len(self._bigrams)
+            self._bigrams.append(0)
+            self._wordtypes_after.append(0)
+            self._wordtypes_before.append(0)
+        return index
 
     def prob(self, trigram):
         # sample must be a triple
         if len(trigram) != 3:
             raise ValueError('Expected an iterable with 3 members.')
         trigram = tuple(trigram)
-        w0, w1, w2 = trigram
-
-        if trigram in self._cache:
-            return self._cache[trigram]
+        if self._cache is None:
+            return self._prob(trigram)
+        prob = self._cache.get(trigram)
+        if prob is None:
+            self._misses += 1
+            prob = self._prob(trigram)
+            self._cache.put(trigram, prob)
         else:
-            # if the sample trigram was seen during training
-            if trigram in self._trigrams:
-                prob = (self._trigrams[trigram]
-                        - self.discount())/self._bigrams[(w0, w1)]
+            self._hits += 1
+        return prob
+
+    def _prob(self, trigram):
+        # if the sample trigram was seen during training
+        if trigram in self._trigrams:
+            i0, i1 = self._word_ids[trigram[0]], self._word_ids[trigram[1]]
+            return ((self._trigrams[trigram] - self.discount())
+                    / self._bigrams[self._pair_index(i0, i1)])
+
+        i0 = self._word_ids.get(trigram[0])
+        i1 = self._word_ids.get(trigram[1])
+        i2 = self._word_ids.get(trigram[2])
+        if i0 is None or i1 is None or i2 is None:
+            return 0.0
+        before = self._pair_index(i0, i1)
+        after = self._pair_index(i1, i2)
 
-            # else if the 'rougher' environment was seen during training
-            elif (w0,w1) in self._bigrams and (w1,w2) in self._wordtypes_before:
-                aftr = self._wordtypes_after[(w0, w1)]
-                bfr = self._wordtypes_before[(w1, w2)]
+        # if the 'rougher' environment was seen during training
+        if (before >= 0 and self._wordtypes_after[before] and
+                after >= 0 and self._wordtypes_before[after]):
+            aftr = self._wordtypes_after[before]
+            bfr = self._wordtypes_before[after]
 
-                # the probability left over from alphas
-                leftover_prob = ((aftr * self.discount())
-                                 / self._bigrams[(w0, w1)])
+            # the probability left over from alphas
+            leftover_prob = ((aftr * self.discount())
+                             / self._bigrams[before])
 
-                # the beta (including normalization)
-                beta = bfr /(self._trigrams_contain[w1] - aftr)
+            # the beta (including normalization)
+            beta = float(bfr) / (self._trigrams_contain[i1] - aftr)
 
-                prob = leftover_prob * beta
+            return leftover_prob * beta
 
-            # else the sample was completely unseen during training
-            else:
-                prob = 0.0
+        # else the sample was completely unseen during training
+        return 0.0
+
+    def prob_many(self, trigrams):
+        """
+        Return the probabilities of the given trigrams.  The probability
+        of each distinct trigram is only computed once (but the cache is
+        not used).
 
-            self._cache[trigram] = prob
-            return prob
+        :param trigrams: The trigrams
+        :type trigrams: iterable of tuples
+        :rtype: list(float)
+        """
+        probs = {}
+        result = []
+        for trigram in trigrams:
+            trigram = tuple(trigram)
+            if len(trigram) != 3:
+                raise ValueError('Expected an iterable with 3 members.')
+            try:
+                result.append(probs[trigram])
+            except KeyError:
+                prob = probs[trigram] = self._prob(trigram)
+                result.append(prob)
+        return result
+
+    def logprob_many(self, trigrams):
+        """
+        Return the base 2 logarithms of the probabilities of the given
+        trigrams (see ``prob_many()``).
+
+        :rtype: list(float)
+        """
+        return [(math.log(p, 2) if p != 0 else _NINF)
+                for p in self.prob_many(trigrams)]
+
+    def cache_info(self):
+        """
+        Return a tuple ``(hits, misses, maxsize, currsize)`` of the numbers
+        of probabilities that were and were not found in the cache, the
+        maximum size of the cache, and its current size; or None if
+        probabilities are not cached.
+
+        :rtype: tuple
+        """
+        if self._cache is None:
+            return None
+        return (self._hits, self._misses, self._cache.maxsize,
+                len(self._cache))
 
     def discount(self):
         """
@@ -1592,6 +1830,8 @@ class KneserNeyProbDist(ProbDistI):
         :rtype: None
         """
         self._D = discount
+        if self._cache is not None:
+            self._cache.clear()
 
     def samples(self):
         return self._trigrams.keys()
@@ -1825,6 +2065,339 @@ class ConditionalFreqDist(defaultdict):
         return '<ConditionalFreqDist with %d conditions>' % len(self)
 
 
+@compat.python_2_unicode_compatible
+class CompactConditionalFreqDist(object):
+    """
+    A conditional frequency distribution that stores its counts in
+    integer arrays, rather than in a ``FreqDist`` for each condition.
+    The conditions and samples are replaced by integer ids, and the
+    counts of each condition are a contiguous range of two arrays, of
+    sample ids (sorted) and of counts, as in a compressed sparse row
+    matrix.  Each count then takes two machine integers, rather than a
+    dictionary entry in a ``FreqDist``, which makes it suitable for
+    tables with hundreds of thousands of conditions, such as the
+    training tables of taggers.
+
+        >>> from nltk.probability import CompactConditionalFreqDist
+        >>> words = "the the the dog dog some other words that we do not care about".split()
+        >>> cfdist = CompactConditionalFreqDist((len(word), word) for word in words)
+        >>> cfdist
+        <CompactConditionalFreqDist with 4 conditions>
+        >>> cfdist[3]
+        FreqDist({'the': 3, 'dog': 2, 'not': 1})
+        >>> cfdist[3].freq('the')
+        0.5
+        >>> cfdist.count(3, 'dog'), cfdist.N()
+        (2, 14)
+
+    Indexing returns a new ``FreqDist`` with the counts of the
+    condition (which is empty if the condition is unknown), so the
+    counts must be changed with ``inc()`` or ``update()``:
+
+        >>> cfdist.inc(3, 'cat')
+        >>> cfdist[3]['cat']
+        1
+
+    New counts are first gathered in a dictionary, which is merged into
+    the arrays whenever it holds ``buffer_size`` counts.  A
+    ``CompactConditionalFreqDist`` is pickled as its arrays.
+    """
+    def __init__(self, cond_samples=None, buffer_size=2**20):
+        """
+        Construct a new conditional frequency distribution.
+
+        :param cond_samples: The samples to initialize the conditional
+            frequency distribution with
+        :type cond_samples: Sequence of (condition, sample) tuples
+        :param buffer_size: The number of distinct (condition, sample)
+            pairs to gather before merging them into the arrays.
+        :type buffer_size: int
+        """
+        self._buffer_size = buffer_size
+        self._conditions = []
+        self._samples = []
+        # The counts of the condition with id i are self._counts[j],
+        # for the sample ids self._indices[j], where j ranges from
+        # self._indptr[i] to self._indptr[i+1].
+        self._indptr = array.array(str('l'), [0])
+        self._indices = array.array(str('l'))
+        self._counts = array.array(str('l'))
+        self._init_ids()
+        if cond_samples:
+            self.update(cond_samples)
+
+    def _init_ids(self):
+        self._condition_ids = dict((c, i) for (i, c) in enumerate(self._conditions))
+        self._sample_ids = dict((s, i) for (i, s) in enumerate(self._samples))
+        # The new counts, by condition id and sample id
+        self._pending = defaultdict(dict)
+        self._num_pending = 0
+
+    @classmethod
+    def fromcfdist(cls, cfdist, buffer_size=2**20):
+        """
+        :return: A ``CompactConditionalFreqDist`` with the counts of the
+            given ``ConditionalFreqDist``.
+        """
+        result = cls(buffer_size=buffer_size)
+        for condition in cfdist.conditions():
+            result._condition_id(condition)
+            for (sample, count) in cfdist[condition].items():
+                result.inc(condition, sample, count)
+        return result
+
+    def tocfdist(self, conditions=None):
+        """
+        :return: A ``ConditionalFreqDist`` with the counts of the given
+            conditions (default is all).
+        """
+        if conditions is None:
+            conditions = self.conditions()
+        cfdist = ConditionalFreqDist()
+        for condition in conditions:
+            cfdist[condition] = self[condition]
+        return cfdist
+
+    def _condition_id(self, condition):
+        try:
+            return self._condition_ids[condition]
+        except KeyError:
+            self._condition_ids[condition] = len(self._conditions)
+            self._conditions.append(condition)
+            return self._condition_ids[condition]
+
+    def _sample_id(self, sample):
+        try:
+            return self._sample_ids[sample]
+        except KeyError:
+            self._sample_ids[sample] = len(self._samples)
+            self._samples.append(sample)
+            return self._sample_ids[sample]
+
+    def inc(self, condition, sample, count=1):
+        """
+        Increment the count of ``sample`` under ``condition``.
+
+        :type count: int
+        """
+        counts = self._pending[self._condition_id(condition)]
+        sample_id = self._sample_id(sample)
+        if sample_id not in counts:
+            counts[sample_id] = 0
+            self._num_pending += 1
+        counts[sample_id] += count
+        if self._num_pending >= self._buffer_size:
+            self.flush()
+
+    def update(self, cond_samples):
+        """
+        Count each of the given ``(condition, sample)`` pairs.
+        """
+        for (condition, sample) in cond_samples:
+            counts = self._pending[self._condition_id(condition)]
+            sample_id = self._sample_id(sample)
+            if sample_id in counts:
+                counts[sample_id] += 1
+            else:
+                counts[sample_id] = 1
+                self._num_pending += 1
+                if self._num_pending >= self._buffer_size:
+                    self.flush()
+
+    def flush(self):
+        """
+        Merge the counts that were gathered by ``inc()`` and
+        ``update()`` into the arrays.  This is done automatically
+        before the counts are read.
+        """
+        if not self._pending and len(self._indptr) > len(self._conditions):
+            return
+        pending = self._pending
+        self._pending = defaultdict(dict)
+        self._num_pending = 0
+        indptr, indices, counts = self._indptr, self._indices, self._counts
+        # Pad the old arrays with empty rows for the new conditions (in
+        # a copy, as the old arrays may be used by a probability
+        # distribution that was derived from them).
+        indptr = indptr + array.array(
+            str('l'), [indptr[-1]] * (len(self._conditions) + 1 - len(indptr)))
+        new_indptr = array.array(str('l'), [0])
+        new_indices = array.array(str('l'))
+        new_counts = array.array(str('l'))
+        row = 0
+        for changed in sorted(pending):
+            # Copy the rows before the changed row as they are
+            shift = len(new_indices) - indptr[row]
+            new_indices.extend(indices[indptr[row]:indptr[changed]])
+            new_counts.extend(counts[indptr[row]:indptr[changed]])
+            new_indptr.extend([i + shift for i in indptr[row+1:changed+1]])
+            start, end = indptr[changed], indptr[changed+1]
+            merged = pending.pop(changed)
+            for (sample_id, count) in izip(indices[start:end], counts[start:end]):
+                merged[sample_id] = merged.get(sample_id, 0) + count
+            sample_ids = sorted(merged)
+            new_indices.extend(sample_ids)
+            new_counts.extend([merged[i] for i in sample_ids])
+            new_indptr.append(len(new_indices))
+            row = changed + 1
+        shift = len(new_indices) - indptr[row]
+        new_indices.extend(indices[indptr[row]:])
+        new_counts.extend(counts[indptr[row]:])
+        new_indptr.extend([i + shift for i in indptr[row+1:]])
+        self._indptr = new_indptr
+        self._indices = new_indices
+        self._counts = new_counts
+
+    def _find(self, row, sample_id):
+        """
+        :return: The index in the arrays of the count of the sample with
+            id ``sample_id`` under the condition with id ``row``, or -1
+            if it has no count.
+        """
+        lo, hi = self._indptr[row], self._indptr[row+1]
+        index = bisect_left(self._indices, sample_id, lo, hi)
+        if index == hi or self._indices[index] != sample_id:
+            return -1
+        return index
+
+    def count(self, condition, sample):
+        """
+        :return: The count of ``sample`` under ``condition``, without
+            building the ``FreqDist`` of the condition.
+        :rtype: int
+        """
+        self.flush()
+        row = self._condition_ids.get(condition)
+        sample_id = self._sample_ids.get(sample)
+        if row is None or sample_id is None:
+            return 0
+        index = self._find(row, sample_id)
+        return self._counts[index] if index >= 0 else 0
+
+    def __getitem__(self, condition):
+        self.flush()
+        fdist = FreqDist()
+        row = self._condition_ids.get(condition)
+        if row is not None:
+            start, end = self._indptr[row], self._indptr[row+1]
+            samples = self._samples
+            fdist.update(dict((samples[i], count) for (i, count) in
+                              izip(self._indices[start:end], self._counts[start:end])))
+        return fdist
+
+    def __contains__(self, condition):
+        return condition in self._condition_ids
+
+    def __iter__(self):
+        return iter(self._conditions)
+
+    def __len__(self):
+        return len(self._conditions)
+
+    def conditions(self):
+        """
+        Return a list of the conditions that have been counted by this
+        ``CompactConditionalFreqDist``.
+
+        :rtype: list
+        """
+        return list(self._conditions)
+
+    keys = conditions
+
+    def items(self):
+        """
+        :return: An iterator over ``(condition, fdist)`` pairs.
+        """
+        return ((condition, self[condition]) for condition in self._conditions)
+
+    def values(self):
+        """
+        :return: An iterator over the ``FreqDist`` of each condition.
+        """
+        return (self[condition] for condition in self._conditions)
+
+    def samples(self):
+        """
+        :return: A list of the samples that have been counted under
+            any condition.
+        :rtype: list
+        """
+        return list(self._samples)
+
+    def N(self):
+        """
+        Return the total number of sample outcomes that have been
+        recorded by this ``CompactConditionalFreqDist``.
+
+        :rtype: int
+        """
+        self.flush()
+        return sum(self._counts)
+
+    def plot(self, *args, **kwargs):
+        """
+        Plot the given samples from the conditional frequency
+        distribution, as ``ConditionalFreqDist.plot()``.
+        """
+        self.tocfdist(kwargs.get('conditions')).plot(*args, **kwargs)
+
+    def tabulate(self, *args, **kwargs):
+        """
+        Tabulate the given samples from the conditional frequency
+        distribution, as ``ConditionalFreqDist.tabulate()``.
+        """
+        self.tocfdist(kwargs.get('conditions')).tabulate(*args, **kwargs)
+
+    def __eq__(self, other):
+        if not isinstance(other, (ConditionalFreqDist, CompactConditionalFreqDist)):
+            return False
+        return (set(self.conditions()) == set(other.conditions()) and
+                all(self[c] == other[c] for c in self.conditions()))
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __getstate__(self):
+        self.flush()
+        state = self.__dict__.copy()
+        for name in ('_condition_ids', '_sample_ids', '_pending', '_num_pending'):
+            del state[name]
+        # Pickle each array with the smallest integer type that fits it
+        for name in ('_indptr', '_indices', '_counts'):
+            state[name] = _shrink_array(state[name])
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name in ('_indptr', '_indices', '_counts'):
+            setattr(self, name, array.array(str('l'), getattr(self, name)))
+        self._init_ids()
+
+    def __repr__(self):
+        """
+        Return a string representation of this ``CompactConditionalFreqDist``.
+
+        :rtype: str
+        """
+        return '<CompactConditionalFreqDist with %d conditions>' % len(self)
+
+
+def _shrink_array(values):
+    """
+    :return: A copy of the given array of integers, with the smallest
+        typecode that can hold its values.
+    """
+    lo, hi = (min(values), max(values)) if values else (0, 0)
+    for typecode in 'bhil':
+        bits = 8 * array.array(str(typecode)).itemsize - 1
+        if -2**bits <= lo and hi < 2**bits:
+            return array.array(str(typecode), values)
+    return values
+
+
 @compat.python_2_unicode_compatible
 class ConditionalProbDistI(dict):
     """
@@ -1951,6 +2524,262 @@ class DictionaryConditionalProbDist(ConditionalProbDistI):
         self[key] = DictionaryProbDist()
         return self[key]
 
+class CompactConditionalProbDist(ConditionalProbDistI):
+    """
+    A conditional probability distribution that is derived from a
+    ``CompactConditionalFreqDist``, like ``ConditionalProbDist``, but
+    without a ``ProbDist`` object for each condition.  For the
+    standard estimators (``MLEProbDist``, ``LidstoneProbDist``,
+    ``LaplaceProbDist``, ``ELEProbDist`` and ``WittenBellProbDist``),
+    the probabilities of all the counts are computed at once (with
+    numpy, if it is installed) into an array that is parallel to the
+    counts, and the distribution of a condition is a light view of
+    these arrays:
+
+        >>> from nltk.probability import CompactConditionalFreqDist
+        >>> from nltk.probability import CompactConditionalProbDist, ELEProbDist
+        >>> words = "the the the dog dog some other words that we do not care about".split()
+        >>> cfdist = CompactConditionalFreqDist((len(word), word) for word in words)
+        >>> cpdist = CompactConditionalProbDist(cfdist, ELEProbDist, 10)
+        >>> cpdist[3]
+        <ELEProbDist based on 6 samples>
+        >>> cpdist[3].max()
+        'the'
+        >>> print('%.4f %.4f' % (cpdist[3].prob('the'), cpdist[3].prob('cat')))
+        0.3182 0.0455
+
+    The probability distributions of the conditions are the same as
+    those of ``ConditionalProbDist``, except that ``max()`` breaks ties
+    by the order in which samples were first counted under any
+    condition (as the ``FreqDist`` of a condition of a
+    ``CompactConditionalFreqDist`` does), rather than under the
+    condition.  They are computed from the counts when the distribution
+    is created, and do not change if the counts are changed later.
+    Other factories are called with the ``FreqDist`` of a condition
+    when it is first accessed.
+    """
+    def __init__(self, cfdist, probdist_factory,
+                 *factory_args, **factory_kw_args):
+        """
+        Construct a new conditional probability distribution, based on
+        the given conditional frequency distribution and ``ProbDist``
+        factory.
+
+        :type cfdist: CompactConditionalFreqDist or ConditionalFreqDist
+        :param cfdist: The conditional frequency distribution, which
+            is converted to a ``CompactConditionalFreqDist`` if needed.
+        :type probdist_factory: class or function
+        :param probdist_factory: The function or class that maps
+            a condition's frequency distribution to its probability
+            distribution, as for ``ConditionalProbDist``.
+        :type factory_args: (any)
+        :param factory_args: Extra arguments for ``probdist_factory``.
+        :type factory_kw_args: (any)
+        :param factory_kw_args: Extra keyword arguments for ``probdist_factory``.
+        """
+        if not isinstance(cfdist, CompactConditionalFreqDist):
+            cfdist = CompactConditionalFreqDist.fromcfdist(cfdist)
+        cfdist.flush()
+        self._cfdist = cfdist
+        self._probdist_factory = probdist_factory
+        self._factory_args = factory_args
+        self._factory_kw_args = factory_kw_args
+        self._probs = self._unseen = None
+        params = _COMPACT_ESTIMATORS.get(probdist_factory)
+        if params is not None:
+            self._estimate(params)
+
+    def _estimate(self, params):
+        cfdist = self._cfdist
+        # Keep the arrays of the counts that the probabilities are
+        # computed from, which flush() replaces rather than changes.
+        indptr = self._indptr = cfdist._indptr
+        self._indices = cfdist._indices
+        counts = self._counts = cfdist._counts
+        # The probability of a sample with count c under the condition
+        # with id i is (c + add[i]) / divisor[i] if c > 0, else unseen[i].
+        add = array.array(str('d'))
+        divisor = array.array(str('d'))
+        unseen = array.array(str('d'))
+        for row in range(len(indptr) - 1):
+            start, end = indptr[row], indptr[row+1]
+            (a, d, u) = params(self._probdist_factory, sum(counts[start:end]),
+                               end - start, *self._factory_args,
+                               **self._factory_kw_args)
+            add.append(a)
+            divisor.append(d)
+            unseen.append(u)
+
+        if numpy is not None:
+            lengths = numpy.diff(numpy.array(indptr, dtype=numpy.int64))
+            c = numpy.array(counts, dtype=numpy.float64)
+            probs = numpy.where(
+                c != 0,
+                (c + numpy.repeat(numpy.array(add), lengths)) /
+                numpy.repeat(numpy.array(divisor), lengths),
+                numpy.repeat(numpy.array(unseen), lengths))
+            self._probs = array.array(str('d'), probs.tobytes())
+        else:
+            probs = self._probs = array.array(str('d'), [0.0]) * len(counts)
+            for row in range(len(indptr) - 1):
+                a, d, u = add[row], divisor[row], unseen[row]
+                for j in range(indptr[row], indptr[row+1]):
+                    probs[j] = (counts[j] + a) / d if counts[j] else u
+        self._unseen = unseen
+
+    def __getitem__(self, condition):
+        if self._probs is not None:
+            row = self._cfdist._condition_ids.get(condition)
+            if row is not None and row < len(self._unseen):
+                return _CompactProbDistView(self, row)
+        return dict.__getitem__(self, condition)
+
+    def __missing__(self, condition):
+        self[condition] = self._probdist_factory(self._cfdist[condition],
+                                                 *self._factory_args,
+                                                 **self._factory_kw_args)
+        return self[condition]
+
+    def __contains__(self, condition):
+        return condition in self._cfdist
+
+    def __iter__(self):
+        return iter(self._cfdist)
+
+    def __len__(self):
+        return len(self._cfdist)
+
+    def conditions(self):
+        return self._cfdist.conditions()
+
+    keys = conditions
+
+    def values(self):
+        return [self[condition] for condition in self.conditions()]
+
+    def items(self):
+        return [(condition, self[condition]) for condition in self.conditions()]
+
+    def __reduce__(self):
+        # Pickle the arrays of probabilities, rather than recomputing
+        # them (the distributions built by other factories are rebuilt
+        # when they are accessed).
+        return (_new_compact_cpdist, (self.__class__,), self.__dict__)
+
+
+def _new_compact_cpdist(cls):
+    return dict.__new__(cls)
+
+
+class _CompactProbDistView(ProbDistI):
+    """
+    The probability distribution of one condition of a
+    ``CompactConditionalProbDist``.
+    """
+    def __init__(self, cpdist, row):
+        self._cpdist = cpdist
+        self._row = row
+        self.SUM_TO_ONE = getattr(cpdist._probdist_factory, 'SUM_TO_ONE', True)
+
+    def prob(self, sample):
+        cpdist = self._cpdist
+        sample_id = cpdist._cfdist._sample_ids.get(sample)
+        if sample_id is not None:
+            lo, hi = cpdist._indptr[self._row], cpdist._indptr[self._row+1]
+            index = bisect_left(cpdist._indices, sample_id, lo, hi)
+            if index < hi and cpdist._indices[index] == sample_id:
+                return cpdist._probs[index]
+        return cpdist._unseen[self._row]
+
+    def max(self):
+        # The sample with the highest count has the highest probability
+        # (ties are broken in the same way as by the FreqDist of the
+        # condition, by the order in which the samples were first
+        # counted under any condition).
+        cpdist = self._cpdist
+        start, end = cpdist._indptr[self._row], cpdist._indptr[self._row+1]
+        if start == end:
+            raise ValueError('A FreqDist must have at least one sample before max is defined.')
+        index = max(range(start, end), key=cpdist._counts.__getitem__)
+        return cpdist._cfdist._samples[cpdist._indices[index]]
+
+    def samples(self):
+        cpdist = self._cpdist
+        start, end = cpdist._indptr[self._row], cpdist._indptr[self._row+1]
+        return [cpdist._cfdist._samples[i] for i in cpdist._indices[start:end]]
+
+    def freqdist(self):
+        """
+        Return the frequency distribution that this probability
+        distribution is based on.
+
+        :rtype: FreqDist
+        """
+        cfdist = self._cpdist._cfdist
+        return cfdist[cfdist._conditions[self._row]]
+
+    def __repr__(self):
+        cpdist = self._cpdist
+        start, end = cpdist._indptr[self._row], cpdist._indptr[self._row+1]
+        return '<%s based on %d samples>' % (
+            cpdist._probdist_factory.__name__,
+            sum(cpdist._counts[start:end]))
+
+
+# The parameters (add, divisor, unseen) of the standard estimators, for
+# a condition with N outcomes and B bins, which mirror their constructors.
+
+def _mle_params(factory, N, B, bins=None):
+    if N == 0:
+        return (0.0, 1.0, 0.0)
+    return (0.0, float(N), 0.0)
+
+def _lidstone_params(factory, N, B, gamma, bins=None):
+    if (bins == 0) or (bins is None and N == 0):
+        name = factory.__name__[:-8]
+        raise ValueError('A %s probability distribution ' % name +
+                         'must have at least one bin.')
+    if (bins is not None) and (bins < B):
+        name = factory.__name__[:-8]
+        raise ValueError('\nThe number of bins in a %s distribution ' % name +
+                         '(%d) must be greater than or equal to\n' % bins +
+                         'the number of bins in the FreqDist used ' +
+                         'to create it (%d).' % B)
+    gamma = float(gamma)
+    if bins is None:
+        bins = B
+    divisor = N + bins * gamma
+    if divisor == 0.0:
+        return (0.0, 1.0, 0.0)
+    return (gamma, divisor, gamma / divisor)
+
+def _laplace_params(factory, N, B, bins=None):
+    return _lidstone_params(factory, N, B, 1, bins)
+
+def _ele_params(factory, N, B, bins=None):
+    return _lidstone_params(factory, N, B, 0.5, bins)
+
+def _witten_bell_params(factory, N, B, bins=None):
+    assert bins is None or bins >= B,\
+           'bins parameter must not be less than %d=freqdist.B()' % B
+    if bins is None:
+        bins = B
+    Z = bins - B
+    if N == 0:
+        P0 = 1.0 / Z
+    else:
+        P0 = B / float(Z * (N + B))
+    return (0.0, float(N + B), P0)
+
+_COMPACT_ESTIMATORS = {
+    MLEProbDist: _mle_params,
+    LidstoneProbDist: _lidstone_params,
+    LaplaceProbDist: _laplace_params,
+    ELEProbDist: _ele_params,
+    WittenBellProbDist: _witten_bell_params,
+}
+
+
 ##//////////////////////////////////////////////////////
 ## Adding in log-space.
 ##//////////////////////////////////////////////////////
@@ -2210,7 +3039,8 @@ if __name__ == '__main__':
     demo(5, 5000)
     gt_demo()
 
-__all__ = ['ConditionalFreqDist', 'ConditionalProbDist',
+__all__ = ['CompactConditionalFreqDist', 'CompactConditionalProbDist',
+           'ConditionalFreqDist', 'ConditionalProbDist',
            'ConditionalProbDistI', 'CrossValidationProbDist',
            'DictionaryConditionalProbDist', 'DictionaryProbDist', 'ELEProbDist',
            'FreqDist', 'SimpleGoodTuringProbDist', 'HeldoutProbDist',
@@ -29,6 +29,7 @@ from nltk.stem.porter import PorterStemmer
 from nltk.stem.snowball import SnowballStemmer
 from nltk.stem.wordnet import WordNetLemmatizer
 from nltk.stem.rslp import RSLPStemmer
+from nltk.stem.cached import CachedStemmer
 
 
 if __name__ == "__main__":
@@ -22,6 +22,24 @@ class StemmerI(object):
         """
         raise NotImplementedError()
 
+    def stem_many(self, tokens):
+        """
+        Return the stems of the given tokens.  The stem of each distinct
+        token is only computed once.
+
+        :param tokens: The tokens that should be stemmed.
+        :type tokens: list(str)
+        :rtype: list(str)
+        """
+        stems = {}
+        result = []
+        for token in tokens:
+            stem = stems.get(token)
+            if stem is None:
+                stem = stems[token] = self.stem(token)
+            result.append(stem)
+        return result
+
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,145 @@
+# Natural Language Toolkit: Cached Stemmer
+#
+# Copyright (C) 2001-2014 NLTK Project
+# URL: <http://nltk.org/>
+# For license information, see LICENSE.TXT
+
+"""
+A stemmer that remembers the stems computed by another stemmer.
+
+The frequencies of the tokens in a text are very skewed, so most calls
+to a stemmer recompute the stem of a word that has been seen before.
+``CachedStemmer`` wraps any stemmer, and keeps the stems of the most
+recently used words in a bounded cache:
+
+    >>> from nltk.stem import PorterStemmer, CachedStemmer
+    >>> stemmer = CachedStemmer(PorterStemmer(), cache_size=1000)
+    >>> print(' '.join(stemmer.stem_many(['running', 'runs', 'running', 'ran'])))
+    run run run ran
+    >>> print(stemmer.stem('runs'))
+    run
+    >>> stemmer.cache_info()
+    (1, 3, 1000, 3)
+
+The stems of a known vocabulary can also be computed in advance, and
+stored in a table; this may be any mapping, such as a dictionary that
+is saved with ``pickle``, or a ``shelve`` for persistent storage:
+
+    >>> stemmer = CachedStemmer(PorterStemmer(), table={})
+    >>> stemmer.precompute(['generously', 'generalization'])
+    >>> for (word, stem) in sorted(stemmer.table.items()):
+    ...     print(word, stem)
+    generalization gener
+    generously gener
+"""
+from __future__ import print_function, unicode_literals
+
+import threading
+
+from nltk.stem.api import StemmerI
+from nltk.util import LRUCache
+
+class CachedStemmer(StemmerI):
+    """
+    A stemmer that calls another stemmer, and remembers the stems of
+    (at most ``cache_size``) recently stemmed tokens.  Stems are also
+    looked up in an optional precomputed ``table``.
+
+    ``CachedStemmer`` objects may be shared by several threads.
+    """
+    def __init__(self, stemmer, cache_size=2**16, table=None):
+        """
+        :param stemmer: The stemmer whose stems are cached.
+        :type stemmer: StemmerI
+        :param cache_size: The maximum number of stems in the cache; the
+            least recently used stem is discarded when it is full.  If
+            None, then the cache is unbounded.
+        :type cache_size: int
+        :param table: A mapping from tokens to their stems, which is
+            consulted before the cache.  It is never modified, except
+            by ``precompute()``.
+        :type table: dict
+        """
+        self._stemmer = stemmer
+        self._cache_size = cache_size
+        self._table = table
+        self._cache = LRUCache(cache_size)
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stemmer(self):
+        """The stemmer whose stems are cached."""
+        return self._stemmer
+
+    @property
+    def table(self):
+        """The precomputed table of stems, or None."""
+        return self._table
+
+    def stem(self, token):
+        with self._lock:
+            if self._table is not None:
+                stem = self._table.get(token)
+                if stem is not None:
+                    self._hits += 1
+                    return stem
+
+            stem = self._cache.get(token)
+            if stem is not None:
+                self._hits += 1
+                return stem
+
+            self._misses += 1
+            stem = self._stemmer.stem(token)
+            self._cache.put(token, stem)
+            return stem
+
+    def precompute(self, tokens):
+        """
+        Stem each of the given tokens, and add their stems to the
+        precomputed table (which is created if there is none).
+        """
+        with self._lock:
+            if self._table is None:
+                self._table = {}
+            for token in set(tokens):
+                if token not in self._table:
+                    self._table[token] = self._stemmer.stem(token)
+
+    def cache_info(self):
+        """
+        :return: A tuple ``(hits, misses, maxsize, currsize)``, of the
+            numbers of stems that were and were not found in the table
+            or cache, the maximum size of the cache, and the current
+            size of the cache.
+        :rtype: tuple
+        """
+        with self._lock:
+            return (self._hits, self._misses, self._cache_size,
+                    len(self._cache))
+
+    def hit_rate(self):
+        """
+        :return: The fraction of stems that were found in the table or
+            the cache, or None if no token has been stemmed.
+        :rtype: float
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            if total == 0:
+                return None
+            return float(self._hits) / total
+
+    def clear(self):
+        """
+        Remove all stems from the cache (but not from the table), and
+        reset the statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+
+    def __repr__(self):
+        return '<CachedStemmer: %r>' % (self._stemmer,)
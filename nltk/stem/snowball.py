@@ -26,6 +26,63 @@ from nltk.stem import porter
 
 from nltk.stem.api import StemmerI
 
+
+class _Suffixes(tuple):
+    """
+    A tuple of suffixes, precompiled to find the suffixes that a word
+    ends with by looking up each tail of the word (one for each length of
+    suffix) in a dictionary, rather than by testing each suffix in turn.
+    """
+    def __new__(cls, suffixes):
+        self = tuple.__new__(cls, suffixes)
+        by_length = {}
+        for (i, suffix) in enumerate(self):
+            by_length.setdefault(len(suffix), {}).setdefault(suffix, i)
+        self._tables = sorted(by_length.items(), reverse=True)
+        return self
+
+    def matches(self, word):
+        """
+        Return the suffixes that ``word`` ends with, in the order in which
+        they occur in this tuple.
+        """
+        if not word.endswith(self):
+            return []
+        n = len(word)
+        found = []
+        for (length, table) in self._tables:
+            if length <= n:
+                i = table.get(word[n-length:])
+                if i is not None:
+                    found.append(i)
+        if len(found) > 1:
+            found.sort()
+        return [self[i] for i in found]
+
+def _matching_suffixes(word, suffixes):
+    """
+    Return the suffixes in the tuple ``suffixes`` that ``word`` ends with,
+    in the order in which they occur in ``suffixes``.  The stemming steps
+    try the suffixes of each step in order, so they only need to try
+    these.  The suffix tuples of the stemmers are compiled into
+    ``_Suffixes`` when their classes are defined (see
+    ``_compile_suffixes()``); other tuples are compiled on each call.
+    """
+    if not isinstance(suffixes, _Suffixes):
+        suffixes = _Suffixes(suffixes)
+    return suffixes.matches(word)
+
+def _compile_suffixes(stemmer):
+    """
+    Replace the suffix tuples of the stemming steps of the class
+    ``stemmer`` (its attributes whose names end with ``_suffixes``) by
+    their ``_Suffixes``.
+    """
+    for (name, suffixes) in list(vars(stemmer).items()):
+        if name.endswith('_suffixes') and isinstance(suffixes, tuple):
+            setattr(stemmer, name, _Suffixes(suffixes))
+
+
 class SnowballStemmer(StemmerI):
 
     """
@@ -354,42 +411,39 @@ class DanishStemmer(_ScandinavianStemmer):
         # according to the descriptions on the Snowball website.
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "s":
-                    if word[-2] in self.__s_ending:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step1_suffixes):
+            if suffix == "s":
+                if word[-2] in self.__s_ending:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-1]
-                r1 = r1[:-1]
-                break
+        for suffix in _matching_suffixes(r1, self.__step2_suffixes):
+            word = word[:-1]
+            r1 = r1[:-1]
+            break
 
         # STEP 3
         if r1.endswith("igst"):
             word = word[:-2]
             r1 = r1[:-2]
 
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "l\xF8st":
+        for suffix in _matching_suffixes(r1, self.__step3_suffixes):
+            if suffix == "l\xF8st":
+                word = word[:-1]
+                r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+
+                if r1.endswith(self.__step2_suffixes):
                     word = word[:-1]
                     r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-
-                    if r1.endswith(self.__step2_suffixes):
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                break
+            break
 
         # STEP 4: Undouble
         for double_cons in self.__double_consonants:
@@ -474,33 +528,32 @@ class DutchStemmer(_StandardStemmer):
                 break
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "heden":
-                    word = "".join((word[:-5], "heid"))
-                    r1 = "".join((r1[:-5], "heid"))
-                    if r2.endswith("heden"):
-                        r2 = "".join((r2[:-5], "heid"))
-
-                elif (suffix in ("ene", "en") and
-                      not word.endswith("heden") and
-                      word[-len(suffix)-1] not in self.__vowels and
-                      word[-len(suffix)-3:-len(suffix)] != "gem"):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                    if word.endswith(("kk", "dd", "tt")):
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
+        for suffix in _matching_suffixes(r1, self.__step1_suffixes):
+            if suffix == "heden":
+                word = "".join((word[:-5], "heid"))
+                r1 = "".join((r1[:-5], "heid"))
+                if r2.endswith("heden"):
+                    r2 = "".join((r2[:-5], "heid"))
+
+            elif (suffix in ("ene", "en") and
+                  not word.endswith("heden") and
+                  word[-len(suffix)-1] not in self.__vowels and
+                  word[-len(suffix)-3:-len(suffix)] != "gem"):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                if word.endswith(("kk", "dd", "tt")):
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
 
-                elif (suffix in ("se", "s") and
-                      word[-len(suffix)-1] not in self.__vowels and
-                      word[-len(suffix)-1] != "j"):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
+            elif (suffix in ("se", "s") and
+                  word[-len(suffix)-1] not in self.__vowels and
+                  word[-len(suffix)-1] != "j"):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
 
         # STEP 2
         if r1.endswith("e") and word[-2] not in self.__vowels:
@@ -532,36 +585,35 @@ class DutchStemmer(_StandardStemmer):
                     r2 = r2[:-1]
 
         # STEP 3b: Derivational suffixes
-        for suffix in self.__step3b_suffixes:
-            if r2.endswith(suffix):
-                if suffix in ("end", "ing"):
-                    word = word[:-3]
-                    r2 = r2[:-3]
-
-                    if r2.endswith("ig") and word[-3] != "e":
-                        word = word[:-2]
-                    else:
-                        if word.endswith(("kk", "dd", "tt")):
-                            word = word[:-1]
+        for suffix in _matching_suffixes(r2, self.__step3b_suffixes):
+            if suffix in ("end", "ing"):
+                word = word[:-3]
+                r2 = r2[:-3]
 
-                elif suffix == "ig" and word[-3] != "e":
+                if r2.endswith("ig") and word[-3] != "e":
                     word = word[:-2]
+                else:
+                    if word.endswith(("kk", "dd", "tt")):
+                        word = word[:-1]
 
-                elif suffix == "lijk":
-                    word = word[:-4]
-                    r1 = r1[:-4]
+            elif suffix == "ig" and word[-3] != "e":
+                word = word[:-2]
 
-                    if r1.endswith("e") and word[-2] not in self.__vowels:
+            elif suffix == "lijk":
+                word = word[:-4]
+                r1 = r1[:-4]
+
+                if r1.endswith("e") and word[-2] not in self.__vowels:
+                    word = word[:-1]
+                    if word.endswith(("kk", "dd", "tt")):
                         word = word[:-1]
-                        if word.endswith(("kk", "dd", "tt")):
-                            word = word[:-1]
 
-                elif suffix == "baar":
-                    word = word[:-4]
+            elif suffix == "baar":
+                word = word[:-4]
 
-                elif suffix == "bar" and step2_success:
-                    word = word[:-3]
-                break
+            elif suffix == "bar" and step2_success:
+                word = word[:-3]
+            break
 
         # STEP 4: Undouble vowel
         if len(word) >= 4:
@@ -725,102 +777,99 @@ class EnglishStemmer(_StandardStemmer):
 
 
         # STEP 0
-        for suffix in self.__step0_suffixes:
-            if word.endswith(suffix):
-                word = word[:-len(suffix)]
-                r1 = r1[:-len(suffix)]
-                r2 = r2[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(word, self.__step0_suffixes):
+            word = word[:-len(suffix)]
+            r1 = r1[:-len(suffix)]
+            r2 = r2[:-len(suffix)]
+            break
 
         # STEP 1a
-        for suffix in self.__step1a_suffixes:
-            if word.endswith(suffix):
+        for suffix in _matching_suffixes(word, self.__step1a_suffixes):
+
+            if suffix == "sses":
+                word = word[:-2]
+                r1 = r1[:-2]
+                r2 = r2[:-2]
 
-                if suffix == "sses":
+            elif suffix in ("ied", "ies"):
+                if len(word[:-len(suffix)]) > 1:
                     word = word[:-2]
                     r1 = r1[:-2]
                     r2 = r2[:-2]
+                else:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
 
-                elif suffix in ("ied", "ies"):
-                    if len(word[:-len(suffix)]) > 1:
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+            elif suffix == "s":
+                for letter in word[:-2]:
+                    if letter in self.__vowels:
+                        step1a_vowel_found = True
+                        break
+
+                if step1a_vowel_found:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
+            break
+
+        # STEP 1b
+        for suffix in _matching_suffixes(word, self.__step1b_suffixes):
+            if suffix in ("eed", "eedly"):
+
+                if r1.endswith(suffix):
+                    word = "".join((word[:-len(suffix)], "ee"))
+
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ee"))
                     else:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
+                        r1 = ""
 
-                elif suffix == "s":
-                    for letter in word[:-2]:
-                        if letter in self.__vowels:
-                            step1a_vowel_found = True
-                            break
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ee"))
+                    else:
+                        r2 = ""
+            else:
+                for letter in word[:-len(suffix)]:
+                    if letter in self.__vowels:
+                        step1b_vowel_found = True
+                        break
 
-                    if step1a_vowel_found:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                break
+                if step1b_vowel_found:
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
 
-        # STEP 1b
-        for suffix in self.__step1b_suffixes:
-            if word.endswith(suffix):
-                if suffix in ("eed", "eedly"):
+                    if word.endswith(("at", "bl", "iz")):
+                        word = "".join((word, "e"))
+                        r1 = "".join((r1, "e"))
 
-                    if r1.endswith(suffix):
-                        word = "".join((word[:-len(suffix)], "ee"))
+                        if len(word) > 5 or len(r1) >=3:
+                            r2 = "".join((r2, "e"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ee"))
-                        else:
-                            r1 = ""
+                    elif word.endswith(self.__double_consonants):
+                        word = word[:-1]
+                        r1 = r1[:-1]
+                        r2 = r2[:-1]
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ee"))
-                        else:
-                            r2 = ""
-                else:
-                    for letter in word[:-len(suffix)]:
-                        if letter in self.__vowels:
-                            step1b_vowel_found = True
-                            break
+                    elif ((r1 == "" and len(word) >= 3 and
+                           word[-1] not in self.__vowels and
+                           word[-1] not in "wxY" and
+                           word[-2] in self.__vowels and
+                           word[-3] not in self.__vowels)
+                          or
+                          (r1 == "" and len(word) == 2 and
+                           word[0] in self.__vowels and
+                           word[1] not in self.__vowels)):
 
-                    if step1b_vowel_found:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
+                        word = "".join((word, "e"))
 
-                        if word.endswith(("at", "bl", "iz")):
-                            word = "".join((word, "e"))
+                        if len(r1) > 0:
                             r1 = "".join((r1, "e"))
 
-                            if len(word) > 5 or len(r1) >=3:
-                                r2 = "".join((r2, "e"))
-
-                        elif word.endswith(self.__double_consonants):
-                            word = word[:-1]
-                            r1 = r1[:-1]
-                            r2 = r2[:-1]
-
-                        elif ((r1 == "" and len(word) >= 3 and
-                               word[-1] not in self.__vowels and
-                               word[-1] not in "wxY" and
-                               word[-2] in self.__vowels and
-                               word[-3] not in self.__vowels)
-                              or
-                              (r1 == "" and len(word) == 2 and
-                               word[0] in self.__vowels and
-                               word[1] not in self.__vowels)):
-
-                            word = "".join((word, "e"))
-
-                            if len(r1) > 0:
-                                r1 = "".join((r1, "e"))
-
-                            if len(r2) > 0:
-                                r2 = "".join((r2, "e"))
-                break
+                        if len(r2) > 0:
+                            r2 = "".join((r2, "e"))
+            break
 
         # STEP 1c
         if len(word) > 2 and word[-1] in "yY" and word[-2] not in self.__vowels:
@@ -836,196 +885,193 @@ class EnglishStemmer(_StandardStemmer):
                 r2 = ""
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix == "tional":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+        for suffix in _matching_suffixes(word, self.__step2_suffixes):
+            if r1.endswith(suffix):
+                if suffix == "tional":
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix in ("enci", "anci", "abli"):
-                        word = "".join((word[:-1], "e"))
+                elif suffix in ("enci", "anci", "abli"):
+                    word = "".join((word[:-1], "e"))
 
-                        if len(r1) >= 1:
-                            r1 = "".join((r1[:-1], "e"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= 1:
+                        r1 = "".join((r1[:-1], "e"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= 1:
-                            r2 = "".join((r2[:-1], "e"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= 1:
+                        r2 = "".join((r2[:-1], "e"))
+                    else:
+                        r2 = ""
 
-                    elif suffix == "entli":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+                elif suffix == "entli":
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix in ("izer", "ization"):
-                        word = "".join((word[:-len(suffix)], "ize"))
+                elif suffix in ("izer", "ization"):
+                    word = "".join((word[:-len(suffix)], "ize"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ize"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ize"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ize"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ize"))
+                    else:
+                        r2 = ""
 
-                    elif suffix in ("ational", "ation", "ator"):
-                        word = "".join((word[:-len(suffix)], "ate"))
+                elif suffix in ("ational", "ation", "ator"):
+                    word = "".join((word[:-len(suffix)], "ate"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ate"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ate"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ate"))
-                        else:
-                            r2 = "e"
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ate"))
+                    else:
+                        r2 = "e"
 
-                    elif suffix in ("alism", "aliti", "alli"):
-                        word = "".join((word[:-len(suffix)], "al"))
+                elif suffix in ("alism", "aliti", "alli"):
+                    word = "".join((word[:-len(suffix)], "al"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "al"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "al"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "al"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "al"))
+                    else:
+                        r2 = ""
 
-                    elif suffix == "fulness":
-                        word = word[:-4]
-                        r1 = r1[:-4]
-                        r2 = r2[:-4]
+                elif suffix == "fulness":
+                    word = word[:-4]
+                    r1 = r1[:-4]
+                    r2 = r2[:-4]
 
-                    elif suffix in ("ousli", "ousness"):
-                        word = "".join((word[:-len(suffix)], "ous"))
+                elif suffix in ("ousli", "ousness"):
+                    word = "".join((word[:-len(suffix)], "ous"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ous"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ous"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ous"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ous"))
+                    else:
+                        r2 = ""
 
-                    elif suffix in ("iveness", "iviti"):
-                        word = "".join((word[:-len(suffix)], "ive"))
+                elif suffix in ("iveness", "iviti"):
+                    word = "".join((word[:-len(suffix)], "ive"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ive"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ive"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ive"))
-                        else:
-                            r2 = "e"
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ive"))
+                    else:
+                        r2 = "e"
 
-                    elif suffix in ("biliti", "bli"):
-                        word = "".join((word[:-len(suffix)], "ble"))
+                elif suffix in ("biliti", "bli"):
+                    word = "".join((word[:-len(suffix)], "ble"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ble"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ble"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ble"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ble"))
+                    else:
+                        r2 = ""
 
-                    elif suffix == "ogi" and word[-4] == "l":
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
+                elif suffix == "ogi" and word[-4] == "l":
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
 
-                    elif suffix in ("fulli", "lessli"):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+                elif suffix in ("fulli", "lessli"):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix == "li" and word[-3] in self.__li_ending:
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
-                break
+                elif suffix == "li" and word[-3] in self.__li_ending:
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+            break
 
         # STEP 3
-        for suffix in self.__step3_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix == "tional":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+        for suffix in _matching_suffixes(word, self.__step3_suffixes):
+            if r1.endswith(suffix):
+                if suffix == "tional":
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                    elif suffix == "ational":
-                        word = "".join((word[:-len(suffix)], "ate"))
+                elif suffix == "ational":
+                    word = "".join((word[:-len(suffix)], "ate"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ate"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ate"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ate"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ate"))
+                    else:
+                        r2 = ""
 
-                    elif suffix == "alize":
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
+                elif suffix == "alize":
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
 
-                    elif suffix in ("icate", "iciti", "ical"):
-                        word = "".join((word[:-len(suffix)], "ic"))
+                elif suffix in ("icate", "iciti", "ical"):
+                    word = "".join((word[:-len(suffix)], "ic"))
 
-                        if len(r1) >= len(suffix):
-                            r1 = "".join((r1[:-len(suffix)], "ic"))
-                        else:
-                            r1 = ""
+                    if len(r1) >= len(suffix):
+                        r1 = "".join((r1[:-len(suffix)], "ic"))
+                    else:
+                        r1 = ""
 
-                        if len(r2) >= len(suffix):
-                            r2 = "".join((r2[:-len(suffix)], "ic"))
-                        else:
-                            r2 = ""
+                    if len(r2) >= len(suffix):
+                        r2 = "".join((r2[:-len(suffix)], "ic"))
+                    else:
+                        r2 = ""
 
-                    elif suffix in ("ful", "ness"):
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
+                elif suffix in ("ful", "ness"):
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
 
-                    elif suffix == "ative" and r2.endswith(suffix):
-                        word = word[:-5]
-                        r1 = r1[:-5]
-                        r2 = r2[:-5]
-                break
+                elif suffix == "ative" and r2.endswith(suffix):
+                    word = word[:-5]
+                    r1 = r1[:-5]
+                    r2 = r2[:-5]
+            break
 
         # STEP 4
-        for suffix in self.__step4_suffixes:
-            if word.endswith(suffix):
-                if r2.endswith(suffix):
-                    if suffix == "ion":
-                        if word[-4] in "st":
-                            word = word[:-3]
-                            r1 = r1[:-3]
-                            r2 = r2[:-3]
-                    else:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(word, self.__step4_suffixes):
+            if r2.endswith(suffix):
+                if suffix == "ion":
+                    if word[-4] in "st":
+                        word = word[:-3]
+                        r1 = r1[:-3]
+                        r2 = r2[:-3]
+                else:
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+            break
 
         # STEP 5
         if r2.endswith("l") and word[-2] == "l":
@@ -1118,148 +1164,144 @@ class FinnishStemmer(_StandardStemmer):
         r1, r2 = self._r1r2_standard(word, self.__vowels)
 
         # STEP 1: Particles etc.
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "sti":
-                    if suffix in r2:
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                else:
-                    if word[-len(suffix)-1] in "ntaeiouy\xE4\xF6":
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step1_suffixes):
+            if suffix == "sti":
+                if suffix in r2:
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
+            else:
+                if word[-len(suffix)-1] in "ntaeiouy\xE4\xF6":
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+            break
 
         # STEP 2: Possessives
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "si":
-                    if word[-3] != "k":
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
-
-                elif suffix == "ni":
+        for suffix in _matching_suffixes(r1, self.__step2_suffixes):
+            if suffix == "si":
+                if word[-3] != "k":
                     word = word[:-2]
                     r1 = r1[:-2]
                     r2 = r2[:-2]
-                    if word.endswith("kse"):
-                        word = "".join((word[:-3], "ksi"))
 
-                    if r1.endswith("kse"):
-                        r1 = "".join((r1[:-3], "ksi"))
+            elif suffix == "ni":
+                word = word[:-2]
+                r1 = r1[:-2]
+                r2 = r2[:-2]
+                if word.endswith("kse"):
+                    word = "".join((word[:-3], "ksi"))
 
-                    if r2.endswith("kse"):
-                        r2 = "".join((r2[:-3], "ksi"))
+                if r1.endswith("kse"):
+                    r1 = "".join((r1[:-3], "ksi"))
 
-                elif suffix == "an":
-                    if (word[-4:-2] in ("ta", "na") or
-                        word[-5:-2] in ("ssa", "sta", "lla", "lta")):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+                if r2.endswith("kse"):
+                    r2 = "".join((r2[:-3], "ksi"))
 
-                elif suffix == "\xE4n":
-                    if (word[-4:-2] in ("t\xE4", "n\xE4") or
-                        word[-5:-2] in ("ss\xE4", "st\xE4",
-                                        "ll\xE4", "lt\xE4")):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+            elif suffix == "an":
+                if (word[-4:-2] in ("ta", "na") or
+                    word[-5:-2] in ("ssa", "sta", "lla", "lta")):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
 
-                elif suffix == "en":
-                    if word[-5:-2] in ("lle", "ine"):
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
-                else:
+            elif suffix == "\xE4n":
+                if (word[-4:-2] in ("t\xE4", "n\xE4") or
+                    word[-5:-2] in ("ss\xE4", "st\xE4",
+                                    "ll\xE4", "lt\xE4")):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+
+            elif suffix == "en":
+                if word[-5:-2] in ("lle", "ine"):
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+            else:
+                word = word[:-3]
+                r1 = r1[:-3]
+                r2 = r2[:-3]
+            break
+
+        # STEP 3: Cases
+        for suffix in _matching_suffixes(r1, self.__step3_suffixes):
+            if suffix in ("han", "hen", "hin", "hon", "h\xE4n",
+                          "h\xF6n"):
+                if ((suffix == "han" and word[-4] == "a") or
+                    (suffix == "hen" and word[-4] == "e") or
+                    (suffix == "hin" and word[-4] == "i") or
+                    (suffix == "hon" and word[-4] == "o") or
+                    (suffix == "h\xE4n" and word[-4] == "\xE4") or
+                    (suffix == "h\xF6n" and word[-4] == "\xF6")):
                     word = word[:-3]
                     r1 = r1[:-3]
                     r2 = r2[:-3]
-                break
-
-        # STEP 3: Cases
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix in ("han", "hen", "hin", "hon", "h\xE4n",
-                              "h\xF6n"):
-                    if ((suffix == "han" and word[-4] == "a") or
-                        (suffix == "hen" and word[-4] == "e") or
-                        (suffix == "hin" and word[-4] == "i") or
-                        (suffix == "hon" and word[-4] == "o") or
-                        (suffix == "h\xE4n" and word[-4] == "\xE4") or
-                        (suffix == "h\xF6n" and word[-4] == "\xF6")):
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                        step3_success = True
-
-                elif suffix in ("siin", "den", "tten"):
-                    if (word[-len(suffix)-1] == "i" and
-                        word[-len(suffix)-2] in self.__restricted_vowels):
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        step3_success = True
-                    else:
-                        continue
-
-                elif suffix == "seen":
-                    if word[-6:-4] in self.__long_vowels:
-                        word = word[:-4]
-                        r1 = r1[:-4]
-                        r2 = r2[:-4]
-                        step3_success = True
-                    else:
-                        continue
+                    step3_success = True
 
-                elif suffix in ("a", "\xE4"):
-                    if word[-2] in self.__vowels and word[-3] in self.__consonants:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                        step3_success = True
+            elif suffix in ("siin", "den", "tten"):
+                if (word[-len(suffix)-1] == "i" and
+                    word[-len(suffix)-2] in self.__restricted_vowels):
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    step3_success = True
+                else:
+                    continue
 
-                elif suffix in ("tta", "tt\xE4"):
-                    if word[-4] == "e":
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                        step3_success = True
+            elif suffix == "seen":
+                if word[-6:-4] in self.__long_vowels:
+                    word = word[:-4]
+                    r1 = r1[:-4]
+                    r2 = r2[:-4]
+                    step3_success = True
+                else:
+                    continue
 
-                elif suffix == "n":
+            elif suffix in ("a", "\xE4"):
+                if word[-2] in self.__vowels and word[-3] in self.__consonants:
                     word = word[:-1]
                     r1 = r1[:-1]
                     r2 = r2[:-1]
                     step3_success = True
 
-                    if word[-2:] == "ie" or word[-2:] in self.__long_vowels:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
+            elif suffix in ("tta", "tt\xE4"):
+                if word[-4] == "e":
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
                     step3_success = True
-                break
+
+            elif suffix == "n":
+                word = word[:-1]
+                r1 = r1[:-1]
+                r2 = r2[:-1]
+                step3_success = True
+
+                if word[-2:] == "ie" or word[-2:] in self.__long_vowels:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                step3_success = True
+            break
 
         # STEP 4: Other endings
-        for suffix in self.__step4_suffixes:
-            if r2.endswith(suffix):
-                if suffix in ("mpi", "mpa", "mp\xE4", "mmi", "mma",
-                              "mm\xE4"):
-                    if word[-5:-3] != "po":
-                        word = word[:-3]
-                        r1 = r1[:-3]
-                        r2 = r2[:-3]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r2, self.__step4_suffixes):
+            if suffix in ("mpi", "mpa", "mp\xE4", "mmi", "mma",
+                          "mm\xE4"):
+                if word[-5:-3] != "po":
+                    word = word[:-3]
+                    r1 = r1[:-3]
+                    r2 = r2[:-3]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
 
         # STEP 5: Plurals
         if step3_success and len(r1) >= 1 and r1[-1] in "ij":
@@ -1409,174 +1451,171 @@ class FrenchStemmer(_StandardStemmer):
         rv = self.__rv_french(word, self.__vowels)
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "eaux":
-                    word = word[:-1]
+        for suffix in _matching_suffixes(word, self.__step1_suffixes):
+            if suffix == "eaux":
+                word = word[:-1]
+                step1_success = True
+
+            elif suffix in ("euse", "euses"):
+                if suffix in r2:
+                    word = word[:-len(suffix)]
                     step1_success = True
 
-                elif suffix in ("euse", "euses"):
-                    if suffix in r2:
-                        word = word[:-len(suffix)]
-                        step1_success = True
+                elif suffix in r1:
+                    word = "".join((word[:-len(suffix)], "eux"))
+                    step1_success = True
 
-                    elif suffix in r1:
-                        word = "".join((word[:-len(suffix)], "eux"))
-                        step1_success = True
+            elif suffix in ("ement", "ements") and suffix in rv:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("ement", "ements") and suffix in rv:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+                if word[-2:] == "iv" and "iv" in r2:
+                    word = word[:-2]
 
-                    if word[-2:] == "iv" and "iv" in r2:
+                    if word[-2:] == "at" and "at" in r2:
                         word = word[:-2]
 
-                        if word[-2:] == "at" and "at" in r2:
-                            word = word[:-2]
+                elif word[-3:] == "eus":
+                    if "eus" in r2:
+                        word = word[:-3]
+                    elif "eus" in r1:
+                        word = "".join((word[:-1], "x"))
 
-                    elif word[-3:] == "eus":
-                        if "eus" in r2:
-                            word = word[:-3]
-                        elif "eus" in r1:
-                            word = "".join((word[:-1], "x"))
+                elif word[-3:] in ("abl", "iqU"):
+                    if "abl" in r2 or "iqU" in r2:
+                        word = word[:-3]
 
-                    elif word[-3:] in ("abl", "iqU"):
-                        if "abl" in r2 or "iqU" in r2:
-                            word = word[:-3]
+                elif word[-3:] in ("i\xE8r", "I\xE8r"):
+                    if "i\xE8r" in rv or "I\xE8r" in rv:
+                        word = "".join((word[:-3], "i"))
 
-                    elif word[-3:] in ("i\xE8r", "I\xE8r"):
-                        if "i\xE8r" in rv or "I\xE8r" in rv:
-                            word = "".join((word[:-3], "i"))
+            elif suffix == "amment" and suffix in rv:
+                word = "".join((word[:-6], "ant"))
+                rv = "".join((rv[:-6], "ant"))
+                rv_ending_found = True
 
-                elif suffix == "amment" and suffix in rv:
-                    word = "".join((word[:-6], "ant"))
-                    rv = "".join((rv[:-6], "ant"))
-                    rv_ending_found = True
+            elif suffix == "emment" and suffix in rv:
+                word = "".join((word[:-6], "ent"))
+                rv_ending_found = True
 
-                elif suffix == "emment" and suffix in rv:
-                    word = "".join((word[:-6], "ent"))
-                    rv_ending_found = True
+            elif (suffix in ("ment", "ments") and suffix in rv and
+                  not rv.startswith(suffix) and
+                  rv[rv.rindex(suffix)-1] in self.__vowels):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                rv_ending_found = True
 
-                elif (suffix in ("ment", "ments") and suffix in rv and
-                      not rv.startswith(suffix) and
-                      rv[rv.rindex(suffix)-1] in self.__vowels):
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    rv_ending_found = True
+            elif suffix == "aux" and suffix in r1:
+                word = "".join((word[:-2], "l"))
+                step1_success = True
 
-                elif suffix == "aux" and suffix in r1:
-                    word = "".join((word[:-2], "l"))
-                    step1_success = True
+            elif (suffix in ("issement", "issements") and suffix in r1
+                  and word[-len(suffix)-1] not in self.__vowels):
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif (suffix in ("issement", "issements") and suffix in r1
-                      and word[-len(suffix)-1] not in self.__vowels):
-                    word = word[:-len(suffix)]
-                    step1_success = True
+            elif suffix in ("ance", "iqUe", "isme", "able", "iste",
+                          "eux", "ances", "iqUes", "ismes",
+                          "ables", "istes") and suffix in r2:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("ance", "iqUe", "isme", "able", "iste",
-                              "eux", "ances", "iqUes", "ismes",
-                              "ables", "istes") and suffix in r2:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+            elif suffix in ("atrice", "ateur", "ation", "atrices",
+                            "ateurs", "ations") and suffix in r2:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("atrice", "ateur", "ation", "atrices",
-                                "ateurs", "ations") and suffix in r2:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+                if word[-2:] == "ic":
+                    if "ic" in r2:
+                        word = word[:-2]
+                    else:
+                        word = "".join((word[:-2], "iqU"))
 
-                    if word[-2:] == "ic":
-                        if "ic" in r2:
-                            word = word[:-2]
-                        else:
-                            word = "".join((word[:-2], "iqU"))
+            elif suffix in ("logie", "logies") and suffix in r2:
+                word = "".join((word[:-len(suffix)], "log"))
+                step1_success = True
 
-                elif suffix in ("logie", "logies") and suffix in r2:
-                    word = "".join((word[:-len(suffix)], "log"))
-                    step1_success = True
+            elif (suffix in ("usion", "ution", "usions", "utions") and
+                  suffix in r2):
+                word = "".join((word[:-len(suffix)], "u"))
+                step1_success = True
 
-                elif (suffix in ("usion", "ution", "usions", "utions") and
-                      suffix in r2):
-                    word = "".join((word[:-len(suffix)], "u"))
-                    step1_success = True
+            elif suffix in ("ence", "ences") and suffix in r2:
+                word = "".join((word[:-len(suffix)], "ent"))
+                step1_success = True
 
-                elif suffix in ("ence", "ences") and suffix in r2:
-                    word = "".join((word[:-len(suffix)], "ent"))
-                    step1_success = True
+            elif suffix in ("it\xE9", "it\xE9s") and suffix in r2:
+                word = word[:-len(suffix)]
+                step1_success = True
 
-                elif suffix in ("it\xE9", "it\xE9s") and suffix in r2:
-                    word = word[:-len(suffix)]
-                    step1_success = True
+                if word[-4:] == "abil":
+                    if "abil" in r2:
+                        word = word[:-4]
+                    else:
+                        word = "".join((word[:-2], "l"))
 
-                    if word[-4:] == "abil":
-                        if "abil" in r2:
-                            word = word[:-4]
-                        else:
-                            word = "".join((word[:-2], "l"))
+                elif word[-2:] == "ic":
+                    if "ic" in r2:
+                        word = word[:-2]
+                    else:
+                        word = "".join((word[:-2], "iqU"))
+
+                elif word[-2:] == "iv":
+                    if "iv" in r2:
+                        word = word[:-2]
+
+            elif (suffix in ("if", "ive", "ifs", "ives") and
+                  suffix in r2):
+                word = word[:-len(suffix)]
+                step1_success = True
+
+                if word[-2:] == "at" and "at" in r2:
+                    word = word[:-2]
 
-                    elif word[-2:] == "ic":
+                    if word[-2:] == "ic":
                         if "ic" in r2:
                             word = word[:-2]
                         else:
                             word = "".join((word[:-2], "iqU"))
-
-                    elif word[-2:] == "iv":
-                        if "iv" in r2:
-                            word = word[:-2]
-
-                elif (suffix in ("if", "ive", "ifs", "ives") and
-                      suffix in r2):
-                    word = word[:-len(suffix)]
-                    step1_success = True
-
-                    if word[-2:] == "at" and "at" in r2:
-                        word = word[:-2]
-
-                        if word[-2:] == "ic":
-                            if "ic" in r2:
-                                word = word[:-2]
-                            else:
-                                word = "".join((word[:-2], "iqU"))
-                break
+            break
 
         # STEP 2a: Verb suffixes beginning 'i'
         if not step1_success or rv_ending_found:
-            for suffix in self.__step2a_suffixes:
-                if word.endswith(suffix):
-                    if (suffix in rv and len(rv) > len(suffix) and
-                        rv[rv.rindex(suffix)-1] not in self.__vowels):
-                        word = word[:-len(suffix)]
-                        step2a_success = True
-                    break
+            for suffix in _matching_suffixes(word, self.__step2a_suffixes):
+                if (suffix in rv and len(rv) > len(suffix) and
+                    rv[rv.rindex(suffix)-1] not in self.__vowels):
+                    word = word[:-len(suffix)]
+                    step2a_success = True
+                break
 
         # STEP 2b: Other verb suffixes
             if not step2a_success:
-                for suffix in self.__step2b_suffixes:
-                    if rv.endswith(suffix):
-                        if suffix == "ions" and "ions" in r2:
-                            word = word[:-4]
-                            step2b_success = True
-
-                        elif suffix in ('eraIent', 'erions', '\xE8rent',
-                                        'erais', 'erait', 'eriez',
-                                        'erons', 'eront', 'erai', 'eras',
-                                        'erez', '\xE9es', 'era', 'iez',
-                                        '\xE9e', '\xE9s', 'er', 'ez',
-                                        '\xE9'):
-                            word = word[:-len(suffix)]
-                            step2b_success = True
-
-                        elif suffix in ('assions', 'assent', 'assiez',
-                                        'aIent', 'antes', 'asses',
-                                        '\xE2mes', '\xE2tes', 'ante',
-                                        'ants', 'asse', 'ais', 'ait',
-                                        'ant', '\xE2t', 'ai', 'as',
-                                        'a'):
-                            word = word[:-len(suffix)]
-                            rv = rv[:-len(suffix)]
-                            step2b_success = True
-                            if rv.endswith("e"):
-                                word = word[:-1]
-                        break
+                for suffix in _matching_suffixes(rv, self.__step2b_suffixes):
+                    if suffix == "ions" and "ions" in r2:
+                        word = word[:-4]
+                        step2b_success = True
+
+                    elif suffix in ('eraIent', 'erions', '\xE8rent',
+                                    'erais', 'erait', 'eriez',
+                                    'erons', 'eront', 'erai', 'eras',
+                                    'erez', '\xE9es', 'era', 'iez',
+                                    '\xE9e', '\xE9s', 'er', 'ez',
+                                    '\xE9'):
+                        word = word[:-len(suffix)]
+                        step2b_success = True
+
+                    elif suffix in ('assions', 'assent', 'assiez',
+                                    'aIent', 'antes', 'asses',
+                                    '\xE2mes', '\xE2tes', 'ante',
+                                    'ants', 'asse', 'ais', 'ait',
+                                    'ant', '\xE2t', 'ai', 'as',
+                                    'a'):
+                        word = word[:-len(suffix)]
+                        rv = rv[:-len(suffix)]
+                        step2b_success = True
+                        if rv.endswith("e"):
+                            word = word[:-1]
+                    break
 
         # STEP 3
         if step1_success or step2a_success or step2b_success:
@@ -1591,23 +1630,22 @@ class FrenchStemmer(_StandardStemmer):
                 word[-2] not in "aiou\xE8s"):
                 word = word[:-1]
 
-            for suffix in self.__step4_suffixes:
-                if word.endswith(suffix):
-                    if suffix in rv:
-                        if (suffix == "ion" and suffix in r2 and
-                            rv[-4] in "st"):
-                            word = word[:-3]
+            for suffix in _matching_suffixes(word, self.__step4_suffixes):
+                if suffix in rv:
+                    if (suffix == "ion" and suffix in r2 and
+                        rv[-4] in "st"):
+                        word = word[:-3]
 
-                        elif suffix in ("ier", "i\xE8re", "Ier",
-                                        "I\xE8re"):
-                            word = "".join((word[:-len(suffix)], "i"))
+                    elif suffix in ("ier", "i\xE8re", "Ier",
+                                    "I\xE8re"):
+                        word = "".join((word[:-len(suffix)], "i"))
 
-                        elif suffix == "e":
-                            word = word[:-1]
+                    elif suffix == "e":
+                        word = word[:-1]
 
-                        elif suffix == "\xEB" and word[-3:-1] == "gu":
-                            word = word[:-1]
-                        break
+                    elif suffix == "\xEB" and word[-3:-1] == "gu":
+                        word = word[:-1]
+                    break
 
         # STEP 5: Undouble
         if word.endswith(("enn", "onn", "ett", "ell", "eill")):
@@ -1740,69 +1778,66 @@ class GermanStemmer(_StandardStemmer):
                 break
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if (suffix in ("en", "es", "e") and
-                    word[-len(suffix)-4:-len(suffix)] == "niss"):
-                    word = word[:-len(suffix)-1]
-                    r1 = r1[:-len(suffix)-1]
-                    r2 = r2[:-len(suffix)-1]
-
-                elif suffix == "s":
-                    if word[-2] in self.__s_ending:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                        r2 = r2[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step1_suffixes):
+            if (suffix in ("en", "es", "e") and
+                word[-len(suffix)-4:-len(suffix)] == "niss"):
+                word = word[:-len(suffix)-1]
+                r1 = r1[:-len(suffix)-1]
+                r2 = r2[:-len(suffix)-1]
+
+            elif suffix == "s":
+                if word[-2] in self.__s_ending:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+                    r2 = r2[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "st":
-                    if word[-3] in self.__st_ending and len(word[:-3]) >= 3:
-                        word = word[:-2]
-                        r1 = r1[:-2]
-                        r2 = r2[:-2]
+        for suffix in _matching_suffixes(r1, self.__step2_suffixes):
+            if suffix == "st":
+                if word[-3] in self.__st_ending and len(word[:-3]) >= 3:
+                    word = word[:-2]
+                    r1 = r1[:-2]
+                    r2 = r2[:-2]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+            break
+
+        # STEP 3: Derivational suffixes
+        for suffix in _matching_suffixes(r2, self.__step3_suffixes):
+            if suffix in ("end", "ung"):
+                if ("ig" in r2[-len(suffix)-2:-len(suffix)] and
+                    "e" not in r2[-len(suffix)-3:-len(suffix)-2]):
+                    word = word[:-len(suffix)-2]
                 else:
                     word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                break
 
-        # STEP 3: Derivational suffixes
-        for suffix in self.__step3_suffixes:
-            if r2.endswith(suffix):
-                if suffix in ("end", "ung"):
-                    if ("ig" in r2[-len(suffix)-2:-len(suffix)] and
-                        "e" not in r2[-len(suffix)-3:-len(suffix)-2]):
-                        word = word[:-len(suffix)-2]
-                    else:
-                        word = word[:-len(suffix)]
+            elif (suffix in ("ig", "ik", "isch") and
+                  "e" not in r2[-len(suffix)-1:-len(suffix)]):
+                word = word[:-len(suffix)]
 
-                elif (suffix in ("ig", "ik", "isch") and
-                      "e" not in r2[-len(suffix)-1:-len(suffix)]):
+            elif suffix in ("lich", "heit"):
+                if ("er" in r1[-len(suffix)-2:-len(suffix)] or
+                    "en" in r1[-len(suffix)-2:-len(suffix)]):
+                    word = word[:-len(suffix)-2]
+                else:
                     word = word[:-len(suffix)]
 
-                elif suffix in ("lich", "heit"):
-                    if ("er" in r1[-len(suffix)-2:-len(suffix)] or
-                        "en" in r1[-len(suffix)-2:-len(suffix)]):
-                        word = word[:-len(suffix)-2]
-                    else:
-                        word = word[:-len(suffix)]
-
-                elif suffix == "keit":
-                    if "lich" in r2[-len(suffix)-4:-len(suffix)]:
-                        word = word[:-len(suffix)-4]
+            elif suffix == "keit":
+                if "lich" in r2[-len(suffix)-4:-len(suffix)]:
+                    word = word[:-len(suffix)-4]
 
-                    elif "ig" in r2[-len(suffix)-2:-len(suffix)]:
-                        word = word[:-len(suffix)-2]
-                    else:
-                        word = word[:-len(suffix)]
-                break
+                elif "ig" in r2[-len(suffix)-2:-len(suffix)]:
+                    word = word[:-len(suffix)-2]
+                else:
+                    word = word[:-len(suffix)]
+            break
 
         # Umlaut accents are removed and
         # 'u' and 'y' are put back into lower case.
@@ -1923,46 +1958,43 @@ class HungarianStemmer(_LanguageSpecificStemmer):
                     break
 
         # STEP 2: Remove frequent cases
-        for suffix in self.__step2_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
+        for suffix in _matching_suffixes(word, self.__step2_suffixes):
+            if r1.endswith(suffix):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
 
-                    if r1.endswith("\xE1"):
-                        word = "".join((word[:-1], "a"))
-                        r1 = "".join((r1[:-1], "a"))
+                if r1.endswith("\xE1"):
+                    word = "".join((word[:-1], "a"))
+                    r1 = "".join((r1[:-1], "a"))
 
-                    elif r1.endswith("\xE9"):
-                        word = "".join((word[:-1], "e"))
-                        r1 = "".join((r1[:-1], "e"))
-                break
+                elif r1.endswith("\xE9"):
+                    word = "".join((word[:-1], "e"))
+                    r1 = "".join((r1[:-1], "e"))
+            break
 
         # STEP 3: Remove special cases
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "\xE9n":
-                    word = "".join((word[:-2], "e"))
-                    r1 = "".join((r1[:-2], "e"))
-                else:
-                    word = "".join((word[:-len(suffix)], "a"))
-                    r1 = "".join((r1[:-len(suffix)], "a"))
-                break
+        for suffix in _matching_suffixes(r1, self.__step3_suffixes):
+            if suffix == "\xE9n":
+                word = "".join((word[:-2], "e"))
+                r1 = "".join((r1[:-2], "e"))
+            else:
+                word = "".join((word[:-len(suffix)], "a"))
+                r1 = "".join((r1[:-len(suffix)], "a"))
+            break
 
         # STEP 4: Remove other cases
-        for suffix in self.__step4_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "\xE1stul":
-                    word = "".join((word[:-5], "a"))
-                    r1 = "".join((r1[:-5], "a"))
-
-                elif suffix == "\xE9st\xFCl":
-                    word = "".join((word[:-5], "e"))
-                    r1 = "".join((r1[:-5], "e"))
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step4_suffixes):
+            if suffix == "\xE1stul":
+                word = "".join((word[:-5], "a"))
+                r1 = "".join((r1[:-5], "a"))
+
+            elif suffix == "\xE9st\xFCl":
+                word = "".join((word[:-5], "e"))
+                r1 = "".join((r1[:-5], "e"))
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 5: Remove factive case
         for suffix in self.__step5_suffixes:
@@ -1976,68 +2008,64 @@ class HungarianStemmer(_LanguageSpecificStemmer):
                         break
 
         # STEP 6: Remove owned
-        for suffix in self.__step6_suffixes:
+        for suffix in _matching_suffixes(r1, self.__step6_suffixes):
+            if suffix in ("\xE1k\xE9", "\xE1\xE9i"):
+                word = "".join((word[:-3], "a"))
+                r1 = "".join((r1[:-3], "a"))
+
+            elif suffix in ("\xE9k\xE9", "\xE9\xE9i",
+                            "\xE9\xE9"):
+                word = "".join((word[:-len(suffix)], "e"))
+                r1 = "".join((r1[:-len(suffix)], "e"))
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
+
+        # STEP 7: Remove singular owner suffixes
+        for suffix in _matching_suffixes(word, self.__step7_suffixes):
             if r1.endswith(suffix):
-                if suffix in ("\xE1k\xE9", "\xE1\xE9i"):
-                    word = "".join((word[:-3], "a"))
-                    r1 = "".join((r1[:-3], "a"))
+                if suffix in ("\xE1nk", "\xE1juk", "\xE1m",
+                              "\xE1d", "\xE1"):
+                    word = "".join((word[:-len(suffix)], "a"))
+                    r1 = "".join((r1[:-len(suffix)], "a"))
 
-                elif suffix in ("\xE9k\xE9", "\xE9\xE9i",
-                                "\xE9\xE9"):
+                elif suffix in ("\xE9nk", "\xE9j\xFCk",
+                                "\xE9m", "\xE9d", "\xE9"):
                     word = "".join((word[:-len(suffix)], "e"))
                     r1 = "".join((r1[:-len(suffix)], "e"))
                 else:
                     word = word[:-len(suffix)]
                     r1 = r1[:-len(suffix)]
-                break
-
-        # STEP 7: Remove singular owner suffixes
-        for suffix in self.__step7_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix in ("\xE1nk", "\xE1juk", "\xE1m",
-                                  "\xE1d", "\xE1"):
-                        word = "".join((word[:-len(suffix)], "a"))
-                        r1 = "".join((r1[:-len(suffix)], "a"))
-
-                    elif suffix in ("\xE9nk", "\xE9j\xFCk",
-                                    "\xE9m", "\xE9d", "\xE9"):
-                        word = "".join((word[:-len(suffix)], "e"))
-                        r1 = "".join((r1[:-len(suffix)], "e"))
-                    else:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                break
+            break
 
         # STEP 8: Remove plural owner suffixes
-        for suffix in self.__step8_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix in ("\xE1im", "\xE1id", "\xE1i",
-                                  "\xE1ink", "\xE1itok", "\xE1ik"):
-                        word = "".join((word[:-len(suffix)], "a"))
-                        r1 = "".join((r1[:-len(suffix)], "a"))
-
-                    elif suffix in ("\xE9im", "\xE9id", "\xE9i",
-                                    "\xE9ink", "\xE9itek", "\xE9ik"):
-                        word = "".join((word[:-len(suffix)], "e"))
-                        r1 = "".join((r1[:-len(suffix)], "e"))
-                    else:
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(word, self.__step8_suffixes):
+            if r1.endswith(suffix):
+                if suffix in ("\xE1im", "\xE1id", "\xE1i",
+                              "\xE1ink", "\xE1itok", "\xE1ik"):
+                    word = "".join((word[:-len(suffix)], "a"))
+                    r1 = "".join((r1[:-len(suffix)], "a"))
+
+                elif suffix in ("\xE9im", "\xE9id", "\xE9i",
+                                "\xE9ink", "\xE9itek", "\xE9ik"):
+                    word = "".join((word[:-len(suffix)], "e"))
+                    r1 = "".join((r1[:-len(suffix)], "e"))
+                else:
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+            break
 
         # STEP 9: Remove plural suffixes
-        for suffix in self.__step9_suffixes:
-            if word.endswith(suffix):
-                if r1.endswith(suffix):
-                    if suffix == "\xE1k":
-                        word = "".join((word[:-2], "a"))
-                    elif suffix == "\xE9k":
-                        word = "".join((word[:-2], "e"))
-                    else:
-                        word = word[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(word, self.__step9_suffixes):
+            if r1.endswith(suffix):
+                if suffix == "\xE1k":
+                    word = "".join((word[:-2], "a"))
+                elif suffix == "\xE9k":
+                    word = "".join((word[:-2], "e"))
+                else:
+                    word = word[:-len(suffix)]
+            break
 
 
         return word
@@ -2191,117 +2219,114 @@ class ItalianStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 0: Attached pronoun
-        for suffix in self.__step0_suffixes:
-            if rv.endswith(suffix):
-                if rv[-len(suffix)-4:-len(suffix)] in ("ando", "endo"):
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                    r2 = r2[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-
-                elif (rv[-len(suffix)-2:-len(suffix)] in
-                      ("ar", "er", "ir")):
-                    word = "".join((word[:-len(suffix)], "e"))
-                    r1 = "".join((r1[:-len(suffix)], "e"))
-                    r2 = "".join((r2[:-len(suffix)], "e"))
-                    rv = "".join((rv[:-len(suffix)], "e"))
-                break
+        for suffix in _matching_suffixes(rv, self.__step0_suffixes):
+            if rv[-len(suffix)-4:-len(suffix)] in ("ando", "endo"):
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+
+            elif (rv[-len(suffix)-2:-len(suffix)] in
+                  ("ar", "er", "ir")):
+                word = "".join((word[:-len(suffix)], "e"))
+                r1 = "".join((r1[:-len(suffix)], "e"))
+                r2 = "".join((r2[:-len(suffix)], "e"))
+                rv = "".join((rv[:-len(suffix)], "e"))
+            break
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "amente" and r1.endswith(suffix):
-                    step1_success = True
-                    word = word[:-6]
-                    r2 = r2[:-6]
-                    rv = rv[:-6]
+        for suffix in _matching_suffixes(word, self.__step1_suffixes):
+            if suffix == "amente" and r1.endswith(suffix):
+                step1_success = True
+                word = word[:-6]
+                r2 = r2[:-6]
+                rv = rv[:-6]
+
+                if r2.endswith("iv"):
+                    word = word[:-2]
+                    r2 = r2[:-2]
+                    rv = rv[:-2]
 
-                    if r2.endswith("iv"):
+                    if r2.endswith("at"):
                         word = word[:-2]
-                        r2 = r2[:-2]
                         rv = rv[:-2]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                elif r2.endswith(("os", "ic")):
+                    word = word[:-2]
+                    rv = rv[:-2]
+
+                elif r2 .endswith("abil"):
+                    word = word[:-4]
+                    rv = rv[:-4]
+
+            elif (suffix in ("amento", "amenti",
+                             "imento", "imenti") and
+                  rv.endswith(suffix)):
+                step1_success = True
+                word = word[:-6]
+                rv = rv[:-6]
+
+            elif r2.endswith(suffix):
+                step1_success = True
+                if suffix in ("azione", "azioni", "atore", "atori"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                    elif r2.endswith(("os", "ic")):
+                    if r2.endswith("ic"):
                         word = word[:-2]
                         rv = rv[:-2]
 
-                    elif r2 .endswith("abil"):
-                        word = word[:-4]
-                        rv = rv[:-4]
+                elif suffix in ("logia", "logie"):
+                    word = word[:-2]
+                    rv = word[:-2]
 
-                elif (suffix in ("amento", "amenti",
-                                 "imento", "imenti") and
-                      rv.endswith(suffix)):
-                    step1_success = True
-                    word = word[:-6]
-                    rv = rv[:-6]
+                elif suffix in ("uzione", "uzioni",
+                                "usione", "usioni"):
+                    word = word[:-5]
+                    rv = rv[:-5]
 
-                elif r2.endswith(suffix):
-                    step1_success = True
-                    if suffix in ("azione", "azioni", "atore", "atori"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+                elif suffix in ("enza", "enze"):
+                    word = "".join((word[:-2], "te"))
+                    rv = "".join((rv[:-2], "te"))
 
-                        if r2.endswith("ic"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                elif suffix == "it\xE0":
+                    word = word[:-3]
+                    r2 = r2[:-3]
+                    rv = rv[:-3]
 
-                    elif suffix in ("logia", "logie"):
+                    if r2.endswith(("ic", "iv")):
                         word = word[:-2]
-                        rv = word[:-2]
-
-                    elif suffix in ("uzione", "uzioni",
-                                    "usione", "usioni"):
-                        word = word[:-5]
-                        rv = rv[:-5]
-
-                    elif suffix in ("enza", "enze"):
-                        word = "".join((word[:-2], "te"))
-                        rv = "".join((rv[:-2], "te"))
-
-                    elif suffix == "it\xE0":
-                        word = word[:-3]
-                        r2 = r2[:-3]
-                        rv = rv[:-3]
+                        rv = rv[:-2]
 
-                        if r2.endswith(("ic", "iv")):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                    elif r2.endswith("abil"):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                        elif r2.endswith("abil"):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                elif suffix in ("ivo", "ivi", "iva", "ive"):
+                    word = word[:-3]
+                    r2 = r2[:-3]
+                    rv = rv[:-3]
 
-                    elif suffix in ("ivo", "ivi", "iva", "ive"):
-                        word = word[:-3]
-                        r2 = r2[:-3]
-                        rv = rv[:-3]
+                    if r2.endswith("at"):
+                        word = word[:-2]
+                        r2 = r2[:-2]
+                        rv = rv[:-2]
 
-                        if r2.endswith("at"):
+                        if r2.endswith("ic"):
                             word = word[:-2]
-                            r2 = r2[:-2]
                             rv = rv[:-2]
-
-                            if r2.endswith("ic"):
-                                word = word[:-2]
-                                rv = rv[:-2]
-                    else:
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                break
+                else:
+                    word = word[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+            break
 
         # STEP 2: Verb suffixes
         if not step1_success:
-            for suffix in self.__step2_suffixes:
-                if rv.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    break
+            for suffix in _matching_suffixes(rv, self.__step2_suffixes):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
 
         # STEP 3a
         if rv.endswith(("a", "e", "i", "o", "\xE0", "\xE8",
@@ -2376,34 +2401,31 @@ class NorwegianStemmer(_ScandinavianStemmer):
         r1 = self._r1_scandinavian(word, self.__vowels)
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix in ("erte", "ert"):
-                    word = "".join((word[:-len(suffix)], "er"))
-                    r1 = "".join((r1[:-len(suffix)], "er"))
-
-                elif suffix == "s":
-                    if (word[-2] in self.__s_ending or
-                        (word[-2] == "k" and word[-3] not in self.__vowels)):
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step1_suffixes):
+            if suffix in ("erte", "ert"):
+                word = "".join((word[:-len(suffix)], "er"))
+                r1 = "".join((r1[:-len(suffix)], "er"))
+
+            elif suffix == "s":
+                if (word[-2] in self.__s_ending or
+                    (word[-2] == "k" and word[-3] not in self.__vowels)):
+                    word = word[:-1]
+                    r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-1]
-                r1 = r1[:-1]
-                break
+        for suffix in _matching_suffixes(r1, self.__step2_suffixes):
+            word = word[:-1]
+            r1 = r1[:-1]
+            break
 
         # STEP 3
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step3_suffixes):
+            word = word[:-len(suffix)]
+            break
 
 
         return word
@@ -2496,94 +2518,92 @@ class PortugueseStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "amente" and r1.endswith(suffix):
-                    step1_success = True
-
-                    word = word[:-6]
-                    r2 = r2[:-6]
-                    rv = rv[:-6]
+        for suffix in _matching_suffixes(word, self.__step1_suffixes):
+            if suffix == "amente" and r1.endswith(suffix):
+                step1_success = True
 
-                    if r2.endswith("iv"):
-                        word = word[:-2]
-                        r2 = r2[:-2]
-                        rv = rv[:-2]
+                word = word[:-6]
+                r2 = r2[:-6]
+                rv = rv[:-6]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                if r2.endswith("iv"):
+                    word = word[:-2]
+                    r2 = r2[:-2]
+                    rv = rv[:-2]
 
-                    elif r2.endswith(("os", "ic", "ad")):
+                    if r2.endswith("at"):
                         word = word[:-2]
                         rv = rv[:-2]
 
-                elif (suffix in ("ira", "iras") and rv.endswith(suffix) and
-                      word[-len(suffix)-1:-len(suffix)] == "e"):
-                    step1_success = True
+                elif r2.endswith(("os", "ic", "ad")):
+                    word = word[:-2]
+                    rv = rv[:-2]
 
-                    word = "".join((word[:-len(suffix)], "ir"))
-                    rv = "".join((rv[:-len(suffix)], "ir"))
+            elif (suffix in ("ira", "iras") and rv.endswith(suffix) and
+                  word[-len(suffix)-1:-len(suffix)] == "e"):
+                step1_success = True
 
-                elif r2.endswith(suffix):
-                    step1_success = True
+                word = "".join((word[:-len(suffix)], "ir"))
+                rv = "".join((rv[:-len(suffix)], "ir"))
 
-                    if suffix in ("log\xEDa", "log\xEDas"):
-                        word = word[:-2]
-                        rv = rv[:-2]
+            elif r2.endswith(suffix):
+                step1_success = True
 
-                    elif suffix in ("uci\xF3n", "uciones"):
-                        word = "".join((word[:-len(suffix)], "u"))
-                        rv = "".join((rv[:-len(suffix)], "u"))
+                if suffix in ("log\xEDa", "log\xEDas"):
+                    word = word[:-2]
+                    rv = rv[:-2]
 
-                    elif suffix in ("\xEAncia", "\xEAncias"):
-                        word = "".join((word[:-len(suffix)], "ente"))
-                        rv = "".join((rv[:-len(suffix)], "ente"))
+                elif suffix in ("uci\xF3n", "uciones"):
+                    word = "".join((word[:-len(suffix)], "u"))
+                    rv = "".join((rv[:-len(suffix)], "u"))
 
-                    elif suffix == "mente":
-                        word = word[:-5]
-                        r2 = r2[:-5]
-                        rv = rv[:-5]
+                elif suffix in ("\xEAncia", "\xEAncias"):
+                    word = "".join((word[:-len(suffix)], "ente"))
+                    rv = "".join((rv[:-len(suffix)], "ente"))
 
-                        if r2.endswith(("ante", "avel", "\xEDvel")):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                elif suffix == "mente":
+                    word = word[:-5]
+                    r2 = r2[:-5]
+                    rv = rv[:-5]
 
-                    elif suffix in ("idade", "idades"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+                    if r2.endswith(("ante", "avel", "\xEDvel")):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                        if r2.endswith(("ic", "iv")):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                elif suffix in ("idade", "idades"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                        elif r2.endswith("abil"):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                    if r2.endswith(("ic", "iv")):
+                        word = word[:-2]
+                        rv = rv[:-2]
 
-                    elif suffix in ("iva", "ivo", "ivas", "ivos"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+                    elif r2.endswith("abil"):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
-                    else:
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                break
+                elif suffix in ("iva", "ivo", "ivas", "ivos"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+
+                    if r2.endswith("at"):
+                        word = word[:-2]
+                        rv = rv[:-2]
+                else:
+                    word = word[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+            break
 
         # STEP 2: Verb suffixes
         if not step1_success:
-            for suffix in self.__step2_suffixes:
-                if rv.endswith(suffix):
-                    step2_success = True
+            for suffix in _matching_suffixes(rv, self.__step2_suffixes):
+                step2_success = True
 
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    break
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
 
         # STEP 3
         if step1_success or step2_success:
@@ -2593,11 +2613,10 @@ class PortugueseStemmer(_StandardStemmer):
 
         ### STEP 4: Residual suffix
         if not step1_success and not step2_success:
-            for suffix in self.__step4_suffixes:
-                if rv.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    rv = rv[:-len(suffix)]
-                    break
+            for suffix in _matching_suffixes(rv, self.__step4_suffixes):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
 
         # STEP 5
         if rv.endswith(("e", "\xE9", "\xEA")):
@@ -2698,6 +2717,7 @@ class RomanianStemmer(_StandardStemmer):
                         'ez', 'am', 'ai', 'au', 'ea', 'ia', 'ui',
                         '\xE2i', '\u0103m', 'em', 'im', '\xE2m',
                         'se')
+    __step4_suffixes = ("ie", "a", "e", "i", "\u0103")
 
     def stem(self, word):
         """
@@ -2729,143 +2749,138 @@ class RomanianStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 0: Removal of plurals and other simplifications
-        for suffix in self.__step0_suffixes:
-            if word.endswith(suffix):
-                if suffix in r1:
-                    if suffix in ("ul", "ului"):
-                        word = word[:-len(suffix)]
+        for suffix in _matching_suffixes(word, self.__step0_suffixes):
+            if suffix in r1:
+                if suffix in ("ul", "ului"):
+                    word = word[:-len(suffix)]
 
-                        if suffix in rv:
-                            rv = rv[:-len(suffix)]
-                        else:
-                            rv = ""
+                    if suffix in rv:
+                        rv = rv[:-len(suffix)]
+                    else:
+                        rv = ""
 
-                    elif (suffix == "aua" or suffix == "atei" or
-                          (suffix == "ile" and word[-5:-3] != "ab")):
-                        word = word[:-2]
+                elif (suffix == "aua" or suffix == "atei" or
+                      (suffix == "ile" and word[-5:-3] != "ab")):
+                    word = word[:-2]
 
-                    elif suffix in ("ea", "ele", "elor"):
-                        word = "".join((word[:-len(suffix)], "e"))
+                elif suffix in ("ea", "ele", "elor"):
+                    word = "".join((word[:-len(suffix)], "e"))
 
-                        if suffix in rv:
-                            rv = "".join((rv[:-len(suffix)], "e"))
-                        else:
-                            rv = ""
+                    if suffix in rv:
+                        rv = "".join((rv[:-len(suffix)], "e"))
+                    else:
+                        rv = ""
 
-                    elif suffix in ("ii", "iua", "iei",
-                                    "iile", "iilor", "ilor"):
-                        word = "".join((word[:-len(suffix)], "i"))
+                elif suffix in ("ii", "iua", "iei",
+                                "iile", "iilor", "ilor"):
+                    word = "".join((word[:-len(suffix)], "i"))
 
-                        if suffix in rv:
-                            rv = "".join((rv[:-len(suffix)], "i"))
-                        else:
-                            rv = ""
+                    if suffix in rv:
+                        rv = "".join((rv[:-len(suffix)], "i"))
+                    else:
+                        rv = ""
 
-                    elif suffix in ("a\u0163ie", "a\u0163ia"):
-                        word = word[:-1]
-                break
+                elif suffix in ("a\u0163ie", "a\u0163ia"):
+                    word = word[:-1]
+            break
 
         # STEP 1: Reduction of combining suffixes
         while True:
 
             replacement_done = False
 
-            for suffix in self.__step1_suffixes:
-                if word.endswith(suffix):
-                    if suffix in r1:
-                        step1_success = True
-                        replacement_done = True
-
-                        if suffix in ("abilitate", "abilitati",
-                                      "abilit\u0103i",
-                                      "abilit\u0103\u0163i"):
-                            word = "".join((word[:-len(suffix)], "abil"))
-
-                        elif suffix == "ibilitate":
-                            word = word[:-5]
-
-                        elif suffix in ("ivitate", "ivitati",
-                                        "ivit\u0103i",
-                                        "ivit\u0103\u0163i"):
-                            word = "".join((word[:-len(suffix)], "iv"))
-
-                        elif suffix in ("icitate", "icitati", "icit\u0103i",
-                                        "icit\u0103\u0163i", "icator",
-                                        "icatori", "iciv", "iciva",
-                                        "icive", "icivi", "iciv\u0103",
-                                        "ical", "icala", "icale", "icali",
-                                        "ical\u0103"):
-                            word = "".join((word[:-len(suffix)], "ic"))
-
-                        elif suffix in ("ativ", "ativa", "ative", "ativi",
-                                        "ativ\u0103", "a\u0163iune",
-                                        "atoare", "ator", "atori",
-                                        "\u0103toare",
-                                        "\u0103tor", "\u0103tori"):
-                            word = "".join((word[:-len(suffix)], "at"))
-
-                            if suffix in r2:
-                                r2 = "".join((r2[:-len(suffix)], "at"))
-
-                        elif suffix in ("itiv", "itiva", "itive", "itivi",
-                                        "itiv\u0103", "i\u0163iune",
-                                        "itoare", "itor", "itori"):
-                            word = "".join((word[:-len(suffix)], "it"))
-
-                            if suffix in r2:
-                                r2 = "".join((r2[:-len(suffix)], "it"))
-                    else:
-                        step1_success = False
-                    break
+            for suffix in _matching_suffixes(word, self.__step1_suffixes):
+                if suffix in r1:
+                    step1_success = True
+                    replacement_done = True
+
+                    if suffix in ("abilitate", "abilitati",
+                                  "abilit\u0103i",
+                                  "abilit\u0103\u0163i"):
+                        word = "".join((word[:-len(suffix)], "abil"))
+
+                    elif suffix == "ibilitate":
+                        word = word[:-5]
+
+                    elif suffix in ("ivitate", "ivitati",
+                                    "ivit\u0103i",
+                                    "ivit\u0103\u0163i"):
+                        word = "".join((word[:-len(suffix)], "iv"))
+
+                    elif suffix in ("icitate", "icitati", "icit\u0103i",
+                                    "icit\u0103\u0163i", "icator",
+                                    "icatori", "iciv", "iciva",
+                                    "icive", "icivi", "iciv\u0103",
+                                    "ical", "icala", "icale", "icali",
+                                    "ical\u0103"):
+                        word = "".join((word[:-len(suffix)], "ic"))
+
+                    elif suffix in ("ativ", "ativa", "ative", "ativi",
+                                    "ativ\u0103", "a\u0163iune",
+                                    "atoare", "ator", "atori",
+                                    "\u0103toare",
+                                    "\u0103tor", "\u0103tori"):
+                        word = "".join((word[:-len(suffix)], "at"))
+
+                        if suffix in r2:
+                            r2 = "".join((r2[:-len(suffix)], "at"))
+
+                    elif suffix in ("itiv", "itiva", "itive", "itivi",
+                                    "itiv\u0103", "i\u0163iune",
+                                    "itoare", "itor", "itori"):
+                        word = "".join((word[:-len(suffix)], "it"))
+
+                        if suffix in r2:
+                            r2 = "".join((r2[:-len(suffix)], "it"))
+                else:
+                    step1_success = False
+                break
 
             if not replacement_done:
                 break
 
         # STEP 2: Removal of standard suffixes
-        for suffix in self.__step2_suffixes:
-            if word.endswith(suffix):
-                if suffix in r2:
-                    step2_success = True
+        for suffix in _matching_suffixes(word, self.__step2_suffixes):
+            if suffix in r2:
+                step2_success = True
 
-                    if suffix in ("iune", "iuni"):
-                        if word[-5] == "\u0163":
-                            word = "".join((word[:-5], "t"))
+                if suffix in ("iune", "iuni"):
+                    if word[-5] == "\u0163":
+                        word = "".join((word[:-5], "t"))
 
-                    elif suffix in ("ism", "isme", "ist", "ista", "iste",
-                                    "isti", "ist\u0103", "i\u015Fti"):
-                        word = "".join((word[:-len(suffix)], "ist"))
+                elif suffix in ("ism", "isme", "ist", "ista", "iste",
+                                "isti", "ist\u0103", "i\u015Fti"):
+                    word = "".join((word[:-len(suffix)], "ist"))
 
-                    else:
-                        word = word[:-len(suffix)]
-                break
+                else:
+                    word = word[:-len(suffix)]
+            break
 
         # STEP 3: Removal of verb suffixes
         if not step1_success and not step2_success:
-            for suffix in self.__step3_suffixes:
-                if word.endswith(suffix):
-                    if suffix in rv:
-                        if suffix in ('seser\u0103\u0163i', 'seser\u0103m',
-                                      'ser\u0103\u0163i', 'sese\u015Fi',
-                                      'seser\u0103', 'ser\u0103m', 'sesem',
-                                      'se\u015Fi', 'ser\u0103', 'sese',
-                                      'a\u0163i', 'e\u0163i', 'i\u0163i',
-                                      '\xE2\u0163i', 'sei', '\u0103m',
-                                      'em', 'im', '\xE2m', 'se'):
+            for suffix in _matching_suffixes(word, self.__step3_suffixes):
+                if suffix in rv:
+                    if suffix in ('seser\u0103\u0163i', 'seser\u0103m',
+                                  'ser\u0103\u0163i', 'sese\u015Fi',
+                                  'seser\u0103', 'ser\u0103m', 'sesem',
+                                  'se\u015Fi', 'ser\u0103', 'sese',
+                                  'a\u0163i', 'e\u0163i', 'i\u0163i',
+                                  '\xE2\u0163i', 'sei', '\u0103m',
+                                  'em', 'im', '\xE2m', 'se'):
+                        word = word[:-len(suffix)]
+                        rv = rv[:-len(suffix)]
+                    else:
+                        if (not rv.startswith(suffix) and
+                            rv[rv.index(suffix)-1] not in
+                            "aeio\u0103\xE2\xEE"):
                             word = word[:-len(suffix)]
-                            rv = rv[:-len(suffix)]
-                        else:
-                            if (not rv.startswith(suffix) and
-                                rv[rv.index(suffix)-1] not in
-                                "aeio\u0103\xE2\xEE"):
-                                word = word[:-len(suffix)]
-                        break
+                    break
 
         # STEP 4: Removal of final vowel
-        for suffix in ("ie", "a", "e", "i", "\u0103"):
-            if word.endswith(suffix):
-                if suffix in rv:
-                    word = word[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(word, self.__step4_suffixes):
+            if suffix in rv:
+                word = word[:-len(suffix)]
+            break
 
         word = word.replace("I", "i").replace("U", "u")
 
@@ -3022,110 +3037,106 @@ class RussianStemmer(_LanguageSpecificStemmer):
         rv, r2 = self.__regions_russian(word)
 
         # Step 1
-        for suffix in self.__perfective_gerund_suffixes:
-            if rv.endswith(suffix):
-                if suffix in ("v", "vshi", "vshis'"):
-                    if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
-                        rv[-len(suffix)-1:-len(suffix)] == "a"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                        step1_success = True
-                        break
-                else:
+        for suffix in _matching_suffixes(rv,
+                                         self.__perfective_gerund_suffixes):
+            if suffix in ("v", "vshi", "vshis'"):
+                if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
+                    rv[-len(suffix)-1:-len(suffix)] == "a"):
                     word = word[:-len(suffix)]
                     r2 = r2[:-len(suffix)]
                     rv = rv[:-len(suffix)]
                     step1_success = True
                     break
+            else:
+                word = word[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                step1_success = True
+                break
 
         if not step1_success:
-            for suffix in self.__reflexive_suffixes:
-                if rv.endswith(suffix):
+            for suffix in _matching_suffixes(rv, self.__reflexive_suffixes):
+                word = word[:-len(suffix)]
+                r2 = r2[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+                break
+
+            for suffix in _matching_suffixes(rv, self.__adjectival_suffixes):
+                if suffix in ('i^ushchi^ui^u', 'i^ushchi^ai^a',
+                          'i^ushchui^u', 'i^ushchai^a', 'i^ushchoi^u',
+                          'i^ushchei^u', 'i^ushchimi', 'i^ushchymi',
+                          'i^ushchego', 'i^ushchogo', 'i^ushchemu',
+                          'i^ushchomu', 'i^ushchikh', 'i^ushchykh',
+                          'shchi^ui^u', 'shchi^ai^a', 'i^ushchee',
+                          'i^ushchie', 'i^ushchye', 'i^ushchoe',
+                          'i^ushchei`', 'i^ushchii`', 'i^ushchyi`',
+                          'i^ushchoi`', 'i^ushchem', 'i^ushchim',
+                          'i^ushchym', 'i^ushchom', 'vshi^ui^u',
+                          'vshi^ai^a', 'shchui^u', 'shchai^a',
+                          'shchoi^u', 'shchei^u', 'emi^ui^u',
+                          'emi^ai^a', 'nni^ui^u', 'nni^ai^a',
+                          'shchimi', 'shchymi', 'shchego', 'shchogo',
+                          'shchemu', 'shchomu', 'shchikh', 'shchykh',
+                          'vshui^u', 'vshai^a', 'vshoi^u', 'vshei^u',
+                          'shchee', 'shchie', 'shchye', 'shchoe',
+                          'shchei`', 'shchii`', 'shchyi`', 'shchoi`',
+                          'shchem', 'shchim', 'shchym', 'shchom',
+                          'vshimi', 'vshymi', 'vshego', 'vshogo',
+                          'vshemu', 'vshomu', 'vshikh', 'vshykh',
+                          'emui^u', 'emai^a', 'emoi^u', 'emei^u',
+                          'nnui^u', 'nnai^a', 'nnoi^u', 'nnei^u',
+                          'vshee', 'vshie', 'vshye', 'vshoe',
+                          'vshei`', 'vshii`', 'vshyi`', 'vshoi`',
+                          'vshem', 'vshim', 'vshym', 'vshom',
+                          'emimi', 'emymi', 'emego', 'emogo',
+                          'ememu', 'emomu', 'emikh', 'emykh',
+                          'nnimi', 'nnymi', 'nnego', 'nnogo',
+                          'nnemu', 'nnomu', 'nnikh', 'nnykh',
+                          'emee', 'emie', 'emye', 'emoe', 'emei`',
+                          'emii`', 'emyi`', 'emoi`', 'emem', 'emim',
+                          'emym', 'emom', 'nnee', 'nnie', 'nnye',
+                          'nnoe', 'nnei`', 'nnii`', 'nnyi`', 'nnoi`',
+                          'nnem', 'nnim', 'nnym', 'nnom'):
+                    if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
+                        rv[-len(suffix)-1:-len(suffix)] == "a"):
+                        word = word[:-len(suffix)]
+                        r2 = r2[:-len(suffix)]
+                        rv = rv[:-len(suffix)]
+                        adjectival_removed = True
+                        break
+                else:
                     word = word[:-len(suffix)]
                     r2 = r2[:-len(suffix)]
                     rv = rv[:-len(suffix)]
+                    adjectival_removed = True
                     break
 
-            for suffix in self.__adjectival_suffixes:
-                if rv.endswith(suffix):
-                    if suffix in ('i^ushchi^ui^u', 'i^ushchi^ai^a',
-                              'i^ushchui^u', 'i^ushchai^a', 'i^ushchoi^u',
-                              'i^ushchei^u', 'i^ushchimi', 'i^ushchymi',
-                              'i^ushchego', 'i^ushchogo', 'i^ushchemu',
-                              'i^ushchomu', 'i^ushchikh', 'i^ushchykh',
-                              'shchi^ui^u', 'shchi^ai^a', 'i^ushchee',
-                              'i^ushchie', 'i^ushchye', 'i^ushchoe',
-                              'i^ushchei`', 'i^ushchii`', 'i^ushchyi`',
-                              'i^ushchoi`', 'i^ushchem', 'i^ushchim',
-                              'i^ushchym', 'i^ushchom', 'vshi^ui^u',
-                              'vshi^ai^a', 'shchui^u', 'shchai^a',
-                              'shchoi^u', 'shchei^u', 'emi^ui^u',
-                              'emi^ai^a', 'nni^ui^u', 'nni^ai^a',
-                              'shchimi', 'shchymi', 'shchego', 'shchogo',
-                              'shchemu', 'shchomu', 'shchikh', 'shchykh',
-                              'vshui^u', 'vshai^a', 'vshoi^u', 'vshei^u',
-                              'shchee', 'shchie', 'shchye', 'shchoe',
-                              'shchei`', 'shchii`', 'shchyi`', 'shchoi`',
-                              'shchem', 'shchim', 'shchym', 'shchom',
-                              'vshimi', 'vshymi', 'vshego', 'vshogo',
-                              'vshemu', 'vshomu', 'vshikh', 'vshykh',
-                              'emui^u', 'emai^a', 'emoi^u', 'emei^u',
-                              'nnui^u', 'nnai^a', 'nnoi^u', 'nnei^u',
-                              'vshee', 'vshie', 'vshye', 'vshoe',
-                              'vshei`', 'vshii`', 'vshyi`', 'vshoi`',
-                              'vshem', 'vshim', 'vshym', 'vshom',
-                              'emimi', 'emymi', 'emego', 'emogo',
-                              'ememu', 'emomu', 'emikh', 'emykh',
-                              'nnimi', 'nnymi', 'nnego', 'nnogo',
-                              'nnemu', 'nnomu', 'nnikh', 'nnykh',
-                              'emee', 'emie', 'emye', 'emoe', 'emei`',
-                              'emii`', 'emyi`', 'emoi`', 'emem', 'emim',
-                              'emym', 'emom', 'nnee', 'nnie', 'nnye',
-                              'nnoe', 'nnei`', 'nnii`', 'nnyi`', 'nnoi`',
-                              'nnem', 'nnim', 'nnym', 'nnom'):
+            if not adjectival_removed:
+                for suffix in _matching_suffixes(rv, self.__verb_suffixes):
+                    if suffix in ("la", "na", "ete", "i`te", "li",
+                                  "i`", "l", "em", "n", "lo", "no",
+                                  "et", "i^ut", "ny", "t'", "esh'",
+                                  "nno"):
                         if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
                             rv[-len(suffix)-1:-len(suffix)] == "a"):
                             word = word[:-len(suffix)]
                             r2 = r2[:-len(suffix)]
                             rv = rv[:-len(suffix)]
-                            adjectival_removed = True
+                            verb_removed = True
                             break
                     else:
                         word = word[:-len(suffix)]
                         r2 = r2[:-len(suffix)]
                         rv = rv[:-len(suffix)]
-                        adjectival_removed = True
+                        verb_removed = True
                         break
 
-            if not adjectival_removed:
-                for suffix in self.__verb_suffixes:
-                    if rv.endswith(suffix):
-                        if suffix in ("la", "na", "ete", "i`te", "li",
-                                      "i`", "l", "em", "n", "lo", "no",
-                                      "et", "i^ut", "ny", "t'", "esh'",
-                                      "nno"):
-                            if (rv[-len(suffix)-3:-len(suffix)] == "i^a" or
-                                rv[-len(suffix)-1:-len(suffix)] == "a"):
-                                word = word[:-len(suffix)]
-                                r2 = r2[:-len(suffix)]
-                                rv = rv[:-len(suffix)]
-                                verb_removed = True
-                                break
-                        else:
-                            word = word[:-len(suffix)]
-                            r2 = r2[:-len(suffix)]
-                            rv = rv[:-len(suffix)]
-                            verb_removed = True
-                            break
-
             if not adjectival_removed and not verb_removed:
-                for suffix in self.__noun_suffixes:
-                    if rv.endswith(suffix):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                        break
+                for suffix in _matching_suffixes(rv, self.__noun_suffixes):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+                    break
 
         # Step 2
         if rv.endswith("i"):
@@ -3133,10 +3144,9 @@ class RussianStemmer(_LanguageSpecificStemmer):
             r2 = r2[:-1]
 
         # Step 3
-        for suffix in self.__derivational_suffixes:
-            if r2.endswith(suffix):
-                word = word[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r2, self.__derivational_suffixes):
+            word = word[:-len(suffix)]
+            break
 
         # Step 4
         if word.endswith("nn"):
@@ -3144,11 +3154,11 @@ class RussianStemmer(_LanguageSpecificStemmer):
             undouble_success = True
 
         if not undouble_success:
-            for suffix in self.__superlative_suffixes:
-                if word.endswith(suffix):
-                    word = word[:-len(suffix)]
-                    superlative_removed = True
-                    break
+            for suffix in _matching_suffixes(word,
+                                             self.__superlative_suffixes):
+                word = word[:-len(suffix)]
+                superlative_removed = True
+                break
             if word.endswith("nn"):
                 word = word[:-1]
 
@@ -3405,122 +3415,120 @@ class SpanishStemmer(_StandardStemmer):
         rv = self._rv_standard(word, self.__vowels)
 
         # STEP 0: Attached pronoun
-        for suffix in self.__step0_suffixes:
-            if word.endswith(suffix):
-                if rv.endswith(suffix):
-                    if rv[:-len(suffix)].endswith(("i\xE9ndo",
-                                                   "\xE1ndo",
-                                                   "\xE1r", "\xE9r",
-                                                   "\xEDr")):
-                        word = (word[:-len(suffix)].replace("\xE1", "a")
-                                                   .replace("\xE9", "e")
-                                                   .replace("\xED", "i"))
-                        r1 = (r1[:-len(suffix)].replace("\xE1", "a")
-                                               .replace("\xE9", "e")
-                                               .replace("\xED", "i"))
-                        r2 = (r2[:-len(suffix)].replace("\xE1", "a")
-                                               .replace("\xE9", "e")
-                                               .replace("\xED", "i"))
-                        rv = (rv[:-len(suffix)].replace("\xE1", "a")
+        for suffix in _matching_suffixes(word, self.__step0_suffixes):
+            if rv.endswith(suffix):
+                if rv[:-len(suffix)].endswith(("i\xE9ndo",
+                                               "\xE1ndo",
+                                               "\xE1r", "\xE9r",
+                                               "\xEDr")):
+                    word = (word[:-len(suffix)].replace("\xE1", "a")
                                                .replace("\xE9", "e")
                                                .replace("\xED", "i"))
+                    r1 = (r1[:-len(suffix)].replace("\xE1", "a")
+                                           .replace("\xE9", "e")
+                                           .replace("\xED", "i"))
+                    r2 = (r2[:-len(suffix)].replace("\xE1", "a")
+                                           .replace("\xE9", "e")
+                                           .replace("\xED", "i"))
+                    rv = (rv[:-len(suffix)].replace("\xE1", "a")
+                                           .replace("\xE9", "e")
+                                           .replace("\xED", "i"))
+
+                elif rv[:-len(suffix)].endswith(("ando", "iendo",
+                                                 "ar", "er", "ir")):
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                    elif rv[:-len(suffix)].endswith(("ando", "iendo",
-                                                     "ar", "er", "ir")):
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-
-                    elif (rv[:-len(suffix)].endswith("yendo") and
-                          word[:-len(suffix)].endswith("uyendo")):
-                        word = word[:-len(suffix)]
-                        r1 = r1[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                break
+                elif (rv[:-len(suffix)].endswith("yendo") and
+                      word[:-len(suffix)].endswith("uyendo")):
+                    word = word[:-len(suffix)]
+                    r1 = r1[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+            break
 
         # STEP 1: Standard suffix removal
-        for suffix in self.__step1_suffixes:
-            if word.endswith(suffix):
-                if suffix == "amente" and r1.endswith(suffix):
-                    step1_success = True
-                    word = word[:-6]
-                    r2 = r2[:-6]
-                    rv = rv[:-6]
+        for suffix in _matching_suffixes(word, self.__step1_suffixes):
+            if suffix == "amente" and r1.endswith(suffix):
+                step1_success = True
+                word = word[:-6]
+                r2 = r2[:-6]
+                rv = rv[:-6]
+
+                if r2.endswith("iv"):
+                    word = word[:-2]
+                    r2 = r2[:-2]
+                    rv = rv[:-2]
 
-                    if r2.endswith("iv"):
+                    if r2.endswith("at"):
                         word = word[:-2]
-                        r2 = r2[:-2]
                         rv = rv[:-2]
 
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
+                elif r2.endswith(("os", "ic", "ad")):
+                    word = word[:-2]
+                    rv = rv[:-2]
+
+            elif r2.endswith(suffix):
+                step1_success = True
+                if suffix in ("adora", "ador", "aci\xF3n", "adoras",
+                              "adores", "aciones", "ante", "antes",
+                              "ancia", "ancias"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                    elif r2.endswith(("os", "ic", "ad")):
+                    if r2.endswith("ic"):
                         word = word[:-2]
                         rv = rv[:-2]
 
-                elif r2.endswith(suffix):
-                    step1_success = True
-                    if suffix in ("adora", "ador", "aci\xF3n", "adoras",
-                                  "adores", "aciones", "ante", "antes",
-                                  "ancia", "ancias"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-
-                        if r2.endswith("ic"):
-                            word = word[:-2]
-                            rv = rv[:-2]
-
-                    elif suffix in ("log\xEDa", "log\xEDas"):
-                        word = word.replace(suffix, "log")
-                        rv = rv.replace(suffix, "log")
+                elif suffix in ("log\xEDa", "log\xEDas"):
+                    word = word.replace(suffix, "log")
+                    rv = rv.replace(suffix, "log")
 
-                    elif suffix in ("uci\xF3n", "uciones"):
-                        word = word.replace(suffix, "u")
-                        rv = rv.replace(suffix, "u")
+                elif suffix in ("uci\xF3n", "uciones"):
+                    word = word.replace(suffix, "u")
+                    rv = rv.replace(suffix, "u")
 
-                    elif suffix in ("encia", "encias"):
-                        word = word.replace(suffix, "ente")
-                        rv = rv.replace(suffix, "ente")
+                elif suffix in ("encia", "encias"):
+                    word = word.replace(suffix, "ente")
+                    rv = rv.replace(suffix, "ente")
 
-                    elif suffix == "mente":
-                        word = word[:-5]
-                        r2 = r2[:-5]
-                        rv = rv[:-5]
+                elif suffix == "mente":
+                    word = word[:-5]
+                    r2 = r2[:-5]
+                    rv = rv[:-5]
 
-                        if r2.endswith(("ante", "able", "ible")):
-                            word = word[:-4]
-                            rv = rv[:-4]
+                    if r2.endswith(("ante", "able", "ible")):
+                        word = word[:-4]
+                        rv = rv[:-4]
 
-                    elif suffix in ("idad", "idades"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
+                elif suffix in ("idad", "idades"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
 
-                        for pre_suff in ("abil", "ic", "iv"):
-                            if r2.endswith(pre_suff):
-                                word = word[:-len(pre_suff)]
-                                rv = rv[:-len(pre_suff)]
+                    for pre_suff in ("abil", "ic", "iv"):
+                        if r2.endswith(pre_suff):
+                            word = word[:-len(pre_suff)]
+                            rv = rv[:-len(pre_suff)]
 
-                    elif suffix in ("ivo", "iva", "ivos", "ivas"):
-                        word = word[:-len(suffix)]
-                        r2 = r2[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                        if r2.endswith("at"):
-                            word = word[:-2]
-                            rv = rv[:-2]
-                    else:
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                break
+                elif suffix in ("ivo", "iva", "ivos", "ivas"):
+                    word = word[:-len(suffix)]
+                    r2 = r2[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+                    if r2.endswith("at"):
+                        word = word[:-2]
+                        rv = rv[:-2]
+                else:
+                    word = word[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
+            break
 
         # STEP 2a: Verb suffixes beginning 'y'
         if not step1_success:
-            for suffix in self.__step2a_suffixes:
+            for suffix in _matching_suffixes(rv, self.__step2a_suffixes):
                 if (rv.endswith(suffix) and
                     word[-len(suffix)-1:-len(suffix)] == "u"):
                     word = word[:-len(suffix)]
@@ -3528,35 +3536,33 @@ class SpanishStemmer(_StandardStemmer):
                     break
 
         # STEP 2b: Other verb suffixes
-            for suffix in self.__step2b_suffixes:
-                if rv.endswith(suffix):
-                    if suffix in ("en", "es", "\xE9is", "emos"):
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-
-                        if word.endswith("gu"):
-                            word = word[:-1]
-
-                        if rv.endswith("gu"):
-                            rv = rv[:-1]
-                    else:
-                        word = word[:-len(suffix)]
-                        rv = rv[:-len(suffix)]
-                    break
-
-        # STEP 3: Residual suffix
-        for suffix in self.__step3_suffixes:
-            if rv.endswith(suffix):
-                if suffix in ("e", "\xE9"):
+            for suffix in _matching_suffixes(rv, self.__step2b_suffixes):
+                if suffix in ("en", "es", "\xE9is", "emos"):
                     word = word[:-len(suffix)]
                     rv = rv[:-len(suffix)]
 
-                    if word[-2:] == "gu" and rv[-1] == "u":
+                    if word.endswith("gu"):
                         word = word[:-1]
+
+                    if rv.endswith("gu"):
+                        rv = rv[:-1]
                 else:
                     word = word[:-len(suffix)]
+                    rv = rv[:-len(suffix)]
                 break
 
+        # STEP 3: Residual suffix
+        for suffix in _matching_suffixes(rv, self.__step3_suffixes):
+            if suffix in ("e", "\xE9"):
+                word = word[:-len(suffix)]
+                rv = rv[:-len(suffix)]
+
+                if word[-2:] == "gu" and rv[-1] == "u":
+                    word = word[:-1]
+            else:
+                word = word[:-len(suffix)]
+            break
+
         word = (word.replace("\xE1", "a").replace("\xE9", "e")
                     .replace("\xED", "i").replace("\xF3", "o")
                     .replace("\xFA", "u"))
@@ -3617,38 +3623,43 @@ class SwedishStemmer(_ScandinavianStemmer):
         r1 = self._r1_scandinavian(word, self.__vowels)
 
         # STEP 1
-        for suffix in self.__step1_suffixes:
-            if r1.endswith(suffix):
-                if suffix == "s":
-                    if word[-2] in self.__s_ending:
-                        word = word[:-1]
-                        r1 = r1[:-1]
-                else:
-                    word = word[:-len(suffix)]
-                    r1 = r1[:-len(suffix)]
-                break
+        for suffix in _matching_suffixes(r1, self.__step1_suffixes):
+            if suffix == "s":
+                if word[-2] in self.__s_ending:
+                    word = word[:-1]
+                    r1 = r1[:-1]
+            else:
+                word = word[:-len(suffix)]
+                r1 = r1[:-len(suffix)]
+            break
 
         # STEP 2
-        for suffix in self.__step2_suffixes:
-            if r1.endswith(suffix):
-                word = word[:-1]
-                r1 = r1[:-1]
-                break
+        for suffix in _matching_suffixes(r1, self.__step2_suffixes):
+            word = word[:-1]
+            r1 = r1[:-1]
+            break
 
         # STEP 3
-        for suffix in self.__step3_suffixes:
-            if r1.endswith(suffix):
-                if suffix in ("els", "lig", "ig"):
-                    word = word[:-len(suffix)]
-                elif suffix in ("fullt", "l\xF6st"):
-                    word = word[:-1]
-                break
+        for suffix in _matching_suffixes(r1, self.__step3_suffixes):
+            if suffix in ("els", "lig", "ig"):
+                word = word[:-len(suffix)]
+            elif suffix in ("fullt", "l\xF6st"):
+                word = word[:-1]
+            break
 
 
         return word
 
 
 
+# Compile the suffixes of each language's stemming steps.
+for _stemmer in list(globals().values()):
+    if (isinstance(_stemmer, type) and
+            issubclass(_stemmer, _LanguageSpecificStemmer)):
+        _compile_suffixes(_stemmer)
+del _stemmer
+
+
 def demo():
     """
     This function provides a demonstration of the Snowball stemmers.
@@ -7,7 +7,10 @@
 # For license information, see LICENSE.TXT
 from __future__ import unicode_literals
 
-from nltk.corpus.reader.wordnet import NOUN
+import codecs
+
+from nltk.corpus.reader.wordnet import (NOUN, VERB, ADJ, ADJ_SAT, ADV,
+                                        POS_LIST, WordNetCorpusReader)
 from nltk.corpus import wordnet
 from nltk.compat import python_2_unicode_compatible
 
@@ -31,19 +34,250 @@ class WordNetLemmatizer(object):
         abacus
         >>> print(wnl.lemmatize('hardrock'))
         hardrock
+
+    Tagged text can be lemmatized in one call, which maps the Penn
+    Treebank tags to WordNet parts of speech:
+
+        >>> words = ['The', 'geese', 'were', 'flying', 'higher']
+        >>> tags = ['DT', 'NNS', 'VBD', 'VBG', 'JJR']
+        >>> print(' '.join(wnl.lemmatize_many(words, tags)))
+        The goose be fly high
+
+    A ``WordNetLemmaTable`` (which can be saved to a file) can be used
+    instead of the WordNet corpus reader.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, table=None):
+        """
+        :param table: A table of the WordNet lemmas to use instead of the
+            WordNet corpus reader, which is then never loaded.
+        :type table: WordNetLemmaTable
+        """
+        self._table = table
 
     def lemmatize(self, word, pos=NOUN):
+        if self._table is not None:
+            return self._table.lemmatize(word, pos)
         lemmas = wordnet._morphy(word, pos)
         return min(lemmas, key=len) if lemmas else word
 
+    def lemmatize_many(self, words, pos_tags=None):
+        """
+        Lemmatize a list of words, each with the WordNet part of speech
+        that corresponds to its Penn Treebank tag (see ``penn_to_wordnet()``).
+        Words whose tags do not correspond to a WordNet part of speech
+        are returned unchanged.  Each distinct word and tag is only
+        lemmatized once.
+
+        :param words: The words to lemmatize.
+        :type words: list(str)
+        :param pos_tags: The Penn Treebank tags of the words.  If not
+            specified, then all words are lemmatized as nouns.
+        :type pos_tags: list(str)
+        :rtype: list(str)
+        """
+        if pos_tags is None:
+            pos_tags = [None] * len(words)
+        elif len(pos_tags) != len(words):
+            raise ValueError('Lists must have the same length.')
+        poses = {}
+        lemmas = {}
+        result = []
+        for (word, tag) in zip(words, pos_tags):
+            try:
+                lemma = lemmas[word, tag]
+            except KeyError:
+                if tag is None:
+                    pos = NOUN
+                else:
+                    try:
+                        pos = poses[tag]
+                    except KeyError:
+                        pos = poses[tag] = penn_to_wordnet(tag)
+                if pos is None:
+                    lemma = word
+                else:
+                    lemma = self.lemmatize(word, pos)
+                lemmas[word, tag] = lemma
+            result.append(lemma)
+        return result
+
     def __repr__(self):
         return '<WordNetLemmatizer>'
 
 
+_PENN_PREFIXES = (('NN', NOUN), ('VB', VERB), ('JJ', ADJ), ('RB', ADV))
+
+def penn_to_wordnet(tag):
+    """
+    Return the WordNet part of speech (``'n'``, ``'v'``, ``'a'`` or
+    ``'r'``) of words with the given Penn Treebank tag, or None if
+    WordNet does not contain words with this tag.
+
+        >>> from nltk.stem.wordnet import penn_to_wordnet
+        >>> print(penn_to_wordnet('VBZ'), penn_to_wordnet('DT'))
+        v None
+    """
+    for (prefix, pos) in _PENN_PREFIXES:
+        if tag.startswith(prefix):
+            return pos
+    return None
+
+
+@python_2_unicode_compatible
+class WordNetLemmaTable(object):
+    """
+    The data that the WordNet lemmatizer uses -- the lemmas for each part
+    of speech, and the exception lists -- together with the lemmas of
+    the inflected forms of all lemmas, computed in advance.  A table can
+    be saved to a file, and lemmatizers that load the table do not need
+    to load the WordNet corpus.
+
+        >>> from nltk.stem.wordnet import WordNetLemmaTable
+        >>> table = WordNetLemmaTable.from_wordnet()
+        >>> print(table.lemmatize('aardwolves'))
+        aardwolf
+
+    The lemmas are the same as those of ``WordNetLemmatizer``, for any
+    word (including words that are not in the precomputed table).
+    """
+    def __init__(self, lemmas, exceptions, forms=None):
+        """
+        :param lemmas: A dictionary mapping each part of speech to the
+            set of its lemmas.
+        :param exceptions: A dictionary mapping each part of speech to a
+            dictionary that maps irregular forms to lists of their
+            lemmas, as in WordNet's exception lists.
+        :param forms: A dictionary mapping each part of speech to a
+            dictionary that maps inflected forms to their lemmas.  If not
+            specified, then the table is computed by ``precompute()``.
+        """
+        self._lemmas = lemmas
+        self._exceptions = exceptions
+        if forms is None:
+            self._forms = dict((pos, {}) for pos in lemmas)
+            self.precompute()
+        else:
+            self._forms = forms
+
+    @classmethod
+    def from_wordnet(cls, reader=wordnet):
+        """
+        Return the table for the lemmas and exceptions of a WordNet
+        corpus reader.
+        """
+        lemmas = dict((pos, set()) for pos in POS_LIST)
+        for (lemma, offsets) in reader._lemma_pos_offset_map.items():
+            for pos in offsets:
+                if pos in lemmas:
+                    lemmas[pos].add(lemma)
+        exceptions = dict((pos, dict(reader._exception_map[pos]))
+                          for pos in POS_LIST)
+        return cls(lemmas, exceptions)
+
+    def precompute(self):
+        """
+        Compute the lemma of each lemma, of each form that a single
+        substitution rule would reduce to a lemma, and of each form in
+        the exception lists; and store those that differ from the form.
+        """
+        for (pos, lemmas) in self._lemmas.items():
+            forms = set(lemmas)
+            forms.update(self._exceptions[pos])
+            substitutions = WordNetCorpusReader.MORPHOLOGICAL_SUBSTITUTIONS[pos]
+            for lemma in lemmas:
+                for (old, new) in substitutions:
+                    if lemma.endswith(new):
+                        forms.add(lemma[:len(lemma)-len(new)] + old)
+            table = self._forms[pos] = {}
+            for form in forms:
+                lemma = self._lemmatize(form, pos)
+                if lemma != form:
+                    table[form] = lemma
+
+    def lemmatize(self, word, pos=NOUN):
+        """
+        :return: The shortest lemma of ``word`` with the given part of
+            speech, or ``word`` itself if there is none.  Satellite
+            adjectives (``ADJ_SAT``) have the lemmas of adjectives.
+        """
+        if pos == ADJ_SAT:
+            pos = ADJ
+        lemma = self._forms[pos].get(word)
+        if lemma is not None:
+            return lemma
+        return self._lemmatize(word, pos)
+
+    def _lemmatize(self, form, pos):
+        # The same algorithm as WordNetCorpusReader._morphy()
+        lemmas = self._lemmas[pos]
+        substitutions = WordNetCorpusReader.MORPHOLOGICAL_SUBSTITUTIONS[pos]
+
+        def apply_rules(forms):
+            return [form[:-len(old)] + new
+                    for form in forms
+                    for old, new in substitutions
+                    if form.endswith(old)]
+
+        def shortest(forms):
+            found = [form for form in forms if form in lemmas]
+            return min(found, key=len) if found else None
+
+        exceptions = self._exceptions[pos]
+        if form in exceptions:
+            return shortest([form] + exceptions[form]) or form
+
+        forms = apply_rules([form])
+        result = shortest([form] + forms)
+        while result is None and forms:
+            forms = apply_rules(forms)
+            result = shortest(forms)
+        return result or form
+
+    def save(self, filename):
+        """
+        Save this table to a text file.  Each line of the file contains
+        fields that are separated by tabs: ``L pos lemma`` for lemmas,
+        ``E pos form lemma...`` for exceptions, and ``F pos form lemma``
+        for the precomputed lemmas of inflected forms.
+        """
+        with codecs.open(filename, 'w', encoding='utf-8') as out:
+            for pos in sorted(self._lemmas):
+                for lemma in sorted(self._lemmas[pos]):
+                    out.write('L\t%s\t%s\n' % (pos, lemma))
+                for (form, lemmas) in sorted(self._exceptions[pos].items()):
+                    out.write('E\t%s\t%s\t%s\n' % (pos, form, '\t'.join(lemmas)))
+                for (form, lemma) in sorted(self._forms[pos].items()):
+                    out.write('F\t%s\t%s\t%s\n' % (pos, form, lemma))
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load a table that was saved by ``save()``.
+        """
+        lemmas = dict((pos, set()) for pos in POS_LIST)
+        exceptions = dict((pos, {}) for pos in POS_LIST)
+        forms = dict((pos, {}) for pos in POS_LIST)
+        with codecs.open(filename, 'r', encoding='utf-8') as infile:
+            for line in infile:
+                fields = line.rstrip('\n').split('\t')
+                kind, pos = fields[0], fields[1]
+                if kind == 'L':
+                    lemmas[pos].add(fields[2])
+                elif kind == 'E':
+                    exceptions[pos][fields[2]] = fields[3:]
+                elif kind == 'F':
+                    forms[pos][fields[2]] = fields[3]
+                else:
+                    raise ValueError('Bad line in lemma table: %r' % line)
+        return cls(lemmas, exceptions, forms)
+
+    def __repr__(self):
+        return '<WordNetLemmaTable: %d lemmas, %d inflected forms>' % (
+            sum(len(lemmas) for lemmas in self._lemmas.values()),
+            sum(len(forms) for forms in self._forms.values()))
+
+
 # unload wordnet
 def teardown_module(module=None):
     from nltk.corpus import wordnet
@@ -24,6 +24,7 @@ import re
 from nltk.probability import ConditionalFreqDist
 from nltk.classify.naivebayes import NaiveBayesClassifier
 from nltk.compat import python_2_unicode_compatible
+from nltk.internals import overridden, _mro
 
 from nltk.tag.api import TaggerI, FeaturesetTaggerI
 
@@ -601,6 +602,16 @@ class ClassifierBasedTagger(SequentialBackoffTagger, FeaturesetTaggerI):
     :param cutoff_prob: If specified, then this tagger will fall
         back on its backoff tagger if the probability of the most
         likely tag is less than *cutoff_prob*.
+
+    Subclasses whose featuresets are mostly independent of the history
+    can define ``context_features()`` and ``history_features()``,
+    which split the feature detector into a history-independent part
+    and a history-dependent part.  ``tag()`` then computes the
+    history-independent features of every token in a sentence once,
+    before tagging it, and only adds the history-dependent features
+    for each token as it is tagged.  Subclasses that override the
+    feature detector of such a class are tagged with their own
+    feature detector.
     """
     def __init__(self, feature_detector=None, train=None,
                  classifier_builder=NaiveBayesClassifier.train,
@@ -629,9 +640,27 @@ class ClassifierBasedTagger(SequentialBackoffTagger, FeaturesetTaggerI):
         if train:
             self._train(train, classifier_builder, verbose)
 
+    def tag(self, tokens):
+        # docs inherited from TaggerI
+        contexts = self._sentence_contexts(tokens)
+        if contexts is None:
+            return SequentialBackoffTagger.tag(self, tokens)
+        self._contexts = (tokens, contexts)
+        try:
+            return SequentialBackoffTagger.tag(self, tokens)
+        finally:
+            self._contexts = None
+
     def choose_tag(self, tokens, index, history):
-        # Use our feature detector to get the featureset.
-        featureset = self.feature_detector(tokens, index, history)
+        # Use our feature detector to get the featureset.  If tag() has
+        # already computed the history-independent features for this
+        # sentence, then only add the history-dependent ones.
+        contexts = getattr(self, '_contexts', None)
+        if contexts is not None and contexts[0] is tokens:
+            featureset = self.history_features(tokens, index, history,
+                                               contexts[1][index])
+        else:
+            featureset = self.feature_detector(tokens, index, history)
 
         # Use the classifier to pick a tag.  If a cutoff probability
         # was specified, then check that the tag's probability is
@@ -656,9 +685,14 @@ class ClassifierBasedTagger(SequentialBackoffTagger, FeaturesetTaggerI):
         for sentence in tagged_corpus:
             history = []
             untagged_sentence, tags = zip(*sentence)
+            contexts = self._sentence_contexts(untagged_sentence)
             for index in range(len(sentence)):
-                featureset = self.feature_detector(untagged_sentence,
-                                                    index, history)
+                if contexts is None:
+                    featureset = self.feature_detector(untagged_sentence,
+                                                        index, history)
+                else:
+                    featureset = self.history_features(
+                        untagged_sentence, index, history, contexts[index])
                 classifier_corpus.append( (featureset, tags[index]) )
                 history.append(tags[index])
 
@@ -690,26 +724,128 @@ class ClassifierBasedTagger(SequentialBackoffTagger, FeaturesetTaggerI):
         """
         return self._classifier
 
+    def context_features(self, tokens, index):
+        """
+        Return the part of the featureset for ``tokens[index]`` that
+        does not depend on the tags of the preceding tokens.  Subclasses
+        that define this method must also define ``history_features()``,
+        such that::
+
+          feature_detector(tokens, index, history) ==
+              history_features(tokens, index, history,
+                               context_features(tokens, index))
+
+        By default, the feature detector is not split.
+        """
+        raise NotImplementedError()
+
+    def history_features(self, tokens, index, history, context):
+        """
+        Return the featureset for ``tokens[index]``, given the
+        history-independent features ``context`` that were returned by
+        ``context_features(tokens, index)``.  The ``context`` dictionary
+        may be shared between calls, so it should not be modified.
+        """
+        raise NotImplementedError()
+
+    def _sentence_contexts(self, tokens):
+        """
+        Return a list of the history-independent features of each of
+        the given tokens, or None if this tagger does not define
+        ``context_features()``.  It is also None if the feature detector
+        was given to the constructor, or defined by a subclass of the
+        class that defines ``context_features()``, since the split
+        feature detector may then differ from it.
+        """
+        if not overridden(self.context_features):
+            return None
+        cls = type(self)
+        owner = _defining_class(cls, 'feature_detector')
+        if owner is ClassifierBasedTagger:
+            # The feature detector is self._feature_detector.
+            if '_feature_detector' in self.__dict__:
+                return None
+            owner = _defining_class(cls, '_feature_detector')
+        if (owner is not None and
+            not issubclass(_defining_class(cls, 'context_features'), owner)):
+            return None
+        return [self.context_features(tokens, index)
+                for index in range(len(tokens))]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_contexts', None)
+        return state
+
+def _defining_class(cls, name):
+    """
+    Return the first class in the method resolution order of ``cls``
+    that defines the attribute ``name``, or None if there is none.
+    """
+    for base in _mro(cls):
+        if name in base.__dict__:
+            return base
+    return None
+
 class ClassifierBasedPOSTagger(ClassifierBasedTagger):
     """
     A classifier based part of speech tagger.
     """
+    #: The maximum number of words whose shape is memoized.
+    _SHAPE_CACHE_SIZE = 100000
+
     def feature_detector(self, tokens, index, history):
+        return self.history_features(tokens, index, history,
+                                     self.context_features(tokens, index))
+
+    def context_features(self, tokens, index):
         word = tokens[index]
         if index == 0:
             prevword = prevprevword = None
-            prevtag = prevprevtag = None
         elif index == 1:
             prevword = tokens[index-1].lower()
             prevprevword = None
-            prevtag = history[index-1]
-            prevprevtag = None
         else:
             prevword = tokens[index-1].lower()
             prevprevword = tokens[index-2].lower()
+
+        features = {
+            'word': word,
+            'word.lower': word.lower(),
+            'suffix3': word.lower()[-3:],
+            'suffix2': word.lower()[-2:],
+            'suffix1': word.lower()[-1:],
+            'prevprevword': prevprevword,
+            'prevword': prevword,
+            'prevword+word': '%s+%s' % (prevword, word.lower()),
+            'shape': self._shape(word),
+            }
+        return features
+
+    def history_features(self, tokens, index, history, context):
+        if index == 0:
+            prevtag = prevprevtag = None
+        elif index == 1:
+            prevtag = history[index-1]
+            prevprevtag = None
+        else:
             prevtag = history[index-1]
             prevprevtag = history[index-2]
 
+        features = dict(context)
+        features['prevtag'] = prevtag
+        features['prevprevtag'] = prevprevtag
+        features['prevtag+word'] = '%s+%s' % (prevtag, context['word.lower'])
+        features['prevprevtag+word'] = '%s+%s' % (prevprevtag,
+                                                  context['word.lower'])
+        return features
+
+    def _shape(self, word):
+        cache = self.__dict__.setdefault('_shape_cache', {})
+        shape = cache.get(word)
+        if shape is not None:
+            return shape
+
         if re.match('[0-9]+(\.[0-9]*)?|[0-9]*\.[0-9]+$', word):
             shape = 'number'
         elif re.match('\W+$', word):
@@ -723,22 +859,15 @@ class ClassifierBasedPOSTagger(ClassifierBasedTagger):
         else:
             shape = 'other'
 
-        features = {
-            'prevtag': prevtag,
-            'prevprevtag': prevprevtag,
-            'word': word,
-            'word.lower': word.lower(),
-            'suffix3': word.lower()[-3:],
-            'suffix2': word.lower()[-2:],
-            'suffix1': word.lower()[-1:],
-            'prevprevword': prevprevword,
-            'prevword': prevword,
-            'prevtag+word': '%s+%s' % (prevtag, word.lower()),
-            'prevprevtag+word': '%s+%s' % (prevprevtag, word.lower()),
-            'prevword+word': '%s+%s' % (prevword, word.lower()),
-            'shape': shape,
-            }
-        return features
+        if len(cache) >= self._SHAPE_CACHE_SIZE:
+            cache.clear()
+        cache[word] = shape
+        return shape
+
+    def __getstate__(self):
+        state = ClassifierBasedTagger.__getstate__(self)
+        state.pop('_shape_cache', None)
+        return state
 
 
 if __name__ == "__main__":
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the bracketed tree corpus reader.
+"""
+from __future__ import absolute_import, unicode_literals
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from nltk.corpus.reader import BracketParseCorpusReader
+from nltk.corpus.reader.util import (read_regexp_block,
+                                     read_unindented_paren_block)
+from nltk.data import SeekableUnicodeStreamReader
+from nltk.tree import Tree
+
+TREES = """\
+( (S (NP-SBJ (DT The) (NN dög))
+    (VP (VBD barked) (,) (ADVP (RB loudly)))
+    (. .)) )
+((S (NP (PRP He)) (VP (VBZ runs run) (NP (-NONE- *T*-1)))))
+(S (NP (NNS cats)) (VP (VBP sleep)))
+"""
+
+class TestBracketParseCorpusReader(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for name in ('a.mrg', 'b.mrg'):
+            with io.open(os.path.join(self.root, name), 'w',
+                         encoding='utf8') as out:
+                out.write(TREES * 50)
+        self.reader = BracketParseCorpusReader(self.root, r'.*\.mrg')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_parsed_sents(self):
+        trees = self.reader.parsed_sents('a.mrg')
+        self.assertEqual(len(trees), 150)
+        self.assertEqual(trees[0], Tree.fromstring(
+            '(S (NP-SBJ (DT The) (NN dög)) (VP (VBD barked) (, ,) '
+            '(ADVP (RB loudly))) (. .))'))
+        self.assertEqual(trees[1], Tree.fromstring(
+            '(S (NP (PRP He)) (VP (VBZ runs) (NP (-NONE- *T*-1))))'))
+
+    def test_tagged_words(self):
+        # The tagged words are those of the parsed trees, which are not
+        # built to find them.
+        tagged = [tw for tree in self.reader.parsed_sents() for tw in tree.pos()]
+        self.assertEqual(list(self.reader.tagged_words()), tagged)
+        self.assertEqual(list(self.reader.words()), [w for (w, t) in tagged])
+        self.assertEqual(self.reader.tagged_sents()[2],
+                         [('cats', 'NNS'), ('sleep', 'VBP')])
+
+    def test_tuple_trees(self):
+        trees = self.reader.tuple_trees()
+        self.assertEqual(trees[2], ('S', ('NP', ('NNS', 'cats')),
+                                    ('VP', ('VBP', 'sleep'))))
+        totree = lambda t: (Tree(t[0], [totree(c) for c in t[1:]])
+                            if isinstance(t, tuple) else t)
+        self.assertEqual([totree(t) for t in trees],
+                         list(self.reader.parsed_sents()))
+
+    def test_processes(self):
+        self.assertEqual(self.reader.tagged_words(processes=2),
+                         list(self.reader.tagged_words()))
+        self.assertEqual(self.reader.parsed_sents(processes=2),
+                         list(self.reader.parsed_sents()))
+
+    def test_unindented_paren_block(self):
+        # The blocks are the same as those of read_regexp_block(), even
+        # when trees are longer than a block.
+        path = os.path.join(self.root, 'a.mrg')
+        for block_size in (10, 100, 16384):
+            expected = []
+            actual = []
+            with open(path, 'rb') as infile:
+                stream = SeekableUnicodeStreamReader(infile, 'utf8')
+                for block in iter(lambda: read_regexp_block(stream, r'^\('), []):
+                    expected.extend(block)
+            with open(path, 'rb') as infile:
+                stream = SeekableUnicodeStreamReader(infile, 'utf8')
+                for block in iter(lambda: read_unindented_paren_block(
+                        stream, block_size), []):
+                    actual.extend(block)
+            self.assertEqual(actual, expected)
@@ -3,10 +3,13 @@
 Corpus View Regression Tests
 """
 from __future__ import absolute_import, unicode_literals
+import os
 import unittest
 import nltk.data
 from nltk.corpus.reader.util import (StreamBackedCorpusView,
                                      read_whitespace_block, read_line_block)
+from nltk.corpus.reader.xmldocs import (XMLCorpusView, StreamingXMLCorpusView,
+                                        ElementTree)
 
 class TestCorpusViews(unittest.TestCase):
 
@@ -43,3 +46,38 @@ class TestCorpusViews(unittest.TestCase):
 
             v = StreamBackedCorpusView(f, read_line_block)
             self.assertEqual(len(v), len(self.linetok.tokenize(file_data)))
+
+
+class TestStreamingXMLCorpusView(unittest.TestCase):
+
+    fileid = os.path.join(os.path.dirname(__file__), '..', 'FX8.xml')
+    tagspecs = ['.*/s', '.*/s/(.*/)?(c|w)', 'bncDoc/teiHeader', '.*/u']
+
+    def elements(self, view_class, tagspec):
+        handler = lambda elt, context: (ElementTree.tostring(elt), context)
+        return list(view_class(self.fileid, tagspec, handler))
+
+    def test_same_elements(self):
+        # The streaming view selects the same elements as XMLCorpusView,
+        # however small its blocks are.
+        default_block_size = StreamingXMLCorpusView._BLOCK_SIZE
+        for tagspec in self.tagspecs:
+            expected = self.elements(XMLCorpusView, tagspec)
+            for block_size in (1, 100, 2**16):
+                StreamingXMLCorpusView._BLOCK_SIZE = block_size
+                try:
+                    self.assertEqual(self.elements(StreamingXMLCorpusView, tagspec),
+                                     expected)
+                finally:
+                    StreamingXMLCorpusView._BLOCK_SIZE = default_block_size
+        self.assertEqual(StreamingXMLCorpusView._BLOCK_SIZE, default_block_size)
+
+    def test_random_access(self):
+        # Blocks are read again from the offsets at which they start.
+        view = StreamingXMLCorpusView(self.fileid, '.*/s/(.*/)?(c|w)',
+                                      lambda elt, context: elt.text)
+        view._BLOCK_SIZE = 100
+        words = list(view)
+        self.assertTrue(len(view._filepos) > 10)
+        for i in (100, 3, len(words) - 1, 50, 0):
+            self.assertEqual(view[i], words[i])
@@ -25,3 +25,82 @@ class SnowballTest(unittest.TestCase):
     def test_short_strings_bug(self):
         stemmer = SnowballStemmer('english')
         assert stemmer.stem("y's") == 'y'
+
+    def test_suffix_tables(self):
+        from nltk.stem.snowball import (EnglishStemmer, _Suffixes,
+                                        _matching_suffixes)
+        # The suffixes of each step are compiled with their class.
+        suffixes = EnglishStemmer._EnglishStemmer__step1a_suffixes
+        assert isinstance(suffixes, _Suffixes)
+        assert suffixes == ("sses", "ied", "ies", "us", "ss", "s")
+        assert _matching_suffixes('classes', suffixes) == ['sses', 's']
+        # Other tuples are compiled when they are used.
+        assert _matching_suffixes('classes', ('s', 'es', 'x')) == ['s', 'es']
+
+
+class CachedStemmerTest(unittest.TestCase):
+
+    def test_same_stems(self):
+        from nltk.stem import PorterStemmer, CachedStemmer
+        words = "the runner was running and runs while others ran".split()
+        stemmer = CachedStemmer(PorterStemmer(), cache_size=3)
+        expected = [PorterStemmer().stem(w) for w in words]
+        assert [stemmer.stem(w) for w in words + words] == expected * 2
+        assert stemmer.stem_many(words) == expected
+
+    def test_lru_eviction(self):
+        from nltk.stem import PorterStemmer, CachedStemmer
+        stemmer = CachedStemmer(PorterStemmer(), cache_size=2)
+        for word in ['cats', 'dogs', 'cats', 'birds', 'cats', 'dogs']:
+            stemmer.stem(word)
+        # 'dogs' was evicted by 'birds', as 'cats' was used more recently
+        assert stemmer.cache_info() == (2, 4, 2, 2)
+        assert stemmer.hit_rate() == 2.0 / 6
+
+
+class WordNetLemmaTableTest(unittest.TestCase):
+
+    def _table(self):
+        from nltk.stem.wordnet import WordNetLemmaTable
+        lemmas = {'n': set(['church', 'goose', 'abacus', 'wolf']),
+                  'v': set(['be', 'fly', 'run']),
+                  'a': set(['high']), 'r': set()}
+        exceptions = {'n': {'geese': ['goose'], 'abaci': ['abacus']},
+                      'v': {'were': ['be'], 'ran': ['run']},
+                      'a': {}, 'r': {}}
+        return WordNetLemmaTable(lemmas, exceptions)
+
+    def test_lemmatize(self):
+        from nltk.stem import WordNetLemmatizer
+        wnl = WordNetLemmatizer(self._table())
+        assert wnl.lemmatize('churches') == 'church'
+        assert wnl.lemmatize('wolves') == 'wolf'
+        assert wnl.lemmatize('abaci') == 'abacus'
+        assert wnl.lemmatize('flies', 'v') == 'fly'
+        assert wnl.lemmatize('highest', 'a') == 'high'
+        assert wnl.lemmatize('highest', 's') == 'high'
+        assert wnl.lemmatize('hardrock') == 'hardrock'
+
+    def test_lemmatize_many(self):
+        from nltk.stem import WordNetLemmatizer
+        wnl = WordNetLemmatizer(self._table())
+        words = ['The', 'geese', 'were', 'flying', 'higher']
+        tags = ['DT', 'NNS', 'VBD', 'VBG', 'JJR']
+        assert wnl.lemmatize_many(words, tags) == [
+            'The', 'goose', 'be', 'fly', 'high']
+        assert wnl.lemmatize_many(['geese', 'flies']) == ['goose', 'flies']
+
+    def test_save_and_load(self):
+        import os, tempfile
+        from nltk.stem.wordnet import WordNetLemmaTable
+        table = self._table()
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            table.save(filename)
+            loaded = WordNetLemmaTable.load(filename)
+        finally:
+            os.remove(filename)
+        for word in ['churches', 'geese', 'wolves', 'dogs']:
+            assert loaded.lemmatize(word) == table.lemmatize(word)
+        assert loaded._forms == table._forms
@@ -12,6 +12,75 @@ def test_basic():
                       ('.', '.')]
 
 
+def test_classifier_based_tagger_contexts():
+    from nltk.tag.sequential import ClassifierBasedPOSTagger
+
+    train = [[('the', 'DT'), ('dog', 'NN'), ('runs', 'VBZ')],
+             [('a', 'DT'), ('cat', 'NN'), ('sleeps', 'VBZ')],
+             [('Mary', 'NNP'), ('runs', 'VBZ'), ('3', 'CD'), ('km', 'NN')]]
+    tagger = ClassifierBasedPOSTagger(train=train)
+
+    # The featuresets built from the cached history-independent
+    # features are the same as those built by the feature detector.
+    tokens = ['Mary', 'sees', 'the', 'dog', '.']
+    history = ['NNP', 'VBZ', 'DT', 'NN']
+    for index in range(len(tokens)):
+        context = tagger.context_features(tokens, index)
+        assert (tagger.history_features(tokens, index, history[:index],
+                                        context) ==
+                tagger.feature_detector(tokens, index, history[:index]))
+
+    tagged = tagger.tag(tokens)
+    assert tagged == [(tokens[i], tagger.tag_one(tokens, i,
+                                                 [t for (w, t) in tagged[:i]]))
+                      for i in range(len(tokens))]
+    assert tagger.tag_sents([tokens, ['the', 'cat']]) == [
+        tagged, tagger.tag(['the', 'cat'])]
+
+
+def test_classifier_based_tagger_overridden_feature_detector():
+    from nltk.tag.sequential import (ClassifierBasedTagger,
+                                     ClassifierBasedPOSTagger)
+    from nltk.chunk.named_entity import NEChunkParserTagger
+
+    train = [[('the', 'DT'), ('dog', 'NN'), ('runs', 'VBZ')],
+             [('a', 'DT'), ('cat', 'NN'), ('sleeps', 'VBZ')]]
+    word_features = lambda tokens, index, history: {'word': tokens[index]}
+
+    # A subclass that only replaces the feature detector is trained
+    # and tagged with it, not with the inherited context_features().
+    class WordTagger(ClassifierBasedPOSTagger):
+        def feature_detector(self, tokens, index, history):
+            return word_features(tokens, index, history)
+
+    tagger = WordTagger(train=train)
+    assert tagger._sentence_contexts(['the', 'dog']) is None
+    assert (set(fname for (label, fname) in
+                tagger.classifier()._feature_probdist) == set(['word']))
+    assert tagger.tag(['a', 'dog']) == [('a', 'DT'), ('dog', 'NN')]
+
+    # So is a tagger given a feature detector by its constructor.
+    class SplitTagger(ClassifierBasedTagger):
+        def context_features(self, tokens, index):
+            return {'word': tokens[index], 'suffix1': tokens[index][-1:]}
+        def history_features(self, tokens, index, history, context):
+            return context
+
+    tagger = SplitTagger(train=train)
+    assert tagger._sentence_contexts(['the', 'dog']) is not None
+    tagger = SplitTagger(train=train, feature_detector=word_features)
+    assert tagger._sentence_contexts(['the', 'dog']) is None
+    assert (set(fname for (label, fname) in
+                tagger.classifier()._feature_probdist) == set(['word']))
+
+    class WordChunkTagger(NEChunkParserTagger):
+        def _feature_detector(self, tokens, index, history):
+            return {'word': tokens[index][0]}
+
+    tagger = WordChunkTagger.__new__(WordChunkTagger)
+    assert tagger._sentence_contexts([('the', 'DT')]) is None
+
+
 def setup_module(module):
     from nose import SkipTest
     try:
@@ -18,11 +18,13 @@ from __future__ import print_function, unicode_literals
 # TODO: add LabelledTree (can be used for dependency trees)
 
 import re
+from array import array
 
 from nltk.grammar import Production, Nonterminal
 from nltk.probability import ProbabilisticMixIn
 from nltk.util import slice_bounds
-from nltk.compat import string_types, python_2_unicode_compatible, unicode_repr
+from nltk.compat import (string_types, integer_types,
+                         python_2_unicode_compatible, unicode_repr)
 from nltk.internals import raise_unorderable_types
 
 ######################################################################
@@ -1458,6 +1460,423 @@ def _child_names(tree):
             names.append(child)
     return names
 
+######################################################################
+## Compact trees
+######################################################################
+
+@python_2_unicode_compatible
+class CompactTrees(object):
+    """
+    A read-only sequence of trees, which are encoded in a few arrays
+    that are shared by all of them, rather than as one list per
+    subtree.  The nodes of the trees (subtrees and leaves) are listed
+    in preorder, and each node has:
+
+      - the id of its label (or, for a leaf, the negated id of its
+        value) in a table of symbols;
+      - the index of the node that follows it and its descendants,
+        which is its next sibling, if it has one;
+      - the number of leaves that precede it.
+
+    The trees are accessed as ``CompactTree`` objects, which are
+    created on demand, and whose methods run over the arrays.  A
+    ``Tree`` is only built by ``CompactTree.totree()``.
+
+        >>> from nltk.tree import Tree, CompactTrees
+        >>> t = Tree.fromstring("(S (NP (D the) (N dog)) (VP (V barked)))")
+        >>> trees = CompactTrees([t, ('S', ('NP', ('N', 'cats')), ('VP', ('V', 'sleep')))])
+        >>> len(trees)
+        2
+        >>> trees[1].leaves()
+        ['cats', 'sleep']
+        >>> trees[0].totree() == t
+        True
+    """
+    def __init__(self, trees=()):
+        """
+        :param trees: The trees to encode.  Each tree is a ``Tree``, a
+            ``CompactTree``, or a tuple ``(label, child, ...)`` such as
+            those of ``BracketParseCorpusReader.tuple_trees()``.
+        """
+        self._symbols = []
+        self._ids = {}
+        self._labels = array(str('i'))
+        self._ends = array(str('i'))
+        # One more entry than there are nodes: the number of leaves.
+        self._leaf_starts = array(str('i'), [0])
+        self._roots = array(str('i'))
+        self.extend(trees)
+
+    def append(self, tree):
+        """
+        Encode a tree and add it at the end of the sequence.
+        """
+        self._roots.append(len(self._labels))
+        num_leaves = self._leaf_starts.pop()
+        self._leaf_starts.append(self._encode(tree, num_leaves,
+                                              isinstance(tree, tuple)))
+
+    def extend(self, trees):
+        for tree in trees:
+            self.append(tree)
+
+    def _id(self, symbol):
+        try:
+            return self._ids[symbol]
+        except KeyError:
+            self._symbols.append(symbol)
+            i = self._ids[symbol] = len(self._symbols) - 1
+            return i
+
+    def _encode(self, tree, num_leaves, tuples):
+        # (num_leaves is the number of leaves before the tree; returns
+        # the number after it.  Tuple children are subtrees only in
+        # tuple trees: in a Tree, they are leaves, such as the (word,
+        # tag) leaves of chunk trees.)
+        if tuples:
+            label, children = tree[0], tree[1:]
+        else:
+            label, children = tree.label(), tree
+        index = len(self._labels)
+        self._labels.append(self._id(label))
+        self._ends.append(0)
+        self._leaf_starts.append(num_leaves)
+        for child in children:
+            if tuples and isinstance(child, tuple):
+                num_leaves = self._encode(child, num_leaves, True)
+            elif isinstance(child, (Tree, CompactTree)):
+                num_leaves = self._encode(child, num_leaves, False)
+            else:
+                self._labels.append(-1 - self._id(child))
+                self._ends.append(len(self._labels))
+                self._leaf_starts.append(num_leaves)
+                num_leaves += 1
+        self._ends[index] = len(self._labels)
+        return num_leaves
+
+    def __len__(self):
+        return len(self._roots)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_ids']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._ids = dict((symbol, i) for (i, symbol) in enumerate(self._symbols))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        root = self._roots[index]
+        return CompactTree(self, root, root)
+
+    def __iter__(self):
+        for root in self._roots:
+            yield CompactTree(self, root, root)
+
+    def __repr__(self):
+        return '<CompactTrees with %d trees and %d nodes>' % (
+            len(self._roots), len(self._labels))
+
+
+@python_2_unicode_compatible
+class CompactTree(object):
+    """
+    A read-only view of a tree, or of a subtree of a tree, that is
+    stored in ``CompactTrees``.  It supports the queries of ``Tree``
+    that do not modify the tree, and ``span()``; subtrees are also
+    ``CompactTree`` objects.
+
+        >>> from nltk.tree import CompactTree
+        >>> t = CompactTree.fromstring("(S (NP (D the) (N dog)) (VP (V chased) (NP (D the) (N cat))))")
+        >>> t.pos()
+        [('the', 'D'), ('dog', 'N'), ('chased', 'V'), ('the', 'D'), ('cat', 'N')]
+        >>> [(s.label(), s.span()) for s in t.subtrees(lambda s: s.label() == 'NP')]
+        [('NP', (0, 2)), ('NP', (3, 5))]
+        >>> print(t[1, 1])
+        (NP (D the) (N cat))
+        >>> t.treeposition_spanning_leaves(3, 5)
+        (1, 1)
+    """
+    def __init__(self, trees, index, root):
+        """
+        :param trees: The ``CompactTrees`` that stores the tree.
+        :param index: The index of the node of the tree.
+        :param root: The index of the root of the whole tree, from the
+            first leaf of which spans are counted.
+        """
+        self._trees = trees
+        self._index = index
+        self._root = root
+
+    @classmethod
+    def fromtree(cls, tree):
+        """
+        :return: A compact encoding of ``tree``, in its own ``CompactTrees``.
+        """
+        return CompactTrees([tree])[0]
+
+    @classmethod
+    def fromstring(cls, s, **kwargs):
+        """
+        :return: A compact encoding of the tree read by
+            ``Tree.fromstring(s, **kwargs)``.
+        """
+        return cls.fromtree(Tree.fromstring(s, **kwargs))
+
+    def label(self):
+        """
+        Return the node label of the tree.
+        """
+        return self._trees._symbols[self._trees._labels[self._index]]
+
+    def _children(self):
+        """
+        Generate the node indices of the children of the tree.
+        """
+        ends = self._trees._ends
+        i = self._index + 1
+        end = ends[self._index]
+        while i < end:
+            yield i
+            i = ends[i]
+
+    def _node(self, i):
+        label = self._trees._labels[i]
+        if label < 0:
+            return self._trees._symbols[-1 - label]
+        return CompactTree(self._trees, i, self._root)
+
+    def __len__(self):
+        return sum(1 for i in self._children())
+
+    def __iter__(self):
+        for i in self._children():
+            yield self._node(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, integer_types):
+            if index < 0:
+                index += len(self)
+            if index >= 0:
+                for (k, i) in enumerate(self._children()):
+                    if k == index:
+                        return self._node(i)
+            raise IndexError('index out of range')
+        elif isinstance(index, slice):
+            return list(self)[index]
+        elif isinstance(index, (list, tuple)):
+            node = self
+            for i in index:
+                node = node[i]
+            return node
+        else:
+            raise TypeError("%s indices must be integers, not %s" %
+                            (type(self).__name__, type(index).__name__))
+
+    def span(self):
+        """
+        :return: The indices ``(start, end)`` of the leaves of this
+            subtree among the leaves of the whole tree.
+        :rtype: tuple(int, int)
+        """
+        leaf_starts = self._trees._leaf_starts
+        first = leaf_starts[self._root]
+        return (leaf_starts[self._index] - first,
+                leaf_starts[self._trees._ends[self._index]] - first)
+
+    def leaves(self):
+        """
+        Return the leaves of the tree.
+
+        :rtype: list
+        """
+        symbols = self._trees._symbols
+        return [symbols[-1 - label] for label in
+                self._trees._labels[self._index:self._trees._ends[self._index]]
+                if label < 0]
+
+    def pos(self):
+        """
+        Return a sequence of pos-tagged words extracted from the tree.
+
+        :rtype: list(tuple)
+        """
+        symbols = self._trees._symbols
+        labels = self._trees._labels
+        ends = self._trees._ends
+        pos = []
+        # The subtrees that have started, of which the last one that
+        # has not ended is the parent of a leaf
+        parents = []
+        for i in range(self._index, ends[self._index]):
+            label = labels[i]
+            if label < 0:
+                while ends[parents[-1]] <= i:
+                    parents.pop()
+                pos.append((symbols[-1 - label], symbols[labels[parents[-1]]]))
+            else:
+                parents.append(i)
+        return pos
+
+    def height(self):
+        """
+        Return the height of the tree, as in ``Tree.height()``.
+
+        :rtype: int
+        """
+        ends = self._trees._ends
+        height = 1
+        stack = []
+        for i in range(self._index, ends[self._index]):
+            while stack and stack[-1] <= i:
+                stack.pop()
+            height = max(height, len(stack) + 1)
+            stack.append(ends[i])
+        return height
+
+    def subtrees(self, filter=None):
+        """
+        Generate all the subtrees of this tree, in preorder, optionally
+        restricted to trees matching the filter function, which is
+        called with each ``CompactTree``.
+
+        :type filter: function
+        :param filter: the function to filter all local trees
+        """
+        labels = self._trees._labels
+        for i in range(self._index, self._trees._ends[self._index]):
+            if labels[i] >= 0:
+                subtree = CompactTree(self._trees, i, self._root)
+                if not filter or filter(subtree):
+                    yield subtree
+
+    def productions(self):
+        """
+        Generate the productions that correspond to the non-terminal
+        nodes of the tree, as in ``Tree.productions()``.
+
+        :rtype: list(Production)
+        """
+        symbols = self._trees._symbols
+        labels = self._trees._labels
+        ends = self._trees._ends
+        prods = []
+        nonterminals = {}
+        for i in range(self._index, ends[self._index]):
+            label = labels[i]
+            if label < 0:
+                continue
+            if label not in nonterminals:
+                if not isinstance(symbols[label], string_types):
+                    raise TypeError('Productions can only be generated from trees having node labels that are strings')
+                nonterminals[label] = Nonterminal(symbols[label])
+            rhs = []
+            j = i + 1
+            end = ends[i]
+            while j < end:
+                child = labels[j]
+                if child < 0:
+                    rhs.append(symbols[-1 - child])
+                elif child in nonterminals:
+                    rhs.append(nonterminals[child])
+                else:
+                    rhs.append(Nonterminal(symbols[child]))
+                j = ends[j]
+            prods.append(Production(nonterminals[label], rhs))
+        return prods
+
+    def leaf_treeposition(self, index):
+        """
+        :return: The tree position of the ``index``-th leaf in this
+            tree.
+
+        :raise IndexError: If this tree contains fewer than ``index+1``
+            leaves, or if ``index<0``.
+        """
+        if index < 0: raise IndexError('index must be non-negative')
+        leaf_starts = self._trees._leaf_starts
+        target = leaf_starts[self._index] + index
+        if target >= leaf_starts[self._trees._ends[self._index]]:
+            raise IndexError('index must be less than or equal to len(self)')
+        # Descend through the child that contains the leaf.
+        labels = self._trees._labels
+        ends = self._trees._ends
+        treepos = ()
+        node = self._index
+        while labels[node] >= 0:
+            k = 0
+            child = node + 1
+            while not (leaf_starts[child] <= target < leaf_starts[ends[child]]):
+                child = ends[child]
+                k += 1
+            treepos += (k,)
+            node = child
+        return treepos
+
+    def treeposition_spanning_leaves(self, start, end):
+        """
+        :return: The tree position of the lowest descendant of this
+            tree that dominates ``self.leaves()[start:end]``.
+        :raise ValueError: if ``end <= start``
+        """
+        if end <= start:
+            raise ValueError('end must be greater than start')
+        start_treepos = self.leaf_treeposition(start)
+        end_treepos = self.leaf_treeposition(end-1)
+        for i in range(len(start_treepos)):
+            if i == len(end_treepos) or start_treepos[i] != end_treepos[i]:
+                return start_treepos[:i]
+        return start_treepos
+
+    def totree(self, cls=None):
+        """
+        :return: The tree as a ``Tree``, or as a tree of class ``cls``.
+        """
+        if cls is None:
+            cls = Tree
+        symbols = self._trees._symbols
+        labels = self._trees._labels
+        ends = self._trees._ends
+        # The labels, children and ends of the open subtrees
+        stack = [(None, [], None)]
+        for i in range(self._index, ends[self._index]):
+            while stack[-1][2] is not None and stack[-1][2] <= i:
+                label, children, end = stack.pop()
+                stack[-1][1].append(cls(label, children))
+            label = labels[i]
+            if label < 0:
+                stack[-1][1].append(symbols[-1 - label])
+            else:
+                stack.append((symbols[label], [], ends[i]))
+        while len(stack) > 1:
+            label, children, end = stack.pop()
+            stack[-1][1].append(cls(label, children))
+        return stack[0][1][0]
+
+    def __eq__(self, other):
+        return (isinstance(other, CompactTree) and
+                self.totree() == other.totree())
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Compact' + repr(self.totree())
+
+    def __str__(self):
+        return self.pprint()
+
+    def pprint(self, **kwargs):
+        """
+        :return: The string of ``Tree.pprint()`` for this tree.
+        """
+        return self.totree().pprint(**kwargs)
+
 ######################################################################
 ## Parsing
 ######################################################################
@@ -1578,7 +1997,8 @@ def demo():
 __all__ = ['ImmutableProbabilisticTree', 'ImmutableTree', 'ProbabilisticMixIn',
            'ProbabilisticTree', 'Tree', 'bracket_parse',
            'sinica_parse', 'ParentedTree', 'MultiParentedTree',
-           'ImmutableParentedTree', 'ImmutableMultiParentedTree']
+           'ImmutableParentedTree', 'ImmutableMultiParentedTree',
+           'CompactTree', 'CompactTrees']
 
 if __name__ == "__main__":
     import doctest
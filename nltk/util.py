@@ -461,6 +461,33 @@ def trigrams(sequence, **kwargs):
     for item in ngrams(sequence, 3, **kwargs):
         yield item
 
+def everygrams(sequence, min_len=1, max_len=-1):
+    """
+    Return all the ngrams generated from a sequence of items, of every
+    length from min_len to max_len, as an iterator.  The ngrams that
+    start at each position are generated in order of length.
+    For example:
+
+        >>> from nltk.util import everygrams
+        >>> list(everygrams([1,2,3], max_len=2))
+        [(1,), (1, 2), (2,), (2, 3), (3,)]
+
+    :param sequence: the source data to be converted into ngrams
+    :type sequence: sequence or iter
+    :param min_len: the minimum length of the ngrams
+    :type min_len: int
+    :param max_len: the maximum length of the ngrams (if negative, the
+        length of the sequence)
+    :type max_len: int
+    :rtype: iter(tuple)
+    """
+    sequence = tuple(sequence)
+    if max_len < 0:
+        max_len = len(sequence)
+    for i in range(len(sequence)):
+        for n in range(min_len, min(max_len, len(sequence) - i) + 1):
+            yield sequence[i:i+n]
+
 ##########################################################################
 # Ordered Dictionary
 ##########################################################################
@@ -553,6 +580,113 @@ class OrderedDict(dict):
         # returns iterator under python 3
         return map(self.get, self._keys)
 
+######################################################################
+# LRU Cache
+######################################################################
+
+# The fields of the links of the doubly linked list that orders the
+# entries of an LRUCache from the least to the most recently used.
+_PREV, _NEXT, _KEY, _VALUE = 0, 1, 2, 3
+
+class LRUCache(object):
+    """
+    A mapping that holds at most ``maxsize`` items, and discards the
+    least recently used item when it is full.  The items are kept in a
+    circular doubly linked list of ``[prev, next, key, value]`` links,
+    from the least to the most recently used, so that each lookup and
+    insertion takes constant time.
+
+        >>> from nltk.util import LRUCache
+        >>> cache = LRUCache(2)
+        >>> cache.put('a', 1)
+        >>> cache.put('b', 2)
+        >>> cache.get('a')
+        1
+        >>> cache.put('c', 3)
+        >>> cache.get('b') is None, cache.get('a'), cache.get('c'), len(cache)
+        (True, 1, 3, 2)
+
+    ``LRUCache`` objects are not thread-safe.
+    """
+    def __init__(self, maxsize):
+        """
+        :param maxsize: The maximum number of items.  If None, then the
+            cache is unbounded; if 0, then no items are kept.
+        :type maxsize: int
+        """
+        self._maxsize = maxsize
+        self._links = {}
+        self._root = []
+        self._root[:] = [self._root, self._root, None, None]
+
+    @property
+    def maxsize(self):
+        """The maximum number of items, or None if it is unbounded."""
+        return self._maxsize
+
+    def get(self, key, default=None):
+        """
+        Return the value of ``key``, and mark it as the most recently
+        used item; or return ``default`` if ``key`` is not in the cache.
+        """
+        link = self._links.get(key)
+        if link is None:
+            return default
+        if self._maxsize is not None:
+            self._unlink(link)
+            self._append(link)
+        return link[_VALUE]
+
+    def put(self, key, value):
+        """
+        Set the value of ``key``, and mark it as the most recently used
+        item, discarding the least recently used item if the cache is
+        full.
+        """
+        link = self._links.get(key)
+        if link is not None:
+            link[_VALUE] = value
+            if self._maxsize is not None:
+                self._unlink(link)
+                self._append(link)
+            return
+        if self._maxsize is None:
+            self._links[key] = [None, None, key, value]
+            return
+        if self._maxsize <= 0:
+            return
+        if len(self._links) >= self._maxsize:
+            oldest = self._root[_NEXT]
+            self._unlink(oldest)
+            del self._links[oldest[_KEY]]
+        link = self._links[key] = [None, None, key, value]
+        self._append(link)
+
+    def _unlink(self, link):
+        link[_PREV][_NEXT] = link[_NEXT]
+        link[_NEXT][_PREV] = link[_PREV]
+
+    def _append(self, link):
+        last = self._root[_PREV]
+        link[_PREV] = last
+        link[_NEXT] = self._root
+        last[_NEXT] = self._root[_PREV] = link
+
+    def clear(self):
+        """Remove all items from the cache."""
+        self._links.clear()
+        self._root[:] = [self._root, self._root, None, None]
+
+    def __contains__(self, key):
+        return key in self._links
+
+    def __len__(self):
+        return len(self._links)
+
+    def __repr__(self):
+        return '<LRUCache with %d of %s items>' % (len(self._links),
+                                                  self._maxsize)
+
 ######################################################################
 # Lazy Sequences
 ######################################################################